@@ -0,0 +1,107 @@
+# -*- coding: utf-8 -*-
+'''
+Helpers for evaluating the IF97 equations on arrays of states
+'''
+import functools
+
+import numpy as np
+
+_blockSize = 4096
+
+_scalarTypes = (float, int, np.floating, np.integer)
+
+def blockwise(kernel):
+    '''Decorator for kernels that evaluate arrays of points elementwise.
+
+    The arguments are converted to float arrays and broadcast against each other, so one call evaluates
+    every point of a block in a single pass. Inputs larger than _blockSize points are split into blocks
+    to keep the temporaries cache sized. Results keep the kernel's dtype and kernels returning a namedtuple
+    get one array per field. Keyword arguments are options and are passed through unchanged.
+
+    Calls where every argument is a scalar skip the array handling and call the kernel with Python floats.
+    Kernels that index with boolean masks evaluate their subregions with piecewise, register a float implementation
+    with the scalar attribute of the decorated function, @kernel.scalar, or are decorated with masked instead.'''
+    implementation = [kernel]
+
+    @functools.wraps(kernel)
+    def wrapper(*args, **options):
+        for arg in args:
+            if not isinstance(arg, _scalarTypes) and not (isinstance(arg, np.ndarray) and not arg.shape):
+                break
+        else:
+            return implementation[0](*map(float, args), **options)
+        args = np.broadcast_arrays(*[np.asarray(arg, dtype=float) for arg in args])
+        shape = args[0].shape
+        size = args[0].size
+        if size <= _blockSize:
+            return kernel(*args, **options)
+
+        flat = [arg.ravel() for arg in args]
+        result = None
+        for start in range(0, size, _blockSize):
+            block = slice(start, start + _blockSize)
+            value = kernel(*[arg[block] for arg in flat], **options)
+            if result is None:
+                result = [np.empty(size, dtype=np.result_type(field)) for field in value] if isinstance(value, tuple) else np.empty(size, dtype=value.dtype)
+            if isinstance(value, tuple):
+                for field, fieldValue in zip(result, value):
+                    field[block] = fieldValue
+            else:
+                result[block] = value
+        if isinstance(value, tuple):
+            return type(value)(*[field.reshape(shape) for field in result])
+        return result.reshape(shape)
+
+    def scalar(function):
+        '''Registers function as the float implementation of the kernel'''
+        implementation[0] = function
+        return function
+    wrapper.scalar = scalar
+    return wrapper
+
+def masked(kernel):
+    '''blockwise for kernels that index with boolean masks and have no float implementation. Scalars are
+    evaluated as a one point array.'''
+    wrapper = blockwise(kernel)
+
+    @wrapper.scalar
+    def onePoint(*args, **options):
+        value = kernel(*[np.full(1, arg) for arg in args], **options)
+        if isinstance(value, tuple):
+            return type(value)(*[field[0] for field in value])
+        return value[0]
+    return wrapper
+
+def piecewise(pieces, *args, outOfRange=None):
+    '''Evaluates a function given piecewise, such as the subregions of a backward equation, on the arguments of a
+    blockwise kernel: floats, or arrays of one shape.
+
+    pieces is a sequence of (condition, evaluate) pairs in order of precedence, the branches of an if/elif chain.
+    A point takes the first piece for which condition(*args) holds and gets evaluate(*args), a condition of None
+    holds for every point. Conditions are only evaluated on the points no piece has taken yet and combine their
+    comparisons with & and |, so one table serves floats and arrays. Points that no piece takes raise
+    ArithmeticError(outOfRange).'''
+    if not isinstance(args[0], np.ndarray):
+        for condition, evaluate in pieces:
+            if condition is None or condition(*args):
+                return evaluate(*args)
+        raise ArithmeticError(outOfRange)
+
+    result = np.empty(args[0].shape)
+    remaining = np.ones(args[0].shape, dtype=bool)
+    for condition, evaluate in pieces:
+        if not remaining.any():
+            break
+        if condition is None:
+            taken = remaining
+        elif remaining.all():
+            taken = condition(*args)
+        else:
+            taken = np.zeros(remaining.shape, dtype=bool)
+            taken[remaining] = condition(*[arg[remaining] for arg in args])
+        if taken.any():
+            result[taken] = evaluate(*[arg[taken] for arg in args])
+            remaining = remaining & ~taken
+    if remaining.any():
+        raise ArithmeticError(outOfRange)
+    return result
@@ -2,10 +2,15 @@
 '''
 Module to calculate boundaries between regions
 '''
-import math
-
 import numpy as np
 
+try:
+    import Arrays
+    import Polynomials
+except ImportError:
+    from . import Arrays
+    from . import Polynomials
+
 def b23p_t(temperature):
     '''Release on the IAPWS Industrial Formulation 1997 for the Thermodynamic Properties of Water and Steam 1997
       Section 4 Auxiliary Equation for the Boundary between Regions 2 and 3 Eq 5, Page 5'''
@@ -14,23 +19,90 @@ def b23p_t(temperature):
 def b23t_p(pressure):
     '''Release on the IAPWS Industrial Formulation 1997 for the Thermodynamic Properties of Water and Steam 1997
         Section 4 Auxiliary Equation for the Boundary between Regions 2 and 3 Eq 6, Page 6'''
-    return 572.54459862746 + math.sqrt((pressure - 13.91883977887) / 1.0192970039326E-03)
+    return 572.54459862746 + np.sqrt((pressure - 13.91883977887) / 1.0192970039326E-03)
 
+# hB13(s), Chapter 4.5
+_hB13_s = Polynomials.Polynomial(
+    [0.913965547600543, -4.30944856041991E-05, 60.3235694765419, .17518273082168E-18, 0.220000904781292, -69.0815545851641],
+    ([0, 1, 1, 3, 5, 6],
+     [0, -2, 2, -12, -4, -3]))
+
+@Arrays.blockwise
 def hB13_s(entropy):
     ''''Supplementary Release on Backward Equations ( ) , p h s for Region 3, 'Chapter 4.5 page 23.'''
-    i = np.array([0, 1, 1, 3, 5, 6])
-    j = np.array([0, -2, 2, -12, -4, -3])
-    n = np.array([0.913965547600543, -4.30944856041991E-05, 60.3235694765419, .17518273082168E-18, 0.220000904781292, -69.0815545851641])
     sigma = entropy/3.8
-    eta = n*(sigma - 0.884)**i*(sigma - 0.864)**j
-    return sum(eta)*1700.0
+    return _hB13_s(sigma - 0.884, sigma - 0.864)*1700.0
+
+# TB23(h,s), Chapter 4.6
+_tB23_hs = Polynomials.Polynomial(
+    [6.2909626082981E-04, -8.23453502583165E-04, 5.15446951519474E-08, -1.17565945784945, 3.48519684726192, -5.07837382408313E-12, -2.84637670005479, -2.36092263939673, 6.01492324973779, 1.48039650824546, 3.60075182221907E-04, -1.26700045009952E-02, -1221843.32521413, 0.149276502463272, 0.698733471798484, -2.52207040114321E-02, 1.47151930985213E-02, -1.08618917681849, -9.36875039816322E-04, 81.9877897570217, -182.041861521835, 2.61907376402688E-06, -29162.6417025961, 1.40660774926165E-05, 7832370.62349385],
+    ([-12, -10, -8, -4, -3, -2, -2, -2, -2, 0, 1, 1, 1, 3, 3, 5, 6, 6, 8, 8, 8, 12, 12, 14, 14],
+     [10, 8, 3, 4, 3, -6, 2, 3, 4, 0, -3, -2, 10, -2, -1, -5, -6, -3, -8, -2, -1, -12, -1, -12, 1]))
 
+@Arrays.blockwise
 def tB23_hs(enthalpy, entropy):
     '''Supplementary Release on Backward Equations ( ) , p h s for Region 3, Chapter 4.6 page 25.'''
-    i = np.array([-12, -10, -8, -4, -3, -2, -2, -2, -2, 0, 1, 1, 1, 3, 3, 5, 6, 6, 8, 8, 8, 12, 12, 14, 14])
-    j = np.array([10, 8, 3, 4, 3, -6, 2, 3, 4, 0, -3, -2, 10, -2, -1, -5, -6, -3, -8, -2, -1, -12, -1, -12, 1])
-    n = np.array([6.2909626082981E-04, -8.23453502583165E-04, 5.15446951519474E-08, -1.17565945784945, 3.48519684726192, -5.07837382408313E-12, -2.84637670005479, -2.36092263939673, 6.01492324973779, 1.48039650824546, 3.60075182221907E-04, -1.26700045009952E-02, -1221843.32521413, 0.149276502463272, 0.698733471798484, -2.52207040114321E-02, 1.47151930985213E-02, -1.08618917681849, -9.36875039816322E-04, 81.9877897570217, -182.041861521835, 2.61907376402688E-06, -29162.6417025961, 1.40660774926165E-05, 7832370.62349385])
-    sigma = entropy/5.3
-    eta = enthalpy/3000.0
-    teta = n*(eta - 0.727)**i*(sigma - 0.864)**j
-    return sum(teta)*900.0
+    return _tB23_hs(enthalpy/3000.0 - 0.727, entropy/5.3 - 0.864)*900.0
+
+def t3ab_p(pressure):
+    '''Revised Supplementary Release on Backward Equations for Specific Volume as a Function of Pressure and Temperature v(p,T) for Region 3 of the IAPWS Industrial Formulation 1997 for the Thermodynamic Properties of Water and Steam 2016
+    Section 3.2 Boundary between Subregions 3a and 3b, Eq 2, Table 3'''
+    logPressure = np.log(pressure)
+    return 1547.93642129415 - 187.661219490113*logPressure + 21.3144632222113*logPressure**2 - 1918.87498864292/logPressure + 918.419702359447/logPressure**2
+
+def t3cd_p(pressure):
+    '''Revised Supplementary Release on Backward Equations for Specific Volume as a Function of Pressure and Temperature v(p,T) for Region 3 of the IAPWS Industrial Formulation 1997 for the Thermodynamic Properties of Water and Steam 2016
+    Section 3.2 Boundary between Subregions 3c and 3d, Eq 1, Table 3'''
+    return 585.276966696349 + 2.78233532206915*pressure - 1.27283549295878E-02*pressure**2 + 1.59090746562729E-04*pressure**3
+
+def t3ef_p(pressure):
+    '''Revised Supplementary Release on Backward Equations for Specific Volume as a Function of Pressure and Temperature v(p,T) for Region 3 of the IAPWS Industrial Formulation 1997 for the Thermodynamic Properties of Water and Steam 2016
+    Section 3.2 Boundary between Subregions 3e and 3f, Eq 3'''
+    return 3.727888004*(pressure - 22.064) + 647.096
+
+def t3gh_p(pressure):
+    '''Revised Supplementary Release on Backward Equations for Specific Volume as a Function of Pressure and Temperature v(p,T) for Region 3 of the IAPWS Industrial Formulation 1997 for the Thermodynamic Properties of Water and Steam 2016
+    Section 3.2 Boundary between Subregions 3g and 3h, Eq 1, Table 3'''
+    return -24928.4240900418 + 4281.43584791546*pressure - 269.02917314013*pressure**2 + 7.51608051114157*pressure**3 - 7.87105249910383E-02*pressure**4
+
+def t3ij_p(pressure):
+    '''Revised Supplementary Release on Backward Equations for Specific Volume as a Function of Pressure and Temperature v(p,T) for Region 3 of the IAPWS Industrial Formulation 1997 for the Thermodynamic Properties of Water and Steam 2016
+    Section 3.2 Boundary between Subregions 3i and 3j, Eq 1, Table 3'''
+    return 584.814781649163 - 0.616179320924617*pressure + 0.260763050899562*pressure**2 - 5.87071076864459E-03*pressure**3 + 5.15308185433082E-05*pressure**4
+
+def t3jk_p(pressure):
+    '''Revised Supplementary Release on Backward Equations for Specific Volume as a Function of Pressure and Temperature v(p,T) for Region 3 of the IAPWS Industrial Formulation 1997 for the Thermodynamic Properties of Water and Steam 2016
+    Section 3.2 Boundary between Subregions 3j and 3k, Eq 1, Table 3'''
+    return 617.229772068439 - 7.70600270141675*pressure + 0.697072596851896*pressure**2 - 1.57391839848015E-02*pressure**3 + 1.37897492684194E-04*pressure**4
+
+def t3mn_p(pressure):
+    '''Revised Supplementary Release on Backward Equations for Specific Volume as a Function of Pressure and Temperature v(p,T) for Region 3 of the IAPWS Industrial Formulation 1997 for the Thermodynamic Properties of Water and Steam 2016
+    Section 3.2 Boundary between Subregions 3m and 3n, Eq 1, Table 3'''
+    return 535.339483742384 + 7.61978122720128*pressure - 0.158365725441648*pressure**2 + 1.92871054508108E-03*pressure**3
+
+def t3op_p(pressure):
+    '''Revised Supplementary Release on Backward Equations for Specific Volume as a Function of Pressure and Temperature v(p,T) for Region 3 of the IAPWS Industrial Formulation 1997 for the Thermodynamic Properties of Water and Steam 2016
+    Section 3.2 Boundary between Subregions 3o and 3p, Eq 2, Table 3'''
+    logPressure = np.log(pressure)
+    return 969.461372400213 - 332.500170441278*logPressure + 64.2859598466067*logPressure**2 + 773.845935768222/logPressure - 1523.13732937084/logPressure**2
+
+def t3qu_p(pressure):
+    '''Revised Supplementary Release on Backward Equations for Specific Volume as a Function of Pressure and Temperature v(p,T) for Region 3 of the IAPWS Industrial Formulation 1997 for the Thermodynamic Properties of Water and Steam 2016
+    Section 3.2 Boundary between Subregions 3q and 3u, Eq 1, Table 3'''
+    return 565.603648239126 + 5.29062258221222*pressure - 0.102020639611016*pressure**2 + 1.22240301070145E-03*pressure**3
+
+def t3rx_p(pressure):
+    '''Revised Supplementary Release on Backward Equations for Specific Volume as a Function of Pressure and Temperature v(p,T) for Region 3 of the IAPWS Industrial Formulation 1997 for the Thermodynamic Properties of Water and Steam 2016
+    Section 3.2 Boundary between Subregions 3r and 3x, Eq 1, Table 3'''
+    return 584.561202520006 - 1.02961025163669*pressure + 0.243293362700452*pressure**2 - 2.94905044740799E-03*pressure**3
+
+def t3uv_p(pressure):
+    '''Revised Supplementary Release on Backward Equations for Specific Volume as a Function of Pressure and Temperature v(p,T) for Region 3 of the IAPWS Industrial Formulation 1997 for the Thermodynamic Properties of Water and Steam 2016
+    Section 4.2 Boundary between Subregions 3u and 3v, Eq 1, Table 11'''
+    return 528.199646263062 + 8.90579602135307*pressure - 0.222814134903755*pressure**2 + 2.86791682263697E-03*pressure**3
+
+def t3wx_p(pressure):
+    '''Revised Supplementary Release on Backward Equations for Specific Volume as a Function of Pressure and Temperature v(p,T) for Region 3 of the IAPWS Industrial Formulation 1997 for the Thermodynamic Properties of Water and Steam 2016
+    Section 4.2 Boundary between Subregions 3w and 3x, Eq 2, Table 11'''
+    logPressure = np.log(pressure)
+    return 7.2805260914538 + 97.3505869861952*logPressure + 14.7370491183191*logPressure**2 + 329.196213998375/logPressure + 873.371668682417/logPressure**2
@@ -2,8 +2,12 @@
 '''
 Conversion functions between SI and English units
 '''
+import functools
+import operator
+
 conversionFactors = { 'enthalpy': 2.326, #[btu/lb]/[kJ/kg]
                       'specific volume': 0.0624279606, #[ft**3/lb]/[m**3/kg]
+                      'density': 1.0/0.0624279606, #[lb/ft**3]/[kg/m**3]
                       'entropy': 1.0/0.238845896627, #[btu/(lb*degF)]/[kJ/(kg*K)]
                       'velocity': 0.3048, #[ft/m]
                       'thermal conductivity': 1.0/0.577789, #[btu/lb*ft*hr]/[W/m*K]
@@ -11,34 +15,102 @@ conversionFactors = { 'enthalpy': 2.326, #[btu/lb]/[kJ/kg]
                       'viscosity': 1.0/2419.088311 #[lb/ft*hr]/[Pa*s]
     }
 
-def toSIUnit(value, quantity, englishUnits=False):
+# Resolved plans by (quantity, englishUnits, toSI), the quantity as passed in
+_plans = {}
+
+def _resolve(quantity, englishUnits, toSI):
+    '''Steps of the conversion of quantity between the SI units of the equations (MPa, K, kJ/kg, ...) and
+    the SI (kPa, °C, kJ/kg, ...) or English units of the public functions'''
     quantity = quantity.lower()
     if quantity == 'pressure':
         if not englishUnits:
-            value /= 1000.0
-        else:
-            value *= 0.00689475729
-    elif quantity == 'temperature':
+            return ((operator.itruediv, 1000.0),) if toSI else ((operator.imul, 1000.0),)
+        return ((operator.imul, 0.00689475729),) if toSI else ((operator.itruediv, 0.00689475729),)
+    if quantity == 'temperature':
         if not englishUnits:
-            value +=  273.15
-        else:
-            value = (5.0/9.0)*(value - 32.0) + 273.15
-    else:
-        value *= conversionFactors[quantity]
+            return ((operator.iadd, 273.15),) if toSI else ((operator.isub, 273.15),)
+        if toSI:
+            return ((operator.isub, 32.0), (operator.imul, 5.0/9.0), (operator.iadd, 273.15))
+        return ((operator.isub, 273.15), (operator.imul, 9.0/5.0), (operator.iadd, 32.0))
+    factor = conversionFactors[quantity]
+    if not englishUnits:
+        return ()
+    return ((operator.imul, factor),) if toSI else ((operator.itruediv, factor),)
+
+def toSIPlan(quantity, englishUnits=False):
+    '''
+    Conversion of quantity from the SI or English units of the public functions to the SI units of the
+    equations, resolved once and cached. Only pressure and temperature differ between the two SI systems,
+    the plan of the other quantities in SI units is empty.
+
+    Args:
+        quantity (str): quantity to convert, a key of conversionFactors, pressure or temperature
+        englishUnits (bool): convert from English units
+
+    Returns:
+        tuple: steps for convert
+    '''
+    key = (quantity, englishUnits, True)
+    plan = _plans.get(key)
+    if plan is None:
+        plan = _plans[key] = _resolve(quantity, englishUnits, True)
+    return plan
+
+def fromSIPlan(quantity, englishUnits=False):
+    '''Conversion of quantity from the SI units of the equations to the units of the public functions, see toSIPlan'''
+    key = (quantity, englishUnits, False)
+    plan = _plans.get(key)
+    if plan is None:
+        plan = _plans[key] = _resolve(quantity, englishUnits, False)
+    return plan
+
+def convert(value, plan):
+    '''Applies a conversion plan to a float or a float numpy array, arrays are converted in place'''
+    for step, constant in plan:
+        value = step(value, constant)
     return value
 
+def _alwaysEnglishPlan(quantity, englishUnits, toSI):
+    '''Plan for toSIUnit and fromSIUnit, which convert quantities other than pressure and temperature from
+    English units whatever englishUnits says'''
+    key = (quantity, englishUnits, toSI, 'always English')
+    plan = _plans.get(key)
+    if plan is None:
+        lowered = quantity.lower()
+        plan = _plans[key] = _resolve(lowered, englishUnits or lowered not in ('pressure', 'temperature'), toSI)
+    return plan
+
+# Conversions of toSIUnit and fromSIUnit as functions of the value, by toSI, englishUnits and quantity
+_functions = {True: {False: {}, True: {}}, False: {False: {}, True: {}}}
+
+# Steps of a plan as functions of the value that leave arrays unchanged
+_steps = {operator.iadd: lambda constant: lambda value: value + constant,
+          operator.isub: lambda constant: lambda value: value - constant,
+          operator.imul: lambda constant: lambda value: value*constant,
+          operator.itruediv: lambda constant: lambda value: value/constant}
+
+def _compose(first, second):
+    return lambda value: second(first(value))
+
+def _function(quantity, englishUnits, toSI):
+    '''_alwaysEnglishPlan as one cached function, so converting a float costs a single call'''
+    englishUnits = bool(englishUnits)
+    steps = [_steps[step](constant) for step, constant in _alwaysEnglishPlan(quantity, englishUnits, toSI)]
+    function = functools.reduce(_compose, steps) if steps else (lambda value: value)
+    _functions[toSI][englishUnits][quantity] = function
+    return function
+
+_toSI = _functions[True]
+_fromSI = _functions[False]
+
+def toSIUnit(value, quantity, englishUnits=False):
+    try:
+        return _toSI[englishUnits][quantity](value)
+    except KeyError:
+        return _function(quantity, englishUnits, True)(value)
+
 def fromSIUnit(value, quantity, englishUnits=False):
-    quantity = quantity.lower()
-    if quantity == 'pressure':
-        if not englishUnits:
-            value *= 1000.0
-        else:
-            value /= 0.00689475729
-    elif quantity == 'temperature':
-        if not englishUnits:
-            value -=  273.15
-        else:
-            value = (value - 273.15)*(9.0/5.0) + 32.0
-    else:
-        value /= conversionFactors[quantity]
-    return value
\ No newline at end of file
+    try:
+        return _fromSI[englishUnits][quantity](value)
+    except KeyError:
+        return _function(quantity, englishUnits, False)(value)
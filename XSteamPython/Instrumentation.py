@@ -0,0 +1,188 @@
+# -*- coding: utf-8 -*-
+'''
+Call counts, latencies and region histograms of instrumented functions, and convergence telemetry of the
+iterative solvers
+'''
+import collections
+import heapq
+import itertools
+import threading
+import timeit
+
+import numpy as np
+
+try:
+    import Constants
+except ImportError:
+    from . import Constants
+
+class FunctionStatistics(object):
+    '''Statistics of one function. Percentiles are taken over the latencies of the last latencyWindow calls.
+
+    Array calls count once in calls and add their number of states to points. errors counts the calls that
+    returned Constants._errorValue and the states of array calls that came back as NaN. regions counts the
+    states by the region they resolved to, 0 for states out of range.'''
+
+    latencyWindow = 10000
+
+    def __init__(self):
+        self.calls = 0
+        self.points = 0
+        self.errors = 0
+        self.totalSeconds = 0.0
+        self.regions = collections.Counter()
+        self._latencies = collections.deque(maxlen=self.latencyWindow)
+
+    def record(self, seconds, points, errors, regions):
+        self.calls += 1
+        self.points += points
+        self.errors += errors
+        self.totalSeconds += seconds
+        self._latencies.append(seconds)
+        if regions is not None:
+            self.regions.update(regions)
+
+    def snapshot(self, percentiles=(50, 90, 99)):
+        latencies = np.array(self._latencies)
+        return {'calls': self.calls, 'points': self.points, 'errors': self.errors, 'totalSeconds': self.totalSeconds,
+                'meanSeconds': self.totalSeconds/self.calls if self.calls else 0.0,
+                'percentileSeconds': dict((percentile, float(np.percentile(latencies, percentile)) if latencies.size else 0.0) for percentile in percentiles),
+                'regions': dict((int(region), count) for region, count in self.regions.items())}
+
+class Recorder(object):
+    '''Wraps functions to record FunctionStatistics by name.
+
+    Only the outermost instrumented call of a thread is recorded, the public functions that are composed
+    of other public functions count once. The regions of a call are classified after its latency is taken.'''
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._statistics = {}
+
+    def wrap(self, name, function, classify=None):
+        '''Function recording its calls as name. classify(args, kwargs, value) returns the region numbers of
+        the states of a call as an iterable, or None.'''
+        local = self._local
+
+        def instrumented(*args, **kwargs):
+            if getattr(local, 'active', False):
+                return function(*args, **kwargs)
+            local.active = True
+            start = timeit.default_timer()
+            try:
+                value = function(*args, **kwargs)
+            finally:
+                seconds = timeit.default_timer() - start
+                local.active = False
+            self._record(name, seconds, args, kwargs, value, classify)
+            return value
+        instrumented.__name__ = getattr(function, '__name__', name)
+        instrumented.__doc__ = getattr(function, '__doc__', None)
+        instrumented.__wrapped__ = function
+        return instrumented
+
+    def _record(self, name, seconds, args, kwargs, value, classify):
+        result = value[0] if kwargs.get('returnMask') else value
+        if isinstance(result, np.ndarray):
+            points, errors = result.size, int(np.isnan(result).sum())
+        else:
+            points, errors = 1, int(result == Constants._errorValue)
+        regions = classify(args, kwargs, value) if classify is not None else None
+        with self._lock:
+            statistics = self._statistics.get(name)
+            if statistics is None:
+                statistics = self._statistics[name] = FunctionStatistics()
+            statistics.record(seconds, points, errors, regions)
+
+    def snapshot(self):
+        '''Statistics of every function called so far as a dict by function name'''
+        with self._lock:
+            return dict((name, statistics.snapshot()) for name, statistics in self._statistics.items())
+
+    def reset(self):
+        with self._lock:
+            self._statistics.clear()
+
+class SolverStatistics(object):
+    '''Convergence of one solver over the states it solved for.
+
+    iterations is a histogram of the iterations each state took, residuals a histogram of the final residuals
+    by decade (-3 counts residuals from 1e-3 to 1e-2, residualFloor counts zero residuals), in the units of the
+    equation the solver matches. failures keeps the inputs of the last failureWindow states that did not
+    converge and slowest the inputs of the slowestCount states that took the most iterations.'''
+
+    failureWindow = 100
+    slowestCount = 10
+    residualFloor = -20
+
+    def __init__(self):
+        self.calls = 0
+        self.points = 0
+        self.failures = 0
+        self.iterations = collections.Counter()
+        self.residuals = collections.Counter()
+        self._failures = collections.deque(maxlen=self.failureWindow)
+        self._slowest = []
+        self._order = itertools.count()
+
+    def record(self, iterations, residuals, converged, inputs):
+        names = sorted(inputs or {})
+        arrays = np.broadcast_arrays(np.asarray(iterations, dtype=int), np.abs(np.asarray(residuals, dtype=float)),
+                                     np.asarray(converged, dtype=bool), *[np.asarray(inputs[name], dtype=float) for name in names])
+        iterations, residuals, converged = [array.ravel() for array in arrays[:3]]
+        inputs = dict((name, array.ravel()) for name, array in zip(names, arrays[3:]))
+        self.calls += 1
+        self.points += iterations.size
+        self.failures += int(iterations.size - np.count_nonzero(converged))
+        self.iterations.update(dict(zip(*[values.tolist() for values in np.unique(iterations, return_counts=True)])))
+        finite = residuals[np.isfinite(residuals)]
+        with np.errstate(divide='ignore'):
+            decades = np.maximum(np.floor(np.log10(finite)), self.residualFloor).astype(int)
+        self.residuals.update(dict(zip(*[values.tolist() for values in np.unique(decades, return_counts=True)])))
+        state = lambda index: dict((name, float(value[index])) for name, value in inputs.items())
+        for index in np.flatnonzero(~converged):
+            self._failures.append(dict(state(index), iterations=int(iterations[index]), residual=float(residuals[index])))
+        # Only the states that can enter the slowest ones are looked at
+        threshold = self._slowest[0][0] if len(self._slowest) == self.slowestCount else -1
+        for index in np.flatnonzero(iterations > threshold):
+            entry = (int(iterations[index]), next(self._order), dict(state(index), iterations=int(iterations[index])))
+            if len(self._slowest) < self.slowestCount:
+                heapq.heappush(self._slowest, entry)
+            elif entry[0] > self._slowest[0][0]:
+                heapq.heapreplace(self._slowest, entry)
+
+    def snapshot(self):
+        return {'calls': self.calls, 'points': self.points, 'failures': self.failures,
+                'iterations': dict(self.iterations), 'residuals': dict(self.residuals),
+                'failedStates': list(self._failures),
+                'slowestStates': [state for iterations, order, state in sorted(self._slowest, key=lambda entry: (-entry[0], entry[1]))]}
+
+class SolverRecorder(object):
+    '''Records SolverStatistics by solver name while enabled. The solvers check enabled before they collect
+    their telemetry, so a disabled recorder costs one attribute lookup per solve.'''
+
+    def __init__(self):
+        self.enabled = False
+        self._lock = threading.Lock()
+        self._statistics = {}
+
+    def record(self, name, iterations, residuals, converged, inputs=None):
+        '''Records one solve of the states of inputs, a dict of the input values by name. iterations, residuals
+        and converged give the result of each state and broadcast against the inputs.'''
+        with self._lock:
+            statistics = self._statistics.get(name)
+            if statistics is None:
+                statistics = self._statistics[name] = SolverStatistics()
+            statistics.record(iterations, residuals, converged, inputs)
+
+    def snapshot(self):
+        '''Statistics of every solver used so far as a dict by solver name'''
+        with self._lock:
+            return dict((name, statistics.snapshot()) for name, statistics in self._statistics.items())
+
+    def reset(self):
+        with self._lock:
+            self._statistics.clear()
+
+solvers = SolverRecorder()
@@ -0,0 +1,144 @@
+# -*- coding: utf-8 -*-
+'''
+Evaluation plans for the polynomial sums of the IF97 equations
+'''
+import numpy as np
+
+def _falling(exponents, order):
+    '''exponents*(exponents - 1)*...*(exponents - order + 1), the factor that differentiating order times brings down'''
+    factor = np.ones(exponents.shape)
+    for step in range(order):
+        factor = factor*(exponents - step)
+    return factor
+
+class Polynomial(object):
+    '''Sum of n*x**i*y**j*... over the terms of one IF97 equation, with its derivatives.
+
+    The coefficients are stored once and compiled into a Python function that evaluates the sum in nested
+    Horner form: the terms are grouped by the exponent of the first variable, each group is a Horner sum in
+    the next variable, and the gaps between consecutive exponents are integer powers built by repeated
+    multiplication. The powers are computed once per call and shared by every requested derivative, so
+    gamma and its first and second derivatives cost one set of powers.
+
+    exponents holds one integer array per variable. derivatives gives the order of differentiation with
+    respect to each variable, (1, 0) for the first derivative in x. A list of such orders returns a tuple
+    with one sum per entry. The default evaluates the sum itself.
+
+    Arrays of any broadcastable shape are evaluated elementwise. A single point is evaluated with Python
+    floats, which avoids the per operation overhead of numpy for scalar calls. Float arguments give float
+    results.'''
+
+    def __init__(self, n, exponents, derivatives=None):
+        self._variables = len(exponents)
+        if derivatives is None:
+            derivatives = (0,)*self._variables
+        self._single = np.ndim(derivatives) == 1
+        if self._single:
+            derivatives = (derivatives,)
+        n = np.asarray(n, dtype=float)
+        exponents = [np.asarray(exponent) for exponent in exponents]
+        if any((exponent != np.round(exponent)).any() for exponent in exponents):
+            raise ValueError('Exponents need to be integers')
+        exponents = [np.round(exponent).astype(int) for exponent in exponents]
+
+        powers = {}
+        sums = []
+        for orders in derivatives:
+            coefficients = n.copy()
+            for exponent, order in zip(exponents, orders):
+                coefficients = coefficients*_falling(exponent, order)
+            keep = coefficients != 0.0
+            terms = sorted(zip(*[list(exponent[keep] - order) for exponent, order in zip(exponents, orders)] + [list(coefficients[keep])]))
+            sums.append(self._horner(terms, 0, powers))
+
+        arguments = ', '.join('x{}'.format(variable) for variable in range(self._variables))
+        lines = ['def evaluate({}):'.format(arguments)]
+        for variable in range(self._variables):
+            lines.extend(self._powerLines(variable, powers.get(variable, set())))
+        lines.append('    return ({},)'.format(', '.join(sums)))
+        namespace = {}
+        exec(compile('\n'.join(lines), '<Polynomial>', 'exec'), namespace)
+        self._evaluate = namespace['evaluate']
+        self.source = '\n'.join(lines)
+
+    @staticmethod
+    def _power(variable, exponent, powers):
+        '''Name of variable**exponent, registering the power to be computed'''
+        if exponent == 1:
+            return 'x{}'.format(variable)
+        powers.setdefault(variable, set()).add(exponent)
+        return 'x{}_{}{}'.format(variable, 'm' if exponent < 0 else '', abs(exponent))
+
+    def _horner(self, terms, variable, powers):
+        '''Nested Horner expression for terms sorted by exponent, each term is (exponents..., coefficient)'''
+        if variable == self._variables:
+            return repr(float(sum(term[-1] for term in terms)))
+        groups = []
+        for term in terms:
+            if groups and groups[-1][0] == term[variable]:
+                groups[-1][1].append(term)
+            else:
+                groups.append((term[variable], [term]))
+        if not groups:
+            return '0.0'
+        # Highest exponent first, every step multiplies by the gap to the next lower exponent
+        groups.reverse()
+        expression = self._horner(groups[0][1], variable + 1, powers)
+        for (exponent, group), (lowerExponent, lowerGroup) in zip(groups[:-1], groups[1:]):
+            expression = '({})*{} + {}'.format(expression, self._power(variable, exponent - lowerExponent, powers), self._horner(lowerGroup, variable + 1, powers))
+        lowest = groups[-1][0]
+        if lowest != 0:
+            expression = '({})*{}'.format(expression, self._power(variable, lowest, powers))
+        return expression
+
+    @staticmethod
+    def _powerLines(variable, exponents):
+        '''Statements computing the registered powers of one variable by repeated multiplication'''
+        lines = []
+        for sign, prefix in ((1, 'x{}_'.format(variable)), (-1, 'x{}_m'.format(variable))):
+            wanted = sorted(abs(exponent) for exponent in exponents if exponent*sign > 0)
+            if not wanted:
+                continue
+            names = {1: 'x{}'.format(variable)}
+            if sign < 0:
+                names[1] = prefix + '1'
+                lines.append('    {} = 1.0/x{}'.format(names[1], variable))
+
+            def build(exponent):
+                # x**k = x**(k//2)*x**(k - k//2), reusing the powers built before
+                if exponent not in names:
+                    half = exponent//2
+                    build(half)
+                    build(exponent - half)
+                    names[exponent] = prefix + str(exponent)
+                    lines.append('    {} = {}*{}'.format(names[exponent], names[half], names[exponent - half]))
+            for exponent in wanted:
+                build(exponent)
+        return lines
+
+    def __call__(self, *arguments):
+        for argument in arguments:
+            if not isinstance(argument, float):
+                break
+        else:
+            try:
+                values = self._evaluate(*map(float, arguments))
+                return values[0] if self._single else values
+            except (ZeroDivisionError, OverflowError):
+                pass
+        arguments = [np.asarray(argument, dtype=float) for argument in arguments]
+        if all(argument.size == 1 for argument in arguments):
+            shape = np.broadcast(*arguments).shape
+            try:
+                values = self._evaluate(*[float(argument.reshape(-1)[0]) for argument in arguments])
+            except (ZeroDivisionError, OverflowError):
+                values = None
+            if values is not None:
+                values = tuple(np.full(shape, value) for value in values)
+        else:
+            values = None
+        if values is None:
+            values = self._evaluate(*arguments)
+            shape = np.broadcast(*arguments).shape
+            values = tuple(value + np.zeros(shape) if np.shape(value) != shape else value for value in values)
+        return values[0] if self._single else values
@@ -0,0 +1,8 @@
+# -*- coding: utf-8 -*-
+'''
+Property bundle returned by the fused region evaluators
+'''
+import collections
+
+# SI units as used by the region functions: MPa, K, m**3/kg, kJ/kg, kJ/(kg K) and m/s
+StateProperties = collections.namedtuple('StateProperties', ['pressure', 'temperature', 'specificVolume', 'enthalpy', 'internalEnergy', 'entropy', 'cp', 'cv', 'speedOfSound'])
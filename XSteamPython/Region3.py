@@ -5,257 +5,618 @@ Region 3 functions
 import math
 
 import numpy as np
-import scipy
-from scipy import optimize
 
 try:
+    import Arrays
     import Boundaries
     import Constants
+    import Instrumentation
+    import Polynomials
+    import Properties
+    import Solvers
     import Region1
     import Region2
+    import Region4
 except ImportError:
+    from . import Arrays
     from . import Boundaries
     from . import Constants
+    from . import Instrumentation
+    from . import Polynomials
+    from . import Properties
+    from . import Solvers
     from . import Region1
     from . import Region2
+    from . import Region4
 
 i = np.array([0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 1, 2, 2, 2, 2, 2, 2, 3, 3, 3, 3, 3, 4, 4, 4, 4, 5, 5, 5, 6, 6, 6, 7, 8, 9, 9, 10, 10, 11])
 j = np.array([0, 0, 1, 2, 7, 10, 12, 23, 2, 6, 15, 17, 0, 2, 6, 7, 22, 26, 0, 2, 4, 16, 26, 0, 2, 4, 26, 1, 3, 26, 0, 2, 26, 2, 26, 2, 26, 0, 1, 26])
 n = np.array([1.0658070028513, -15.732845290239, 20.944396974307, -7.6867707878716, 2.6185947787954, -2.808078114862, 1.2053369696517, -8.4566812812502E-03, -1.2654315477714, -1.1524407806681, 0.88521043984318, -0.64207765181607, 0.38493460186671, -0.85214708824206, 4.8972281541877, -3.0502617256965, 0.039420536879154, 0.12558408424308, -0.2799932969871, 1.389979956946, -2.018991502357, -8.2147637173963E-03, -0.47596035734923, 0.0439840744735, -0.44476435428739, 0.90572070719733, 0.70522450087967, 0.10770512626332, -0.32913623258954, -0.50871062041158, -0.022175400873096, 0.094260751665092, 0.16436278447961, -0.013503372241348, -0.014834345352472, 5.7922953628084E-04, 3.2308904703711E-03, 8.0964802996215E-05, -1.6557679795037E-04, -4.4923899061815E-05])
 
+# Helmholtz free energy phi in delta and tau without the n[0]*log(delta) term, and its derivatives
+_phi = Polynomials.Polynomial(n, (i, j))
+_phi_delta = Polynomials.Polynomial(n, (i, j), (1, 0))
+_phi_tau = Polynomials.Polynomial(n, (i, j), (0, 1))
+_phi_tautau = Polynomials.Polynomial(n, (i, j), (0, 2))
+_phiDerivatives = Polynomials.Polynomial(n, (i, j), [(0, 0), (1, 0), (2, 0), (0, 1), (0, 2), (1, 1)])
+
+@Arrays.blockwise
 def p3_rhot(density, temperature):
     '''Release on the IAPWS Industrial Formulation 1997 for the Thermodynamic Properties of Water and Steam, September 1997
     '7 Basic Equation for Region 3, Section. 6.1 Basic Equation Table 30 and 31, Page 30 and 31'''
     delta = density/Constants._rhoc
-    tau = Constants._tc/temperature
-    fidelta = sum(n*i*delta**(i - 1.0)*tau**j) + n[0]/delta
+    fidelta = _phi_delta(delta, Constants._tc/temperature) + n[0]/delta
     return density*Constants._R*temperature*delta*fidelta/1000.0
 
+@Arrays.blockwise
 def u3_rhot(density, temperature):
     '''Release on the IAPWS Industrial Formulation 1997 for the Thermodynamic Properties of Water and Steam, September 1997
     7 Basic Equation for Region 3, Section. 6.1 Basic Equation Table 30 and 31, Page 30 and 31'''
     delta = density/Constants._rhoc
     tau = Constants._tc/temperature
-    fitau = sum(n*delta**i*j*tau**(j - 1))
+    fitau = _phi_tau(delta, tau)
     return Constants._R*temperature*tau*fitau
 
+@Arrays.blockwise
 def h3_rhot(density, temperature):
     '''Release on the IAPWS Industrial Formulation 1997 for the Thermodynamic Properties of Water and Steam, September 1997
     7 Basic Equation for Region 3, Section. 6.1 Basic Equation Table 30 and 31, Page 30 and 31'''
     delta = density/Constants._rhoc
     tau = Constants._tc/temperature
-    fidelta = sum(n*i*delta**(i - 1)*tau**j) + n[0]/delta
-    fitau = sum(n*delta**i*j*tau**(j - 1))
+    fidelta = _phi_delta(delta, tau) + n[0]/delta
+    fitau = _phi_tau(delta, tau)
     return Constants._R*temperature*(tau*fitau + delta*fidelta)
 
+@Arrays.blockwise
 def s3_rhot(density, temperature):
     '''Release on the IAPWS Industrial Formulation 1997 for the Thermodynamic Properties of Water and Steam, September 1997
     7 Basic Equation for Region 3, Section. 6.1 Basic Equation Table 30 and 31, Page 30 and 31'''
     delta = density/Constants._rhoc
     tau = Constants._tc/temperature
-    fi = sum(n*delta**i*tau**j) + n[0]*(math.log(delta) - 1.0)
-    fitau = sum(n*delta**i*j*tau**(j - 1))
+    fi = _phi(delta, tau) + n[0]*(np.log(delta) - 1.0)
+    fitau = _phi_tau(delta, tau)
     return Constants._R*(tau*fitau - fi)
 
+@Arrays.blockwise
 def cp3_rhot(density, temperature):
     '''Release on the IAPWS Industrial Formulation 1997 for the Thermodynamic Properties of Water and Steam, September 1997
     7 Basic Equation for Region 3, Section. 6.1 Basic Equation Table 30 and 31, Page 30 and 31 '''
     delta = density/Constants._rhoc
     tau = Constants._tc/temperature
-    fitautau = sum(n*delta**i*j*(j - 1)*tau**(j - 2))
-    fidelta = sum(n*i*delta**(i - 1)*tau**j) + n[0]/delta
-    fideltatau = sum(n*i*delta**(i - 1)*j*tau**(j - 1))
-    fideltadelta = sum(n*i*(i - 1)*delta**(i - 2)*tau**j) - n[0]/delta**2
+    fi, fidelta, fideltadelta, fitau, fitautau, fideltatau = _phiDerivatives(delta, tau)
+    fidelta = fidelta + n[0]/delta
+    fideltadelta = fideltadelta - n[0]/delta**2
     return Constants._R*(-(tau**2*fitautau) + (delta*fidelta - delta*tau*fideltatau)**2 / (2.0*delta*fidelta + delta**2*fideltadelta))
 
+@Arrays.blockwise
 def cv3_rhot(density, temperature):
     ''' Release on the IAPWS Industrial Formulation 1997 for the Thermodynamic Properties of Water and Steam, September 1997
     7 Basic Equation for Region 3, Section. 6.1 Basic Equation Table 30 and 31, Page 30 and 31'''
     delta = density/Constants._rhoc
     tau = Constants._tc/temperature
-    fitautau = sum(n*delta**i*j*(j -1)*tau**(j - 2))
+    fitautau = _phi_tautau(delta, tau)
     return -Constants._R*tau**2*fitautau
 
+@Arrays.blockwise
 def w3_rhot(density, temperature):
     ''' Release on the IAPWS Industrial Formulation 1997 for the Thermodynamic Properties of Water and Steam, September 1997
     7 Basic Equation for Region 3, Section. 6.1 Basic Equation Table 30 and 31, Page 30 and 31'''
     delta = density/Constants._rhoc
     tau = Constants._tc/temperature
-    fitautau = sum(n*delta**i*j*(j - 1)*tau**(j - 2))
-    fidelta = sum(n*i*delta**(i - 1)*tau**j) + n[0]/delta
-    fideltatau = sum(n*i*delta**(i - 1)*j*tau**(j - 1))
-    fideltadelta = sum(n*i*(i - 1)*delta**(i - 2)*tau**j) - n[0]/delta**2
-    return math.sqrt(1000.0*Constants._R*temperature*(2.0*delta*fidelta + delta**2*fideltadelta - (delta*fidelta - delta*tau*fideltatau)**2 / (tau**2 * fitautau)))
+    fi, fidelta, fideltadelta, fitau, fitautau, fideltatau = _phiDerivatives(delta, tau)
+    fidelta = fidelta + n[0]/delta
+    fideltadelta = fideltadelta - n[0]/delta**2
+    return np.sqrt(1000.0*Constants._R*temperature*(2.0*delta*fidelta + delta**2*fideltadelta - (delta*fidelta - delta*tau*fideltatau)**2 / (tau**2 * fitautau)))
+
+@Arrays.blockwise
+def properties3_rhot(density, temperature):
+    '''Release on the IAPWS Industrial Formulation 1997 for the Thermodynamic Properties of Water and Steam, September 1997
+    7 Basic Equation for Region 3, Section. 6.1 Basic Equation Table 30, 31 and 32, Page 30 to 32
+    Evaluates phi and all of its first and second derivatives once per (rho, T) and returns every property, including the pressure,
+    as a Properties.StateProperties bundle.'''
+    delta = density/Constants._rhoc
+    tau = Constants._tc/temperature
+    fi, fidelta, fideltadelta, fitau, fitautau, fideltatau = _phiDerivatives(delta, tau)
+    fi = fi + n[0]*(np.log(delta) - 1.0)
+    fidelta = fidelta + n[0]/delta
+    fideltadelta = fideltadelta - n[0]/delta**2
+
+    pressure = density*Constants._R*temperature*delta*fidelta/1000.0
+    enthalpy = Constants._R*temperature*(tau*fitau + delta*fidelta)
+    internalEnergy = Constants._R*temperature*tau*fitau
+    entropy = Constants._R*(tau*fitau - fi)
+    a = (delta*fidelta - delta*tau*fideltatau)**2
+    b = 2.0*delta*fidelta + delta**2*fideltadelta
+    cp = Constants._R*(-(tau**2*fitautau) + a/b)
+    cv = -Constants._R*tau**2*fitautau
+    speedOfSound = np.sqrt(1000.0*Constants._R*temperature*(b - a/(tau**2*fitautau)))
+    return Properties.StateProperties(pressure, np.copy(temperature)[()], 1.0/density, enthalpy, internalEnergy, entropy, cp, cv, speedOfSound)
 
+# Subregion 3a T(p,h), Eq 2, Table 3
+_t3_phA = Polynomials.Polynomial(
+    [-1.33645667811215E-07, 4.55912656802978E-06, -1.46294640700979E-05, 6.3934131297008E-03, 372.783927268847, -7186.54377460447, 573494.7521034, -2675693.29111439, -3.34066283302614E-05, -2.45479214069597E-02, 47.8087847764996, 7.64664131818904E-06, 1.28350627676972E-03, 1.71219081377331E-02, -8.51007304583213, -1.36513461629781E-02, -3.84460997596657E-06, 3.37423807911655E-03, -0.551624873066791, 0.72920227710747, -9.92522757376041E-03, -0.119308831407288, 0.793929190615421, 0.454270731799386, 0.20999859125991, -6.42109823904738E-03, -0.023515586860454, 2.52233108341612E-03, -7.64885133368119E-03, 1.36176427574291E-02, -1.33027883575669E-02],
+    ([-12, -12, -12, -12, -12, -12, -12, -12, -10, -10, -10, -8, -8, -8, -8, -5, -3, -2, -2, -2, -1, -1, 0, 0, 1, 3, 3, 4, 4, 10, 12],
+     [0, 1, 2, 6, 14, 16, 20, 22, 1, 5, 12, 0, 2, 4, 10, 2, 0, 1, 3, 4, 0, 2, 0, 1, 1, 0, 1, 0, 3, 4, 5]))
+
+# Subregion 3b T(p,h), Eq 3, Table 4
+_t3_phB = Polynomials.Polynomial(
+    [3.2325457364492E-05, -1.27575556587181E-04, -4.75851877356068E-04, 1.56183014181602E-03, 0.105724860113781, -85.8514221132534, 724.140095480911, 2.96475810273257E-03, -5.92721983365988E-03, -1.26305422818666E-02, -0.115716196364853, 84.9000969739595, -1.08602260086615E-02, 1.54304475328851E-02, 7.50455441524466E-02, 2.52520973612982E-02, -6.02507901232996E-02, -3.07622221350501, -5.74011959864879E-02, 5.03471360939849, -0.925081888584834, 3.91733882917546, -77.314600713019, 9493.08762098587, -1410437.19679409, 8491662.30819026, 0.861095729446704, 0.32334644281172, 0.873281936020439, -0.436653048526683, 0.286596714529479, -0.131778331276228, 6.76682064330275E-03],
+    ([-12, -12, -10, -10, -10, -10, -10, -8, -8, -8, -8, -8, -6, -6, -6, -4, -4, -3, -2, -2, -1, -1, -1, -1, -1, -1, 0, 0, 1, 3, 5, 6, 8],
+     [0, 1, 0, 1, 5, 10, 12, 0, 1, 2, 4, 10, 0, 1, 2, 0, 1, 5, 0, 4, 2, 4, 6, 10, 14, 16, 0, 2, 1, 1, 1, 1, 1]))
+
+def _subregion3a_ph(pressure, enthalpy):
+    '''States of subregion 3a, below the boundary enthalpy of subregions 3a and 3b, Eq 1 Page 5'''
+    return enthalpy < 2014.64004206875 + 3.74696550136983*pressure - 2.19921901054187E-02*pressure**2 + 8.7513168600995E-05*pressure**3
+
+# Subregions of t3_ph in order of precedence, a condition on (p, h) and the backward equation
+_t3_phSubregions = (
+    # Subregion 3a Eq 2, Table 3, Page 7
+    (_subregion3a_ph, lambda p, h: 760.0*_t3_phA(p/100.0 + 0.24, h/2300.0 - 0.615)),
+    # Subregion 3b Eq3, Table 4, Page 7,8
+    (None, lambda p, h: 860.0*_t3_phB(p/100.0 + 0.298, h/2800.0 - 0.72)))
+
+@Arrays.blockwise
 def t3_ph(pressure, enthalpy):
     '''Revised Supplementary Release on Backward Equations for the Functions T(p,h), v(p,h) and T(p,s), v(p,s) for Region 3 of the IAPWS Industrial Formulation 1997 for the Thermodynamic Properties of Water and Steam 2004
     Section 3.3 Backward Equations T(p,h) and v(p,h) for Subregions 3a and 3b Boundary equation, Eq 1 Page 5'''
-    h3ab = 2014.64004206875 + 3.74696550136983*pressure - 2.19921901054187E-02*pressure**2 + 8.7513168600995E-05*pressure**3
-
-    if enthalpy < h3ab:
-        ## Subregion 3a Eq 2, Table 3, Page 7
-        i = np.array([-12, -12, -12, -12, -12, -12, -12, -12, -10, -10, -10, -8, -8, -8, -8, -5, -3, -2, -2, -2, -1, -1, 0, 0, 1, 3, 3, 4, 4, 10, 12])
-        j = np.array([0, 1, 2, 6, 14, 16, 20, 22, 1, 5, 12, 0, 2, 4, 10, 2, 0, 1, 3, 4, 0, 2, 0, 1, 1, 0, 1, 0, 3, 4, 5])
-        n = np.array([-1.33645667811215E-07, 4.55912656802978E-06, -1.46294640700979E-05, 6.3934131297008E-03, 372.783927268847, -7186.54377460447, 573494.7521034, -2675693.29111439, -3.34066283302614E-05, -2.45479214069597E-02, 47.8087847764996, 7.64664131818904E-06, 1.28350627676972E-03, 1.71219081377331E-02, -8.51007304583213, -1.36513461629781E-02, -3.84460997596657E-06, 3.37423807911655E-03, -0.551624873066791, 0.72920227710747, -9.92522757376041E-03, -0.119308831407288, 0.793929190615421, 0.454270731799386, 0.20999859125991, -6.42109823904738E-03, -0.023515586860454, 2.52233108341612E-03, -7.64885133368119E-03, 1.36176427574291E-02, -1.33027883575669E-02])
-
-        ps = pressure/100.0
-        hs = enthalpy/2300.0
-        Ts = n*(ps + 0.24)**i*(hs - 0.615)**j
-        return 760.0*Ts.sum()
-    else:
-        ## Subregion 3b Eq3, Table 4, Page 7,8
-        i = np.array([-12, -12, -10, -10, -10, -10, -10, -8, -8, -8, -8, -8, -6, -6, -6, -4, -4, -3, -2, -2, -1, -1, -1, -1, -1, -1, 0, 0, 1, 3, 5, 6, 8])
-        j = np.array([0, 1, 0, 1, 5, 10, 12, 0, 1, 2, 4, 10, 0, 1, 2, 0, 1, 5, 0, 4, 2, 4, 6, 10, 14, 16, 0, 2, 1, 1, 1, 1, 1])
-        n = np.array([3.2325457364492E-05, -1.27575556587181E-04, -4.75851877356068E-04, 1.56183014181602E-03, 0.105724860113781, -85.8514221132534, 724.140095480911, 2.96475810273257E-03, -5.92721983365988E-03, -1.26305422818666E-02, -0.115716196364853, 84.9000969739595, -1.08602260086615E-02, 1.54304475328851E-02, 7.50455441524466E-02, 2.52520973612982E-02, -6.02507901232996E-02, -3.07622221350501, -5.74011959864879E-02, 5.03471360939849, -0.925081888584834, 3.91733882917546, -77.314600713019, 9493.08762098587, -1410437.19679409, 8491662.30819026, 0.861095729446704, 0.32334644281172, 0.873281936020439, -0.436653048526683, 0.286596714529479, -0.131778331276228, 6.76682064330275E-03])
+    return Arrays.piecewise(_t3_phSubregions, pressure, enthalpy)
+
+# Subregion 3a v(p,h), Eq 4, Table 6
+_v3_phA = Polynomials.Polynomial(
+    [5.29944062966028E-03, -0.170099690234461, 11.1323814312927, -2178.98123145125, -5.06061827980875E-04, 0.556495239685324, -9.43672726094016, -0.297856807561527, 93.9353943717186, 1.92944939465981E-02, 0.421740664704763, -3689141.2628233, -7.37566847600639E-03, -0.354753242424366, -1.99768169338727, 1.15456297059049, 5683.6687581596, 8.08169540124668E-03, 0.172416341519307, 1.04270175292927, -0.297691372792847, 0.560394465163593, 0.275234661176914, -0.148347894866012, -6.51142513478515E-02, -2.92468715386302, 6.64876096952665E-02, 3.52335014263844, -1.46340792313332E-02, -2.24503486668184, 1.10533464706142, -4.08757344495612E-02],
+    ([-12, -12, -12, -12, -10, -10, -10, -8, -8, -6, -6, -6, -4, -4, -3, -2, -2, -1, -1, -1, -1, 0, 0, 1, 1, 1, 2, 2, 3, 4, 5, 8],
+     [6, 8, 12, 18, 4, 7, 10, 5, 12, 3, 4, 22, 2, 3, 7, 3, 16, 0, 1, 2, 3, 0, 1, 0, 1, 2, 0, 2, 0, 2, 2, 2]))
 
-        ps = pressure/100.0
-        hs = enthalpy/2800.0
-        Ts = n*(ps + 0.298)**i*(hs - 0.72)**j
-        return 860.0*Ts.sum()
+# Subregion 3b v(p,h), Eq 5, Table 7
+_v3_phB = Polynomials.Polynomial(
+    [-2.25196934336318E-09, 1.40674363313486E-08, 2.3378408528056E-06, -3.31833715229001E-05, 1.07956778514318E-03, -0.271382067378863, 1.07202262490333, -0.853821329075382, -2.15214194340526E-05, 7.6965608822273E-04, -4.31136580433864E-03, 0.453342167309331, -0.507749535873652, -100.475154528389, -0.219201924648793, -3.21087965668917, 607.567815637771, 5.57686450685932E-04, 0.18749904002955, 9.05368030448107E-03, 0.285417173048685, 3.29924030996098E-02, 0.239897419685483, 4.82754995951394, -11.8035753702231, 0.169490044091791, -1.79967222507787E-02, 3.71810116332674E-02, -5.36288335065096E-02, 1.6069710109252],
+    ([-12, -12, -8, -8, -8, -8, -8, -8, -6, -6, -6, -6, -6, -6, -4, -4, -4, -3, -3, -2, -2, -1, -1, -1, -1, 0, 1, 1, 2, 2],
+     [0, 1, 0, 1, 3, 6, 7, 8, 0, 1, 2, 5, 6, 10, 3, 6, 10, 0, 2, 1, 2, 0, 1, 4, 5, 0, 0, 1, 2, 6]))
 
+# Subregions of v3_ph in order of precedence, a condition on (p, h) and the backward equation
+_v3_phSubregions = (
+    # Subregion 3a Eq 4, Table 6, Page 9
+    (_subregion3a_ph, lambda p, h: _v3_phA(p/100.0 + 0.128, h/2100.0 - 0.727)*0.0028),
+    # Subregion 3b Eq 5, Table 7, Page 9
+    (None, lambda p, h: _v3_phB(p/100.0 + 0.0661, h/2800.0 - 0.72)*0.0088))
+
+@Arrays.blockwise
 def v3_ph(pressure, enthalpy):
     '''Revised Supplementary Release on Backward Equations for the Functions T(p,h), v(p,h) and T(p,s), v(p,s) for Region 3 of the IAPWS Industrial Formulation 1997 for the Thermodynamic Properties of Water and Steam 2004
     Section 3.3 Backward Equations T(p,h) and v(p,h) for Subregions 3a and 3b Boundary equation, Eq 1 Page 5'''
-    specificVolume = 0.0
-    enthalpyBoundary = 2014.64004206875 + 3.74696550136983*pressure - 2.19921901054187E-02 *pressure**2 + 8.7513168600995E-05*pressure**3
-
-    if enthalpy < enthalpyBoundary:
-        # Subregion 3a Eq 4, Table 6, Page 9
-        i = np.array([-12, -12, -12, -12, -10, -10, -10, -8, -8, -6, -6, -6, -4, -4, -3, -2, -2, -1, -1, -1, -1, 0, 0, 1, 1, 1, 2, 2, 3, 4, 5, 8])
-        j = np.array([6, 8, 12, 18, 4, 7, 10, 5, 12, 3, 4, 22, 2, 3, 7, 3, 16, 0, 1, 2, 3, 0, 1, 0, 1, 2, 0, 2, 0, 2, 2, 2])
-        n = np.array([5.29944062966028E-03, -0.170099690234461, 11.1323814312927, -2178.98123145125, -5.06061827980875E-04, 0.556495239685324, -9.43672726094016, -0.297856807561527, 93.9353943717186, 1.92944939465981E-02, 0.421740664704763, -3689141.2628233, -7.37566847600639E-03, -0.354753242424366, -1.99768169338727, 1.15456297059049, 5683.6687581596, 8.08169540124668E-03, 0.172416341519307, 1.04270175292927, -0.297691372792847, 0.560394465163593, 0.275234661176914, -0.148347894866012, -6.51142513478515E-02, -2.92468715386302, 6.64876096952665E-02, 3.52335014263844, -1.46340792313332E-02, -2.24503486668184, 1.10533464706142, -4.08757344495612E-02])
-        ps = pressure/100.0
-        hs = enthalpy/2100.0
-        vs = sum(n*(ps + 0.128)**i*(hs - 0.727)**j)
-        specificVolume = vs*0.0028
-    else:
-        # Subregion 3b Eq 5, Table 7, Page 9
-        i = np.array([-12, -12, -8, -8, -8, -8, -8, -8, -6, -6, -6, -6, -6, -6, -4, -4, -4, -3, -3, -2, -2, -1, -1, -1, -1, 0, 1, 1, 2, 2])
-        j = np.array([0, 1, 0, 1, 3, 6, 7, 8, 0, 1, 2, 5, 6, 10, 3, 6, 10, 0, 2, 1, 2, 0, 1, 4, 5, 0, 0, 1, 2, 6])
-        n = np.array([-2.25196934336318E-09, 1.40674363313486E-08, 2.3378408528056E-06, -3.31833715229001E-05, 1.07956778514318E-03, -0.271382067378863, 1.07202262490333, -0.853821329075382, -2.15214194340526E-05, 7.6965608822273E-04, -4.31136580433864E-03, 0.453342167309331, -0.507749535873652, -100.475154528389, -0.219201924648793, -3.21087965668917, 607.567815637771, 5.57686450685932E-04, 0.18749904002955, 9.05368030448107E-03, 0.285417173048685, 3.29924030996098E-02, 0.239897419685483, 4.82754995951394, -11.8035753702231, 0.169490044091791, -1.79967222507787E-02, 3.71810116332674E-02, -5.36288335065096E-02, 1.6069710109252])
-        ps = pressure/100.0
-        hs = enthalpy/2800.0
-        vs = sum(n*(ps + 0.0661)**i*(hs - 0.72)**j)
-        specificVolume = vs*0.0088
+    return Arrays.piecewise(_v3_phSubregions, pressure, enthalpy)
 
-    return specificVolume
+# Subregion 3a T(p,s), Eq 6, Table 10
+_t3_psA = Polynomials.Polynomial(
+    [1500420082.63875, -159397258480.424, 5.02181140217975E-04, -67.2057767855466, 1450.58545404456, -8238.8953488889, -0.154852214233853, 11.2305046746695, -29.7000213482822, 43856513263.5495, 1.37837838635464E-03, -2.97478527157462, 9717779473494.13, -5.71527767052398E-05, 28830.794977842, -74442828926270.3, 12.8017324848921, -368.275545889071, 6.64768904779177E+15, 0.044935925195888, -4.22897836099655, -0.240614376434179, -4.74341365254924, 0.72409399912611, 0.923874349695897, 3.99043655281015, 3.84066651868009E-02, -3.59344365571848E-03, -0.735196448821653, 0.188367048396131, 1.41064266818704E-04, -2.57418501496337E-03, 1.23220024851555E-03],
+    ([-12, -12, -10, -10, -10, -10, -8, -8, -8, -8, -6, -6, -6, -5, -5, -5, -4, -4, -4, -2, -2, -1, -1, 0, 0, 0, 1, 2, 2, 3, 8, 8, 10],
+     [28, 32, 4, 10, 12, 14, 5, 7, 8, 28, 2, 6, 32, 0, 14, 32, 6, 10, 36, 1, 4, 1, 6, 0, 1, 4, 0, 0, 3, 2, 0, 1, 2]))
+
+# Subregion 3b T(p,s), Eq 7, Table 11
+_t3_psB = Polynomials.Polynomial(
+    [0.52711170160166, -40.1317830052742, 153.020073134484, -2247.99398218827, -0.193993484669048, -1.40467557893768, 42.6799878114024, 0.752810643416743, 22.6657238616417, -622.873556909932, -0.660823667935396, 0.841267087271658, -25.3717501764397, 485.708963532948, 880.531517490555, 2650155.92794626, -0.359287150025783, -656.991567673753, 2.41768149185367, 0.856873461222588, 0.655143675313458, -0.213535213206406, 5.62974957606348E-03, -316955725450471, -6.99997000152457E-04, 1.19845803210767E-02, 1.93848122022095E-05, -2.15095749182309E-05],
+    ([-12, -12, -12, -12, -8, -8, -8, -6, -6, -6, -5, -5, -5, -5, -5, -4, -3, -3, -2, 0, 2, 3, 4, 5, 6, 8, 12, 14],
+     [1, 3, 4, 7, 0, 1, 3, 0, 2, 4, 0, 1, 2, 4, 6, 12, 1, 6, 2, 0, 1, 1, 0, 24, 0, 3, 1, 2]))
 
+def _subregion3a_s(first, entropy):
+    '''States of subregion 3a, up to the critical entropy that bounds subregions 3a and 3b, given (p, s) or (h, s)'''
+    return entropy <= 4.41202148223476
+
+# Subregions of t3_ps in order of precedence, a condition on (p, s) and the backward equation
+_t3_psSubregions = (
+    # Subregion 3a Eq 6, Table 10, Page 11
+    (_subregion3a_s, lambda p, s: _t3_psA(p/100.0 + 0.24, s/4.4 - 0.703)*760.0),
+    # Subregion 3b Eq 7, Table 11, Page 11
+    (None, lambda p, s: _t3_psB(p/100.0 + 0.76, s/5.3 - 0.818)*860.0))
+
+@Arrays.blockwise
 def t3_ps(pressure, entropy):
     '''Revised Supplementary Release on Backward Equations for the Functions T(p,h), v(p,h) and T(p,s), v(p,s) for Region 3 of the IAPWS Industrial Formulation 1997 for the Thermodynamic Properties of Water and Steam 2004
     3.4 Backward Equations T(p,s) and v(p,s) for Subregions 3a and 3b Boundary equation, Eq 6 Page 11'''
-    entropyBoundary = 4.41202148223476
-    temperature = 0.0
-    if entropy <= entropyBoundary:
-        # Subregion 3a Eq 6, Table 10, Page 11
-        i = np.array([-12, -12, -10, -10, -10, -10, -8, -8, -8, -8, -6, -6, -6, -5, -5, -5, -4, -4, -4, -2, -2, -1, -1, 0, 0, 0, 1, 2, 2, 3, 8, 8, 10])
-        j = np.array([28, 32, 4, 10, 12, 14, 5, 7, 8, 28, 2, 6, 32, 0, 14, 32, 6, 10, 36, 1, 4, 1, 6, 0, 1, 4, 0, 0, 3, 2, 0, 1, 2])
-        n = np.array([1500420082.63875, -159397258480.424, 5.02181140217975E-04, -67.2057767855466, 1450.58545404456, -8238.8953488889, -0.154852214233853, 11.2305046746695, -29.7000213482822, 43856513263.5495, 1.37837838635464E-03, -2.97478527157462, 9717779473494.13, -5.71527767052398E-05, 28830.794977842, -74442828926270.3, 12.8017324848921, -368.275545889071, 6.64768904779177E+15, 0.044935925195888, -4.22897836099655, -0.240614376434179, -4.74341365254924, 0.72409399912611, 0.923874349695897, 3.99043655281015, 3.84066651868009E-02, -3.59344365571848E-03, -0.735196448821653, 0.188367048396131, 1.41064266818704E-04, -2.57418501496337E-03, 1.23220024851555E-03])
-        sigma = entropy/4.4
-        ps = pressure/100.0
-        teta = sum(n*(ps + 0.24)**i*(sigma - 0.703)**j)
-        temperature = teta*760.0
-    else:
-        # Subregion 3b Eq 7, Table 11, Page 11
-        i = np.array([-12, -12, -12, -12, -8, -8, -8, -6, -6, -6, -5, -5, -5, -5, -5, -4, -3, -3, -2, 0, 2, 3, 4, 5, 6, 8, 12, 14])
-        j = np.array([1, 3, 4, 7, 0, 1, 3, 0, 2, 4, 0, 1, 2, 4, 6, 12, 1, 6, 2, 0, 1, 1, 0, 24, 0, 3, 1, 2])
-        n = np.array([0.52711170160166, -40.1317830052742, 153.020073134484, -2247.99398218827, -0.193993484669048, -1.40467557893768, 42.6799878114024, 0.752810643416743, 22.6657238616417, -622.873556909932, -0.660823667935396, 0.841267087271658, -25.3717501764397, 485.708963532948, 880.531517490555, 2650155.92794626, -0.359287150025783, -656.991567673753, 2.41768149185367, 0.856873461222588, 0.655143675313458, -0.213535213206406, 5.62974957606348E-03, -316955725450471, -6.99997000152457E-04, 1.19845803210767E-02, 1.93848122022095E-05, -2.15095749182309E-05])
-        sigma = entropy/5.3
-        ps = pressure/100.0
-        teta = sum(n*(ps + 0.76)**i*(sigma - 0.818)**j)
-        temperature = teta*860.0
+    return Arrays.piecewise(_t3_psSubregions, pressure, entropy)
 
-    return temperature
+# Subregion 3a v(p,s), Eq 8, Table 13
+_v3_psA = Polynomials.Polynomial(
+    [79.5544074093975, -2382.6124298459, 17681.3100617787, -1.10524727080379E-03, -15.3213833655326, 297.544599376982, -35031520.6871242, 0.277513761062119, -0.523964271036888, -148011.182995403, 1600148.99374266, 1708023226634.27, 2.46866996006494E-04, 1.6532608479798, -0.118008384666987, 2.537986423559, 0.965127704669424, -28.2172420532826, 0.203224612353823, 1.10648186063513, 0.52612794845128, 0.277000018736321, 1.08153340501132, -7.44127885357893E-02, 1.64094443541384E-02, -6.80468275301065E-02, 0.025798857610164, -1.45749861944416E-04],
+    ([-12, -12, -12, -10, -10, -10, -10, -8, -8, -8, -8, -6, -5, -4, -3, -3, -2, -2, -1, -1, 0, 0, 0, 1, 2, 4, 5, 6],
+     [10, 12, 14, 4, 8, 10, 20, 5, 6, 14, 16, 28, 1, 5, 2, 4, 3, 8, 1, 2, 0, 1, 3, 0, 0, 2, 2, 0]))
 
+# Subregion 3b v(p,s), Eq 9, Table 14
+_v3_psB = Polynomials.Polynomial(
+    [5.91599780322238E-05, -1.85465997137856E-03, 1.04190510480013E-02, 5.9864730203859E-03, -0.771391189901699, 1.72549765557036, -4.67076079846526E-04, 1.34533823384439E-02, -8.08094336805495E-02, 0.508139374365767, 1.28584643361683E-03, -1.63899353915435, 5.86938199318063, -2.92466667918613, -6.14076301499537E-03, 5.76199014049172, -12.1613320606788, 1.67637540957944, -7.44135838773463, 3.78168091437659E-02, 4.01432203027688, 16.0279837479185, 3.17848779347728, -3.58362310304853, -1159952.60446827, 0.199256573577909, -0.122270624794624, -19.1449143716586, -1.50448002905284E-02, 14.6407900162154, -3.2747778718823],
+    ([-12, -12, -12, -12, -12, -12, -10, -10, -10, -10, -8, -5, -5, -5, -4, -4, -4, -4, -3, -2, -2, -2, -2, -2, -2, 0, 0, 0, 1, 1, 2],
+     [0, 1, 2, 3, 5, 6, 0, 1, 2, 4, 0, 1, 2, 3, 0, 1, 2, 3, 1, 0, 1, 2, 3, 4, 12, 0, 1, 2, 0, 2, 2]))
+
+# Subregions of v3_ps in order of precedence, a condition on (p, s) and the backward equation
+_v3_psSubregions = (
+    # Subregion 3a Eq 8, Table 13, Page 14
+    (_subregion3a_s, lambda p, s: _v3_psA(p/100.0 + 0.187, s/4.4 - 0.755)*0.0028),
+    # Subregion 3b Eq 9, Table 14, Page 14
+    (None, lambda p, s: _v3_psB(p/100.0 + 0.298, s/5.3 - 0.816)*0.0088))
+
+@Arrays.blockwise
 def v3_ps(pressure, entropy):
     '''Revised Supplementary Release on Backward Equations for the Functions T(p,h), v(p,h) and T(p,s), v(p,s) for Region 3 of the IAPWS Industrial Formulation 1997 for the Thermodynamic Properties of Water and Steam 2004
     3.4 Backward Equations T(p,s) and v(p,s) for Subregions 3a and 3b Boundary equation, Eq 6 Page 11'''
-    entropyBoundary = 4.41202148223476
-    specificVolume = 0.0
-    if entropy <= entropyBoundary:
-        # Subregion 3a Eq 8, Table 13, Page 14
-        i = np.array([-12, -12, -12, -10, -10, -10, -10, -8, -8, -8, -8, -6, -5, -4, -3, -3, -2, -2, -1, -1, 0, 0, 0, 1, 2, 4, 5, 6])
-        j = np.array([10, 12, 14, 4, 8, 10, 20, 5, 6, 14, 16, 28, 1, 5, 2, 4, 3, 8, 1, 2, 0, 1, 3, 0, 0, 2, 2, 0])
-        n = np.array([79.5544074093975, -2382.6124298459, 17681.3100617787, -1.10524727080379E-03, -15.3213833655326, 297.544599376982, -35031520.6871242, 0.277513761062119, -0.523964271036888, -148011.182995403, 1600148.99374266, 1708023226634.27, 2.46866996006494E-04, 1.6532608479798, -0.118008384666987, 2.537986423559, 0.965127704669424, -28.2172420532826, 0.203224612353823, 1.10648186063513, 0.52612794845128, 0.277000018736321, 1.08153340501132, -7.44127885357893E-02, 1.64094443541384E-02, -6.80468275301065E-02, 0.025798857610164, -1.45749861944416E-04])
-        ps = pressure/100.0
-        sigma = entropy/4.4
-        omega = sum(n*(ps + 0.187)**i*(sigma - 0.755)**j)
-        specificVolume = omega*0.0028
-    else:
-        # Subregion 3b Eq 9, Table 14, Page 14
-        i = np.array([-12, -12, -12, -12, -12, -12, -10, -10, -10, -10, -8, -5, -5, -5, -4, -4, -4, -4, -3, -2, -2, -2, -2, -2, -2, 0, 0, 0, 1, 1, 2])
-        j = np.array([0, 1, 2, 3, 5, 6, 0, 1, 2, 4, 0, 1, 2, 3, 0, 1, 2, 3, 1, 0, 1, 2, 3, 4, 12, 0, 1, 2, 0, 2, 2])
-        n = np.array([5.91599780322238E-05, -1.85465997137856E-03, 1.04190510480013E-02, 5.9864730203859E-03, -0.771391189901699, 1.72549765557036, -4.67076079846526E-04, 1.34533823384439E-02, -8.08094336805495E-02, 0.508139374365767, 1.28584643361683E-03, -1.63899353915435, 5.86938199318063, -2.92466667918613, -6.14076301499537E-03, 5.76199014049172, -12.1613320606788, 1.67637540957944, -7.44135838773463, 3.78168091437659E-02, 4.01432203027688, 16.0279837479185, 3.17848779347728, -3.58362310304853, -1159952.60446827, 0.199256573577909, -0.122270624794624, -19.1449143716586, -1.50448002905284E-02, 14.6407900162154, -3.2747778718823])
-        ps = pressure/100.0
-        sigma = entropy/5.3
-        omega = sum(n*(ps + 0.298)**i*(sigma - 0.816)**j)
-        specificVolume = omega*0.0088
+    return Arrays.piecewise(_v3_psSubregions, pressure, entropy)
 
-    return specificVolume
+# Subregion 3a p(h,s), Eq 1, Table 3
+_p3_hsA = Polynomials.Polynomial(
+    [7.70889828326934, -26.0835009128688, 267.416218930389, 17.2221089496844, -293.54233214597, 614.135601882478, -61056.2757725674, -65127225.1118219, 73591.9313521937, -11664650591.4191, 35.5267086434461, -596.144543825955, -475.842430145708, 69.6781965359503, 335.674250377312, 25052.6809130882, 146997.380630766, 5.38069315091534E+19, 1.43619827291346E+21, 3.64985866165994E+19, -2547.41561156775, 2.40120197096563E+27, -3.93847464679496E+29, 1.47073407024852E+24, -4.26391250432059E+31, 1.94509340621077E+38, 6.66212132114896E+23, 7.06777016552858E+33, 1.75563621975576E+41, 1.08408607429124E+28, 7.30872705175151E+43, 1.5914584739887E+24, 3.77121605943324E+40],
+    ([0, 0, 0, 1, 1, 1, 1, 1, 2, 2, 3, 3, 3, 4, 4, 4, 4, 5, 6, 7, 8, 10, 10, 14, 18, 20, 22, 22, 24, 28, 28, 32, 32],
+     [0, 1, 5, 0, 3, 4, 8, 14, 6, 16, 0, 2, 3, 0, 1, 4, 5, 28, 28, 24, 1, 32, 36, 22, 28, 36, 16, 28, 36, 16, 36, 10, 28]))
+
+# Subregion 3b p(h,s), Eq 2, Table 4
+_p3_hsB = Polynomials.Polynomial(
+    [1.25244360717979E-13, -1.26599322553713E-02, 5.06878030140626, 31.7847171154202, -391041.161399932, -9.75733406392044E-11, -18.6312419488279, 510.973543414101, 373847.005822362, 2.99804024666572E-08, 20.0544393820342, -4.98030487662829E-06, -10.230180636003, 55.2819126990325, -206.211367510878, -7940.12232324823, 7.82248472028153, -58.6544326902468, 3550.73647696481, -1.15303107290162E-04, -1.75092403171802, 257.98168774816, -727.048374179467, 1.21644822609198E-04, 3.93137871762692E-02, 7.04181005909296E-03, -82.910820069811, -0.26517881813125, 13.7531682453991, -52.2394090753046, 2405.56298941048, -22736.1631268929, 89074.6343932567, -23923456.5822486, 5687958081.29714],
+    ([-12, -12, -12, -12, -12, -10, -10, -10, -10, -8, -8, -6, -6, -6, -6, -5, -4, -4, -4, -3, -3, -3, -3, -2, -2, -1, 0, 2, 2, 5, 6, 8, 10, 14, 14],
+     [2, 10, 12, 14, 20, 2, 10, 14, 18, 2, 8, 2, 6, 7, 8, 10, 4, 5, 8, 1, 3, 5, 6, 0, 1, 0, 3, 0, 1, 0, 1, 1, 1, 3, 7]))
+
+# Subregions of p3_hs in order of precedence, a condition on (h, s) and the backward equation
+_p3_hsSubregions = (
+    # Subregion 3a Eq 1, Table 3, Page 8
+    (_subregion3a_s, lambda h, s: _p3_hsA(h/2300.0 - 1.01, s/4.4 - 0.75)*99.0),
+    # Subregion 3b Eq 2, Table 4, Page 8
+    (None, lambda h, s: 16.6/_p3_hsB(h/2800.0 - 0.681, s/5.3 - 0.792)))
 
+@Arrays.blockwise
 def p3_hs(enthalpy, entropy):
     '''Supplementary Release on Backward Equations ( ) , p h s for Region 3, Equations as a Function of h and s for the Region Boundaries, and an Equation( ) sat , T hs for Region 4 of the IAPWS Industrial Formulation 1997 for the Thermodynamic Properties of Water and Steam 2004
     Section 3 Backward Functions p(h,s), T(h,s), and v(h,s) for Region 3'''
-    entropyBoundary = 4.41202148223476
-    pressure = 0.0
-    if entropy <= entropyBoundary:
-        # Subregion 3a Eq 1, Table 3, Page 8
-        i = np.array([0, 0, 0, 1, 1, 1, 1, 1, 2, 2, 3, 3, 3, 4, 4, 4, 4, 5, 6, 7, 8, 10, 10, 14, 18, 20, 22, 22, 24, 28, 28, 32, 32])
-        j = np.array([0, 1, 5, 0, 3, 4, 8, 14, 6, 16, 0, 2, 3, 0, 1, 4, 5, 28, 28, 24, 1, 32, 36, 22, 28, 36, 16, 28, 36, 16, 36, 10, 28])
-        n = np.array([7.70889828326934, -26.0835009128688, 267.416218930389, 17.2221089496844, -293.54233214597, 614.135601882478, -61056.2757725674, -65127225.1118219, 73591.9313521937, -11664650591.4191, 35.5267086434461, -596.144543825955, -475.842430145708, 69.6781965359503, 335.674250377312, 25052.6809130882, 146997.380630766, 5.38069315091534E+19, 1.43619827291346E+21, 3.64985866165994E+19, -2547.41561156775, 2.40120197096563E+27, -3.93847464679496E+29, 1.47073407024852E+24, -4.26391250432059E+31, 1.94509340621077E+38, 6.66212132114896E+23, 7.06777016552858E+33, 1.75563621975576E+41, 1.08408607429124E+28, 7.30872705175151E+43, 1.5914584739887E+24, 3.77121605943324E+40])
-        sigma = entropy/4.4
-        eta = enthalpy/2300.0
-        ps = sum(n*(eta - 1.01)**i*(sigma - 0.75)**j)
-        pressure = ps*99.0
+    return Arrays.piecewise(_p3_hsSubregions, enthalpy, entropy)
+
+# Backward equations v(p,T) for the subregions 3a to 3z, keyed by subregion letter:
+# v*, p*, T*, a, b, c, d, e, then the exponents I, J and the coefficients n of Eq 4 (Eq 5 for subregion 3n)
+_subregionsVpt = {
+    'a': (0.0024, 100.0, 760.0, 0.085, 0.817, 1.0, 1.0, 1.0,
+          np.array([-12, -12, -12, -10, -10, -10, -8, -8, -8, -6, -5, -5, -5, -4, -3, -3, -3, -3, -2, -2, -2, -1, -1, -1, 0, 0, 1, 1, 2, 2]),
+          np.array([5, 10, 12, 5, 10, 12, 5, 8, 10, 1, 1, 5, 10, 8, 0, 1, 3, 6, 0, 2, 3, 0, 1, 2, 0, 1, 0, 2, 0, 2]),
+          np.array([0.00110879558823853, 572.616740810616, -76705.1948380852, -0.0253321069529674, 6280.08049345689, 234105.654131876, 0.216867826045856, -156.237904341963, -26989.3956176613, -0.000180407100085505, 0.00116732227668261, 26.698704085604, 28277.6617243286, -2424.31520029523, 0.000435217323022733, -0.0122494831387441, 1.79357604019989, 44.2729521058314, -0.00593223489018342, 0.453186261685774, 1.3582570312914, 0.0408748415856745, 0.474686397863312, 1.18646814997915, 0.546987265727549, 0.195266770452643, -0.0502268790869663, -0.369645308193377, 0.0063382803752842, 0.0797441793901017])),
+    'b': (0.0041, 100.0, 860.0, 0.28, 0.779, 1.0, 1.0, 1.0,
+          np.array([-12, -12, -10, -10, -8, -6, -6, -6, -5, -5, -5, -4, -4, -4, -3, -3, -3, -3, -3, -2, -2, -2, -1, -1, 0, 0, 1, 1, 2, 3, 4, 4]),
+          np.array([10, 12, 8, 14, 8, 5, 6, 8, 5, 8, 10, 2, 4, 5, 0, 1, 2, 3, 5, 0, 2, 5, 0, 2, 0, 1, 0, 2, 0, 2, 0, 1]),
+          np.array([-0.0827670470003621, 41.6887126010565, 0.0483651982197059, -29103.2084950276, -111.422582236948, -0.0202300083904014, 294.002509338515, 140.244997609658, -344.384158811459, 361.182452612149, -1406.99677420738, -0.00202023902676481, 171.346792457471, -4.25597804058632, 6.91346085000334e-06, 0.00151140509678925, -0.0416375290166236, -41.3754957011042, -50.6673295721637, -0.000572212965569023, 6.08817368401785, 23.9600660256161, 0.0122261479925384, 2.16356057692938, 0.398198903368642, -0.116892827834085, -0.102845919373532, -0.492676637589284, 0.065554045640679, -0.24046253507853, -0.0269798180310075, 0.128369435967012])),
+    'c': (0.0022, 40.0, 690.0, 0.259, 0.903, 1.0, 1.0, 1.0,
+          np.array([-12, -12, -12, -10, -10, -10, -8, -8, -8, -6, -5, -5, -5, -4, -4, -3, -3, -2, -2, -2, -1, -1, -1, 0, 0, 0, 1, 1, 2, 2, 2, 2, 3, 3, 8]),
+          np.array([6, 8, 10, 6, 8, 10, 5, 6, 7, 8, 1, 4, 7, 2, 8, 0, 3, 0, 4, 5, 0, 1, 2, 0, 1, 2, 0, 2, 0, 1, 3, 7, 0, 7, 1]),
+          np.array([3.1196778876303, 27671.3458847564, 32258310.3403269, -342.416065095363, -899732.529907377, -79389204.9821251, 95.3193003217388, 2297.84742345072, 175336.675322499, 7912143.65222792, 3.19933345844209e-05, -65.9508863555767, -833426.563212851, 0.0645734680583292, -3820310.20570813, 4.06398848470079e-05, 31.0327498492008, -0.000892996718483724, 234.604891591616, 3775.15668966951, 0.0158646812591361, 0.707906336241843, 12.601622514657, 0.736143655772152, 0.676544268999101, -17.8100588189137, -0.156531975531713, 11.7707430048158, 0.0840143653860447, -0.186442467471949, -44.0170203949645, 1232904.23502494, -0.0240650039730845, -1070777.16660869, 0.0438319858566475])),
+    'd': (0.0029, 40.0, 690.0, 0.559, 0.939, 1.0, 1.0, 4.0,
+          np.array([-12, -12, -12, -12, -12, -12, -10, -10, -10, -10, -10, -10, -10, -8, -8, -8, -8, -6, -6, -5, -5, -5, -5, -4, -4, -4, -3, -3, -2, -2, -1, -1, -1, 0, 0, 1, 1, 3]),
+          np.array([4, 6, 7, 10, 12, 16, 0, 2, 4, 6, 8, 10, 14, 3, 7, 8, 10, 6, 8, 1, 2, 5, 7, 0, 1, 7, 2, 4, 0, 1, 0, 1, 5, 0, 2, 0, 6, 0]),
+          np.array([-4.52484847171645e-10, 3.15210389538801e-05, -0.00214991352047545, 508.058874808345, -12712303.6845932, 1153711331204.97, -1.97805728776273e-16, 2.41554806033972e-11, -1.56481703640525e-06, 0.00277211346836625, -20.3578994462286, 1443694.89909053, -41125421794.6539, 6.23449786243773e-06, -22.1774281146038, -68931.5087933158, -19541952.5060713, 3163.73510564015, 2240407.54426988, -4.36701347922356e-06, -0.000404213852833996, -348.153203414663, -385294.213555289, 1.35203700099403e-07, 0.000134648383271089, 125031.835351736, 0.0968123678455841, 225.660517512438, -0.000190102435341872, -0.0299628410819229, 0.00500833915372121, 0.387842482998411, -1385.35367777182, 0.870745245971773, 1.71946252068742, -0.0326650121426383, 4980.44171727877, 0.00551478022765087])),
+    'e': (0.0032, 40.0, 710.0, 0.587, 0.918, 1.0, 1.0, 1.0,
+          np.array([-12, -12, -10, -10, -10, -10, -10, -8, -8, -8, -6, -5, -4, -4, -3, -3, -3, -2, -2, -2, -2, -1, 0, 0, 1, 1, 1, 2, 2]),
+          np.array([14, 16, 3, 6, 10, 14, 16, 7, 8, 10, 6, 6, 2, 4, 2, 6, 7, 0, 1, 3, 4, 0, 0, 1, 0, 4, 6, 0, 2]),
+          np.array([715815808.404721, -114328360753.449, 3.7653100201572e-12, -9.03983668691157e-05, 665695.908836252, 5353641749.60127, 79497740233.5603, 92.2230563421437, -142586.073991215, -1117963.81424162, 8961.2162964076, -6699.89239070491, 0.00451242538486834, -33.9731325977713, -1.20523111552278, 47599.2667717124, -266627.750390341, -0.000153314954386524, 0.305638404828265, 123.654999499486, -1043.90794213011, -0.0157496516174308, 0.685331118940253, 1.78373462873903, -0.54467412487891, 2045.29931318843, -22834.2359328752, 0.413197481515899, -34.1931835910405])),
+    'f': (0.0064, 40.0, 730.0, 0.587, 0.891, 0.5, 1.0, 4.0,
+          np.array([0, 0, 0, 0, 0, 0, 1, 1, 1, 1, 2, 2, 3, 3, 3, 4, 5, 5, 6, 7, 7, 10, 12, 12, 12, 14, 14, 14, 14, 14, 16, 16, 18, 18, 20, 20, 20, 22, 24, 24, 28, 32]),
+          np.array([-3, -2, -1, 0, 1, 2, -1, 1, 2, 3, 0, 1, -5, -2, 0, -3, -8, 1, -6, -4, 1, -6, -10, -8, -4, -12, -10, -8, -6, -4, -10, -8, -12, -10, -12, -10, -6, -12, -12, -4, -12, -12]),
+          np.array([-2.51756547792325e-08, 6.01307193668763e-06, -0.00100615977450049, 0.999969140252192, 2.14107759236486, -16.5175571959086, -0.00141987303638727, 2.69251915156554, 34.9741815858722, -30.0208695771783, -1.31546288252539, -8.39091277286169, 1.81545608337015e-10, -0.000591099206478909, 1.52115067087106, 2.52956470663225e-05, 1.00726265203786e-15, -1.4977453386065, -7.93940970562969e-10, -0.000150290891264717, 1.51205531275133, 4.70942606221652e-06, 1.95049710391712e-13, -9.11627886266077e-09, 0.000604374640201265, -2.25132933900136e-16, 6.10916973582981e-12, -3.03063908043404e-07, -1.37796070798409e-05, -0.000919296736666106, 6.39288223132545e-10, 7.53259479898699e-07, -4.00321478682929e-13, 7.56140294351614e-09, -9.12082054034891e-12, -2.37612381140539e-08, 2.69586010591874e-05, -7.32828135157839e-11, 2.4199557830666e-10, -0.000405735532730322, 1.89424143498011e-10, -4.86632965074563e-10])),
+    'g': (0.0027, 25.0, 660.0, 0.872, 0.971, 1.0, 1.0, 4.0,
+          np.array([-12, -12, -12, -12, -12, -12, -10, -10, -10, -8, -8, -8, -8, -6, -6, -5, -5, -4, -3, -2, -2, -2, -2, -1, -1, -1, 0, 0, 0, 1, 1, 1, 3, 5, 6, 8, 10, 10]),
+          np.array([7, 12, 14, 18, 22, 24, 14, 20, 24, 7, 8, 10, 12, 8, 22, 7, 20, 22, 7, 3, 5, 14, 24, 2, 8, 18, 0, 1, 2, 0, 1, 3, 24, 22, 12, 3, 0, 6]),
+          np.array([4.12209020652996e-05, -1149872.38280587, 9481808850.3208, -1.95788865718971e+17, 4.962507048713e+24, -1.05549884548496e+28, -758642165988.278, -9.22172769596101e+22, 7.25379072059348e+29, -61.7718249205859, 10755.5033344858, -37954580.2336487, 228646846221.831, -4997410.93010619, -2.80214310054101e+30, 1049154.06769586, 6.13754229168619e+27, 8.02056715528378e+31, -29861781.9828065, -91.0782540134681, 135033.227281565, -7.12949383408211e+18, -1.04578785289542e+36, 30.4331584444093, 5932507979.59445, -3.64174062110798e+27, 0.921791403532461, -0.337693609657471, -72.4644143758508, -0.110480239272601, 5.36516031875059, -2914.41872156205, 6.16338176535305e+39, -1.2088917586118e+38, 8.18396024524612e+22, 940781944.835829, -36727.9669545448, -8375139317986550.0])),
+    'h': (0.0032, 25.0, 660.0, 0.898, 0.983, 1.0, 1.0, 4.0,
+          np.array([-12, -12, -10, -10, -10, -10, -10, -10, -8, -8, -8, -8, -8, -6, -6, -6, -5, -5, -5, -4, -4, -3, -3, -2, -1, -1, 0, 1, 1]),
+          np.array([8, 12, 4, 6, 8, 10, 14, 16, 0, 1, 6, 7, 8, 4, 6, 8, 2, 3, 4, 2, 4, 1, 2, 0, 0, 2, 0, 0, 2]),
+          np.array([0.0561379678887577, 7741354215.87083, 1.11482975877938e-09, -0.00143987128208183, 1936.9655876492, -605971823.585005, 17195156812433.7, -1.85461154985145e+16, 3.8785116807801e-17, -3.95464327846105e-14, -170.875935679023, -2120.1062070122, 17768333.7348191, 11.0177443629575, -234396.091693313, -6561744.21999594, 1.56362212977396e-05, -2.129462570214, 13.5249306374858, 0.177189164145813, 1394.99167345464, -0.00703670932036388, -0.152011044389648, 9.81916922991113e-05, 0.00147199658618076, 20.2618487025578, 0.89934551894424, -0.211346402240858, 24.9971752957491])),
+    'i': (0.0041, 25.0, 660.0, 0.91, 0.984, 0.5, 1.0, 4.0,
+          np.array([0, 0, 0, 1, 1, 1, 1, 2, 3, 3, 4, 4, 4, 5, 5, 5, 7, 7, 8, 8, 10, 12, 12, 12, 14, 14, 14, 14, 18, 18, 18, 18, 18, 20, 20, 22, 24, 24, 32, 32, 36, 36]),
+          np.array([0, 1, 10, -4, -2, -1, 0, 0, -5, 0, -3, -2, -1, -6, -1, 12, -4, -3, -6, 10, -8, -12, -6, -4, -10, -8, -4, 5, -12, -10, -8, -6, 2, -12, -10, -12, -12, -8, -10, -5, -10, -8]),
+          np.array([1.06905684359136, -1.48620857922333, 259862256980408.0, -4.46352055678749e-12, -5.66620757170032e-07, -0.00235302885736849, -0.269226321968839, 9.22024992944392, 3.57633505503772e-12, -17.3942565562222, 7.00681785556229e-06, -0.000267050351075768, -2.31779669675624, -7.53533046979752e-13, 4.81337131452891, -2.23286270422356e+21, -1.18746004987383e-05, 0.00646412934136496, -4.10588536330937e-10, 4.22739537057241e+19, 3.13698180473812e-13, 1.6439533434504e-24, -3.39823323754373e-06, -0.0135268639905021, -7.23252514211625e-15, 1.84386437538366e-09, -0.0463959533752385, -99226310037675.0, 6.88169154439335e-17, -2.22620998452197e-11, -5.40843018624083e-08, 0.00345570606200257, 42227580030.4086, -1.26974478770487e-15, 9.27237985153679e-10, 6.12670812016489e-14, -7.22693924063497e-12, -0.000383669502636822, 0.000374684572410204, -93197.6897511086, -0.0247690616026922, 65.8110546759474])),
+    'j': (0.0054, 25.0, 670.0, 0.875, 0.964, 0.5, 1.0, 4.0,
+          np.array([0, 0, 0, 1, 1, 1, 2, 2, 3, 4, 4, 5, 5, 5, 6, 10, 12, 12, 14, 14, 14, 16, 18, 20, 20, 24, 24, 28, 28]),
+          np.array([-1, 0, 1, -2, -1, 1, -1, 1, -2, -2, 2, -3, -2, 0, 3, -6, -8, -3, -10, -8, -5, -10, -12, -12, -10, -12, -6, -12, -5]),
+          np.array([-0.00011137131739554, 1.00342892423685, 5.30615581928979, 1.79058760078792e-06, -0.000728541958464774, -18.7576133371704, 0.00199060874071849, 24.357475537729, -0.000177040785499444, -0.0025968038522713, -198.704578406823, 7.38627790224287e-05, -0.00236264692844138, -1.61023121314333, 6223.22971786473, -9.60754116701669e-09, -5.10572269720488e-11, 0.00767373781404211, 6.63855469485254e-15, -7.17590735526745e-10, 1.46564542926508e-05, 3.09029474277013e-12, -4.64216300971708e-16, -3.90499637961161e-14, -2.36716126781431e-10, 4.54652854268717e-12, -0.00422271787482497, 2.83911742354706e-11, 2.70929002720228])),
+    'k': (0.0077, 25.0, 680.0, 0.802, 0.935, 1.0, 1.0, 1.0,
+          np.array([-2, -2, -1, -1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 1, 1, 2, 2, 2, 2, 2, 2, 5, 5, 5, 6, 6, 6, 6, 8, 10, 12]),
+          np.array([10, 12, -5, 6, -12, -6, -2, -1, 0, 1, 2, 3, 14, -3, -2, 0, 1, 2, -8, -6, -3, -2, 0, 4, -12, -6, -3, -12, -10, -8, -5, -12, -12, -10]),
+          np.array([-401215699.576099, 48450147831.8406, 3.94721471363678e-15, 37262.9967374147, -3.69794374168666e-30, -3.80436407012452e-15, 4.75361629970233e-07, -0.000879148916140706, 0.844317863844331, 12.24331626566, -104.529634830279, 589.702771277429, -29102685116444.4, 1.7034307284185e-06, -0.000277617606975748, -3.44709605486686, 22.1333862447095, -194.646110037079, 8.08354639772825e-16, -1.8084520914547e-11, -6.96664158132412e-06, -0.00181057560300994, 2.55830298579027, 3289.13873658481, -1.73270241249904e-19, -6.61876792558034e-07, -0.0039568892342125, 6.04203299819132e-18, -4.00879935920517e-14, 1.60751107464958e-09, 3.83719409025556e-05, -6.49565446702457e-15, -1.49095328506e-12, 5.41449377329581e-09])),
+    'l': (0.0026, 24.0, 650.0, 0.908, 0.989, 1.0, 1.0, 4.0,
+          np.array([-12, -12, -12, -12, -12, -10, -10, -8, -8, -8, -8, -8, -8, -8, -6, -5, -5, -4, -4, -3, -3, -3, -3, -2, -2, -2, -1, -1, -1, 0, 0, 0, 0, 1, 1, 2, 4, 5, 5, 6, 10, 10, 14]),
+          np.array([14, 16, 18, 20, 22, 14, 24, 6, 10, 12, 14, 18, 24, 36, 8, 4, 5, 7, 16, 1, 3, 18, 20, 2, 3, 10, 0, 1, 3, 0, 1, 2, 12, 0, 16, 1, 0, 0, 1, 14, 4, 12, 10]),
+          np.array([2607020586.47537, -188277213604704.0, 5.54923870289667e+18, -7.58966946387758e+22, 4.13865186848908e+26, -815038000738.06, -3.81458260489955e+32, -0.0123239564600519, 22609563.1437174, -495017809506.72, 5294829964228630.0, -4.44359478746295e+22, 5.21635864527315e+34, -4.87095672740742e+54, -714430.209937547, 0.127868634615495, -10.0752127917598, 7774514.3796099, -1.08105480796471e+24, -3.57578581169659e-06, -2.12857169423484, 2.70706111085238e+29, -6.95953622348829e+32, 0.11060902747228, 72.1559163361354, -306367307532219.0, 2.6583961888553e-05, 0.0253392392889754, -214.443041836579, 0.937846601489667, 2.231840431017, 33.8401222509191, 4.94237237179718e+20, -0.198068404154428, -1.4141534988114e+30, -99.3862421613651, 125.070534142731, -996.473529004439, 47313.7909872765, 1.16662121219322e+32, -3158749762715330.0, -4.45703369196945e+32, 6.42794932373694e+32])),
+    'm': (0.0028, 23.0, 650.0, 1.0, 0.997, 1.0, 0.25, 1.0,
+          np.array([0, 3, 8, 20, 1, 3, 4, 5, 1, 6, 2, 4, 14, 2, 5, 3, 0, 1, 1, 1, 28, 2, 16, 0, 5, 0, 3, 4, 12, 16, 1, 8, 14, 0, 2, 3, 4, 8, 14, 24]),
+          np.array([0, 0, 0, 2, 5, 5, 5, 5, 6, 6, 7, 8, 8, 10, 10, 12, 14, 14, 18, 20, 20, 22, 22, 24, 24, 28, 28, 28, 28, 28, 32, 32, 32, 36, 36, 36, 36, 36, 36, 36]),
+          np.array([0.811384363481847, -5681.99310990094, -17865719817.2556, 7.95537657613427e+31, -81456.8209346872, -65977456.7602874, -15286114865.9302, -560165667510.446, 458384.828593949, -38575400038384.8, 45373580.0004273, 939454935735.563, 2.66572856432938e+27, -5475783138.99097, 200725701112386.0, 1850072455632.39, 185135446.828337, -170451090076.385, 157890366037614.0, -2025305097487740.0, 3.6819392618357e+59, 1.70215539458936e+17, 6.39234909918741e+41, -821698160721956.0, -7.95260241872306e+23, 2.3341586947851e+17, -6.00079934586803e+22, 5.94584382273384e+24, 1.89461279349492e+39, -8.10093428842645e+45, 1.88813911076809e+21, 1.11052244098768e+35, 2.91133958602503e+45, -3.2942192395146e+21, -1.37570282536696e+25, 1.81508996303902e+27, -3.46865122768353e+29, -2.1196114877426e+37, -1.28617899887675e+48, 4.79817895699239e+64])),
+    'n': (0.0031, 23.0, 650.0, 0.976, 0.997, 1.0, 1.0, 1.0,
+          np.array([0, 3, 4, 6, 7, 10, 12, 14, 18, 0, 3, 5, 6, 8, 12, 0, 3, 7, 12, 2, 3, 4, 2, 4, 7, 4, 3, 5, 6, 0, 0, 3, 1, 0, 1, 0, 1, 0, 1]),
+          np.array([-12, -12, -12, -12, -12, -12, -12, -12, -12, -10, -10, -10, -10, -10, -10, -8, -8, -8, -8, -6, -6, -6, -5, -5, -5, -4, -3, -3, -3, -2, -1, -1, 0, 1, 1, 2, 4, 5, 6]),
+          np.array([2.80967799943151e-39, 6.14869006573609e-31, 5.82238667048942e-28, 3.90628369238462e-23, 8.21445758255119e-21, 4.02137961842776e-15, 6.51718171878301e-13, -2.11773355803058e-08, 0.00264953354380072, -1.35031446451331e-32, -6.07246643970893e-24, -4.02352115234494e-19, -7.44938506925544e-17, 1.89917206526237e-13, 3.64975183508473e-06, 1.77274872361946e-26, -3.34952758812999e-19, -4.21537726098389e-09, -0.0391048167929649, 5.41276911564176e-14, 7.05412100773699e-12, 2.58585887897486e-09, -4.93111362030162e-11, -1.58649699894543e-06, -0.5250374278861, 0.00220019901729615, -0.00643064132636925, 62.9154149015048, 135.147318617061, 2.40560808321713e-07, -0.000890763306701305, -4402.09599407714, -302.807107747776, 1591.58748314599, 232534.272709876, -792681.2071326, -86987136466.2769, 354542769185.671, 400849240129329.0])),
+    'o': (0.0034, 23.0, 650.0, 0.974, 0.996, 0.5, 1.0, 1.0,
+          np.array([0, 0, 0, 2, 3, 4, 4, 4, 4, 4, 5, 5, 6, 7, 8, 8, 8, 10, 10, 14, 14, 20, 20, 24]),
+          np.array([-12, -4, -1, -1, -10, -12, -8, -5, -4, -1, -4, -3, -8, -12, -10, -8, -4, -12, -8, -12, -8, -12, -10, -12]),
+          np.array([1.28746023979718e-35, -7.35234770382342e-12, 0.0028907869214915, 0.244482731907223, 1.41733492030985e-24, -3.54533853059476e-29, -5.94539202901431e-18, -5.85188401782779e-09, 2.01377325411803e-06, 1.38647388209306, -1.73959365084772e-05, 0.00137680878349369, 8.14897605805513e-15, 4.25596631351839e-26, -3.87449113787755e-18, 1.3981474793024e-13, -0.00171849638951521, 6.41890529513296e-22, 1.18960578072018e-11, -1.55282762571611e-18, 2.33907907347507e-08, -1.74093247766213e-13, 3.77682649089149e-09, -5.16720236575302e-11])),
+    'p': (0.0041, 23.0, 650.0, 0.972, 0.997, 0.5, 1.0, 1.0,
+          np.array([0, 0, 0, 0, 1, 2, 3, 3, 4, 6, 7, 7, 8, 10, 12, 12, 12, 14, 14, 14, 16, 18, 20, 22, 24, 24, 36]),
+          np.array([-1, 0, 1, 2, 1, -1, -3, 0, -2, -2, -5, -4, -2, -3, -12, -6, -5, -10, -8, -3, -8, -8, -10, -10, -12, -8, -12]),
+          np.array([-9.82825342010366e-05, 1.05145700850612, 116.033094095084, 3246.64750281543, -1235.92348610137, -0.0561403450013495, 8.56677401640869e-08, 236.313425393924, 0.00972503292350109, -1.03001994531927, -1.49653706199162e-09, -2.15743778861592e-05, -8.34452198291445, 0.586602660564988, 3.43480022104968e-26, 8.16256095947021e-06, 0.00294985697916798, 7.11730466276584e-17, 4.00954763806941e-10, 10.7766027032853, -4.09449599138182e-07, -7.29121307758902e-06, 6.77107970938909e-09, 6.02745973022975e-08, -3.82323011855257e-11, 0.00179946628317437, -0.000345042834640005])),
+    'q': (0.0022, 23.0, 650.0, 0.848, 0.983, 1.0, 1.0, 4.0,
+          np.array([-12, -12, -10, -10, -10, -10, -8, -6, -5, -5, -4, -4, -3, -2, -2, -2, -2, -1, -1, -1, 0, 1, 1, 1]),
+          np.array([10, 12, 6, 7, 8, 10, 8, 6, 2, 5, 3, 4, 3, 0, 1, 2, 4, 0, 1, 2, 0, 0, 1, 3]),
+          np.array([-82043.384325995, 47327151846.1586, -0.0805950021005413, 32.860002543598, -3566.1702998249, -1729857814.33335, 35176923.2729192, -775489.259985144, 7.10346691966018e-05, 99349.9883820274, -0.64209417190457, -6128.42816820083, 232.808472983776, -1.42808220416837e-05, -0.00643596060678456, -4.28577227475614, 2256.89939161918, 0.0010035565172151, 0.333491455143516, 1.09697576888873, 0.961917379376452, -0.0838165632204598, 2.47795908411492, -3191.14969006533])),
+    'r': (0.0054, 23.0, 650.0, 0.874, 0.982, 1.0, 1.0, 1.0,
+          np.array([-8, -8, -3, -3, -3, -3, -3, 0, 0, 0, 0, 3, 3, 8, 8, 8, 8, 10, 10, 10, 10, 10, 10, 10, 10, 12, 14]),
+          np.array([6, 14, -3, 3, 4, 5, 8, -1, 0, 1, 5, -6, -2, -12, -10, -8, -5, -12, -10, -8, -6, -5, -4, -3, -2, -12, -12]),
+          np.array([0.00144165955660863, -7014385996282.58, -8.30946716459219e-17, 0.261975135368109, 393.097214706245, -10433.4030654021, 490112654.154211, -0.000147104222772069, 1.03602748043408, 3.05308890065089, -3997452.76971264, 5.6923371959375e-12, -0.0464923504407778, -5.35400396512906e-18, 3.99988795693162e-13, -5.36479560201811e-07, 0.0159536722411202, 2.70303248860217e-15, 2.44247453858506e-08, -9.83430636716454e-06, 0.0663513144224454, -9.93456957845006, 546.491323528491, -14336.5406393758, 150764.974125511, -3.37209709340105e-10, 3.77501980025469e-09])),
+    's': (0.0022, 21.0, 640.0, 0.886, 0.99, 1.0, 1.0, 4.0,
+          np.array([-12, -12, -10, -8, -6, -5, -5, -4, -4, -3, -3, -2, -1, -1, -1, 0, 0, 0, 0, 1, 1, 3, 3, 3, 4, 4, 4, 5, 14]),
+          np.array([20, 24, 22, 14, 36, 8, 16, 6, 32, 3, 8, 4, 1, 2, 3, 0, 1, 4, 28, 0, 32, 0, 1, 2, 3, 18, 24, 4, 24]),
+          np.array([-5.32466612140254e+22, 1.00415480000824e+31, -1.91540001821367e+29, 1.05618377808847e+16, 2.02281884477061e+58, 88458547.2596134, 1.66540181638363e+22, -313563.197669111, -1.85662327545324e+53, -0.0624942093918942, -5041607241.3259, 18751.4491833092, 0.00121399979993217, 1.88317043049455, -1670.7350396206, 0.965961650599775, 2.94885696802488, -65391.5627346115, 6.04012200163444e+49, -0.198339358557937, -1.75984090163501e+57, 3.56314881403987, -575.991255144384, 45621.3415338071, -10917404.4987829, 4.37796099975134e+33, -6.16552611135792e+45, 1935687689.17797, 9.50898170425042e+53])),
+    't': (0.0088, 20.0, 650.0, 0.803, 1.02, 1.0, 1.0, 1.0,
+          np.array([0, 0, 0, 0, 1, 1, 2, 2, 2, 3, 3, 4, 4, 7, 7, 7, 7, 7, 10, 10, 10, 10, 10, 18, 20, 22, 22, 24, 28, 32, 32, 32, 36]),
+          np.array([0, 1, 4, 12, 0, 10, 0, 6, 14, 3, 8, 0, 10, 3, 4, 7, 20, 36, 10, 12, 14, 16, 22, 18, 32, 22, 36, 24, 28, 22, 32, 36, 36]),
+          np.array([1.55287249586268, 6.64235115009031, -2893.6623672721, -3859232023098.48, -2.91002915783761, -829088246858.083, 1.76814899675218, -534686695.713469, 1.60464608687834e+17, 196435.366560186, 1566374275417.29, -1.78154560260006, -2297462376236920.0, 38565900.1648006, 1105544467.90543, -67707383068734.9, -3.27910592086523e+30, -3.41552040860644e+50, -5.27251339709047e+20, 2.45375640937055e+23, -1.68776617209269e+26, 3.58958955867578e+28, -6.56475280339411e+35, 3.55286045512301e+38, 5.6902145441327e+57, -7.00584546433113e+47, -7.05772623326374e+64, 1.66861176200148e+52, -3.00475129680486e+60, -6.68481295196808e+50, 4.28432338620678e+68, -4.44227367758304e+71, -2.81396013562745e+76])),
+    'u': (0.0026, 23.0, 650.0, 0.902, 0.988, 1.0, 1.0, 1.0,
+          np.array([-12, -10, -10, -10, -8, -8, -8, -6, -6, -5, -5, -5, -3, -1, -1, -1, -1, 0, 0, 1, 2, 2, 3, 5, 5, 5, 6, 6, 8, 8, 10, 12, 12, 12, 14, 14, 14, 14]),
+          np.array([14, 10, 12, 14, 10, 12, 14, 8, 12, 4, 8, 12, 2, -1, 1, 12, 14, -3, 1, -2, 5, 10, -5, -4, 2, 3, -5, 2, -8, 8, -4, -12, -4, 4, -12, -10, -6, 6]),
+          np.array([1.22088349258355e+17, 1042164686.08488, -8826669315646520.0, 2.59929510849499e+19, 222612779142211.0, -8.78473585050085e+17, -3.14432577551552e+21, -2169349169962.85, 1.59079648196849e+20, -339.567617303423, 8843876513378.36, -8.43405926846418e+20, 11.4178193518022, -0.000122708229235641, -106.201671767107, 9.03443213959313e+24, -6.93996270370852e+27, 6.48916718965575e-09, 7189.57567127851, 0.00105581745346187, -651903203602581.0, -1.60116813274676e+24, -5.10254294237837e-09, -0.152355388953402, 677143292290.144, 276378438378930.0, 0.0116862983141686, -30142694798017.1, 1.6971981388484e-08, 1.04674840020929e+26, -10801.690456014, -9.90623601934295e-13, 5361164.83602738, 2.26145963747881e+21, -4.8873156577621e-10, 1.5100154888067e-05, -22770.046464392, -7.81754507698846e+27])),
+    'v': (0.0031, 23.0, 650.0, 0.96, 0.995, 1.0, 1.0, 1.0,
+          np.array([-10, -8, -6, -6, -6, -6, -6, -6, -5, -5, -5, -5, -5, -5, -4, -4, -4, -4, -3, -3, -3, -2, -2, -1, -1, 0, 0, 0, 1, 1, 3, 4, 4, 4, 5, 8, 10, 12, 14]),
+          np.array([-8, -12, -12, -3, 5, 6, 8, 10, 1, 2, 6, 8, 10, 14, -12, -10, -6, 10, -3, 10, 12, 2, 4, -2, 0, -2, 6, 10, -12, -10, 3, -6, 3, 10, 2, -12, -2, -3, 1]),
+          np.array([-4.15652812061591e-55, 1.77441742924043e-61, -3.57078668203377e-55, 3.59252213604114e-26, -25.9123736380269, 59461.976619346, -62418400710.3158, 3.13080299915944e+16, 1.05006446192036e-09, -1.92824336984852e-06, 654144.373749937, 5131174628650.44, -6.97595750347391e+18, -1.03977184454767e+28, 1.19563135540666e-48, -4.36677034051655e-42, 9.26990036530639e-30, 5.87793105620748e+20, 2.80375725094731e-18, -1.92359972440634e+22, 7.42705723302738e+26, -51.7429682450605, 8206120.48645469, -1.88214882341448e-09, 0.0184587261114837, -1.35830407782663e-06, -7.23681885626348e+16, -2.23449194054124e+26, -1.11526741826431e-35, 2.76032601145151e-29, 134856491567853.0, 6.5244029334586e-10, 5.1065511977436e+16, -4.68138358908732e+31, -7606674911832790.0, -4.17247986986821e-19, 31254567775610.4, -100375333864186.0, 2.47761392329058e+26])),
+    'w': (0.0039, 23.0, 650.0, 0.959, 0.995, 1.0, 1.0, 4.0,
+          np.array([-12, -12, -10, -10, -8, -8, -8, -6, -6, -6, -6, -5, -4, -4, -3, -3, -2, -2, -1, -1, -1, 0, 0, 1, 2, 2, 3, 3, 5, 5, 5, 8, 8, 10, 10]),
+          np.array([8, 14, -1, 8, 6, 8, 14, -4, -3, 2, 8, -10, -1, 3, -10, 3, 1, 2, -8, -4, 1, -12, 1, -1, -1, 2, -12, -5, -10, -8, -6, -12, -10, -12, -8]),
+          np.array([-5.86219133817016e-08, -89446035500.5526, 5.31168037519774e-31, 0.109892402329239, -0.0575368389425212, 22827.6853990249, -1.58548609655002e+18, 3.29865748576503e-28, -6.34987981190669e-25, 6.15762068640611e-09, -96110924.0985747, -4.06274286652625e-45, -4.71103725498077e-13, 0.725937724828145, 1.87768525763682e-39, -1033.08436323771, -0.0662552816342168, 579.51404176571, 2.37416732616644e-27, 2.71700235739893e-15, -90.78862134836, -1.71242509570207e-37, 156.792067854621, 0.92326135790147, -5.97865988422577, 3219887.67636389, -3.99441390042203e-30, 4.93429086046981e-08, 8.12036983370565e-20, -2.07610284654137e-12, -3.40821291419719e-07, 5.42000573372233e-18, -8.56711586510214e-13, 2.66170454405981e-14, 8.58133791857099e-06])),
+    'x': (0.0049, 23.0, 650.0, 0.91, 0.988, 1.0, 1.0, 1.0,
+          np.array([-8, -6, -5, -4, -4, -4, -3, -3, -1, 0, 0, 0, 1, 1, 2, 3, 3, 3, 4, 5, 5, 5, 6, 8, 8, 8, 8, 10, 12, 12, 12, 12, 14, 14, 14, 14]),
+          np.array([14, 10, 10, 1, 2, 14, -2, 12, 5, 0, 4, 10, -10, -1, 6, -12, 0, 8, 3, -6, -2, 1, 1, -6, -3, 1, 8, -8, -10, -8, -5, -4, -12, -10, -8, -6]),
+          np.array([3.77373741298151e+18, -5071008837229.13, -1033632255988600.0, 1.84790814320773e-06, -0.000924729378390945, -4.25999562292738e+23, -4.62307771873973e-13, 1.07319065855767e+21, 64866249228.0682, 2.44200600688281, -8515357334.84258, 1.69894481433592e+21, 2.1578022250902e-27, -0.320850551367334, -3.8264244845861e+16, -2.75386077674421e-29, -563199.253391666, -3.26068646279314e+20, 39794900155318.4, 1.00824008584757e-07, 16223.4569738433, -43235522531.9745, -592874245598.61, 1.33061647281106, 1573381.97797544, 25818961427085.3, 2.62413209706358e+24, -0.0920011937431142, 0.00220213765905426, -11.0433759109547, 8470048.70612087, -592910695.762536, -1.8302717326966e-05, 0.181339603516302, -1192.28759669889, 4308676.58061468])),
+    'y': (0.0031, 22.0, 650.0, 0.996, 0.994, 1.0, 1.0, 4.0,
+          np.array([0, 0, 0, 0, 1, 2, 2, 2, 2, 3, 3, 3, 4, 4, 5, 5, 8, 8, 10, 12]),
+          np.array([-3, 1, 5, 8, 8, -4, -1, 4, 5, -8, 4, 8, -6, 6, -2, 1, -8, -2, -5, -8]),
+          np.array([-5.25597995024633e-10, 5834.41305228407, -1.34778968457925e+16, 1.18973500934212e+25, -1.59096490904708e+26, -3.15839902302021e-07, 496.212197158239, 3.27777227273171e+18, -5.27114657850696e+21, 2.10017506281863e-17, 7.05106224399834e+20, -2.66713136106469e+30, -1.45370512554562e-08, 1.4933391705313e+27, -14979562.0287641, -3818819062711000.0, 7.24660165585797e-05, -93780816955019.3, 5144114683.76383, -82819.8594040141])),
+    'z': (0.0038, 22.0, 650.0, 0.993, 0.994, 1.0, 1.0, 4.0,
+          np.array([-8, -6, -5, -5, -4, -4, -4, -3, -3, -3, -2, -1, 0, 1, 2, 3, 3, 6, 6, 6, 6, 8, 8]),
+          np.array([3, 6, 6, 8, 5, 6, 8, -2, 5, 6, 2, -6, 3, 1, 6, -6, -2, -6, -5, -4, -1, -8, -4]),
+          np.array([2.4400789229065e-11, -4630574.30331242, 7288032747.77712, 3277763028588560.0, -1105981701.18409, -3238999157299.57, 9238140070232450.0, 8.42250080413712e-13, 663221436245.506, -167170186672139.0, 2537.49358701391, -8.19731559610523e-21, 328380587890.663, -62500479.1171543, 8.03197957462023e+20, -2.04397011338353e-11, -3783.91047055938, 0.0097287654593862, 15.4355721681459, -3739.62862928643, -68285901137.4572, -0.000248488015614543, 3945360.49497068])),
+}
+
+# Evaluation plans of Eq 4 and 5 in (p/p* - a)**c and (T/T* - b)**d for every subregion
+_planVpt = dict((letter, Polynomials.Polynomial(values[10], values[8:10])) for letter, values in _subregionsVpt.items())
+
+# Saturation pressure at 643.15 K, the lower pressure limit of the near critical subregions
+_pressureSat643 = 21.04336731897525
+
+def _pick(temperature, boundaries, letters):
+    '''Subregion letter of states in a pressure band, from the boundary temperatures of the band in increasing order'''
+    return np.array(list(letters))[np.sum([temperature > boundary for boundary in boundaries], axis=0)]
+
+def subregion3_pt(pressure, temperature):
+    '''Revised Supplementary Release on Backward Equations for Specific Volume as a Function of Pressure and Temperature v(p,T) for Region 3 of the IAPWS Industrial Formulation 1997 for the Thermodynamic Properties of Water and Steam 2016
+    Range of the subregions 3a to 3t Table 2 and of the near critical subregions 3u to 3z Table 10.
+    Returns the subregion letter of every state. The states are assumed to be in region 3, on the liquid side of the
+    saturation line for temperatures up to the saturation temperature. Only the boundaries of the pressure bands that
+    hold states are evaluated.'''
+    pressure, temperature = np.broadcast_arrays(np.asarray(pressure, dtype=float), np.asarray(temperature, dtype=float))
+    subregion = np.full(pressure.shape, 't')
+
+    band = pressure > 40.0
+    if band.any():
+        p, T = pressure[band], temperature[band]
+        subregion[band] = _pick(T, (Boundaries.t3ab_p(p),), 'ab')
+    band = (pressure > 25.0) & (pressure <= 40.0)
+    if band.any():
+        p, T = pressure[band], temperature[band]
+        subregion[band] = _pick(T, (Boundaries.t3cd_p(p), Boundaries.t3ab_p(p), Boundaries.t3ef_p(p)), 'cdef')
+    band = (pressure > 23.0) & (pressure <= 25.0)
+    if band.any():
+        p, T = pressure[band], temperature[band]
+        letters = _pick(T, (Boundaries.t3cd_p(p), Boundaries.t3gh_p(p), Boundaries.t3ef_p(p), Boundaries.t3ij_p(p), Boundaries.t3jk_p(p)), 'cghijk')
+        subregion[band] = np.where((letters == 'g') & (p <= 23.5), 'l', letters)
+    band = (pressure > 22.5) & (pressure <= 23.0)
+    if band.any():
+        p, T = pressure[band], temperature[band]
+        subregion[band] = _pick(T, (Boundaries.t3cd_p(p), Boundaries.t3gh_p(p), Boundaries.t3mn_p(p), Boundaries.t3ef_p(p), Boundaries.t3op_p(p), Boundaries.t3ij_p(p), Boundaries.t3jk_p(p)), 'clmnopjk')
+    band = (pressure > _pressureSat643) & (pressure <= 22.5)
+    if band.any():
+        p, T = pressure[band], temperature[band]
+        letters = _pick(T, (Boundaries.t3cd_p(p), Boundaries.t3qu_p(p), Boundaries.t3rx_p(p), Boundaries.t3jk_p(p)), 'cq?rk')
+        nearCritical = letters == '?'
+        if nearCritical.any():
+            # Auxiliary subregions 3u to 3z, Table 10
+            p, T = p[nearCritical], T[nearCritical]
+            tuv, tef, twx = Boundaries.t3uv_p(p), Boundaries.t3ef_p(p), Boundaries.t3wx_p(p)
+            vapor = T > Region4.t4_p(np.minimum(p, Constants._pc))
+            letters[nearCritical] = np.select(
+                [p > 22.11, p > 22.064, vapor, p > 21.93161551],
+                [_pick(T, (tuv, tef, twx), 'uvwx'), _pick(T, (tuv, tef, twx), 'uyzx'),
+                 np.where((p > 21.90096265) & (T <= twx), 'z', 'x'), np.where(T > tuv, 'y', 'u')], default='u')
+        subregion[band] = letters
+    band = (pressure > 20.5) & (pressure <= _pressureSat643)
+    if band.any():
+        p, T = pressure[band], temperature[band]
+        subregion[band] = _pick(T, (Boundaries.t3cd_p(p), Region4.t4_p(p), Boundaries.t3jk_p(p)), 'csrk')
+    band = (pressure > 19.00881189173929) & (pressure <= 20.5)
+    if band.any():
+        p, T = pressure[band], temperature[band]
+        subregion[band] = _pick(T, (Boundaries.t3cd_p(p), Region4.t4_p(p)), 'cst')
+    band = pressure <= 19.00881189173929
+    if band.any():
+        subregion[band] = _pick(temperature[band], (Region4.t4_p(pressure[band]),), 'ct')
+
+    return subregion[()]
+
+def _pickScalar(temperature, boundaries, letters):
+    '''_pick of a single state'''
+    return letters[sum(temperature > boundary for boundary in boundaries)]
+
+def _subregion3Scalar_pt(pressure, temperature):
+    '''subregion3_pt of a single state, the boundaries of its pressure band evaluated on floats'''
+    if pressure > 40.0:
+        return _pickScalar(temperature, (Boundaries.t3ab_p(pressure),), 'ab')
+    elif pressure > 25.0:
+        return _pickScalar(temperature, (Boundaries.t3cd_p(pressure), Boundaries.t3ab_p(pressure), Boundaries.t3ef_p(pressure)), 'cdef')
+    elif pressure > 23.0:
+        letter = _pickScalar(temperature, (Boundaries.t3cd_p(pressure), Boundaries.t3gh_p(pressure), Boundaries.t3ef_p(pressure), Boundaries.t3ij_p(pressure), Boundaries.t3jk_p(pressure)), 'cghijk')
+        return 'l' if letter == 'g' and pressure <= 23.5 else letter
+    elif pressure > 22.5:
+        return _pickScalar(temperature, (Boundaries.t3cd_p(pressure), Boundaries.t3gh_p(pressure), Boundaries.t3mn_p(pressure), Boundaries.t3ef_p(pressure), Boundaries.t3op_p(pressure), Boundaries.t3ij_p(pressure), Boundaries.t3jk_p(pressure)), 'clmnopjk')
+    elif pressure > _pressureSat643:
+        letter = _pickScalar(temperature, (Boundaries.t3cd_p(pressure), Boundaries.t3qu_p(pressure), Boundaries.t3rx_p(pressure), Boundaries.t3jk_p(pressure)), 'cq?rk')
+        if letter != '?':
+            return letter
+        # Auxiliary subregions 3u to 3z, Table 10
+        if pressure > 22.064:
+            return _pickScalar(temperature, (Boundaries.t3uv_p(pressure), Boundaries.t3ef_p(pressure), Boundaries.t3wx_p(pressure)), 'uvwx' if pressure > 22.11 else 'uyzx')
+        elif temperature > Region4.t4_p(min(pressure, Constants._pc)):
+            return 'z' if pressure > 21.90096265 and temperature <= Boundaries.t3wx_p(pressure) else 'x'
+        elif pressure > 21.93161551 and temperature > Boundaries.t3uv_p(pressure):
+            return 'y'
+        else:
+            return 'u'
+    elif pressure > 20.5:
+        return _pickScalar(temperature, (Boundaries.t3cd_p(pressure), Region4.t4_p(pressure), Boundaries.t3jk_p(pressure)), 'csrk')
+    elif pressure > 19.00881189173929:
+        return _pickScalar(temperature, (Boundaries.t3cd_p(pressure), Region4.t4_p(pressure)), 'cst')
     else:
-        # Subregion 3b Eq 2, Table 4, Page 8
-        i = np.array([-12, -12, -12, -12, -12, -10, -10, -10, -10, -8, -8, -6, -6, -6, -6, -5, -4, -4, -4, -3, -3, -3, -3, -2, -2, -1, 0, 2, 2, 5, 6, 8, 10, 14, 14])
-        j = np.array([2, 10, 12, 14, 20, 2, 10, 14, 18, 2, 8, 2, 6, 7, 8, 10, 4, 5, 8, 1, 3, 5, 6, 0, 1, 0, 3, 0, 1, 0, 1, 1, 1, 3, 7])
-        n = np.array([1.25244360717979E-13, -1.26599322553713E-02, 5.06878030140626, 31.7847171154202, -391041.161399932, -9.75733406392044E-11, -18.6312419488279, 510.973543414101, 373847.005822362, 2.99804024666572E-08, 20.0544393820342, -4.98030487662829E-06, -10.230180636003, 55.2819126990325, -206.211367510878, -7940.12232324823, 7.82248472028153, -58.6544326902468, 3550.73647696481, -1.15303107290162E-04, -1.75092403171802, 257.98168774816, -727.048374179467, 1.21644822609198E-04, 3.93137871762692E-02, 7.04181005909296E-03, -82.910820069811, -0.26517881813125, 13.7531682453991, -52.2394090753046, 2405.56298941048, -22736.1631268929, 89074.6343932567, -23923456.5822486, 5687958081.29714])
-        sigma = entropy/5.3
-        eta = enthalpy/2800.0
-        ps = sum(n*(eta - 0.681)**i*(sigma - 0.792)**j)
-        pressure = 16.6/ps
+        return _pickScalar(temperature, (Region4.t4_p(pressure),), 'ct')
 
-    return pressure
+_phiDensity = Polynomials.Polynomial(n, (i, j), [(1, 0), (2, 0)])
+_n0 = float(n[0])
 
-def h3_pt(pressure, temperature):
-    '''Not avalible with IF 97
-    Solve function T3_ph-T=0 with half interval method.'''
-    ts = temperature + 1
-    lowBound = Region1.h1_pt(pressure, 623.15)
-    highBound = Region2.h2_pt(pressure, Boundaries.b23t_p(pressure))
-    tolerance = 0.00001
-    enthalpy = 0.0
-    while abs(temperature - ts) > tolerance:
-        enthalpy = (lowBound + highBound)/2.0
-        ts = t3_ph(pressure, enthalpy)
-        if ts > temperature:
-            highBound = enthalpy
+def _polishDensity(density, pressure, temperature):
+    '''Newton iterations on the basic equation p3_rhot(rho, T) = p, starting from the backward equation density.
+    Points that have converged are dropped from the following iterations.'''
+    tolerance = 1e-12
+    active = ~np.isnan(density)
+    telemetry = Instrumentation.solvers.enabled
+    if telemetry:
+        solved = active.copy()
+        iterations, residuals = np.zeros(density.shape, dtype=int), np.zeros(density.shape)
+    for _ in range(20):
+        if not active.any():
+            break
+        delta = density[active]/Constants._rhoc
+        fidelta, fideltadelta = _phiDensity(delta, Constants._tc/temperature[active])
+        fidelta = fidelta + n[0]/delta
+        fideltadelta = fideltadelta - n[0]/delta**2
+        rt = Constants._R*temperature[active]/1000.0
+        residual = density[active]*rt*delta*fidelta - pressure[active]
+        slope = rt*(2.0*delta*fidelta + delta**2*fideltadelta)
+        if telemetry:
+            iterations[active] += 1
+            residuals[active] = residual
+        # The slope vanishes at the critical point, keep the backward value there
+        step = np.where(slope > 0.0, residual/np.where(slope > 0.0, slope, 1.0), 0.0)
+        density[active] -= step
+        active[active] = np.abs(step) > tolerance*density[active]
+    if telemetry:
+        Instrumentation.solvers.record('Region3.v3_pt', iterations[solved], residuals[solved], ~active[solved],
+                                       {'pressure': pressure[solved], 'temperature': temperature[solved]})
+    return density
+
+def _polishDensityScalar(density, pressure, temperature):
+    '''_polishDensity of a single state'''
+    if density != density:
+        return density
+    tau = Constants._tc/temperature
+    rt = Constants._R*temperature/1000.0
+    converged = False
+    for iteration in range(1, 21):
+        delta = density/Constants._rhoc
+        fidelta, fideltadelta = _phiDensity(delta, tau)
+        fidelta += _n0/delta
+        fideltadelta -= _n0/(delta*delta)
+        residual = density*rt*delta*fidelta - pressure
+        slope = rt*(2.0*delta*fidelta + delta*delta*fideltadelta)
+        # The slope vanishes at the critical point, keep the backward value there
+        step = residual/slope if slope > 0.0 else 0.0
+        density -= step
+        if abs(step) <= 1e-12*density:
+            converged = True
+            break
+    if Instrumentation.solvers.enabled:
+        Instrumentation.solvers.record('Region3.v3_pt', iteration, residual, converged, {'pressure': pressure, 'temperature': temperature})
+    return density
+
+@Arrays.blockwise
+def v3_pt(pressure, temperature, polish=False):
+    '''Revised Supplementary Release on Backward Equations for Specific Volume as a Function of Pressure and Temperature v(p,T) for Region 3 of the IAPWS Industrial Formulation 1997 for the Thermodynamic Properties of Water and Steam 2016
+    Backward equations v(p,T) for the subregions 3a to 3t and the auxiliary equations for the subregions 3u to 3z, Eq 4 and 5.
+    The backward equations agree with the basic equation within the permissible deviations of the release. With polish the
+    density is refined with Newton iterations on the basic equation, so the result is consistent with p3_rhot.'''
+    specificVolume = np.empty(pressure.shape)
+    subregion = subregion3_pt(pressure, temperature)
+    for letter in np.unique(subregion):
+        mask = subregion == letter
+        vStar, pStar, tStar, a, b, c, d, e = _subregionsVpt[letter][:8]
+        x = pressure[mask]/pStar - a
+        y = temperature[mask]/tStar - b
+        # Fractional exponents c*I and d*J are integer powers of x**c and y**d
+        if c != 1.0:
+            x = x**c
+        if d != 1.0:
+            y = y**d
+        if letter == 'n':
+            specificVolume[mask] = vStar*np.exp(_planVpt[letter](x, y))
         else:
-            lowBound = enthalpy
+            specificVolume[mask] = vStar*_planVpt[letter](x, y)**e
+
+    if polish:
+        specificVolume = 1.0/_polishDensity(1.0/specificVolume, pressure, temperature)
+    return specificVolume
 
-    return enthalpy
+@v3_pt.scalar
+def _v3Scalar_pt(pressure, temperature, polish=False):
+    '''v3_pt of a single state'''
+    letter = _subregion3Scalar_pt(pressure, temperature)
+    vStar, pStar, tStar, a, b, c, d, e = _subregionsVpt[letter][:8]
+    x = pressure/pStar - a
+    y = temperature/tStar - b
+    if c != 1.0:
+        x = x**c
+    if d != 1.0:
+        y = y**d
+    if letter == 'n':
+        specificVolume = vStar*math.exp(_planVpt[letter](x, y))
+    else:
+        specificVolume = vStar*_planVpt[letter](x, y)**e
+
+    if polish:
+        specificVolume = 1.0/_polishDensityScalar(1.0/specificVolume, pressure, temperature)
+    return specificVolume
+
+@Arrays.blockwise
+def h3_pt(pressure, temperature):
+    '''Not avalible with IF 97
+    Density from the v(p,T) backward equations polished on the basic equation, then enthalpy from the basic equation.'''
+    return h3_rhot(1.0/v3_pt(pressure, temperature, polish=True), temperature)
 
 def t3_prho(pressure, density):
     '''Solve with Secant Method'''
-    f = lambda temperature: p3_rhot(density, temperature) - pressure
-    return optimize.newton(f, 623.15, tol=1e-8)
+    f = lambda temperature, pressure, density: p3_rhot(density, temperature) - pressure
+    return Solvers.secant(f, 623.15, (pressure, density), tol=1e-8, name='Region3.t3_prho', argumentNames=('pressure', 'density'))
 
+# Eq 10, Table 17 shared by p3sat_h and the slope used to invert it in Region4
+_p3sat_hI = np.array([0, 1, 1, 1, 1, 5, 7, 8, 14, 20, 22, 24, 28, 36])
+_p3sat_hJ = np.array([0, 1, 3, 4, 36, 3, 0, 24, 16, 16, 3, 18, 8, 24])
+_p3sat_hN = np.array([0.600073641753024, -9.36203654849857, 24.6590798594147, -107.014222858224, -91582131580576.8, -8623.32011700662, -23.5837344740032, 2.52304969384128E+17, -3.89718771997719E+18, -3.33775713645296E+22, 35649946963.6328, -1.48547544720641E+26, 3.30611514838798E+18, 8.13641294467829E+37])
+_p3sat_h = Polynomials.Polynomial(_p3sat_hN, (_p3sat_hI, _p3sat_hJ))
+_p3satDerivatives_h = Polynomials.Polynomial(_p3sat_hN, (_p3sat_hI, _p3sat_hJ), [(0, 0), (1, 0), (0, 1)])
+
+@Arrays.blockwise
 def p3sat_h(enthalpy):
     '''Revised Supplementary Release on Backward Equations for the Functions T(p,h), v(p,h) and T(p,s), v(p,s) for   Region 3 of the IAPWS Industrial Formulation 1997 for the Thermodynamic Properties of Water and Steam 2004
        Section 4 Boundary Equations psat(h) and psat(s) for the Saturation Lines of Region 3 see pictures Page 17, Eq 10, Table 17, Page 18'''
-    i = np.array([0, 1, 1, 1, 1, 5, 7, 8, 14, 20, 22, 24, 28, 36])
-    j = np.array([0, 1, 3, 4, 36, 3, 0, 24, 16, 16, 3, 18, 8, 24])
-    n = np.array([0.600073641753024, -9.36203654849857, 24.6590798594147, -107.014222858224, -91582131580576.8, -8623.32011700662, -23.5837344740032, 2.52304969384128E+17, -3.89718771997719E+18, -3.33775713645296E+22, 35649946963.6328, -1.48547544720641E+26, 3.30611514838798E+18, 8.13641294467829E+37])
+    h = enthalpy/2600.0
+    return _p3sat_h(h - 1.02, h - 0.608)*22.0
 
+def _p3satSlope_h(enthalpy):
+    '''p3sat_h and its derivative with respect to enthalpy in MPa/(kJ/kg) for an array of enthalpies'''
     h = enthalpy/2600.0
-    ps = n*(h - 1.02)**i*(h - 0.608)**j
-    return ps.sum()*22.0
+    ps, ps_x, ps_y = _p3satDerivatives_h(h - 1.02, h - 0.608)
+    return ps*22.0, (ps_x + ps_y)*22.0/2600.0
+
+# Eq 11, Table 18
+_p3sat_s = Polynomials.Polynomial(
+    [0.639767553612785, -12.9727445396014, -2.24595125848403E+15, 1774667.41801846, 7170793495.71538, -3.78829107169011E+17, -9.55586736431328E+34, 1.87269814676188E+23, 119254746466.473, 1.10649277244882E+36],
+    ([0, 1, 1, 4, 12, 12, 16, 24, 28, 32],
+     [0, 1, 32, 7, 4, 14, 36, 10, 0, 18]))
 
+@Arrays.blockwise
 def p3sat_s(entropy):
-    i = np.array([0, 1, 1, 4, 12, 12, 16, 24, 28, 32])
-    j = np.array([0, 1, 32, 7, 4, 14, 36, 10, 0, 18])
-    n = np.array([0.639767553612785, -12.9727445396014, -2.24595125848403E+15, 1774667.41801846, 7170793495.71538, -3.78829107169011E+17, -9.55586736431328E+34, 1.87269814676188E+23, 119254746466.473, 1.10649277244882E+36])
     sigma = entropy/5.2
-    pressure = sum(n*(sigma - 1.03)**i*(sigma - 0.699)**j)
-    return pressure*22.0
\ No newline at end of file
+    return _p3sat_s(sigma - 1.03, sigma - 0.699)*22.0
\ No newline at end of file
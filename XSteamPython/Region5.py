@@ -2,17 +2,21 @@
 '''
 Region 5 functions
 '''
-import math
-
 import numpy as np
-import scipy
-from scipy import optimize
 
 try:
+    import Arrays
     import Constants
+    import Polynomials
+    import Properties
+    import Solvers
     import Region2
 except ImportError:
+    from . import Arrays
     from . import Constants
+    from . import Polynomials
+    from . import Properties
+    from . import Solvers
     from . import Region2
 
 j0 = np.array([0, 1, -3, -2, -1, 2])
@@ -21,84 +25,117 @@ ir = np.array([1, 1, 1, 2, 3])
 jr = np.array([0, 1, 3, 9, 3])
 nr = np.array([-1.2563183589592E-04, 2.1774678714571E-03, -0.004594282089991, -3.9724828359569E-06, 1.2919228289784E-07])
 
+# Ideal-gas part gamma0 in tau and residual part gammar in pi and tau
+_gamma0 = Polynomials.Polynomial(n0, (j0,))
+_gamma0_tau = Polynomials.Polynomial(n0, (j0,), (1,))
+_gamma0_tautau = Polynomials.Polynomial(n0, (j0,), (2,))
+_gamma0Derivatives = Polynomials.Polynomial(n0, (j0,), [(0,), (1,), (2,)])
+_gammar = Polynomials.Polynomial(nr, (ir, jr))
+_gammar_pi = Polynomials.Polynomial(nr, (ir, jr), (1, 0))
+_gammar_tau = Polynomials.Polynomial(nr, (ir, jr), (0, 1))
+_gammar_tautau = Polynomials.Polynomial(nr, (ir, jr), (0, 2))
+_gammarDerivatives = Polynomials.Polynomial(nr, (ir, jr), [(0, 0), (1, 0), (2, 0), (0, 1), (0, 2), (1, 1)])
+
+@Arrays.blockwise
 def h5_pt(pressure, temperature):
     '''Release on the IAPWS Industrial Formulation 1997 for the Thermodynamic Properties of Water and Steam September 1997
         Basic Equation for Region 5
         Eq 32,33, Page 36, Tables 37-41'''
     tau = 1000.0/temperature
-    gamma0_tau = n0*j0*tau**(j0 - 1)
-    gammar_tau = nr*jr*pressure**ir*tau**(jr - 1)
-    return Constants._R*temperature*tau*(gamma0_tau.sum() + gammar_tau.sum())
+    return Constants._R*temperature*tau*(_gamma0_tau(tau) + _gammar_tau(pressure, tau))
 
+@Arrays.blockwise
 def v5_pt(pressure, temperature):
     ''' Release on the IAPWS Industrial Formulation 1997 for the Thermodynamic Properties of Water and Steam, September 1997 Basic Equation for Region 5
     Eq 32,33, Page 36, Tables 37-41'''
     tau = 1000.0/temperature
     gamma0_pi = 1.0/pressure
-    gammar_pi = sum(nr*ir*pressure**(ir - 1)*tau**jr)
+    gammar_pi = _gammar_pi(pressure, tau)
     return Constants._R*temperature*(gamma0_pi + gammar_pi)/1000.0
 
+@Arrays.blockwise
 def u5_pt(pressure, temperature):
     '''Release on the IAPWS Industrial Formulation 1997 for the Thermodynamic Properties of Water and Steam, September 1997 Basic Equation for Region 5
     Eq 32,33, Page 36, Tables 37-41'''
     tau = 1000.0/temperature
     gamma0_pi = 1.0/pressure
-    gamma0_tau = sum(n0*j0*tau**(j0 - 1))
-    gammar_pi = sum(nr*ir*pressure**(ir - 1)*tau**jr)
-    gammar_tau = sum(nr*pressure**ir*jr*tau**(jr - 1))
+    gamma0_tau = _gamma0_tau(tau)
+    gammar_pi = _gammar_pi(pressure, tau)
+    gammar_tau = _gammar_tau(pressure, tau)
     return Constants._R*temperature*(tau*(gamma0_tau + gammar_tau) - pressure*(gamma0_pi + gammar_pi))
 
+@Arrays.blockwise
 def cp5_pt(pressure, temperature):
     '''Release on the IAPWS Industrial Formulation 1997 for the Thermodynamic Properties of Water and Steam, September 1997 Basic Equation for Region 5
     Eq 32,33, Page 36, Tables 37-41'''
     tau = 1000.0/temperature
-    gamma0_tautau = sum(n0*j0*(j0 - 1)*tau**(j0 - 2))
-    gammar_tautau = sum(nr*pressure**ir*jr*(jr - 1)*tau**(jr - 2))
+    gamma0_tautau = _gamma0_tautau(tau)
+    gammar_tautau = _gammar_tautau(pressure, tau)
     return -Constants._R*tau**2*(gamma0_tautau + gammar_tautau)
 
+@Arrays.blockwise
 def s5_pt(pressure, temperature):
     '''Release on the IAPWS Industrial Formulation 1997 for the Thermodynamic Properties of Water and Steam, September 1997 Basic Equation for Region 5
     Eq 32,33, Page 36, Tables 37-41'''
     tau = 1000.0/temperature
-    gamma0_tau = sum(n0*j0*tau**(j0 - 1))
-    gamma0 = sum(n0*tau**j0) + math.log(pressure)
-    gammar = sum(nr*pressure**ir*tau**jr)
-    gammar_tau = sum(nr*pressure**ir*jr*tau**(jr - 1))
+    gamma0_tau = _gamma0_tau(tau)
+    gamma0 = _gamma0(tau) + np.log(pressure)
+    gammar = _gammar(pressure, tau)
+    gammar_tau = _gammar_tau(pressure, tau)
     return Constants._R*(tau*(gamma0_tau + gammar_tau) - (gamma0 + gammar))
 
+@Arrays.blockwise
 def cv5_pt(pressure, temperature):
     '''Release on the IAPWS Industrial Formulation 1997 for the Thermodynamic Properties of Water and Steam, September 1997 Basic Equation for Region 5
     Eq 32,33, Page 36, Tables 37-41'''
     tau = 1000.0/temperature
-    gamma0_tautau = sum(n0*(j0 - 1)*j0*tau**(j0 - 2))
-    gammar_pi = sum(nr*ir*pressure**(ir - 1)*tau**jr)
-    gammar_pitau = sum(nr*ir*pressure**(ir - 1)*jr*tau**(jr - 1))
-    gammar_pipi = sum(nr*ir*(ir - 1)*pressure**(ir - 2)*tau**jr)
-    gammar_tautau = sum(nr*pressure**ir*jr*(jr - 1)*tau**(jr - 2))
+    gamma0_tautau = _gamma0_tautau(tau)
+    gammar, gammar_pi, gammar_pipi, gammar_tau, gammar_tautau, gammar_pitau = _gammarDerivatives(pressure, tau)
     return Constants._R*(-(tau**2*(gamma0_tautau + gammar_tautau)) - (1.0 + pressure*gammar_pi - tau*pressure*gammar_pitau)**2 / (1.0 - pressure**2*gammar_pipi))
 
+@Arrays.blockwise
 def w5_pt(pressure, temperature):
     '''Release on the IAPWS Industrial Formulation 1997 for the Thermodynamic Properties of Water and Steam, September 1997 Basic Equation for Region 5
     Eq 32,33, Page 36, Tables 37-41'''
     tau = 1000.0/temperature
-    gamma0_tautau = sum(n0*(j0 - 1)*j0*tau**(j0 - 2))
-    gammar_pi = sum(nr*ir*pressure**(ir - 1)*tau**jr)
-    gammar_pitau = sum(nr*ir*pressure**(ir - 1)*jr*tau**(jr - 1))
-    gammar_pipi = sum(nr*ir*(ir - 1)*pressure**(ir - 2)*tau**jr)
-    gammar_tautau = sum(nr*pressure**ir*jr*(jr - 1)*tau**(jr - 2))
-    return math.sqrt(1000.0*Constants._R*temperature*(1.0 + 2.0*pressure*gammar_pi + pressure**2*gammar_pi**2) / ((1.0 - pressure**2*gammar_pipi) + (1.0 + pressure*gammar_pi - tau*pressure*gammar_pitau)**2 / (tau**2*(gamma0_tautau + gammar_tautau))))
+    gamma0_tautau = _gamma0_tautau(tau)
+    gammar, gammar_pi, gammar_pipi, gammar_tau, gammar_tautau, gammar_pitau = _gammarDerivatives(pressure, tau)
+    return np.sqrt(1000.0*Constants._R*temperature*(1.0 + 2.0*pressure*gammar_pi + pressure**2*gammar_pi**2) / ((1.0 - pressure**2*gammar_pipi) + (1.0 + pressure*gammar_pi - tau*pressure*gammar_pitau)**2 / (tau**2*(gamma0_tautau + gammar_tautau))))
+
+@Arrays.blockwise
+def properties5_pt(pressure, temperature):
+    '''Release on the IAPWS Industrial Formulation 1997 for the Thermodynamic Properties of Water and Steam, September 1997 Basic Equation for Region 5
+    Eq 32,33, Page 36, Tables 37-41
+    Evaluates the ideal-gas part gamma0 and the residual part gammar with all of their first and second derivatives once
+    and returns every property as a Properties.StateProperties bundle.'''
+    tau = 1000.0/temperature
+    g0, g0_tau, g0_tautau = _gamma0Derivatives(tau)
+    g0 = g0 + np.log(pressure)
+    g0_pi = 1.0/pressure
+    gr, gr_pi, gr_pipi, gr_tau, gr_tautau, gr_pitau = _gammarDerivatives(pressure, tau)
+
+    specificVolume = Constants._R*temperature*(g0_pi + gr_pi)/1000.0
+    enthalpy = Constants._R*temperature*tau*(g0_tau + gr_tau)
+    internalEnergy = Constants._R*temperature*(tau*(g0_tau + gr_tau) - pressure*(g0_pi + gr_pi))
+    entropy = Constants._R*(tau*(g0_tau + gr_tau) - (g0 + gr))
+    cp = -Constants._R*tau**2*(g0_tautau + gr_tautau)
+    a = 1.0 + pressure*gr_pi - tau*pressure*gr_pitau
+    b = 1.0 - pressure**2*gr_pipi
+    cv = Constants._R*(-tau**2*(g0_tautau + gr_tautau) - a**2/b)
+    speedOfSound = np.sqrt(1000.0*Constants._R*temperature*(1.0 + 2.0*pressure*gr_pi + pressure**2*gr_pi**2)/(b + a**2/(tau**2*(g0_tautau + gr_tautau))))
+    return Properties.StateProperties(np.copy(pressure)[()], np.copy(temperature)[()], specificVolume, enthalpy, internalEnergy, entropy, cp, cv, speedOfSound)
 
 def t5_ph(pressure, enthalpy):
     '''Solve with Secant Method'''
-    f = lambda temperature: h5_pt(pressure, temperature) - enthalpy
-    return optimize.newton(f, 1073.15, tol=1e-5)
+    f = lambda temperature, pressure, enthalpy: h5_pt(pressure, temperature) - enthalpy
+    return Solvers.secant(f, np.full(np.shape(enthalpy), 1073.15), (pressure, enthalpy), tol=1e-5, name='Region5.t5_ph', argumentNames=('pressure', 'enthalpy'))
 
 def t5_ps(pressure, entropy):
     '''Solve with Secant Method'''
-    f = lambda temperature: s5_pt(pressure, temperature) - entropy
-    return optimize.newton(f, 1073.15, tol=1e-6)
+    f = lambda temperature, pressure, entropy: s5_pt(pressure, temperature) - entropy
+    return Solvers.secant(f, np.full(np.shape(entropy), 1073.15), (pressure, entropy), tol=1e-6, name='Region5.t5_ps', argumentNames=('pressure', 'entropy'))
 
 def t5_prho(pressure, density):
     '''Solve with Secant Method'''
-    f = lambda temperature: 1.0/Region2.v2_pt(pressure, temperature) - density
-    return optimize.newton(f, 1073.15, tol=1e-6)
\ No newline at end of file
+    f = lambda temperature, pressure, density: 1.0/Region2.v2_pt(pressure, temperature) - density
+    return Solvers.secant(f, 1073.15, (pressure, density), tol=1e-6, name='Region5.t5_prho', argumentNames=('pressure', 'density'))
\ No newline at end of file
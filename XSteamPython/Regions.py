@@ -2,7 +2,10 @@
 '''
 Region determinations
 '''
+import numpy as np
+
 try:
+    import Arrays
     import Region1
     import Region2
     import Region3
@@ -10,6 +13,7 @@ try:
     import Region5
     import Boundaries
 except ImportError:
+    from . import Arrays
     from . import Region1
     from . import Region2
     from . import Region3
@@ -17,6 +21,10 @@ except ImportError:
     from . import Region5
     from . import Boundaries
 
+# Error codes reported by region_prho_array
+pressureOutOfBounds = 1
+densityOutOfBounds = 2
+
 def region_pt(pressure, temperature):
     ''' Regions as a function of pressure and temperature '''
     region = 0
@@ -45,6 +53,19 @@ def region_pt(pressure, temperature):
 
     return region
 
+@Arrays.masked
+def region_pt_array(pressure, temperature):
+    ''' Regions as a function of pressure and temperature for arrays of states.
+    Returns an int8 array of region numbers with 0 where the state is out of range. Both boundaries are
+    evaluated for every point of a block, which is cheaper than gathering the points on each side. '''
+    high = temperature > 623.15
+    pressureSat = Region4.p4_t(np.clip(temperature, 273.15, 647.096))
+    region = np.where(high, np.where(pressure > Boundaries.b23p_t(temperature), 3, 2), np.where(pressure > pressureSat, 1, 2)).astype(np.int8)
+    region[(np.abs(pressure - pressureSat) < 0.00001) & (~high | ((region == 3) & (temperature < 647.096)))] = 4
+    region[~((temperature <= 1073.15) & (temperature > 273.15) & (pressure <= 100) & (pressure > 0.000611))] = 0
+    region[(temperature > 1073.15) & (temperature < 2273.15) & (pressure < 10.0) & (pressure > 0.000611)] = 5
+    return region
+
 def region_ph(pressure, enthalpy):
     ''' Regions as a function of pressure and enthalpy '''
     pressureMin, pressureMax = 0.000611657, 100.0
@@ -91,6 +112,38 @@ def region_ph(pressure, enthalpy):
 
             return 2
 
+@Arrays.masked
+def region_ph_array(pressure, enthalpy):
+    ''' Regions as a function of pressure and enthalpy for arrays of states.
+    Returns an int8 array of region numbers with 0 where the state is out of range. Each boundary
+    enthalpy is computed once, only for the points on the branch that needs it. '''
+    region = np.zeros(pressure.shape, dtype=np.int8)
+    valid = (pressure >= 0.000611657) & (pressure <= 100.0)
+    # Linear adaption to Region1.h1_pt()+2 to speed up calcualations.
+    belowMin = valid & (enthalpy < 0.963*pressure + 2.2)
+    valid[belowMin] = enthalpy[belowMin] >= Region1.h1_pt(pressure[belowMin], 273.15)
+
+    # Bellow region 3, check region 1,4,2,5
+    low = valid & (pressure < 16.5292)
+    p, h = pressure[low], enthalpy[low]
+    temperatureSat = Region4.t4_p(p)
+    code = np.select([h <= Region1.h1_pt(p, temperatureSat), h < Region2.h2_pt(p, temperatureSat), h < 4000.0], [1, 4, 2], 0).astype(np.int8)
+    hot = code == 0
+    p, h = p[hot], h[hot]
+    code[hot] = np.select([h <= Region2.h2_pt(p, 1073.15), (h < Region5.h5_pt(p, 2273.15)) & (p <= 10.0)], [2, 5], 0)
+    region[low] = code
+
+    # Above the lowest point of region 3, check region 1,3,4,2
+    high = valid & (pressure >= 16.5292)
+    p, h = pressure[high], enthalpy[high]
+    code = np.select([h < Region1.h1_pt(p, 623.15), h < Region2.h2_pt(p, Boundaries.b23t_p(p))], [1, 3], 0).astype(np.int8)
+    dome = code == 3
+    code[dome] = np.where(p[dome] > Region3.p3sat_h(h[dome]), 3, 4)
+    hot = code == 0
+    code[hot] = np.where(h[hot] < Region2.h2_pt(p[hot], 1073.15), 2, 0)
+    region[high] = code
+    return region
+
 def region_ps(pressure, entropy):
     ''' Regions as a function of pressure and enthalpy '''
     if pressure < 0.000611657 or pressure > 100.0 or entropy < 0.0 or entropy > Region5.s5_pt(pressure, 2273.15):
@@ -122,6 +175,36 @@ def region_ps(pressure, entropy):
     # If it hasn't reached this point then return region 1
     return 1
 
+@Arrays.masked
+def region_ps_array(pressure, entropy):
+    ''' Regions as a function of pressure and entropy for arrays of states.
+    Returns an int8 array of region numbers with 0 where the state is out of range. Each boundary
+    entropy is computed once, only for the points on the branch that needs it. '''
+    region = np.zeros(pressure.shape, dtype=np.int8)
+    valid = (pressure >= 0.000611657) & (pressure <= 100.0) & (entropy >= 0.0)
+    valid[valid] = entropy[valid] <= Region5.s5_pt(pressure[valid], 2273.15)
+    p, s = pressure[valid], entropy[valid]
+    code = np.ones(p.shape, dtype=np.int8)
+
+    # Check region 5
+    hot = s > Region2.s2_pt(p, 1073.15)
+    code[hot] = np.where(p[hot] <= 10.0, 5, 0)
+    # Check region 2, 3 and 4 above the lowest point of region 3
+    high = ~hot & (p > 16.529)
+    ph, sh = p[high], s[high]
+    codeHigh = np.select([sh > Region2.s2_pt(ph, Boundaries.b23t_p(ph)), sh > Region1.s1_pt(ph, 623.15)], [2, 3], 1).astype(np.int8)
+    dome = codeHigh == 3
+    codeHigh[dome] = np.where(ph[dome] > Region3.p3sat_s(sh[dome]), 3, 4)
+    code[high] = codeHigh
+    # Check region 2 and 4 below it, both bounded by the saturation line
+    low = ~hot & (p <= 16.529)
+    pl, sl = p[low], s[low]
+    temperatureSat = Region4.t4_p(pl)
+    code[low] = np.select([sl > Region2.s2_pt(pl, temperatureSat), (pl < 16.529) & (sl > Region1.s1_pt(pl, temperatureSat))], [2, 4], 1)
+
+    region[valid] = code
+    return region
+
 def region_hs(enthalpy, entropy):
     ''' Regions as a function of enthalpy and entropy '''
     enthalpyMin = (((-0.0415878 - 2500.89262) / (-0.00015455 - 9.155759))*entropy)
@@ -218,6 +301,76 @@ def region_hs(enthalpy, entropy):
                 return 2
     return None
 
+def _enthalpyMax3_s(entropy):
+    ''' Enthalpy on the 100 MPa isobar in region 3 '''
+    return Region3.h3_rhot(1.0/Region3.v3_ps(100.0, entropy), Region3.t3_ps(100.0, entropy))
+
+@Arrays.masked
+def region_hs_array(enthalpy, entropy):
+    ''' Regions as a function of enthalpy and entropy for arrays of states.
+    Returns an int8 array of region numbers with 0 where the state is out of range. Every entropy band is
+    resolved on its own subset of points, so each backward equation only sees the points that need it. '''
+    region = np.zeros(enthalpy.shape, dtype=np.int8)
+    enthalpyMin = (((-0.0415878 - 2500.89262) / (-0.00015455 - 9.155759))*entropy)
+    valid = (enthalpy >= -0.0001545495919) & ((entropy >= 9.155759395) | (enthalpy >= enthalpyMin))
+
+    # Check region 1 or 4 plus a small bit over B13
+    band = valid & (entropy >= -0.0001545495919) & (entropy <= 3.77828134)
+    h, s = enthalpy[band], entropy[band]
+    code = np.zeros(h.shape, dtype=np.int8)
+    saturated = h < Region4.h4_s(s)
+    code[saturated] = 4
+    liquid = ~saturated & (s < 3.397782955) # 100 MPa line is limiting
+    code[liquid] = np.where(h[liquid] < Region1.h1_pt(100.0, Region1.t1_ps(100.0, s[liquid])), 1, 0)
+    b13 = ~saturated & ~liquid # The point is either in region 4, 1, or 3. Check B23
+    code[b13] = np.select([h[b13] < Boundaries.hB13_s(s[b13]), h[b13] < _enthalpyMax3_s(s[b13])], [1, 3], 0)
+    region[band] = code
+
+    # Check region 2 or 4 upper part of area b23 -> max
+    band = valid & (entropy >= 5.260578707) & (entropy <= 11.9212156897728)
+    h, s = enthalpy[band], entropy[band]
+    code = np.zeros(h.shape, dtype=np.int8)
+    above = s > 9.155759395 # Above region 4
+    hA, sA = h[above], s[above]
+    enthalpyMin = Region2.h2_pt(0.000611, Region2.t2_ps(0.000611, sA))
+    enthalpyMax = -0.07554022*sA**4 + 3.341571*sA**3 - 55.42151*sA**2 + 408.515*sA + 3031.338
+    code[above] = np.where((hA > enthalpyMin) & (hA < enthalpyMax), 2, 0)
+    below = ~above
+    hB, sB = h[below], s[below]
+    enthalpyMax = np.empty(sB.shape)
+    isobar = sB < 6.04048367171238
+    enthalpyMax[isobar] = Region2.h2_pt(100.0, Region2.t2_ps(100.0, sB[isobar]))
+    sF = sB[~isobar]
+    # Function adapted to h(1073.15,s)
+    enthalpyMax[~isobar] = -2.988734*sF**4 + 121.4015*sF**3 - 1805.15*sF**2 + 11720.16*sF - 23998.33
+    code[below] = np.select([hB < Region4.h4_s(sB), hB < enthalpyMax], [4, 2], 0)
+    region[band] = code
+
+    # Check region 3 or 4 below the critical point
+    band = valid & (entropy > 3.77828134) & (entropy <= 4.41202148223476)
+    h, s = enthalpy[band], entropy[band]
+    region[band] = np.select([h < Region4.h4_s(s), h < _enthalpyMax3_s(s)], [4, 3], 0)
+
+    # Check region 3 or 4 from critical point to top of b23
+    band = valid & (entropy > 4.41202148223476) & (entropy < 5.260578707)
+    h, s = enthalpy[band], entropy[band]
+    code = np.zeros(h.shape, dtype=np.int8)
+    saturated = h < Region4.h4_s(s)
+    code[saturated] = 4
+    underB23 = ~saturated & (s <= 5.048096828) # Check if under validity of B23
+    code[underB23] = np.where(h[underB23] < _enthalpyMax3_s(s[underB23]), 3, 0)
+    # In the area of B23, above b23 in h
+    aboveB23 = ~saturated & ~underB23 & (h > 2812.942061) & (s > 5.09796573397125)
+    code[aboveB23] = np.where(h[aboveB23] < Region2.h2_pt(100.0, Region2.t2_ps(100.0, s[aboveB23])), 2, 0)
+    # Below B23 in h but we have already checked above hV2c3b
+    code[~saturated & ~underB23 & (h < 2563.592004)] = 3
+    # Within the b23 area in both s and h
+    withinB23 = ~saturated & ~underB23 & (h >= 2563.592004) & (h <= 2812.942061)
+    hW, sW = h[withinB23], s[withinB23]
+    code[withinB23] = np.where(Region2.p2_hs(hW, sW) > Boundaries.b23p_t(Boundaries.tB23_hs(hW, sW)), 3, 2)
+    region[band] = code
+    return region
+
 def region_prho(pressure, density):
     ''' Regions as a function of pressure and density '''
     specificVolume = 1.0/density
@@ -249,4 +402,49 @@ def region_prho(pressure, density):
                 return 4
         # Check region 2
         if specificVolume < Region2.v2_pt(pressure, 1073.15):
-            return 2
\ No newline at end of file
+            return 2
+
+def region_prho_array(pressure, density):
+    ''' Regions as a function of pressure and density for arrays of states.
+    Returns an int8 array of region numbers and an int8 array of error codes instead of raising. The error
+    is pressureOutOfBounds or densityOutOfBounds where region_prho raises, densityOutOfBounds where it finds
+    no region, and 0 elsewhere. The saturation enthalpies near the critical point are solved once per
+    distinct pressure and shared by all the points at that pressure. '''
+    pressure, density = np.broadcast_arrays(np.asarray(pressure, dtype=float), np.asarray(density, dtype=float))
+    shape = pressure.shape
+    pressure, specificVolume = pressure.ravel(), 1.0/density.ravel()
+    region = np.zeros(pressure.shape, dtype=np.int8)
+    error = np.zeros(pressure.shape, dtype=np.int8)
+
+    valid = (pressure >= 0.000611657) & (pressure <= 100.0)
+    error[~valid] = pressureOutOfBounds
+    tooDense = valid.copy()
+    tooDense[valid] = ~(specificVolume[valid] >= Region1.v1_pt(pressure[valid], 273.15))
+    error[tooDense] = densityOutOfBounds
+    valid &= ~tooDense
+
+    # Below region 3, check region 1, 4, 2 and 5
+    low = np.flatnonzero(valid & (pressure < 16.5292))
+    p, v = pressure[low], specificVolume[low]
+    temperatureSat = Region4.t4_p(p)
+    code = np.select([v < Region1.v1_pt(p, temperatureSat), v < Region2.v2_pt(p, temperatureSat), v < Region2.v2_pt(p, 1073.15)], [1, 4, 2], 0)
+    hot = code == 0
+    code[hot] = np.where((p[hot] <= 10.0) & (v[hot] <= Region5.v5_pt(p[hot], 2073.15)), 5, 0)
+    # Above region 5
+    error[low[hot & (p > 10.0)]] = pressureOutOfBounds
+    region[low] = code
+
+    # Check region 1, 3, 4, 3, 2 (above the lowest point of region 3.)
+    high = np.flatnonzero(valid & (pressure >= 16.5292))
+    p, v = pressure[high], specificVolume[high]
+    code = np.select([v < Region1.v1_pt(p, 623.15), v < Region2.v2_pt(p, Boundaries.b23t_p(p)), v < Region2.v2_pt(p, 1073.15)], [1, 3, 2], 0)
+    # Region 3 or 4 below the critical pressure
+    dome = (code == 3) & (p <= 22.064)
+    pressureSat, index = np.unique(p[dome], return_inverse=True)
+    liquidVolume = Region3.v3_ph(pressureSat, Region4.h4_p(pressureSat, 'liq'))
+    vaporVolume = Region3.v3_ph(pressureSat, Region4.h4_p(pressureSat, 'vap'))
+    code[dome] = np.where((v[dome] < liquidVolume[index]) | (v[dome] > vaporVolume[index]), 3, 4)
+    region[high] = code
+
+    error[(region == 0) & (error == 0)] = densityOutOfBounds
+    return region.reshape(shape)[()], error.reshape(shape)[()]
@@ -0,0 +1,153 @@
+# -*- coding: utf-8 -*-
+'''
+Precomputed saturation line with cubic spline interpolation
+'''
+import numpy as np
+
+try:
+    import Constants
+    import Properties
+    import Region4
+    import States
+    import Storage
+except ImportError:
+    from . import Constants
+    from . import Properties
+    from . import Region4
+    from . import States
+    from . import Storage
+
+def _splineCurvature(x, y):
+    '''Second derivatives at the nodes x of the not-a-knot cubic spline through y, one column per field'''
+    size = x.size
+    step = np.diff(x)
+    matrix = np.zeros((size, size))
+    rows = np.arange(1, size - 1)
+    matrix[rows, rows - 1] = step[:-1]
+    matrix[rows, rows] = 2.0*(step[:-1] + step[1:])
+    matrix[rows, rows + 1] = step[1:]
+    # Not-a-knot: the third derivative is continuous across the second and the second to last node
+    matrix[0, :3] = step[1], -(step[0] + step[1]), step[0]
+    matrix[-1, -3:] = step[-1], -(step[-2] + step[-1]), step[-2]
+    rightHandSide = np.zeros(y.shape)
+    slope = np.diff(y, axis=0)/step[:, np.newaxis]
+    rightHandSide[1:-1] = 6.0*(slope[1:] - slope[:-1])
+    return np.linalg.solve(matrix, rightHandSide)
+
+def _splineEvaluate(x, y, curvature, point):
+    '''Cubic spline through y with the given curvature at the nodes x, evaluated at point'''
+    index = np.clip(np.searchsorted(x, point) - 1, 0, x.size - 2)
+    step = (x[index + 1] - x[index])[:, np.newaxis]
+    a = ((x[index + 1] - point)/(x[index + 1] - x[index]))[:, np.newaxis]
+    b = 1.0 - a
+    return a*y[index] + b*y[index + 1] + ((a**3 - a)*curvature[index] + (b**3 - b)*curvature[index + 1])*step**2/6.0
+
+class SaturationTable(object):
+    '''Saturated liquid and vapor properties tabulated over pressure.
+
+    Every field of Properties.StateProperties is stored for both phases at nodes between 611.657 Pa and
+    22.06395 MPa and interpolated with not-a-knot cubic splines, two per phase:
+    - below 16.529 MPa (regions 1 and 2) in log(p/(pMax - p)), which is log spaced at low pressure and
+      refines towards the critical point,
+    - from 16.529 MPa (region 3) in sqrt(1 - p/pMax), in which the region 3 saturation line of h4_p is smooth.
+    pMax is the maximum of Region3.p3sat_h, just above the critical pressure. cp is interpolated as 1/cp,
+    because the region 3 saturation states pass through a pole of cp above 22.06 MPa.
+
+    maximumError holds the largest relative error of each field against the region equations, measured
+    when the table is built on a check grid at sixths of every table interval. It is a sampled estimate:
+    near the triple point, where the liquid enthalpy and entropy are close to zero, the error between the
+    check points reaches about 1.4 times the measured value. With the default sizes every field stays
+    below 1e-7 over the whole table. For cp the measurement stops at 22 MPa, above which cp has the pole.
+
+    save stores a built table to a directory and load maps it back into memory, see Storage.'''
+
+    _cpMeasuredBelow = 22.0
+    _checkPoints = 6
+
+    def __init__(self, lowPressurePoints=400, highPressurePoints=200):
+        pressureMax = Region4._p3satMax
+        self._lowNodes = np.linspace(self._lowVariable(Constants._pressureMin), self._lowVariable(Constants._pressureSubDomain), lowPressurePoints)
+        self._highNodes = np.linspace(self._highVariable(Constants._pressureMax), self._highVariable(Constants._pressureSubDomain), highPressurePoints)
+        lowPressure = pressureMax/(1.0 + np.exp(-self._lowNodes))
+        lowPressure[0], lowPressure[-1] = Constants._pressureMin, np.nextafter(Constants._pressureSubDomain, 0.0)
+        highPressure = pressureMax*(1.0 - self._highNodes**2)
+        highPressure[0], highPressure[-1] = Constants._pressureMax, Constants._pressureSubDomain
+
+        self._splines = {}
+        for phase in ('liq', 'vap'):
+            # Node values one row per pressure, cp is stored as 1/cp
+            low, high = [np.column_stack(properties._replace(cp=1.0/properties.cp)) for properties in (self._equations(lowPressure, phase), self._equations(highPressure, phase))]
+            self._splines[phase] = (low, _splineCurvature(self._lowNodes, low), high, _splineCurvature(self._highNodes, high))
+
+        self.maximumError = self._measureError()
+
+    def save(self, path):
+        '''Stores the table in the directory path'''
+        arrays = {'lowNodes': self._lowNodes, 'highNodes': self._highNodes}
+        for phase, splines in self._splines.items():
+            arrays.update(('{}_{}'.format(name, phase), spline) for name, spline in zip(('low', 'lowCurvature', 'high', 'highCurvature'), splines))
+        Storage.save(path, 'SaturationTable', {'maximumError': self.maximumError}, arrays)
+
+    @classmethod
+    def load(cls, path):
+        '''Table stored in the directory path, with the nodes mapped read-only from the files. Raises ValueError
+        if the stored table cannot be used with these equations.'''
+        header, arrays = Storage.load(path, 'SaturationTable')
+        table = cls.__new__(cls)
+        table.maximumError = header['maximumError']
+        table._lowNodes, table._highNodes = arrays['lowNodes'], arrays['highNodes']
+        table._splines = dict((phase, tuple(arrays['{}_{}'.format(name, phase)] for name in ('low', 'lowCurvature', 'high', 'highCurvature'))) for phase in ('liq', 'vap'))
+        return table
+
+    @staticmethod
+    def _lowVariable(pressure):
+        return np.log(pressure/(Region4._p3satMax - pressure))
+
+    @staticmethod
+    def _highVariable(pressure):
+        return np.sqrt(1.0 - pressure/Region4._p3satMax)
+
+    @staticmethod
+    def _equations(pressure, phase):
+        return States._saturatedEquations(pressure, Region4.t4_p(pressure), pressure < Constants._pressureSubDomain, phase)
+
+    def _interpolate(self, pressure, phase, lowPressure):
+        low, lowCurvature, high, highCurvature = self._splines[phase]
+        values = np.empty(pressure.shape + (len(Properties.StateProperties._fields),))
+        if lowPressure.any():
+            values[lowPressure] = _splineEvaluate(self._lowNodes, low, lowCurvature, self._lowVariable(pressure[lowPressure]))
+        highPressure = ~lowPressure
+        if highPressure.any():
+            values[highPressure] = _splineEvaluate(self._highNodes, high, highCurvature, self._highVariable(pressure[highPressure]))
+        return values
+
+    def _measureError(self):
+        # Check points at sixths of every interval, the nodes themselves are exact
+        fractions = np.arange(1, self._checkPoints)/float(self._checkPoints)
+        lowChecks = (self._lowNodes[:-1, np.newaxis] + np.outer(np.diff(self._lowNodes), fractions)).ravel()
+        highChecks = (self._highNodes[:-1, np.newaxis] + np.outer(np.diff(self._highNodes), fractions)).ravel()
+        pressure = np.concatenate((Region4._p3satMax/(1.0 + np.exp(-lowChecks)), Region4._p3satMax*(1.0 - highChecks**2)))
+        lowPressure = np.arange(pressure.size) < lowChecks.size
+        maximumError = dict.fromkeys(Properties.StateProperties._fields, 0.0)
+        for phase in ('liq', 'vap'):
+            exact = self._equations(pressure, phase)
+            table = self.properties_p(pressure, phase, lowPressure)
+            for field in Properties.StateProperties._fields:
+                relative = np.abs(getattr(table, field)/getattr(exact, field) - 1.0)
+                if field == 'cp':
+                    relative = relative[pressure < self._cpMeasuredBelow]
+                maximumError[field] = max(maximumError[field], float(relative.max()))
+        return maximumError
+
+    def properties_p(self, pressure, phase, lowPressure=None):
+        '''Saturated liquid ('liq') or vapor ('vap') properties for an array of pressures in MPa inside the table.
+        lowPressure selects the points taken from the region 1 and 2 part of the table, by default the points
+        below 16.529 MPa. The pressure field is the given pressure.'''
+        pressure = np.asarray(pressure, dtype=float)
+        if lowPressure is None:
+            lowPressure = pressure < Constants._pressureSubDomain
+        values = self._interpolate(pressure, phase, lowPressure)
+        properties = Properties.StateProperties(*np.moveaxis(values, -1, 0))
+        properties.pressure[...] = pressure
+        properties.cp[...] = 1.0/properties.cp
+        return properties
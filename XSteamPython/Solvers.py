@@ -0,0 +1,325 @@
+# -*- coding: utf-8 -*-
+'''
+Root finders for the iterative solutions of the region equations: secant, Newton, Newton safeguarded by
+bisection and Brent's method.
+
+Each solver takes f(x, *args) and solves f = 0 for scalars or arrays. With scalar arguments the iteration runs
+on floats. With arrays every state is iterated until it converges, and f is only evaluated on the states that
+are still active, with args reduced to those states. A solver given a name records its convergence in
+Instrumentation.solvers while solver telemetry is enabled.
+'''
+import warnings
+
+import numpy as np
+
+try:
+    import Instrumentation
+except ImportError:
+    from . import Instrumentation
+
+def _isScalar(x0, args):
+    return np.ndim(x0) == 0 and all(np.ndim(arg) == 0 for arg in args)
+
+def _flatten(x0, args):
+    '''Starting values and arguments broadcast against each other and flattened, with their common shape'''
+    arrays = np.broadcast_arrays(np.asarray(x0, dtype=float), *[np.asarray(arg, dtype=float) for arg in args])
+    return arrays[0].shape, arrays[0].ravel().copy(), [arg.ravel() for arg in arrays[1:]]
+
+def _finish(f, args, root, iterations, converged, name, argumentNames):
+    '''Records the solve and raises for a scalar that did not converge or an array of which no state converged.
+    An array of which only some states did not converge warns, those states keep their last iterate.'''
+    if name is not None and Instrumentation.solvers.enabled:
+        with np.errstate(all='ignore'):
+            residual = f(root, *args)
+        Instrumentation.solvers.record(name, iterations, residual, converged, dict(zip(argumentNames, args)))
+    if np.ndim(root) == 0:
+        if not converged:
+            raise RuntimeError('Failed to converge after {} iterations, value is {}'.format(iterations, root))
+    elif not converged.all():
+        message = '{} failed to converge after {} iterations'.format('all' if not converged.any() else 'some', int(np.max(iterations)))
+        if not converged.any():
+            raise RuntimeError(message)
+        warnings.warn(message, RuntimeWarning)
+    return root
+
+def _secantScalar(f, x0, args, tol, maxiter):
+    p0 = float(x0)
+    p1 = p0*(1.0 + 1e-4)
+    p1 += 1e-4 if p1 >= 0.0 else -1e-4
+    q0, q1 = float(f(p0, *args)), float(f(p1, *args))
+    if abs(q1) < abs(q0):
+        p0, p1, q0, q1 = p1, p0, q1, q0
+    p = p1
+    for iteration in range(1, maxiter + 1):
+        if q1 == q0:
+            # Flat secant, converged only if both points are the same
+            return (p1 + p0)/2.0, iteration, p1 == p0
+        # The form dividing by the larger residual keeps the step accurate close to the root
+        if abs(q1) > abs(q0):
+            p = (-q0/q1*p1 + p0)/(1.0 - q0/q1)
+        else:
+            p = (-q1/q0*p0 + p1)/(1.0 - q1/q0)
+        if abs(p - p1) <= tol:
+            return p, iteration, True
+        p0, q0 = p1, q1
+        p1 = p
+        q1 = float(f(p1, *args))
+    return p, maxiter, False
+
+def _secantArray(f, x0, args, tol, maxiter):
+    shape, p0, args = _flatten(x0, args)
+    root = p0.copy()
+    iterations = np.zeros(p0.shape, dtype=int)
+    converged = np.zeros(p0.shape, dtype=bool)
+    dx = np.finfo(float).eps**0.33
+    p1 = p0*(1.0 + dx) + np.where(p0 >= 0.0, dx, -dx)
+    q0, q1 = np.asarray(f(p0, *args), dtype=float), np.asarray(f(p1, *args), dtype=float)
+    index = np.arange(p0.size)
+    for _ in range(maxiter):
+        if not index.size:
+            break
+        iterations[index] += 1
+        flat = q1 == q0
+        with np.errstate(divide='ignore', invalid='ignore'):
+            p = np.where(flat, (p1 + p0)/2.0, p1 - q1*(p1 - p0)/np.where(flat, 1.0, q1 - q0))
+        done = flat | (np.abs(p - p1) < tol)
+        root[index[done]] = p[done]
+        converged[index[done]] = ~flat[done] | (p1[done] == p0[done])
+        keep = ~done
+        index, p0, q0, p1 = index[keep], p1[keep], q1[keep], p[keep]
+        if index.size:
+            q1 = np.asarray(f(p1, *[arg[index] for arg in args]), dtype=float)
+    root[index] = p1
+    return root.reshape(shape), iterations.reshape(shape), converged.reshape(shape)
+
+def secant(f, x0, args=(), tol=1e-8, maxiter=50, name=None, argumentNames=()):
+    '''
+    Secant method from x0 and a second point close to it, the steps of scipy.optimize.newton without a derivative
+
+    Args:
+        f (callable): residual f(x, *args)
+        x0 (float or array): starting value
+        args (tuple): further arguments of f, floats or arrays broadcasting against x0
+        tol (float): absolute tolerance of the last step
+        maxiter (int): largest number of iterations
+        name (str): solver name to record telemetry as
+        argumentNames (tuple): names of args in the telemetry
+
+    Returns:
+        float or array: root
+    '''
+    if _isScalar(x0, args):
+        root, iterations, converged = _secantScalar(f, x0, args, tol, maxiter)
+    else:
+        root, iterations, converged = _secantArray(f, x0, args, tol, maxiter)
+    return _finish(f, args, root, iterations, converged, name, argumentNames)
+
+def _newtonScalar(f, fprime, x0, args, tol, maxiter):
+    x = float(x0)
+    for iteration in range(1, maxiter + 1):
+        slope = float(fprime(x, *args))
+        if slope == 0.0:
+            return x, iteration, float(f(x, *args)) == 0.0
+        step = float(f(x, *args))/slope
+        x -= step
+        if abs(step) <= tol:
+            return x, iteration, True
+    return x, maxiter, False
+
+def _newtonArray(f, fprime, x0, args, tol, maxiter):
+    shape, x, args = _flatten(x0, args)
+    iterations = np.zeros(x.shape, dtype=int)
+    converged = np.zeros(x.shape, dtype=bool)
+    index = np.arange(x.size)
+    for _ in range(maxiter):
+        if not index.size:
+            break
+        iterations[index] += 1
+        active = [arg[index] for arg in args]
+        value, slope = np.asarray(f(x[index], *active), dtype=float), np.asarray(fprime(x[index], *active), dtype=float)
+        flat = slope == 0.0
+        step = np.where(flat, 0.0, value/np.where(flat, 1.0, slope))
+        x[index] -= step
+        done = flat | (np.abs(step) <= tol)
+        converged[index[done]] = ~flat[done] | (value[done] == 0.0)
+        index = index[~done]
+    return x.reshape(shape), iterations.reshape(shape), converged.reshape(shape)
+
+def newton(f, fprime, x0, args=(), tol=1e-8, maxiter=50, name=None, argumentNames=()):
+    '''
+    Newton's method with the derivative fprime(x, *args) of f, for residuals whose derivative comes with the
+    properties at little extra cost. The arguments and result are those of secant.
+    '''
+    if _isScalar(x0, args):
+        root, iterations, converged = _newtonScalar(f, fprime, x0, args, tol, maxiter)
+    else:
+        root, iterations, converged = _newtonArray(f, fprime, x0, args, tol, maxiter)
+    return _finish(f, args, root, iterations, converged, name, argumentNames)
+
+def _safeguardedNewtonScalar(f, x0, lower, upper, args, tol, maxiter):
+    x, lower, upper = float(x0), float(lower), float(upper)
+    for iteration in range(1, maxiter + 1):
+        value, slope = f(x, *args)
+        if value != value:
+            return x, iteration, False
+        if value > 0.0:
+            upper = x
+        else:
+            lower = x
+        following = (lower + upper)/2.0
+        if slope > 0.0 and lower < x - value/slope < upper:
+            following = x - value/slope
+        step, x = following - x, following
+        if abs(step) <= tol or upper - lower <= tol:
+            return x, iteration, True
+    return x, maxiter, False
+
+def _safeguardedNewtonArray(f, x0, lower, upper, args, tol, maxiter):
+    shape, x, args = _flatten(x0, args)
+    lower = np.broadcast_to(np.asarray(lower, dtype=float), shape).ravel().copy()
+    upper = np.broadcast_to(np.asarray(upper, dtype=float), shape).ravel().copy()
+    iterations = np.zeros(x.shape, dtype=int)
+    converged = np.zeros(x.shape, dtype=bool)
+    index = np.arange(x.size)
+    for _ in range(maxiter):
+        if not index.size:
+            break
+        iterations[index] += 1
+        current = x[index]
+        value, slope = f(current, *[arg[index] for arg in args])
+        above = value > 0.0
+        upper[index] = np.where(above, current, upper[index])
+        lower[index] = np.where(above, lower[index], current)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            newton = current - value/slope
+        inside = (slope > 0.0) & (newton > lower[index]) & (newton < upper[index])
+        following = np.where(inside, newton, (lower[index] + upper[index])/2.0)
+        x[index] = following
+        failed = np.isnan(value)
+        done = failed | (np.abs(following - current) <= tol) | (upper[index] - lower[index] <= tol)
+        converged[index[done & ~failed]] = True
+        index = index[~done]
+    return x.reshape(shape), iterations.reshape(shape), converged.reshape(shape)
+
+def safeguardedNewton(f, x0, lower, upper, args=(), tol=1e-8, maxiter=100, name=None, argumentNames=()):
+    '''
+    Newton's method kept inside the bracket [lower, upper] of a residual that increases through its root, for
+    residuals whose derivative comes with the same properties. f(x, *args) returns the residual and its derivative.
+    Every residual narrows the bracket, and a Newton step that leaves it or has a slope of the wrong sign is replaced
+    by bisection, so the iteration converges even from a poor starting value. Converges when the step or the bracket
+    is within tol, a root beyond a limit converges onto that limit. States with a NaN residual stop and do not
+    converge. The other arguments and the result are those of secant.
+    '''
+    if _isScalar(x0, args) and np.ndim(lower) == 0 and np.ndim(upper) == 0:
+        root, iterations, converged = _safeguardedNewtonScalar(f, x0, lower, upper, args, tol, maxiter)
+    else:
+        root, iterations, converged = _safeguardedNewtonArray(f, x0, lower, upper, args, tol, maxiter)
+    return _finish(lambda x, *args: f(x, *args)[0], args, root, iterations, converged, name, argumentNames)
+
+def _brentStep(xpre, xcur, xblk, fpre, fcur, fblk, spre, sbis, delta):
+    '''Step of Brent's method for arrays: inverse quadratic or secant interpolation when it falls well inside
+    the bracket and shrinks faster than bisection, bisection otherwise. Returns the interpolation step and
+    whether it is taken.'''
+    with np.errstate(divide='ignore', invalid='ignore'):
+        secantStep = -fcur*(xcur - xpre)/(fcur - fpre)
+        dpre = (fpre - fcur)/(xpre - xcur)
+        dblk = (fblk - fcur)/(xblk - xcur)
+        quadraticStep = -fcur*(fblk*dblk - fpre*dpre)/(dblk*dpre*(fblk - fpre))
+    interpolate = (np.abs(spre) > delta) & (np.abs(fcur) < np.abs(fpre))
+    stry = np.where(xpre == xblk, secantStep, quadraticStep)
+    accept = interpolate & (2.0*np.abs(stry) < np.minimum(np.abs(spre), 3.0*np.abs(sbis) - delta))
+    return stry, accept
+
+def _brentScalar(f, a, b, args, tol, rtol, maxiter):
+    xpre, xcur = float(a), float(b)
+    fpre, fcur = float(f(xpre, *args)), float(f(xcur, *args))
+    if fpre*fcur > 0.0:
+        raise ValueError('f(a) and f(b) must have different signs')
+    if fpre == 0.0:
+        return xpre, 0, True
+    if fcur == 0.0:
+        return xcur, 0, True
+    xblk = fblk = spre = scur = 0.0
+    for iteration in range(1, maxiter + 1):
+        if fpre != 0.0 and fcur != 0.0 and (fpre < 0.0) != (fcur < 0.0):
+            xblk, fblk = xpre, fpre
+            spre = scur = xcur - xpre
+        if abs(fblk) < abs(fcur):
+            xpre, xcur, xblk = xcur, xblk, xcur
+            fpre, fcur, fblk = fcur, fblk, fcur
+        delta = (tol + rtol*abs(xcur))/2.0
+        sbis = (xblk - xcur)/2.0
+        if fcur == 0.0 or abs(sbis) < delta:
+            return xcur, iteration, True
+        if abs(spre) > delta and abs(fcur) < abs(fpre):
+            if xpre == xblk:
+                stry = -fcur*(xcur - xpre)/(fcur - fpre)
+            else:
+                dpre = (fpre - fcur)/(xpre - xcur)
+                dblk = (fblk - fcur)/(xblk - xcur)
+                stry = -fcur*(fblk*dblk - fpre*dpre)/(dblk*dpre*(fblk - fpre))
+            if 2.0*abs(stry) < min(abs(spre), 3.0*abs(sbis) - delta):
+                spre, scur = scur, stry
+            else:
+                spre = scur = sbis
+        else:
+            spre = scur = sbis
+        xpre, fpre = xcur, fcur
+        xcur += scur if abs(scur) > delta else (delta if sbis > 0.0 else -delta)
+        fcur = float(f(xcur, *args))
+    return xcur, maxiter, False
+
+def _brentArray(f, a, b, args, tol, rtol, maxiter):
+    shape, xcur, args = _flatten(b, args)
+    xpre = np.broadcast_to(np.asarray(a, dtype=float), shape).ravel().copy()
+    fpre, fcur = np.asarray(f(xpre, *args), dtype=float), np.asarray(f(xcur, *args), dtype=float)
+    if (fpre*fcur > 0.0).any():
+        raise ValueError('f(a) and f(b) must have different signs')
+    root = np.where(fpre == 0.0, xpre, xcur)
+    iterations = np.zeros(xcur.shape, dtype=int)
+    converged = (fpre == 0.0) | (fcur == 0.0)
+    index = np.flatnonzero(~converged)
+    xpre, xcur, fpre, fcur = xpre[index], xcur[index], fpre[index], fcur[index]
+    xblk, fblk, spre, scur = [np.zeros(index.size) for _ in range(4)]
+    for _ in range(maxiter):
+        if not index.size:
+            break
+        iterations[index] += 1
+        bracket = (fpre != 0.0) & (fcur != 0.0) & ((fpre < 0.0) != (fcur < 0.0))
+        xblk, fblk = np.where(bracket, xpre, xblk), np.where(bracket, fpre, fblk)
+        spre, scur = np.where(bracket, xcur - xpre, spre), np.where(bracket, xcur - xpre, scur)
+        # Keep the end of the bracket with the smaller residual as the current point
+        swap = np.abs(fblk) < np.abs(fcur)
+        xpre, xcur, xblk = np.where(swap, xcur, xpre), np.where(swap, xblk, xcur), np.where(swap, xcur, xblk)
+        fpre, fcur, fblk = np.where(swap, fcur, fpre), np.where(swap, fblk, fcur), np.where(swap, fcur, fblk)
+        delta = (tol + rtol*np.abs(xcur))/2.0
+        sbis = (xblk - xcur)/2.0
+        done = (fcur == 0.0) | (np.abs(sbis) < delta)
+        root[index[done]] = xcur[done]
+        converged[index[done]] = True
+        keep = ~done
+        index = index[keep]
+        xpre, xcur, xblk, fpre, fcur, fblk = xpre[keep], xcur[keep], xblk[keep], fpre[keep], fcur[keep], fblk[keep]
+        spre, scur, delta, sbis = spre[keep], scur[keep], delta[keep], sbis[keep]
+        if not index.size:
+            break
+        stry, accept = _brentStep(xpre, xcur, xblk, fpre, fcur, fblk, spre, sbis, delta)
+        spre, scur = np.where(accept, scur, sbis), np.where(accept, stry, sbis)
+        xpre, fpre = xcur, fcur
+        xcur = xcur + np.where(np.abs(scur) > delta, scur, np.where(sbis > 0.0, delta, -delta))
+        fcur = np.asarray(f(xcur, *[arg[index] for arg in args]), dtype=float)
+    root[index] = xcur
+    return root.reshape(shape), iterations.reshape(shape), converged.reshape(shape)
+
+def brent(f, a, b, args=(), tol=2e-12, rtol=4.0*np.finfo(float).eps, maxiter=100, name=None, argumentNames=()):
+    '''
+    Brent's method on the bracket [a, b], f(a) and f(b) of different signs, the algorithm of scipy.optimize.brentq.
+    Converges for any continuous residual and close to the root as fast as the secant method. Raises ValueError
+    if a state is not bracketed. The arguments and result are those of secant, tol and rtol bound the width of
+    the final bracket.
+    '''
+    if _isScalar(b, args) and np.ndim(a) == 0:
+        root, iterations, converged = _brentScalar(f, a, b, args, tol, rtol, maxiter)
+    else:
+        root, iterations, converged = _brentArray(f, a, b, args, tol, rtol, maxiter)
+    return _finish(f, args, root, iterations, converged, name, argumentNames)
@@ -0,0 +1,401 @@
+# -*- coding: utf-8 -*-
+'''
+Array evaluation of the public functions.
+Every function takes arrays in SI units (MPa, K, kJ/kg, kJ/(kg K)), resolves the region of each point
+and evaluates the region kernels on the points of that region only. Invalid points come back as NaN.
+'''
+import numpy as np
+
+try:
+    import Constants
+    import Properties
+    import Region1
+    import Region2
+    import Region3
+    import Region4
+    import Region5
+    import Regions
+    import Viscosity
+except ImportError:
+    from . import Constants
+    from . import Properties
+    from . import Region1
+    from . import Region2
+    from . import Region3
+    from . import Region4
+    from . import Region5
+    from . import Regions
+    from . import Viscosity
+
+_entropyMin, _entropyMax = -0.0001545495919, 9.155759395
+
+# Saturation.SaturationTable interpolating the saturated states instead of the region equations, see
+# XSteamPython.useSaturationTable
+saturationTable = None
+
+# Tables.PropertyTable interpolating the properties instead of the region equations, keyed by input pair,
+# see XSteamPython.usePropertyTable
+propertyTables = {}
+
+def _empty(shape):
+    '''StateProperties bundle with every field set to NaN'''
+    return Properties.StateProperties(*[np.full(shape, np.nan) for field in Properties.StateProperties._fields])
+
+def _assign(properties, mask, values):
+    for field, value in zip(properties, values):
+        field[mask] = value
+
+def _singlePhase(properties, region, pressure, temperature, density):
+    '''Fills the points of regions 1, 2, 3 and 5. Region 3 is evaluated from density and temperature.'''
+    for number, evaluate in ((1, Region1.properties1_pt), (2, Region2.properties2_pt), (5, Region5.properties5_pt)):
+        mask = region == number
+        if mask.any():
+            _assign(properties, mask, evaluate(pressure[mask], temperature[mask]))
+
+    mask = region == 3
+    if mask.any():
+        _assign(properties, mask, Region3.properties3_rhot(density[mask], temperature[mask]))
+        properties.pressure[mask] = pressure[mask]
+
+def _saturated(pressure, temperature, lowPressure, phase):
+    '''Saturated liquid or vapor at pressure and temperature on the saturation line, from saturationTable
+    when one is set'''
+    if saturationTable is None:
+        return _saturatedEquations(pressure, temperature, lowPressure, phase)
+    properties = saturationTable.properties_p(pressure, phase, lowPressure)
+    properties.temperature[...] = temperature
+    return properties
+
+def _saturatedEquations(pressure, temperature, lowPressure, phase):
+    '''Saturated liquid or vapor from the region equations.
+    Points in lowPressure are taken from region 1 or 2, the others from region 3 at h4_p.'''
+    properties = _empty(pressure.shape)
+    if lowPressure.any():
+        evaluate = Region1.properties1_pt if phase == 'liq' else Region2.properties2_pt
+        _assign(properties, lowPressure, evaluate(pressure[lowPressure], temperature[lowPressure]))
+
+    highPressure = ~lowPressure
+    if highPressure.any():
+        enthalpy = Region4.h4_p(pressure[highPressure], phase)
+        density = 1.0/Region3.v3_ph(pressure[highPressure], enthalpy)
+        _assign(properties, highPressure, Region3.properties3_rhot(density, temperature[highPressure]))
+        properties.pressure[highPressure] = pressure[highPressure]
+        properties.enthalpy[highPressure] = enthalpy
+
+    return properties
+
+def _saturated_p(pressure, phase):
+    pressure = np.asarray(pressure, dtype=float)
+    properties = _empty(pressure.shape)
+    valid = (pressure > Constants._pressureMin) & (pressure < Constants._pressureMax)
+    if valid.any():
+        validPressure = pressure[valid]
+        temperature = Region4.t4_p(validPressure)
+        _assign(properties, valid, _saturated(validPressure, temperature, validPressure < Constants._pressureSubDomain, phase))
+    return properties
+
+def _saturated_t(temperature, phase):
+    temperature = np.asarray(temperature, dtype=float)
+    properties = _empty(temperature.shape)
+    valid = (temperature > Constants._temperatureMin) & (temperature < Constants._temperatureMax)
+    if valid.any():
+        validTemperature = temperature[valid]
+        pressure = Region4.p4_t(validTemperature)
+        _assign(properties, valid, _saturated(pressure, validTemperature, validTemperature <= Constants._temperatureSubDomain, phase))
+    return properties
+
+def saturatedLiquid_p(pressure):
+    '''Saturated liquid properties given pressure'''
+    return _saturated_p(pressure, 'liq')
+
+def saturatedVapor_p(pressure):
+    '''Saturated vapor properties given pressure'''
+    return _saturated_p(pressure, 'vap')
+
+def saturatedLiquid_t(temperature):
+    '''Saturated liquid properties given temperature'''
+    return _saturated_t(temperature, 'liq')
+
+def saturatedVapor_t(temperature):
+    '''Saturated vapor properties given temperature'''
+    return _saturated_t(temperature, 'vap')
+
+def _twoPhase(properties, mask, pressure, temperature, quality):
+    '''Fills the points of region 4 as a mixture of saturated liquid and vapor.
+    quality maps the liquid and vapor bundles to the vapor fraction of each point. Heat capacities and
+    speed of sound are not defined for the mixture and stay NaN.'''
+    lowPressure = pressure < Constants._pressureSubDomain
+    liquid = _saturated(pressure, temperature, lowPressure, 'liq')
+    vapor = _saturated(pressure, temperature, lowPressure, 'vap')
+    vaporFraction = quality(liquid, vapor)
+    properties.pressure[mask] = pressure
+    properties.temperature[mask] = temperature
+    for field in ('specificVolume', 'enthalpy', 'internalEnergy', 'entropy'):
+        getattr(properties, field)[mask] = vaporFraction*getattr(vapor, field) + (1.0 - vaporFraction)*getattr(liquid, field)
+
+def _enthalpyQuality(enthalpy):
+    return lambda liquid, vapor: np.clip((enthalpy - liquid.enthalpy)/(vapor.enthalpy - liquid.enthalpy), 0.0, 1.0)
+
+def _entropyQuality(entropy):
+    return lambda liquid, vapor: np.clip((entropy - liquid.entropy)/(vapor.entropy - liquid.entropy), 0.0, 1.0)
+
+def properties_pt(pressure, temperature):
+    '''Properties given pressure and temperature. Points on the saturation line are invalid.'''
+    pressure, temperature = np.broadcast_arrays(np.asarray(pressure, dtype=float), np.asarray(temperature, dtype=float))
+    region = Regions.region_pt_array(pressure, temperature)
+    properties = _empty(pressure.shape)
+    density = np.empty(pressure.shape)
+
+    region3 = region == 3
+    if region3.any():
+        density[region3] = 1.0/Region3.v3_pt(pressure[region3], temperature[region3], polish=True)
+
+    _singlePhase(properties, region, pressure, temperature, density)
+    return properties
+
+def properties_ph(pressure, enthalpy, fields=None):
+    '''Properties given pressure and enthalpy, from propertyTables['ph'] when one is set. A table fills only the
+    fields named in fields, all of them by default.'''
+    if 'ph' in propertyTables:
+        return propertyTables['ph'].properties(pressure, enthalpy, fields)
+    return _properties_phEquations(pressure, enthalpy)
+
+def _properties_phEquations(pressure, enthalpy):
+    '''Properties given pressure and enthalpy from the region equations'''
+    pressure, enthalpy = np.broadcast_arrays(np.asarray(pressure, dtype=float), np.asarray(enthalpy, dtype=float))
+    region = Regions.region_ph_array(pressure, enthalpy)
+    properties = _empty(pressure.shape)
+    temperature = np.empty(pressure.shape)
+    density = np.empty(pressure.shape)
+
+    for number, backward in ((1, Region1.t1_ph), (2, Region2.t2_ph), (3, Region3.t3_ph), (5, Region5.t5_ph)):
+        mask = region == number
+        if mask.any():
+            temperature[mask] = backward(pressure[mask], enthalpy[mask])
+    mask = region == 3
+    if mask.any():
+        density[mask] = 1.0/Region3.v3_ph(pressure[mask], enthalpy[mask])
+
+    _singlePhase(properties, region, pressure, temperature, density)
+    mask = region == 4
+    if mask.any():
+        _twoPhase(properties, mask, pressure[mask], Region4.t4_p(pressure[mask]), _enthalpyQuality(enthalpy[mask]))
+    return properties
+
+def properties_ps(pressure, entropy, fields=None):
+    '''Properties given pressure and entropy, from propertyTables['ps'] when one is set, see properties_ph'''
+    if 'ps' in propertyTables:
+        return propertyTables['ps'].properties(pressure, entropy, fields)
+    return _properties_psEquations(pressure, entropy)
+
+def _properties_psEquations(pressure, entropy):
+    '''Properties given pressure and entropy from the region equations'''
+    pressure, entropy = np.broadcast_arrays(np.asarray(pressure, dtype=float), np.asarray(entropy, dtype=float))
+    region = Regions.region_ps_array(pressure, entropy)
+    properties = _empty(pressure.shape)
+    temperature = np.empty(pressure.shape)
+    density = np.empty(pressure.shape)
+
+    for number, backward in ((1, Region1.t1_ps), (2, Region2.t2_ps), (3, Region3.t3_ps), (5, Region5.t5_ps)):
+        mask = region == number
+        if mask.any():
+            temperature[mask] = backward(pressure[mask], entropy[mask])
+    mask = region == 3
+    if mask.any():
+        density[mask] = 1.0/Region3.v3_ps(pressure[mask], entropy[mask])
+
+    _singlePhase(properties, region, pressure, temperature, density)
+    mask = region == 4
+    if mask.any():
+        _twoPhase(properties, mask, pressure[mask], Region4.t4_p(pressure[mask]), _entropyQuality(entropy[mask]))
+    return properties
+
+def region_hs(enthalpy, entropy):
+    '''Regions.region_hs_array without region 5, which has no backward equations'''
+    region = Regions.region_hs_array(enthalpy, entropy)
+    region[region == 5] = 0
+    return region
+
+def properties_hs(enthalpy, entropy, fields=None):
+    '''Properties given enthalpy and entropy, from propertyTables['hs'] when one is set, see properties_ph. Region 5
+    has no backward equations and is invalid.'''
+    if 'hs' in propertyTables:
+        return propertyTables['hs'].properties(enthalpy, entropy, fields)
+    return _properties_hsEquations(enthalpy, entropy)
+
+def _properties_hsEquations(enthalpy, entropy):
+    '''Properties given enthalpy and entropy from the region equations'''
+    enthalpy, entropy = np.broadcast_arrays(np.asarray(enthalpy, dtype=float), np.asarray(entropy, dtype=float))
+    region = region_hs(enthalpy, entropy)
+    properties = _empty(enthalpy.shape)
+    pressure = np.empty(enthalpy.shape)
+    temperature = np.empty(enthalpy.shape)
+    density = np.empty(enthalpy.shape)
+
+    for number, backwardPressure, backwardTemperature in ((1, Region1.p1_hs, Region1.t1_ph), (2, Region2.p2_hs, Region2.t2_ph), (3, Region3.p3_hs, Region3.t3_ph)):
+        mask = region == number
+        if mask.any():
+            pressure[mask] = backwardPressure(enthalpy[mask], entropy[mask])
+            temperature[mask] = backwardTemperature(pressure[mask], enthalpy[mask])
+    mask = region == 3
+    if mask.any():
+        density[mask] = 1.0/Region3.v3_ph(pressure[mask], enthalpy[mask])
+
+    _singlePhase(properties, region, pressure, temperature, density)
+    mask = region == 4
+    if mask.any():
+        saturationTemperature = Region4.t4_hs(enthalpy[mask], entropy[mask])
+        _twoPhase(properties, mask, Region4.p4_t(saturationTemperature), saturationTemperature, _enthalpyQuality(enthalpy[mask]))
+    return properties
+
+def saturationTemperature_p(pressure):
+    pressure = np.asarray(pressure, dtype=float)
+    valid = (pressure >= Constants._pressureMin) & (pressure <= Constants._pressureMax + 0.001)
+    return np.where(valid, Region4.t4_p(np.where(valid, pressure, np.nan)), np.nan)
+
+def saturationPressure_t(temperature):
+    temperature = np.asarray(temperature, dtype=float)
+    valid = (temperature > Constants._temperatureMin) & (temperature <= Constants._temperatureMax)
+    return np.where(valid, Region4.p4_t(np.where(valid, temperature, np.nan)), np.nan)
+
+def saturationPressure_s(entropy):
+    entropy = np.asarray(entropy, dtype=float)
+    pressure = np.full(entropy.shape, np.nan)
+    valid = (entropy > _entropyMin) & (entropy < _entropyMax)
+    if valid.any():
+        pressure[valid] = Region4.p4_s(entropy[valid])
+    return pressure
+
+def saturationTemperature_s(entropy):
+    return Region4.t4_p(saturationPressure_s(entropy))
+
+def quality_ph(pressure, enthalpy):
+    '''Vapor fraction given pressure and enthalpy, clipped to 0 and 1 outside the two phase region'''
+    pressure, enthalpy = np.broadcast_arrays(np.asarray(pressure, dtype=float), np.asarray(enthalpy, dtype=float))
+    liquid, vapor = saturatedLiquid_p(pressure), saturatedVapor_p(pressure)
+    return _enthalpyQuality(enthalpy)(liquid, vapor)
+
+def quality_ps(pressure, entropy):
+    '''Vapor fraction given pressure and entropy, clipped to 0 and 1 outside the two phase region'''
+    pressure, entropy = np.broadcast_arrays(np.asarray(pressure, dtype=float), np.asarray(entropy, dtype=float))
+    liquid, vapor = saturatedLiquid_p(pressure), saturatedVapor_p(pressure)
+    return _entropyQuality(entropy)(liquid, vapor)
+
+def _voidFraction(pressure, quality):
+    liquid, vapor = saturatedLiquid_p(pressure), saturatedVapor_p(pressure)
+    quality = quality(liquid, vapor)
+    return quality*vapor.specificVolume/(quality*vapor.specificVolume + (1.0 - quality)*liquid.specificVolume)
+
+def voidFraction_ph(pressure, enthalpy):
+    pressure, enthalpy = np.broadcast_arrays(np.asarray(pressure, dtype=float), np.asarray(enthalpy, dtype=float))
+    return _voidFraction(pressure, _enthalpyQuality(enthalpy))
+
+def voidFraction_ps(pressure, entropy):
+    pressure, entropy = np.broadcast_arrays(np.asarray(pressure, dtype=float), np.asarray(entropy, dtype=float))
+    return _voidFraction(pressure, _entropyQuality(entropy))
+
+def enthalpy_px(pressure, quality):
+    pressure, quality = np.broadcast_arrays(np.asarray(pressure, dtype=float), np.asarray(quality, dtype=float))
+    liquid, vapor = saturatedLiquid_p(pressure), saturatedVapor_p(pressure)
+    enthalpy = liquid.enthalpy + quality*(vapor.enthalpy - liquid.enthalpy)
+    return np.where((quality >= 0.0) & (quality <= 1.0), enthalpy, np.nan)
+
+def enthalpy_tx(temperature, quality):
+    temperature = np.asarray(temperature, dtype=float)
+    pressure = Region4.p4_t(np.where(temperature < Constants._temperatureMax, temperature, np.nan))
+    return enthalpy_px(pressure, quality)
+
+def _viscosity(pressure, temperature, density):
+    '''my_rhot on the valid area of the viscosity formulation'''
+    valid = ~((temperature > 900.0 + 273.15) | ((temperature > 600.0 + 273.15) & (pressure > 300.0)) | ((temperature > 150.0 + 273.15) & (pressure > 350.0)) | (pressure > 500.0))
+    return np.where(valid, Viscosity.my_rhot(density, temperature), np.nan)
+
+def viscosity_pt(pressure, temperature):
+    properties = properties_pt(pressure, temperature)
+    return _viscosity(properties.pressure, properties.temperature, 1.0/properties.specificVolume)
+
+def viscosity_ph(pressure, enthalpy):
+    '''Viscosity given pressure and enthalpy, the two phase region is invalid'''
+    properties = properties_ph(pressure, enthalpy, ('temperature', 'specificVolume', 'cp'))
+    singlePhase = ~np.isnan(properties.cp)
+    return np.where(singlePhase, _viscosity(properties.pressure, properties.temperature, 1.0/properties.specificVolume), np.nan)
+
+def viscosity_ps(pressure, entropy):
+    return viscosity_ph(pressure, properties_ps(pressure, entropy, ('enthalpy',)).enthalpy)
+
+def thermalConductivity_ptrho(pressure, temperature, density):
+    '''tc_pTrho for arrays'''
+    pressure, temperature, density = np.broadcast_arrays(np.asarray(pressure, dtype=float), np.asarray(temperature, dtype=float), np.asarray(density, dtype=float))
+    valid = (temperature >= 0.0) & (pressure >= Constants._pressureMin) & (temperature <= 800.0) & (pressure <= 400.0) \
+        & (((pressure <= 100.0) & (temperature <= 373.15)) \
+        | ((pressure <= 150.0) & (temperature <= 673.15)) \
+        | ((pressure <= 200.0) & (temperature <= 523.15)) \
+        | ((pressure <= 400.0) & (temperature <= 398.15)))
+    tPrime = np.where(valid, temperature, np.nan)/Constants._tp
+    rhoPrime = density/Constants._rhop
+    tc0 = tPrime**0.5 * (0.0102811 + 0.0299621*tPrime + 0.0156146*tPrime**2 - 0.00422464*tPrime**3)
+    tc1 = -0.39707 + 0.400302*rhoPrime + 1.06 * np.exp(-0.171587*(rhoPrime + 2.39219)**2)
+    dT = np.abs(tPrime - 1.0) + 0.00308976
+    Q = 2.0 + 0.0822994/dT**(3.0/5.0)
+    s = np.where(tPrime >= 1.0, 1.0/tPrime, 10.0932/dT**(3.0/5.0))
+    tc2 = (0.0701309/tPrime**10 + 0.011852)*rhoPrime**(9.0/5.0)*np.exp(0.642857*(1.0-rhoPrime**(14.0/5.0)))\
+       + 0.00169937*s*rhoPrime**Q*np.exp((Q/(1.0 + Q))*(1 - rhoPrime**(1.0 + Q)))\
+      - 1.02*np.exp(-4.11717*tPrime**(3.0/2.0) - 6.17937/rhoPrime**5)
+    return tc0 + tc1 + tc2
+
+def thermalConductivity_pt(pressure, temperature):
+    properties = properties_pt(pressure, temperature)
+    return thermalConductivity_ptrho(properties.pressure, properties.temperature, 1.0/properties.specificVolume)
+
+def thermalConductivity_ph(pressure, enthalpy):
+    properties = properties_ph(pressure, enthalpy, ('temperature', 'specificVolume'))
+    return thermalConductivity_ptrho(properties.pressure, properties.temperature, 1.0/properties.specificVolume)
+
+def thermalConductivity_hs(enthalpy, entropy):
+    return thermalConductivity_ph(properties_hs(enthalpy, entropy, ('pressure',)).pressure, enthalpy)
+
+def _saturatedThermalConductivity(properties):
+    return thermalConductivity_ptrho(properties.pressure, properties.temperature, 1.0/properties.specificVolume)
+
+def thermalConductivityLiquid_p(pressure):
+    return _saturatedThermalConductivity(saturatedLiquid_p(pressure))
+
+def thermalConductivityVapor_p(pressure):
+    return _saturatedThermalConductivity(saturatedVapor_p(pressure))
+
+def thermalConductivityLiquid_t(temperature):
+    return _saturatedThermalConductivity(saturatedLiquid_t(temperature))
+
+def thermalConductivityVapor_t(temperature):
+    return _saturatedThermalConductivity(saturatedVapor_t(temperature))
+
+def prandtl_pt(pressure, temperature):
+    properties = properties_pt(pressure, temperature)
+    density = 1.0/properties.specificVolume
+    viscosity = _viscosity(properties.pressure, properties.temperature, density)
+    thermalConductivity = thermalConductivity_ptrho(properties.pressure, properties.temperature, density)
+    return properties.cp*1000.0*viscosity/thermalConductivity
+
+def prandtl_ph(pressure, enthalpy):
+    properties = properties_ph(pressure, enthalpy, ('temperature', 'specificVolume', 'cp'))
+    density = 1.0/properties.specificVolume
+    viscosity = _viscosity(properties.pressure, properties.temperature, density)
+    thermalConductivity = thermalConductivity_ptrho(properties.pressure, properties.temperature, density)
+    return properties.cp*1000.0*viscosity/thermalConductivity
+
+def heatCapacityRatio_pt(pressure, temperature):
+    properties = properties_pt(pressure, temperature)
+    return properties.cp/properties.cv
+
+def heatCapacityRatio_ph(pressure, enthalpy):
+    properties = properties_ph(pressure, enthalpy, ('cp', 'cv'))
+    return properties.cp/properties.cv
+
+def surfaceTension_t(temperature):
+    temperature = np.asarray(temperature, dtype=float)
+    valid = (temperature >= 0.01) & (temperature <= Constants._tc)
+    tau = 1.0 - np.where(valid, temperature, np.nan)/Constants._tc
+    return 0.2358*tau**1.256*(1.0 - 0.625*tau)
+
+def surfaceTension_p(pressure):
+    return surfaceTension_t(saturationTemperature_p(pressure))
@@ -0,0 +1,98 @@
+# -*- coding: utf-8 -*-
+'''
+On-disk format of the precomputed tables: a directory with one .npy file per array and a JSON header
+'''
+import hashlib
+import json
+import os
+import shutil
+
+import numpy as np
+
+try:
+    import Boundaries
+    import Constants
+    import Polynomials
+    import Region1
+    import Region2
+    import Region3
+    import Region4
+    import Region5
+except ImportError:
+    from . import Boundaries
+    from . import Constants
+    from . import Polynomials
+    from . import Region1
+    from . import Region2
+    from . import Region3
+    from . import Region4
+    from . import Region5
+
+# Incremented whenever the layout of the stored tables changes
+formatVersion = 2
+
+_headerName = 'header.json'
+
+def checksum():
+    '''Checksum of the constants, coefficient arrays and evaluation plans of the equations the tables are built from'''
+    digest = hashlib.sha1()
+    for module in (Constants, Boundaries, Region1, Region2, Region3, Region4, Region5):
+        for name in sorted(vars(module)):
+            value = getattr(module, name)
+            if isinstance(value, np.ndarray):
+                data = value.tobytes()
+            elif isinstance(value, Polynomials.Polynomial):
+                data = value.source.encode('utf-8')
+            elif isinstance(value, float):
+                data = repr(value).encode('utf-8')
+            else:
+                continue
+            digest.update(module.__name__.split('.')[-1].encode('utf-8') + b'.' + name.encode('utf-8') + b'=' + data)
+    return digest.hexdigest()
+
+def save(path, kind, header, arrays):
+    '''Writes arrays, a dict of numpy arrays, and header, a dict of JSON values, to the directory path.
+    The files are written to a temporary directory first and moved in place, so a process loading the
+    table sees either the complete table or none.'''
+    path = os.path.abspath(path)
+    temporary = '{}.{}.tmp'.format(path, os.getpid())
+    if os.path.isdir(temporary):
+        shutil.rmtree(temporary)
+    os.makedirs(temporary)
+    for name, array in arrays.items():
+        np.save(os.path.join(temporary, name + '.npy'), np.ascontiguousarray(array))
+    header = dict(header, kind=kind, formatVersion=formatVersion, checksum=checksum(), arrays=sorted(arrays))
+    with open(os.path.join(temporary, _headerName), 'w') as headerFile:
+        json.dump(header, headerFile, indent=1, sort_keys=True)
+    if os.path.isdir(path):
+        shutil.rmtree(path, ignore_errors=True)
+    try:
+        os.rename(temporary, path)
+    except OSError:
+        # Another process stored the same table first
+        shutil.rmtree(temporary, ignore_errors=True)
+
+def load(path, kind):
+    '''Header and arrays of a table stored with save. The arrays are read-only memory maps of the files, so
+    processes loading the same table share one copy in memory. Raises ValueError if the table is of another
+    kind or was stored by another format version or from other equations.'''
+    with open(os.path.join(path, _headerName)) as headerFile:
+        header = json.load(headerFile)
+    if header.get('kind') != kind:
+        raise ValueError('{} holds a {} table, not a {} table'.format(path, header.get('kind'), kind))
+    if header.get('formatVersion') != formatVersion:
+        raise ValueError('{} was stored in table format {}, this version reads format {}'.format(path, header.get('formatVersion'), formatVersion))
+    if header.get('checksum') != checksum():
+        raise ValueError('{} was built from other equations, the table needs to be rebuilt'.format(path))
+    arrays = dict((name, np.load(os.path.join(path, name + '.npy'), mmap_mode='r')) for name in header['arrays'])
+    return header, arrays
+
+def loadOrBuild(path, load, build):
+    '''Table returned by load(path). If path holds no table or one that cannot be used any more, the table
+    returned by build() is stored at path and loaded from there, so that it is shared with the processes
+    loading it later.'''
+    try:
+        return load(path)
+    except (IOError, OSError, ValueError):
+        build().save(path)
+        return load(path)
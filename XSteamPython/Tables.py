@@ -0,0 +1,251 @@
+# -*- coding: utf-8 -*-
+'''
+Spline based table look-up (SBTL) of the properties over pairs of input properties
+'''
+import numpy as np
+
+try:
+    import Arrays
+    import Properties
+    import Regions
+    import States
+    import Storage
+except ImportError:
+    from . import Arrays
+    from . import Properties
+    from . import Regions
+    from . import States
+    from . import Storage
+
+# Grid of every input pair: the two input fields, their node ranges, whether each axis is log spaced and
+# the default number of nodes, then the equations the table is built from and the region map used to keep
+# patches inside one region
+_layouts = {
+    'ph': (('pressure', 'enthalpy'), ((0.000611657, 100.0), (-0.1, 7400.0)), (True, False), (200, 400),
+           lambda first, second: States._properties_phEquations(first, second), Regions.region_ph_array),
+    'ps': (('pressure', 'entropy'), ((0.000611657, 100.0), (-0.01, 13.95)), (True, False), (200, 400),
+           lambda first, second: States._properties_psEquations(first, second), Regions.region_ps_array),
+    'hs': (('enthalpy', 'entropy'), ((-0.1, 4200.0), (-0.01, 12.0)), (False, False), (400, 400),
+           lambda first, second: States._properties_hsEquations(first, second), States.region_hs),
+}
+
+# Fields interpolated in log, they span several orders of magnitude over the table
+_logFields = ('pressure', 'specificVolume')
+
+# Check points per node spacing along each axis when the error of the cells is measured, and the fraction of
+# the tolerance the error on the check grid has to stay below, for the larger error between the check points
+_checkPoints = 6
+_margin = 0.5
+
+# Smallest value the error of a field is taken relative to, the energies and entropy pass through zero
+# at the triple point
+_errorScale = {'enthalpy': 1.0, 'internalEnergy': 1.0, 'entropy': 0.01}
+
+# Monomial coefficients of the cubic Lagrange weights of the nodes -1, 0, 1 and 2, row p holds the coefficients
+# of t**p, so the weight of node k at t is sum(_monomials[p, k]*t**p)
+_monomials = np.array([[0.0, 1.0, 0.0, 0.0],
+                       [-1.0/3.0, -0.5, 1.0, -1.0/6.0],
+                       [0.5, -1.0, 0.5, 0.0],
+                       [-1.0/6.0, 0.5, -0.5, 1.0/6.0]])
+
+def _basis(t, u):
+    '''Monomials t**p u**q of the bicubic patches in the order of the coefficients, one row of 16 per point'''
+    tPowers = np.column_stack((np.ones(t.shape), t, t*t, t*t*t))
+    uPowers = np.column_stack((np.ones(u.shape), u, u*u, u*u*u))
+    return (tPowers[:, :, np.newaxis]*uPowers[:, np.newaxis, :]).reshape(-1, 16)
+
+class PropertyTable(object):
+    '''Properties tabulated over an input pair with bicubic patches, the SBTL approach of IAPWS.
+
+    The nodes form a regular grid in the transformed inputs, log(p) and h for 'ph', log(p) and s for 'ps'
+    and h and s for 'hs'. Between the nodes every field is the bicubic Lagrange polynomial through the 4 x 4
+    nodes around the cell, pressure and specific volume are interpolated in log. A cell is served from the
+    table only if all of its 16 nodes lie in the same region, so the region boundaries and the edges of the
+    table are always evaluated with the equations.
+
+    The table stores the 16 polynomial coefficients of every kept cell, one contiguous block per field, so a
+    look-up gathers one row per point and field and only the fields asked for are interpolated. That is 16
+    times the memory of the nodes, about 60 MB for the default 'ph' table.
+
+    When the table is built the error of every remaining cell is measured against the equations on a check
+    grid at a sixth of the node spacing. Cells with a relative error above half the tolerance in any field
+    are also left to the equations, the error between the check points is larger but stays within tolerance.
+    maximumError holds the largest error of each field on the check grid of the cells that are kept, taken
+    relative to at least 1 kJ/kg for enthalpy and internal energy and 0.01 kJ/(kg K) for entropy. It is a
+    sampled estimate: on 400 000 random states of each default table the largest error was 5.8e-6 with the
+    default tolerance of 1e-5. coverage is the fraction of the cells inside the range of the equations that
+    is kept. The input fields are returned as given.
+
+    save stores a built table to a directory and load maps it back into memory, see Storage.'''
+
+    def __init__(self, inputs='ph', firstPoints=None, secondPoints=None, tolerance=1e-5):
+        if inputs not in _layouts:
+            raise ValueError('Tables are available for {}'.format(', '.join(sorted(_layouts))))
+        self.tolerance = tolerance
+        ranges, points = self._setLayout(inputs)
+        firstPoints, secondPoints = firstPoints or points[0], secondPoints or points[1]
+        self._origin = np.array([self._transform(limit[0], axis) for axis, limit in enumerate(ranges)])
+        self._step = (np.array([self._transform(limit[1], axis) for axis, limit in enumerate(ranges)]) - self._origin)/(np.array([firstPoints, secondPoints]) - 1.0)
+        self._shape = (firstPoints, secondPoints)
+
+        first, second = np.meshgrid(*[self._inverse(self._origin[axis] + self._step[axis]*np.arange(points), axis) for axis, points in enumerate(self._shape)], indexing='ij')
+        nodes = self._values(self._equations(first.ravel(), second.ravel())).reshape((len(self._fields),) + self._shape)
+        region = self._region(first, second)
+        rows, columns = np.nonzero(self._singleRegionCells(region, nodes))
+        self._coefficients = self._patchCoefficients(nodes, rows, columns)
+        # Row of the coefficients of every cell, -1 for the cells left to the equations
+        self._cells = np.full((self._shape[0] - 1, self._shape[1] - 1), -1, dtype=np.int32)
+        self._cells[rows, columns] = np.arange(rows.size)
+        self.maximumError = self._measureError(rows, columns)
+        valid = (region[:-1, :-1] != 0) & (region[1:, :-1] != 0) & (region[:-1, 1:] != 0) & (region[1:, 1:] != 0)
+        self.coverage = float((self._cells >= 0).sum())/max(valid.sum(), 1)
+
+    def _setLayout(self, inputs):
+        self.inputs = inputs
+        self._inputFields, ranges, self._logAxes, points, self._equations, self._region = _layouts[inputs]
+        self._fields = [field for field in Properties.StateProperties._fields if field not in self._inputFields]
+        return ranges, points
+
+    def save(self, path):
+        '''Stores the table in the directory path'''
+        header = {'inputs': self.inputs, 'shape': list(self._shape), 'origin': self._origin.tolist(), 'step': self._step.tolist(),
+                  'tolerance': self.tolerance, 'maximumError': self.maximumError, 'coverage': self.coverage}
+        Storage.save(path, 'PropertyTable', header, {'coefficients': self._coefficients, 'cells': self._cells})
+
+    @classmethod
+    def load(cls, path, inputs=None):
+        '''Table stored in the directory path, with the coefficients mapped read-only from the files. Raises
+        ValueError if the stored table is not over inputs or cannot be used with these equations.'''
+        header, arrays = Storage.load(path, 'PropertyTable')
+        if inputs is not None and header['inputs'] != inputs:
+            raise ValueError('{} holds a table over {}, not over {}'.format(path, header['inputs'], inputs))
+        table = cls.__new__(cls)
+        table._setLayout(header['inputs'])
+        table.tolerance, table.maximumError, table.coverage = header['tolerance'], header['maximumError'], header['coverage']
+        table._shape = tuple(header['shape'])
+        table._origin, table._step = np.array(header['origin']), np.array(header['step'])
+        table._coefficients, table._cells = arrays['coefficients'], arrays['cells']
+        return table
+
+    def _transform(self, value, axis):
+        return np.log(value) if self._logAxes[axis] else np.asarray(value, dtype=float)
+
+    def _inverse(self, value, axis):
+        return np.exp(value) if self._logAxes[axis] else value
+
+    def _values(self, properties):
+        '''Node values of the tabulated fields, one row per field'''
+        with np.errstate(invalid='ignore', divide='ignore'):
+            return np.array([np.log(getattr(properties, field)) if field in _logFields else getattr(properties, field) for field in self._fields])
+
+    def _singleRegionCells(self, region, nodes):
+        '''Cells whose 16 nodes lie in one valid region and are either all finite or all NaN in every field,
+        cp and w are NaN in the two phase region'''
+        rows, columns = self._shape[0] - 3, self._shape[1] - 3
+        cornerRegion = region[:rows, :columns]
+        usable = cornerRegion != 0
+        finite = np.isfinite(nodes)
+        cornerFinite = finite[:, :rows, :columns]
+        for a in range(4):
+            for b in range(4):
+                usable &= region[a:a + rows, b:b + columns] == cornerRegion
+                usable &= (finite[:, a:a + rows, b:b + columns] == cornerFinite).all(axis=0)
+        # Cell (i, j) is the one between nodes i and i + 1, its stencil starts one node lower
+        cells = np.zeros((self._shape[0] - 1, self._shape[1] - 1), dtype=bool)
+        cells[1:-1, 1:-1] = usable
+        return cells
+
+    def _patchCoefficients(self, nodes, rows, columns):
+        '''Coefficients of t**p u**q of the patches of the cells (rows, columns), one block of rows by 16 per field'''
+        offsets = np.arange(4) - 1
+        first, second = (rows[:, np.newaxis] + offsets)[:, :, np.newaxis], (columns[:, np.newaxis] + offsets)[:, np.newaxis, :]
+        coefficients = np.empty((len(self._fields), rows.size, 16))
+        for column, fieldNodes in enumerate(nodes):
+            coefficients[column] = np.einsum('pk,nkl,ql->npq', _monomials, fieldNodes[first, second], _monomials).reshape(-1, 16)
+        return coefficients
+
+    def _measureError(self, rows, columns):
+        '''Drops the cells above half the tolerance from the table and returns the largest error of each field'''
+        # Check grid at sixths of the node spacing, the node itself is exact
+        offsets = [(a/_checkPoints, b/_checkPoints) for a in range(_checkPoints) for b in range(_checkPoints)][1:]
+        error = np.zeros((rows.size, len(self._fields)))
+        kept = np.ones(rows.size, dtype=bool)
+        cornerRegion = self._region(*self._nodeInputs(rows, columns))
+        for a, b in offsets:
+            first, second = self._nodeInputs(rows + a, columns + b)
+            exact = self._equations(first, second)
+            kept &= self._region(first, second) == cornerRegion
+            basis = _basis(np.array([a]), np.array([b]))[0]
+            for column, field in enumerate(self._fields):
+                # Every cell is checked at the same offset, one product per field gives the value in all of them
+                value = np.dot(self._coefficients[column], basis)
+                if field in _logFields:
+                    value = np.exp(value)
+                reference = getattr(exact, field)
+                with np.errstate(invalid='ignore', divide='ignore'):
+                    pointError = np.abs(value - reference)/np.maximum(np.abs(reference), _errorScale.get(field, 0.0))
+                # NaN in both is a field that is not defined in the region, NaN in one is a failed cell
+                pointError[np.isnan(value) & np.isnan(reference)] = 0.0
+                pointError[np.isnan(pointError)] = np.inf
+                np.maximum(error[:, column], pointError, out=error[:, column])
+
+        kept &= (error <= _margin*self.tolerance).all(axis=-1)
+        self._coefficients = np.ascontiguousarray(self._coefficients[:, kept])
+        self._cells[rows, columns] = np.where(kept, np.cumsum(kept) - 1, -1)
+        return dict((field, float(error[kept, column].max()) if kept.any() else 0.0) for column, field in enumerate(self._fields))
+
+    def _nodeInputs(self, rows, columns):
+        '''Inputs at the fractional node positions (rows, columns)'''
+        return [self._inverse(self._origin[axis] + self._step[axis]*index, axis) for axis, index in enumerate((rows, columns))]
+
+    def _locate(self, first, second):
+        '''Coefficient row of the cell holding each point, -1 where the equations are used, and the position of
+        the point inside its cell'''
+        with np.errstate(invalid='ignore', divide='ignore'):
+            position = [(self._transform(value, axis) - self._origin[axis])/self._step[axis] for axis, value in enumerate((first, second))]
+            index = [np.floor(value) for value in position]
+            # NaN positions compare False and are outside
+            inside = (index[0] >= 0.0) & (index[0] < self._cells.shape[0]) & (index[1] >= 0.0) & (index[1] < self._cells.shape[1])
+            cell = self._cells[np.where(inside, index[0], 0.0).astype(np.intp), np.where(inside, index[1], 0.0).astype(np.intp)]
+        return np.where(inside, cell, -1), position[0] - index[0], position[1] - index[1]
+
+    def _interpolate(self, column, cell, t, u):
+        '''Field column at points of the kept cells cell with Horner's scheme, in blocks of Arrays._blockSize
+        points so that the gathered coefficient rows stay in cache'''
+        coefficients = self._coefficients[column]
+        value = np.empty(cell.shape)
+        for start in range(0, cell.size, Arrays._blockSize):
+            block = slice(start, start + Arrays._blockSize)
+            a, tBlock, uBlock = np.take(coefficients, cell[block], axis=0), t[block], u[block]
+            result = ((a[:, 15]*uBlock + a[:, 14])*uBlock + a[:, 13])*uBlock + a[:, 12]
+            for power in (8, 4, 0):
+                result = result*tBlock + (((a[:, power + 3]*uBlock + a[:, power + 2])*uBlock + a[:, power + 1])*uBlock + a[:, power])
+            value[block] = result
+        return value
+
+    def properties(self, first, second, fields=None):
+        '''Properties.StateProperties for arrays of the two inputs in SI units, from the table where a kept cell
+        holds the state and from the equations everywhere else. fields names the fields needed, the other
+        fields are left NaN at the states served from the table.'''
+        first, second = np.broadcast_arrays(np.asarray(first, dtype=float), np.asarray(second, dtype=float))
+        shape = first.shape
+        first, second = first.ravel(), second.ravel()
+        cell, t, u = self._locate(first, second)
+        table = cell >= 0
+        everyPoint = table.all()
+
+        properties = States._empty(first.shape)
+        for field, value in zip(self._inputFields, (first, second)):
+            getattr(properties, field)[...] = value
+        if table.any():
+            if not everyPoint:
+                cell, t, u = cell[table], t[table], u[table]
+            for column, field in enumerate(self._fields):
+                if fields is not None and field not in fields:
+                    continue
+                value = self._interpolate(column, cell, t, u)
+                getattr(properties, field)[table] = np.exp(value) if field in _logFields else value
+        if not everyPoint:
+            equations = ~table
+            States._assign(properties, equations, self._equations(first[equations], second[equations]))
+        return Properties.StateProperties(*[field.reshape(shape) for field in properties])
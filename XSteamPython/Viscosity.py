@@ -2,8 +2,6 @@
 '''
 Viscosity functions
 '''
-import math
-
 import numpy as np
 
 try:
@@ -39,7 +37,7 @@ def my_allregions_pT(pressure, temperature):
     elif region == 2:
         density = 1.0/Region2.v2_pt(pressure, temperature)
     elif region == 3:
-        density = 1.0/Region3.v3_ph(pressure, Region3.h3_pt(pressure, temperature))
+        density = 1.0/Region3.v3_pt(pressure, temperature, polish=True)
     elif region == 4:
         density = Constants._errorValue
     elif region == 5:
@@ -114,5 +112,5 @@ def my_rhot(density, temperature):
     for i in range(6):
         total += h0[i]*a**i + h1[i]*a**i*b + h2[i]*a**i*b**2 + h3[i]*a**i*b**3 + h4[i]*a**i*b**4 + h5[i]*a**i*b**5 + h6[i]*a**i*b**6
 
-    my_1 = math.exp(rhos*total)
+    my_1 = np.exp(rhos*total)
     return my_0*my_1*0.000055071
@@ -3,31 +3,99 @@
 XSteamPython
 Steam tables in python
 '''
+import contextlib
+import functools
 import math
+import sys
+import threading
+
+import numpy as np
 
 try:
     import Constants
     import Convert
+    import Instrumentation
     import Region1
     import Region2
     import Region3
     import Region4
     import Region5
     import Regions
+    import Saturation
+    import States
+    import Storage
+    import Tables
     import Viscosity
 except ImportError:
     from . import Constants
     from . import Convert
+    from . import Instrumentation
     from . import Region1
     from . import Region2
     from . import Region3
     from . import Region4
     from . import Region5
     from . import Regions
+    from . import Saturation
+    from . import States
+    from . import Storage
+    from . import Tables
     from . import Viscosity
 
+# Unit system of the process, the default for calls outside of unitSystem and without units
 englishUnits = False
 
+class _ThreadUnits(threading.local):
+    '''Stand-in for contextvars.ContextVar on Python versions without contextvars, one value per thread'''
+    value = None
+
+    def get(self):
+        return self.value
+
+    def set(self, value):
+        previous, self.value = self.value, value
+        return previous
+
+    def reset(self, previous):
+        self.value = previous
+
+try:
+    import contextvars
+    # Unit system set by unitSystem for the current thread or asyncio task, None to use englishUnits
+    _units = contextvars.ContextVar('units', default=None)
+except ImportError:
+    _units = _ThreadUnits()
+
+def _englishUnits():
+    '''True if the current call is in English units'''
+    english = _units.get()
+    return englishUnits if english is None else english
+
+def _isEnglish(units):
+    if units in ('SI', 'si'):
+        return False
+    if units in ('English', 'english'):
+        return True
+    raise ValueError("units needs to be 'SI' or 'English', got {!r}".format(units))
+
+@contextlib.contextmanager
+def unitSystem(units):
+    '''
+    Evaluates the calls inside the with block in the given unit system. The setting applies to the current
+    thread or asyncio task only, so concurrent callers can use different unit systems.
+
+    >>> with unitSystem('English'):
+    ...     h_pT(14.7, 212.0)
+
+    Args:
+        units (str): 'SI' or 'English'
+    '''
+    token = _units.set(_isEnglish(units))
+    try:
+        yield
+    finally:
+        _units.reset(token)
+
 def switchUnits():
     '''Function to switch between unit systems'''
     global englishUnits
@@ -49,6 +117,283 @@ def useSI():
     print("Using SI Units")
     englishUnits = False
 
+def useSaturationTable(table=None, path=None):
+    '''
+    Interpolate saturated states in array mode from a precomputed saturation table instead of evaluating
+    the region equations. Scalar calls are not affected.
+
+    Args:
+        table (Saturation.SaturationTable): table to use, a table with the default sizes is built if omitted
+        path (str): directory of a stored table, mapped into memory if it holds a table built from these
+            equations, otherwise the table is built and stored there
+
+    Returns:
+        Saturation.SaturationTable: the table in use, its maximumError gives the relative error of each property
+    '''
+    if table is None:
+        if path is None:
+            table = Saturation.SaturationTable()
+        else:
+            table = Storage.loadOrBuild(path, Saturation.SaturationTable.load, Saturation.SaturationTable)
+    States.saturationTable = table
+    return States.saturationTable
+
+def useSaturationEquations():
+    '''Evaluate saturated states in array mode from the region equations again'''
+    States.saturationTable = None
+
+def usePropertyTable(inputs='ph', table=None, path=None):
+    '''
+    Interpolate the properties in array mode from a spline table over an input pair instead of evaluating the
+    region equations (fast mode). States near region boundaries are still evaluated with the equations.
+    Scalar calls are not affected.
+
+    Args:
+        inputs (str): input pair of the table, 'ph', 'ps' or 'hs'
+        table (Tables.PropertyTable): table to use, a table with the default sizes is built if omitted
+        path (str): directory of a stored table, mapped into memory if it holds a table over inputs built from
+            these equations, otherwise the table is built and stored there
+
+    Returns:
+        Tables.PropertyTable: the table in use, its maximumError gives the largest relative error of each property
+    '''
+    if table is None:
+        if path is None:
+            table = Tables.PropertyTable(inputs)
+        else:
+            table = Storage.loadOrBuild(path, lambda path: Tables.PropertyTable.load(path, inputs), lambda: Tables.PropertyTable(inputs))
+    States.propertyTables[table.inputs] = table
+    return table
+
+def usePropertyEquations():
+    '''Evaluate the properties in array mode from the region equations again'''
+    States.propertyTables.clear()
+
+# Recorder of the instrumented calls and the original of every instrumented function by name
+_recorder = Instrumentation.Recorder()
+_instrumented = {}
+
+# Region classifiers by the input pair at the end of a function name
+_regionClassifiers = {'pT': Regions.region_pt_array, 'ph': Regions.region_ph_array, 'ps': Regions.region_ps_array, 'hs': Regions.region_hs_array}
+
+def _namespaces():
+    '''Namespaces holding the public functions, this module and the package that imports them from it'''
+    namespaces = [globals()]
+    package = sys.modules.get(__package__ or '')
+    if package is not None and package is not sys.modules[__name__]:
+        namespaces.append(vars(package))
+    return namespaces
+
+def _regionClassifier(name, function):
+    '''Histogram of the regions of the states of a call of a public function as a dict, None for functions
+    that do not resolve a region'''
+    prefix, inputs = name.split('_', 1)
+    if prefix in ('Tsat', 'Psat', 'st', 'surfaceTension') or prefix[-1] in 'LV' or inputs in ('px', 'Tx'):
+        # Saturated states, the states out of range count as region 0
+        def classify(args, kwargs, value):
+            result = value[0] if kwargs.get('returnMask') else value
+            if isinstance(result, np.ndarray):
+                invalid = int(np.isnan(result).sum())
+                return {4: result.size - invalid, 0: invalid}
+            return {0: 1} if result == Constants._errorValue else {4: 1}
+        return classify
+
+    classifier = _regionClassifiers.get(inputs)
+    if classifier is None:
+        return None
+    plans = function._plans
+
+    def classify(args, kwargs, value):
+        units = kwargs.get('units')
+        englishUnits = _englishUnits() if units is None else _isEnglish(units)
+        states = [Convert.convert(np.array(arg, dtype=float), plan) for arg, plan in zip(args, plans[englishUnits][0])]
+        if len(states) != 2:
+            return None
+        with np.errstate(invalid='ignore', divide='ignore'):
+            region = np.asarray(classifier(*np.broadcast_arrays(*[np.atleast_1d(state) for state in states])))
+        counts = np.bincount(region.ravel().astype(int), minlength=6)
+        return dict((number, int(count)) for number, count in enumerate(counts) if count)
+    return classify
+
+def enableInstrumentation():
+    '''
+    Record the calls of the public property functions: call counts, cumulative and percentile latency, counts
+    of invalid results (Constants._errorValue, NaN in array mode) and a histogram of the regions the states
+    resolved to. The functions of this module are swapped for recording ones, references taken before
+    enabling are not recorded. A public function called by another one is not recorded separately.
+    '''
+    if _instrumented:
+        return
+    namespaces = _namespaces()
+    for name, function in list(globals().items()):
+        if callable(function) and hasattr(function, '_plans'):
+            instrumented = _recorder.wrap(name, function, _regionClassifier(name, function))
+            _instrumented[name] = function
+            for namespace in namespaces:
+                if namespace.get(name) is function:
+                    namespace[name] = instrumented
+
+def disableInstrumentation():
+    '''Swap the original public functions back in, the recorded statistics are kept'''
+    for namespace in _namespaces():
+        for name, function in _instrumented.items():
+            if getattr(namespace.get(name), '__wrapped__', None) is function:
+                namespace[name] = function
+    _instrumented.clear()
+
+def instrumentationSnapshot():
+    '''
+    Statistics recorded since enabling instrumentation or the last reset
+
+    Returns:
+        dict: by function name a dict with calls, points (states evaluated), errors, totalSeconds,
+            meanSeconds, percentileSeconds (50th, 90th and 99th percentile of the latest calls) and regions
+            (states by region number, 0 for out of range)
+    '''
+    return _recorder.snapshot()
+
+def resetInstrumentation():
+    '''Clear the recorded statistics'''
+    _recorder.reset()
+
+def enableSolverTelemetry():
+    '''
+    Record the convergence of the iterative solvers: the iterations and final residual of every state solved
+    for and the states that did not converge. The solvers are the secant solves of t1_prho, t2_prho, t3_prho,
+    t5_ph, t5_ps and t5_prho, the Newton polish of the region 3 density behind h3_pt (Region3.v3_pt), the
+    Newton steps of h4_p above 16.529 MPa and the wet and liquid loops of t4_hs.
+    '''
+    Instrumentation.solvers.enabled = True
+
+def disableSolverTelemetry():
+    '''Stop recording the solvers, the recorded statistics are kept'''
+    Instrumentation.solvers.enabled = False
+
+def solverTelemetrySnapshot():
+    '''
+    Solver statistics recorded since enabling solver telemetry or the last reset
+
+    Returns:
+        dict: by solver name a dict with calls, points (states solved for), failures (states that did not
+            converge), iterations (states by iteration count), residuals (states by decade of the final
+            residual), failedStates (inputs of the latest states that did not converge) and slowestStates
+            (inputs of the states that took the most iterations)
+    '''
+    return Instrumentation.solvers.snapshot()
+
+def resetSolverTelemetry():
+    '''Clear the recorded solver statistics'''
+    Instrumentation.solvers.reset()
+
+def _plans(quantities, resultQuantity):
+    '''Conversion plans of the arguments and the result of a public function for both unit systems,
+    dimensionless quantities (None) are not converted'''
+    return dict((englishUnits, ([Convert.toSIPlan(quantity, englishUnits) if quantity else () for quantity in quantities],
+                                Convert.fromSIPlan(resultQuantity, englishUnits) if resultQuantity else ()))
+                for englishUnits in (False, True))
+
+def _field(evaluate, field):
+    '''Array kernel returning one field of a States property bundle, density is 1/specificVolume'''
+    if evaluate in (States.properties_ph, States.properties_ps, States.properties_hs):
+        # A property table interpolates only the field that is returned
+        evaluate = functools.partial(evaluate, fields=('specificVolume',) if field == 'density' else (field,))
+    if field == 'density':
+        return lambda *args: 1.0/evaluate(*args).specificVolume
+    return lambda *args: getattr(evaluate(*args), field)
+
+# Default of the argument of the one argument public functions, to tell a missing argument from None
+_noArgument = object()
+
+def _arrays(kernel, quantities, resultQuantity):
+    '''Adds an array mode to a public function.
+
+    Calls without numpy arrays go to the scalar function unchanged. When any argument is a numpy array
+    the arguments are broadcast against each other and converted to SI units (quantities names the
+    unit of each argument, None for dimensionless), kernel evaluates every point at once with the
+    States functions and the result is converted back as resultQuantity. Invalid points are NaN instead
+    of Constants._errorValue. Passing returnMask=True also returns a boolean array that is True where
+    the result is valid.
+
+    Passing units='SI' or units='English' evaluates the call in that unit system, see unitSystem.'''
+    plans = _plans(quantities, resultQuantity)
+
+    def decorator(function):
+        code = getattr(function, '__wrapped__', function).__code__
+        names = code.co_varnames[:code.co_argcount]
+
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            if not kwargs:
+                for arg in args:
+                    if isinstance(arg, np.ndarray):
+                        break
+                else:
+                    return function(*args)
+            units = kwargs.pop('units', None)
+            if units is not None:
+                with unitSystem(units):
+                    return wrapper(*args, **kwargs)
+            returnMask = kwargs.pop('returnMask', False)
+            if not any(isinstance(arg, np.ndarray) for arg in list(args) + list(kwargs.values())):
+                value = function(*args, **kwargs)
+                if returnMask:
+                    return value, value != Constants._errorValue
+                return value
+
+            args = list(args) + [kwargs.pop(name) for name in names[len(args):] if name in kwargs]
+            if kwargs or len(args) != len(names):
+                raise TypeError('{}() takes arguments {}'.format(function.__name__, ', '.join(names)))
+            argumentPlans, resultPlan = plans[_englishUnits()]
+            args = np.broadcast_arrays(*[Convert.convert(np.array(arg, dtype=float), plan) for arg, plan in zip(args, argumentPlans)])
+            shape = args[0].shape
+            with np.errstate(invalid='ignore', divide='ignore'):
+                value = kernel(*[arg.ravel() for arg in args])
+            value = Convert.convert(np.require(value, dtype=float, requirements='W').reshape(shape), resultPlan)
+            if returnMask:
+                return value, ~np.isnan(value)
+            return value
+
+        if len(names) == 1:
+            general = wrapper
+
+            # Scalar calls of the one argument functions, the cheapest ones, skip packing the arguments
+            @functools.wraps(function)
+            def wrapper(argument=_noArgument, *args, **kwargs):
+                if args or kwargs or argument is _noArgument or isinstance(argument, np.ndarray):
+                    return general(*(() if argument is _noArgument else (argument,)) + args, **kwargs)
+                return function(argument)
+        wrapper._plans = plans
+        return wrapper
+    return decorator
+
+def _inSI(quantities, resultQuantity):
+    '''Evaluates a public function that is composed of other public functions in SI units. English
+    arguments are converted to SI units once and the result is converted back once, instead of every
+    function called converting its arguments and result. quantities and resultQuantity are as for
+    _arrays, Constants._errorValue is returned as it is.'''
+    # English units of the public functions to their SI units, through the SI units of the equations
+    toSI = [Convert.toSIPlan(quantity, True) + Convert.fromSIPlan(quantity, False) if quantity else () for quantity in quantities]
+    fromSI = Convert.toSIPlan(resultQuantity, False) + Convert.fromSIPlan(resultQuantity, True) if resultQuantity else ()
+
+    def decorator(function):
+        names = function.__code__.co_varnames[:function.__code__.co_argcount]
+
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            if not _englishUnits():
+                return function(*args, **kwargs)
+            args = list(args) + [kwargs.pop(name) for name in names[len(args):] if name in kwargs]
+            args = [Convert.convert(float(arg), plan) for arg, plan in zip(args, toSI)]
+            with unitSystem('SI'):
+                value = function(*args, **kwargs)
+            if value == Constants._errorValue:
+                return value
+            return Convert.convert(value, fromSI)
+        wrapper.__wrapped__ = function
+        return wrapper
+    return decorator
+
+@_arrays(States.saturationTemperature_p, ('pressure',), 'temperature')
 def Tsat_p(pressure):
     '''
     Saturation temperature given pressure
@@ -59,6 +404,7 @@ def Tsat_p(pressure):
     Returns:
         float: Saturation temperature in °C or °F
     '''
+    englishUnits = _englishUnits()
     pressure = Convert.toSIUnit(float(pressure), 'pressure', englishUnits=englishUnits)
 
     if pressure >= Constants._pressureMin and pressure <= Constants._pressureMax + 0.001:
@@ -66,6 +412,7 @@ def Tsat_p(pressure):
     else:
         return Constants._errorValue
 
+@_arrays(States.saturationTemperature_s, ('entropy',), 'temperature')
 def Tsat_s(entropy):
     '''
     Saturation temperature given entropy
@@ -76,6 +423,7 @@ def Tsat_s(entropy):
     Returns:
         float: Saturation temperature in °C or °F
     '''
+    englishUnits = _englishUnits()
     if englishUnits: entropy = Convert.toSIUnit(float(entropy), 'entropy')
     entropyMin, entropyMax = -0.0001545495919, 9.155759395
 
@@ -84,6 +432,7 @@ def Tsat_s(entropy):
     else:
         return Constants._errorValue
 
+@_arrays(_field(States.properties_ph, 'temperature'), ('pressure', 'enthalpy'), 'temperature')
 def T_ph(pressure, enthalpy):
     '''
     Temperature given pressure and enthalpy
@@ -95,6 +444,7 @@ def T_ph(pressure, enthalpy):
     Returns:
         float: Temperature in °C or °F
     '''
+    englishUnits = _englishUnits()
     pressure = Convert.toSIUnit(float(pressure), 'pressure', englishUnits=englishUnits)
     enthalpy = float(enthalpy)
     if englishUnits: enthalpy = Convert.toSIUnit(enthalpy, 'enthalpy')
@@ -116,6 +466,7 @@ def T_ph(pressure, enthalpy):
 
     return Convert.fromSIUnit(temperature, 'temperature', englishUnits=englishUnits)
 
+@_arrays(_field(States.properties_ps, 'temperature'), ('pressure', 'entropy'), 'temperature')
 def T_ps(pressure, entropy):
     '''
     Temperature given pressure and entropy
@@ -127,6 +478,7 @@ def T_ps(pressure, entropy):
     Returns:
         float: Temperature in °C or °F
     '''
+    englishUnits = _englishUnits()
     pressure = Convert.toSIUnit(float(pressure), 'pressure', englishUnits=englishUnits)
     entropy = float(entropy)
     if englishUnits: entropy = Convert.toSIUnit(entropy, 'entropy')
@@ -148,6 +500,7 @@ def T_ps(pressure, entropy):
 
     return Convert.fromSIUnit(temperature, 'temperature', englishUnits=englishUnits)
 
+@_arrays(_field(States.properties_hs, 'temperature'), ('enthalpy', 'entropy'), 'temperature')
 def T_hs(enthalpy, entropy):
     '''
     Temperature given enthalpy and entropy
@@ -159,6 +512,7 @@ def T_hs(enthalpy, entropy):
     Returns:
         float: Temperature in °C or °F
     '''
+    englishUnits = _englishUnits()
     enthalpy, entropy = float(enthalpy), float(entropy)
     if englishUnits:
         enthalpy = Convert.toSIUnit(enthalpy, 'enthalpy')
@@ -179,6 +533,7 @@ def T_hs(enthalpy, entropy):
 
     return Convert.fromSIUnit(temperature, 'temperature', englishUnits=englishUnits)
 
+@_arrays(States.saturationPressure_t, ('temperature',), 'pressure')
 def Psat_T(temperature):
     '''
     Saturation Pressure given temperature
@@ -190,6 +545,7 @@ def Psat_T(temperature):
         float: pressure in kPa or psi
 
     '''
+    englishUnits = _englishUnits()
     temperature = Convert.toSIUnit(float(temperature), 'temperature', englishUnits=englishUnits)
     pressure = 0.0
     if temperature <= Constants._temperatureMax and temperature > Constants._temperatureMin:
@@ -198,6 +554,7 @@ def Psat_T(temperature):
         pressure = Constants._errorValue
     return pressure
 
+@_arrays(States.saturationPressure_s, ('entropy',), 'pressure')
 def Psat_s(entropy):
     '''
     Saturation pressure given entropy
@@ -208,6 +565,7 @@ def Psat_s(entropy):
     Returns:
         float: pressure in kPa or psi
     '''
+    englishUnits = _englishUnits()
     entropy = float(entropy)
 
     if englishUnits:
@@ -218,6 +576,7 @@ def Psat_s(entropy):
     else:
         return Constants._errorValue
 
+@_arrays(_field(States.properties_hs, 'pressure'), ('enthalpy', 'entropy'), 'pressure')
 def P_hs(enthalpy, entropy):
     '''
     Pressure given enthalpy and entropy
@@ -229,6 +588,7 @@ def P_hs(enthalpy, entropy):
     Returns:
         float: pressure in kPa or psi
     '''
+    englishUnits = _englishUnits()
     enthalpy, entropy = float(enthalpy), float(entropy)
     if englishUnits:
         enthalpy = Convert.toSIUnit(enthalpy, 'enthalpy')
@@ -249,6 +609,7 @@ def P_hs(enthalpy, entropy):
 
     return Convert.fromSIUnit(pressure, 'pressure', englishUnits=englishUnits)
 
+@_arrays(_field(States.saturatedVapor_p, 'enthalpy'), ('pressure',), 'enthalpy')
 def hV_p(pressure):
     '''
     Vapor enthalpy given pressure
@@ -259,6 +620,7 @@ def hV_p(pressure):
     Returns:
         float: enthalpy in kJ/kg or Btu/lb
     '''
+    englishUnits = _englishUnits()
     pressure = Convert.toSIUnit(pressure, 'pressure', englishUnits=englishUnits)
     if pressure > Constants._pressureMin and pressure < Constants._pressureMax:
         enthalpy = Region4.h4_p(pressure, 'vap')
@@ -269,6 +631,7 @@ def hV_p(pressure):
     else:
         return Constants._errorValue
 
+@_arrays(_field(States.saturatedLiquid_p, 'enthalpy'), ('pressure',), 'enthalpy')
 def hL_p(pressure):
     '''
     Liquid enthalpy given pressure
@@ -279,6 +642,7 @@ def hL_p(pressure):
     Returns:
         float: enthalpy in kJ/kg or Btu/lb
     '''
+    englishUnits = _englishUnits()
     pressure = Convert.toSIUnit(pressure, 'pressure', englishUnits=englishUnits)
     if pressure > Constants._pressureMin and pressure < Constants._pressureMax:
         enthalpy = Region4.h4_p(pressure, 'liq')
@@ -289,6 +653,7 @@ def hL_p(pressure):
     else:
         return Constants._errorValue
 
+@_arrays(_field(States.saturatedVapor_t, 'enthalpy'), ('temperature',), 'enthalpy')
 def hV_T(temperature):
     '''
     Vapor enthalpy given temperature
@@ -299,6 +664,7 @@ def hV_T(temperature):
     Returns:
         float: enthalpy in kJ/kg or Btu/lb
     '''
+    englishUnits = _englishUnits()
     temperature = Convert.toSIUnit(temperature, 'temperature', englishUnits=englishUnits)
     if temperature > Constants._temperatureMin and temperature < Constants._temperatureMax:
         enthalpy = Region4.h4_p(Region4.p4_t(temperature), 'vap')
@@ -308,6 +674,7 @@ def hV_T(temperature):
     else:
         return Constants._errorValue
 
+@_arrays(_field(States.saturatedLiquid_t, 'enthalpy'), ('temperature',), 'enthalpy')
 def hL_T(temperature):
     '''
     Liquid enthalpy given temperature
@@ -318,6 +685,7 @@ def hL_T(temperature):
     Returns:
         float: enthalpy in kJ/kg or Btu/lb
     '''
+    englishUnits = _englishUnits()
     temperature = Convert.toSIUnit(temperature, 'temperature', englishUnits=englishUnits)
     if temperature > Constants._temperatureMin and temperature < Constants._temperatureMax:
         enthalpy = Region4.h4_p(Region4.p4_t(temperature), 'liq')
@@ -327,6 +695,7 @@ def hL_T(temperature):
     else:
         return Constants._errorValue
 
+@_arrays(_field(States.properties_pt, 'enthalpy'), ('pressure', 'temperature'), 'enthalpy')
 def h_pT(pressure, temperature):
     '''
     Enthalpy given pressure and temperature
@@ -338,6 +707,7 @@ def h_pT(pressure, temperature):
     Returns:
         float: enthalpy in kJ/kg or Btu/lb
     '''
+    englishUnits = _englishUnits()
     pressure = Convert.toSIUnit(pressure, 'pressure', englishUnits=englishUnits)
     temperature = Convert.toSIUnit(temperature, 'temperature', englishUnits=englishUnits)
     region = Regions.region_pt(pressure, temperature)
@@ -359,6 +729,7 @@ def h_pT(pressure, temperature):
     else:
         return enthalpy
 
+@_arrays(_field(States.properties_ps, 'enthalpy'), ('pressure', 'entropy'), 'enthalpy')
 def h_ps(pressure, entropy):
     '''
     Enthalpy given pressure and entropy
@@ -370,6 +741,7 @@ def h_ps(pressure, entropy):
     Returns:
         float: enthalpy in kJ/kg or Btu/lb
     '''
+    englishUnits = _englishUnits()
     pressure = Convert.toSIUnit(pressure, 'pressure', englishUnits=englishUnits)
     if englishUnits:
         entropy = Convert.toSIUnit(entropy, 'entropy')
@@ -397,6 +769,7 @@ def h_ps(pressure, entropy):
     else:
         return enthalpy
 
+@_arrays(States.enthalpy_px, ('pressure', None), 'enthalpy')
 def h_px(pressure, quality):
     '''
     Enthalpy given pressure and static quality
@@ -408,6 +781,7 @@ def h_px(pressure, quality):
     Returns:
         float: enthalpy in kJ/kg or Btu/lb
     '''
+    englishUnits = _englishUnits()
     pressure = Convert.toSIUnit(pressure, 'pressure', englishUnits=englishUnits)
 
     if quality > 1.0 or quality < 0.0 or pressure >= 22.064:
@@ -424,6 +798,7 @@ def h_px(pressure, quality):
 
     return enthalpy
 
+@_arrays(States.enthalpy_tx, ('temperature', None), 'enthalpy')
 def h_Tx(temperature, quality):
     '''
     Enthalpy given pressure and static quality
@@ -435,6 +810,7 @@ def h_Tx(temperature, quality):
     Returns:
         float: enthalpy in kJ/kg or Btu/lb
     '''
+    englishUnits = _englishUnits()
     temperature = Convert.toSIUnit(temperature, 'temperature', englishUnits=englishUnits)
 
     if quality > 1.0 or quality < 0.0 or temperature >= Constants._temperatureMax:
@@ -444,6 +820,7 @@ def h_Tx(temperature, quality):
 
     return h_px(pressure, quality)
 
+@_arrays(_field(States.saturatedVapor_p, 'specificVolume'), ('pressure',), 'specific volume')
 def vV_p(pressure):
     '''
     Vapor specific volume given pressure
@@ -454,6 +831,7 @@ def vV_p(pressure):
     Returns:
         float: specific volume in m**3/kg or ft**3/lb
     '''
+    englishUnits = _englishUnits()
     pressure = Convert.toSIUnit(pressure, 'pressure', englishUnits=englishUnits)
     specificVolume = Constants._errorValue
     if pressure <= Constants._pressureMin or pressure >= Constants._pressureMax:
@@ -466,6 +844,7 @@ def vV_p(pressure):
         specificVolume = Convert.fromSIUnit(specificVolume, 'specific volume')
     return specificVolume
 
+@_arrays(_field(States.saturatedLiquid_p, 'specificVolume'), ('pressure',), 'specific volume')
 def vL_p(pressure):
     '''
     Liquid specific volume given pressure
@@ -476,6 +855,7 @@ def vL_p(pressure):
     Returns:
         float: specific volume in m**3/kg or ft**3/lb
     '''
+    englishUnits = _englishUnits()
     pressure = Convert.toSIUnit(pressure, 'pressure', englishUnits=englishUnits)
     specificVolume = Constants._errorValue
     if pressure <= Constants._pressureMin or pressure >= Constants._pressureMax:
@@ -490,6 +870,7 @@ def vL_p(pressure):
         specificVolume = Convert.fromSIUnit(specificVolume, 'specific volume')
     return specificVolume
 
+@_arrays(_field(States.saturatedVapor_t, 'specificVolume'), ('temperature',), 'specific volume')
 def vV_T(temperature):
     '''
     Vapor specific volume given temperature
@@ -500,6 +881,7 @@ def vV_T(temperature):
     Returns:
         float: specific volume in m**3/kg or ft**3/lb
     '''
+    englishUnits = _englishUnits()
     temperature = Convert.toSIUnit(temperature, 'temperature', englishUnits=englishUnits)
     specificVolume = Constants._errorValue
     if temperature <= Constants._temperatureMin or temperature >= Constants._temperatureMax:
@@ -512,6 +894,7 @@ def vV_T(temperature):
         specificVolume = Convert.fromSIUnit(specificVolume, 'specific volume')
     return specificVolume
 
+@_arrays(_field(States.saturatedLiquid_t, 'specificVolume'), ('temperature',), 'specific volume')
 def vL_T(temperature):
     '''
     Liquid specific volume given temperature
@@ -522,6 +905,7 @@ def vL_T(temperature):
     Returns:
         float: specific volume in m**3/kg or ft**3/lb
     '''
+    englishUnits = _englishUnits()
     temperature = Convert.toSIUnit(temperature, 'temperature', englishUnits=englishUnits)
     specificVolume = Constants._errorValue
     if temperature <= Constants._temperatureMin or temperature >= Constants._temperatureMax:
@@ -534,6 +918,7 @@ def vL_T(temperature):
         specificVolume = Convert.fromSIUnit(specificVolume, 'specific volume')
     return specificVolume
 
+@_arrays(_field(States.properties_pt, 'specificVolume'), ('pressure', 'temperature'), 'specific volume')
 def v_pT(pressure, temperature):
     '''
     Specific volume given pressure and temperature
@@ -545,6 +930,7 @@ def v_pT(pressure, temperature):
     Returns:
         float: specific volume in m**3/kg or ft**3/lb
     '''
+    englishUnits = _englishUnits()
     pressure = Convert.toSIUnit(pressure, 'pressure', englishUnits=englishUnits)
     temperature = Convert.toSIUnit(temperature, 'temperature', englishUnits=englishUnits)
     specificVolume = Constants._errorValue
@@ -557,7 +943,7 @@ def v_pT(pressure, temperature):
     elif region == 2:
         specificVolume = Region2.v2_pt(pressure, temperature)
     elif region == 3:
-        specificVolume = Region3.v3_ph(pressure, Region3.h3_pt(pressure, temperature))
+        specificVolume = Region3.v3_pt(pressure, temperature, polish=True)
     elif region == 5:
         specificVolume = Region5.v5_pt(pressure, temperature)
 
@@ -566,6 +952,7 @@ def v_pT(pressure, temperature):
 
     return specificVolume
 
+@_arrays(_field(States.properties_ph, 'specificVolume'), ('pressure', 'enthalpy'), 'specific volume')
 def v_ph(pressure, enthalpy):
     '''
     Specific volume given pressure and enthalpy
@@ -577,6 +964,7 @@ def v_ph(pressure, enthalpy):
     Returns:
         float: specific volume in m**3/kg or ft**3/lb
     '''
+    englishUnits = _englishUnits()
     pressure = Convert.toSIUnit(pressure, 'pressure', englishUnits=englishUnits)
     if englishUnits:
         enthalpy = Convert.toSIUnit(enthalpy, 'enthalpy')
@@ -608,6 +996,7 @@ def v_ph(pressure, enthalpy):
 
     return specificVolume
 
+@_arrays(_field(States.properties_ps, 'specificVolume'), ('pressure', 'entropy'), 'specific volume')
 def v_ps(pressure, entropy):
     '''
     Specific volume given pressure and entropy
@@ -619,6 +1008,7 @@ def v_ps(pressure, entropy):
     Returns:
         float: specific volume in m**3/kg or ft**3/lb
     '''
+    englishUnits = _englishUnits()
     pressure = Convert.toSIUnit(pressure, 'pressure', englishUnits=englishUnits)
     if englishUnits:
         entropy = Convert.toSIUnit(entropy, 'entropy')
@@ -650,6 +1040,7 @@ def v_ps(pressure, entropy):
 
     return specificVolume
 
+@_arrays(_field(States.saturatedVapor_p, 'density'), ('pressure',), 'density')
 def rhoV_p(pressure):
     '''
     Vapor density given pressure
@@ -662,6 +1053,7 @@ def rhoV_p(pressure):
     '''
     return 1.0/vV_p(pressure)
 
+@_arrays(_field(States.saturatedLiquid_p, 'density'), ('pressure',), 'density')
 def rhoL_p(pressure):
     '''
     Liquid density given pressure
@@ -674,6 +1066,7 @@ def rhoL_p(pressure):
     '''
     return 1.0/vL_p(pressure)
 
+@_arrays(_field(States.saturatedLiquid_t, 'density'), ('temperature',), 'density')
 def rhoL_T(temperature):
     '''
     Liquid density given temperature
@@ -686,6 +1079,7 @@ def rhoL_T(temperature):
     '''
     return 1.0/vL_T(temperature)
 
+@_arrays(_field(States.saturatedVapor_t, 'density'), ('temperature',), 'density')
 def rhoV_T(temperature):
     '''
     Vapor density given temperature
@@ -698,6 +1092,7 @@ def rhoV_T(temperature):
     '''
     return 1.0/vV_T(temperature)
 
+@_arrays(_field(States.properties_pt, 'density'), ('pressure', 'temperature'), 'density')
 def rho_pT(pressure, temperature):
     '''
     Density given pressure and temperature
@@ -711,6 +1106,7 @@ def rho_pT(pressure, temperature):
     '''
     return 1.0/v_pT(pressure, temperature)
 
+@_arrays(_field(States.properties_ph, 'density'), ('pressure', 'enthalpy'), 'density')
 def rho_ph(pressure, enthalpy):
     '''
     Density given pressure and enthalpy
@@ -724,6 +1120,7 @@ def rho_ph(pressure, enthalpy):
     '''
     return 1.0/v_ph(pressure, enthalpy)
 
+@_arrays(_field(States.properties_ps, 'density'), ('pressure', 'entropy'), 'density')
 def rho_ps(pressure, entropy):
     '''
     Density given pressure and entropy
@@ -737,6 +1134,7 @@ def rho_ps(pressure, entropy):
     '''
     return 1.0/v_ps(pressure, entropy)
 
+@_arrays(_field(States.saturatedVapor_p, 'entropy'), ('pressure',), 'entropy')
 def sV_p(pressure):
     '''
     Vapor entropy given pressure
@@ -747,6 +1145,7 @@ def sV_p(pressure):
     Returns:
         float: entropy in kJ/(kg*K) or btu/(lb*°F)
     '''
+    englishUnits = _englishUnits()
     pressure = Convert.toSIUnit(pressure, 'pressure', englishUnits=englishUnits)
     entropy = Constants._errorValue
 
@@ -763,6 +1162,7 @@ def sV_p(pressure):
     else:
         return Constants._errorValue
 
+@_arrays(_field(States.saturatedLiquid_p, 'entropy'), ('pressure',), 'entropy')
 def sL_p(pressure):
     '''
     Liquid entropy given pressure
@@ -773,6 +1173,7 @@ def sL_p(pressure):
     Returns:
         float: entropy in kJ/(kg*K) or btu/(lb*°F)
     '''
+    englishUnits = _englishUnits()
     pressure = Convert.toSIUnit(pressure, 'pressure', englishUnits=englishUnits)
     entropy = Constants._errorValue
 
@@ -789,6 +1190,7 @@ def sL_p(pressure):
     else:
         return Constants._errorValue
 
+@_arrays(_field(States.saturatedVapor_t, 'entropy'), ('temperature',), 'entropy')
 def sV_T(temperature):
     '''
     Vapor entropy given temperature
@@ -799,6 +1201,7 @@ def sV_T(temperature):
     Returns:
         float: entropy in kJ/(kg*K) or btu/(lb*°F)
     '''
+    englishUnits = _englishUnits()
     temperature = Convert.toSIUnit(temperature, 'temperature', englishUnits=englishUnits)
     entropy = Constants._errorValue
 
@@ -816,6 +1219,7 @@ def sV_T(temperature):
     else:
         return Constants._errorValue
 
+@_arrays(_field(States.saturatedLiquid_t, 'entropy'), ('temperature',), 'entropy')
 def sL_T(temperature):
     '''
     Liquid entropy given temperature
@@ -826,6 +1230,7 @@ def sL_T(temperature):
     Returns:
         float: entropy in kJ/(kg*K) or btu/(lb*°F)
     '''
+    englishUnits = _englishUnits()
     temperature = Convert.toSIUnit(temperature, 'temperature', englishUnits=englishUnits)
     entropy = Constants._errorValue
 
@@ -843,6 +1248,7 @@ def sL_T(temperature):
     else:
         return Constants._errorValue
 
+@_arrays(_field(States.properties_pt, 'entropy'), ('pressure', 'temperature'), 'entropy')
 def s_pT(pressure, temperature):
     '''
     Vapor entropy given pressure and temperature
@@ -854,6 +1260,7 @@ def s_pT(pressure, temperature):
     Returns:
         float: entropy in kJ/(kg*K) or btu/(lb*°F)
     '''
+    englishUnits = _englishUnits()
     pressure = Convert.toSIUnit(pressure, 'pressure', englishUnits=englishUnits)
     temperature = Convert.toSIUnit(temperature, 'temperature', englishUnits=englishUnits)
 
@@ -867,7 +1274,7 @@ def s_pT(pressure, temperature):
     elif region == 2:
         entropy = Region2.s2_pt(pressure, temperature)
     elif region == 3:
-        specificVolume = Region3.v3_ph(pressure, Region3.h3_pt(pressure, temperature))
+        specificVolume = Region3.v3_pt(pressure, temperature, polish=True)
         entropy = Region3.s3_rhot(1.0/specificVolume, temperature)
     elif region == 5:
         entropy = Region5.s5_pt(pressure, temperature)
@@ -876,6 +1283,7 @@ def s_pT(pressure, temperature):
         entropy = Convert.fromSIUnit(entropy, 'entropy')
     return entropy
 
+@_arrays(_field(States.properties_ph, 'entropy'), ('pressure', 'enthalpy'), 'entropy')
 def s_ph(pressure, enthalpy):
     '''
     Vapor entropy given pressure and enthalpy
@@ -887,6 +1295,7 @@ def s_ph(pressure, enthalpy):
     Returns:
         float: entropy in kJ/(kg*K) or btu/(lb*°F)
     '''
+    englishUnits = _englishUnits()
     pressure = Convert.toSIUnit(pressure, 'pressure', englishUnits=englishUnits)
     if englishUnits:
         enthalpy = Convert.toSIUnit(enthalpy, 'enthalpy')
@@ -921,6 +1330,7 @@ def s_ph(pressure, enthalpy):
         entropy = Convert.fromSIUnit(entropy, 'entropy')
     return entropy
 
+@_arrays(_field(States.saturatedVapor_p, 'internalEnergy'), ('pressure',), 'enthalpy')
 def uV_p(pressure):
     '''
     Vapor internal energy given pressure
@@ -931,6 +1341,7 @@ def uV_p(pressure):
     Returns:
         float: internal energy in kJ/kg or btu/lb
     '''
+    englishUnits = _englishUnits()
     pressure = Convert.toSIUnit(pressure, 'pressure', englishUnits=englishUnits)
 
     if pressure > Constants._pressureMin and pressure < Constants._pressureMax:
@@ -947,6 +1358,7 @@ def uV_p(pressure):
     else:
         return Constants._errorValue
 
+@_arrays(_field(States.saturatedLiquid_p, 'internalEnergy'), ('pressure',), 'enthalpy')
 def uL_p(pressure):
     '''
     Liquid internal energy given pressure
@@ -957,6 +1369,7 @@ def uL_p(pressure):
     Returns:
         float: internal energy in kJ/kg or btu/lb
     '''
+    englishUnits = _englishUnits()
     pressure = Convert.toSIUnit(pressure, 'pressure', englishUnits=englishUnits)
 
     if pressure > Constants._pressureMin and pressure < Constants._pressureMax:
@@ -973,6 +1386,7 @@ def uL_p(pressure):
     else:
         return Constants._errorValue
 
+@_arrays(_field(States.saturatedVapor_t, 'internalEnergy'), ('temperature',), 'enthalpy')
 def uV_T(temperature):
     '''
     Vapor internal energy given temperature
@@ -983,6 +1397,7 @@ def uV_T(temperature):
     Returns:
         float: internal energy in kJ/kg or btu/lb
     '''
+    englishUnits = _englishUnits()
     temperature = Convert.toSIUnit(temperature, 'temperature', englishUnits=englishUnits)
 
     if temperature > Constants._temperatureMin and temperature < Constants._temperatureMax:
@@ -999,6 +1414,7 @@ def uV_T(temperature):
     else:
         return Constants._errorValue
 
+@_arrays(_field(States.saturatedLiquid_t, 'internalEnergy'), ('temperature',), 'enthalpy')
 def uL_T(temperature):
     '''
     Liquid internal energy given temperature
@@ -1009,6 +1425,7 @@ def uL_T(temperature):
     Returns:
         float: internal energy in kJ/kg or btu/lb
     '''
+    englishUnits = _englishUnits()
     temperature = Convert.toSIUnit(temperature, 'temperature', englishUnits=englishUnits)
 
     if temperature > Constants._temperatureMin and temperature < Constants._temperatureMax:
@@ -1025,6 +1442,7 @@ def uL_T(temperature):
     else:
         return Constants._errorValue
 
+@_arrays(_field(States.properties_pt, 'internalEnergy'), ('pressure', 'temperature'), 'enthalpy')
 def u_pT(pressure, temperature):
     '''
     Internal energy given pressure and temperature
@@ -1036,6 +1454,7 @@ def u_pT(pressure, temperature):
     Returns:
         float: internal energy in kJ/kg or btu/lb
     '''
+    englishUnits = _englishUnits()
     pressure = Convert.toSIUnit(pressure, 'pressure', englishUnits=englishUnits)
     temperature = Convert.toSIUnit(temperature, 'temperature', englishUnits=englishUnits)
 
@@ -1049,7 +1468,7 @@ def u_pT(pressure, temperature):
     elif region == 2:
         internalEnergy = Region2.u2_pt(pressure, temperature)
     elif region == 3:
-        specificVolume = Region3.v3_ph(pressure, Region3.h3_pt(pressure, temperature))
+        specificVolume = Region3.v3_pt(pressure, temperature, polish=True)
         internalEnergy = Region3.u3_rhot(1.0/specificVolume, temperature)
     elif region == 5:
         internalEnergy = Region5.u5_pt(pressure, temperature)
@@ -1059,6 +1478,7 @@ def u_pT(pressure, temperature):
 
     return internalEnergy
 
+@_arrays(_field(States.properties_ph, 'internalEnergy'), ('pressure', 'enthalpy'), 'enthalpy')
 def u_ph(pressure, enthalpy):
     '''
     Internal energy given pressure and enthalpy
@@ -1070,6 +1490,7 @@ def u_ph(pressure, enthalpy):
     Returns:
         float: internal energy in kJ/kg or btu/lb
     '''
+    englishUnits = _englishUnits()
     pressure = Convert.toSIUnit(pressure, 'pressure', englishUnits=englishUnits)
     if englishUnits:
         enthalpy = Convert.toSIUnit(enthalpy, 'enthalpy')
@@ -1106,6 +1527,7 @@ def u_ph(pressure, enthalpy):
         internalEnergy = Convert.fromSIUnit(internalEnergy, 'enthalpy')
     return internalEnergy
 
+@_arrays(_field(States.properties_ps, 'internalEnergy'), ('pressure', 'entropy'), 'enthalpy')
 def u_ps(pressure, entropy):
     '''
     Internal energy given pressure and entropy
@@ -1117,6 +1539,7 @@ def u_ps(pressure, entropy):
     Returns:
         float: internal energy in kJ/kg or btu/lb
     '''
+    englishUnits = _englishUnits()
     pressure, entropy = Convert.toSIUnit(pressure, 'pressure', englishUnits=englishUnits), float(entropy)
     if englishUnits:
         entropy = Convert.toSIUnit(entropy, 'entropy')
@@ -1152,6 +1575,7 @@ def u_ps(pressure, entropy):
         internalEnergy = Convert.fromSIUnit(internalEnergy, 'enthalpy')
     return internalEnergy
 
+@_arrays(_field(States.saturatedVapor_p, 'cp'), ('pressure',), 'entropy')
 def cpV_p(pressure):
     '''
     Vapor heat capacity at constant pressure given pressure
@@ -1162,6 +1586,7 @@ def cpV_p(pressure):
     Returns:
         float: heat capacity in kJ/(kg*K) or btu/(lb*°F)
     '''
+    englishUnits = _englishUnits()
     pressure = Convert.toSIUnit(pressure, 'pressure', englishUnits=englishUnits)
 
     if pressure > Constants._pressureMin and pressure < Constants._pressureMax:
@@ -1178,6 +1603,7 @@ def cpV_p(pressure):
     else:
         return Constants._errorValue
 
+@_arrays(_field(States.saturatedLiquid_p, 'cp'), ('pressure',), 'entropy')
 def cpL_p(pressure):
     '''
     Liquid heat capacity at constant pressure given pressure
@@ -1188,6 +1614,7 @@ def cpL_p(pressure):
     Returns:
         float: heat capacity in kJ/(kg*K) or btu/(lb*°F)
     '''
+    englishUnits = _englishUnits()
     pressure = Convert.toSIUnit(pressure, 'pressure', englishUnits=englishUnits)
 
     if pressure > Constants._pressureMin and pressure < Constants._pressureMax:
@@ -1204,6 +1631,7 @@ def cpL_p(pressure):
     else:
         return Constants._errorValue
 
+@_arrays(_field(States.saturatedVapor_t, 'cp'), ('temperature',), 'entropy')
 def cpV_T(temperature):
     '''
     Vapor heat capacity at constant pressure given temperature
@@ -1214,6 +1642,7 @@ def cpV_T(temperature):
     Returns:
         float: heat capacity in kJ/(kg*K) or btu/(lb*°F)
     '''
+    englishUnits = _englishUnits()
     temperature = Convert.toSIUnit(temperature, 'temperature', englishUnits=englishUnits)
 
     if temperature > Constants._temperatureMin and temperature < Constants._temperatureMax:
@@ -1231,6 +1660,7 @@ def cpV_T(temperature):
     else:
         return Constants._errorValue
 
+@_arrays(_field(States.saturatedLiquid_t, 'cp'), ('temperature',), 'entropy')
 def cpL_T(temperature):
     '''
     Liquid heat capacity at constant pressure given temperature
@@ -1241,6 +1671,7 @@ def cpL_T(temperature):
     Returns:
         float: heat capacity in kJ/(kg*K) or btu/(lb*°F)
     '''
+    englishUnits = _englishUnits()
     temperature = Convert.toSIUnit(temperature, 'temperature', englishUnits=englishUnits)
 
     if temperature > Constants._temperatureMin and temperature < Constants._temperatureMax:
@@ -1258,6 +1689,7 @@ def cpL_T(temperature):
     else:
         return Constants._errorValue
 
+@_arrays(_field(States.properties_pt, 'cp'), ('pressure', 'temperature'), 'entropy')
 def cp_pT(pressure, temperature):
     '''
     Heat capacity at constant pressure given pressure and temperature
@@ -1269,6 +1701,7 @@ def cp_pT(pressure, temperature):
     Returns:
         float: heat capacity in kJ/(kg*K) or btu/(lb*°F)
     '''
+    englishUnits = _englishUnits()
     pressure = Convert.toSIUnit(pressure, 'pressure', englishUnits=englishUnits)
     temperature = Convert.toSIUnit(temperature, 'temperature', englishUnits=englishUnits)
 
@@ -1281,7 +1714,7 @@ def cp_pT(pressure, temperature):
     elif region == 2:
         specificHeat = Region2.cp2_pt(pressure, temperature)
     elif region == 3:
-        specificVolume = Region3.v3_ph(pressure, Region3.h3_pt(pressure, temperature))
+        specificVolume = Region3.v3_pt(pressure, temperature, polish=True)
         specificHeat = Region3.cp3_rhot(1.0/specificVolume, temperature)
     elif region == 5:
         specificHeat = Region5.cp5_pt(pressure, temperature)
@@ -1290,6 +1723,7 @@ def cp_pT(pressure, temperature):
         specificHeat = Convert.fromSIUnit(specificHeat, 'entropy')
     return specificHeat
 
+@_arrays(_field(States.properties_ph, 'cp'), ('pressure', 'enthalpy'), 'entropy')
 def cp_ph(pressure, enthalpy):
     '''
     Heat capacity at constant pressure given pressure and enthalpy
@@ -1301,6 +1735,7 @@ def cp_ph(pressure, enthalpy):
     Returns:
         float: heat capacity in kJ/(kg*K) or btu/(lb*°F)
     '''
+    englishUnits = _englishUnits()
     pressure = Convert.toSIUnit(pressure, 'pressure', englishUnits=englishUnits)
     if englishUnits:
         enthalpy = Convert.toSIUnit(enthalpy, 'enthalpy')
@@ -1323,6 +1758,7 @@ def cp_ph(pressure, enthalpy):
         specificHeat = Convert.fromSIUnit(specificHeat, 'entropy')
     return specificHeat
 
+@_arrays(_field(States.properties_ps, 'cp'), ('pressure', 'entropy'), 'entropy')
 def cp_ps(pressure, entropy):
     '''
     Heat capacity at constant pressure given pressure and entropy
@@ -1334,6 +1770,7 @@ def cp_ps(pressure, entropy):
     Returns:
         float: heat capacity in kJ/(kg*K) or btu/(lb*°F)
     '''
+    englishUnits = _englishUnits()
     pressure = Convert.toSIUnit(pressure, 'pressure', englishUnits=englishUnits)
     if englishUnits:
         entropy = Convert.toSIUnit(entropy, 'entropy')
@@ -1356,6 +1793,7 @@ def cp_ps(pressure, entropy):
         specificHeat = Convert.fromSIUnit(specificHeat, 'entropy')
     return specificHeat
 
+@_arrays(_field(States.saturatedVapor_p, 'cv'), ('pressure',), 'entropy')
 def cvV_p(pressure):
     '''
     Vapor heat capacity at constant volume given pressure
@@ -1366,6 +1804,7 @@ def cvV_p(pressure):
     Returns:
         float: heat capacity in kJ/(kg*K) or btu/(lb*°F)
     '''
+    englishUnits = _englishUnits()
     pressure = Convert.toSIUnit(pressure, 'pressure', englishUnits=englishUnits)
 
     if pressure > Constants._pressureMin and pressure < Constants._pressureMax:
@@ -1382,6 +1821,7 @@ def cvV_p(pressure):
     else:
         return Constants._errorValue
 
+@_arrays(_field(States.saturatedLiquid_p, 'cv'), ('pressure',), 'entropy')
 def cvL_p(pressure):
     '''
     Liquid heat capacity at constant volume given pressure
@@ -1392,6 +1832,7 @@ def cvL_p(pressure):
     Returns:
         float: heat capacity in kJ/(kg*K) or btu/(lb*°F)
     '''
+    englishUnits = _englishUnits()
     pressure = Convert.toSIUnit(pressure, 'pressure', englishUnits=englishUnits)
 
     if pressure > Constants._pressureMin and pressure < Constants._pressureMax:
@@ -1408,6 +1849,7 @@ def cvL_p(pressure):
     else:
         return Constants._errorValue
 
+@_arrays(_field(States.saturatedVapor_t, 'cv'), ('temperature',), 'entropy')
 def cvV_T(temperature):
     '''
     Vapor heat capacity at constant volume given temperature
@@ -1418,6 +1860,7 @@ def cvV_T(temperature):
     Returns:
         float: heat capacity in kJ/(kg*K) or btu/(lb*°F)
     '''
+    englishUnits = _englishUnits()
     temperature = Convert.toSIUnit(temperature, 'temperature', englishUnits=englishUnits)
 
     if temperature > Constants._temperatureMin and temperature < Constants._temperatureMax:
@@ -1435,6 +1878,7 @@ def cvV_T(temperature):
     else:
         return Constants._errorValue
 
+@_arrays(_field(States.saturatedLiquid_t, 'cv'), ('temperature',), 'entropy')
 def cvL_T(temperature):
     '''
     Liquid heat capacity at constant volume given temperature
@@ -1445,6 +1889,7 @@ def cvL_T(temperature):
     Returns:
         float: heat capacity in kJ/(kg*K) or btu/(lb*°F)
     '''
+    englishUnits = _englishUnits()
     temperature = Convert.toSIUnit(temperature, 'temperature', englishUnits=englishUnits)
 
     if temperature > Constants._temperatureMin and temperature < Constants._temperatureMax:
@@ -1462,6 +1907,7 @@ def cvL_T(temperature):
     else:
         return Constants._errorValue
 
+@_arrays(_field(States.properties_pt, 'cv'), ('pressure', 'temperature'), 'entropy')
 def cv_pT(pressure, temperature):
     '''
     Heat capacity at constant volume given pressure and temperature
@@ -1473,6 +1919,7 @@ def cv_pT(pressure, temperature):
     Returns:
         float: heat capacity in kJ/(kg*K) or btu/(lb*°F)
     '''
+    englishUnits = _englishUnits()
     pressure = Convert.toSIUnit(pressure, 'pressure', englishUnits=englishUnits)
     temperature = Convert.toSIUnit(temperature, 'temperature', englishUnits=englishUnits)
 
@@ -1485,7 +1932,7 @@ def cv_pT(pressure, temperature):
     elif region == 2:
         specificHeat = Region2.cv2_pt(pressure, temperature)
     elif region == 3:
-        specificVolume = Region3.v3_ph(pressure, Region3.h3_pt(pressure, temperature))
+        specificVolume = Region3.v3_pt(pressure, temperature, polish=True)
         specificHeat = Region3.cv3_rhot(1.0/specificVolume, temperature)
     elif region == 5:
         specificHeat = Region5.cv5_pt(pressure, temperature)
@@ -1494,6 +1941,7 @@ def cv_pT(pressure, temperature):
         specificHeat = Convert.fromSIUnit(specificHeat, 'entropy')
     return specificHeat
 
+@_arrays(_field(States.properties_ph, 'cv'), ('pressure', 'enthalpy'), 'entropy')
 def cv_ph(pressure, enthalpy):
     '''
     Heat capacity at constant volume given pressure and enthalpy
@@ -1505,6 +1953,7 @@ def cv_ph(pressure, enthalpy):
     Returns:
         float: heat capacity in kJ/(kg*K) or btu/(lb*°F)
     '''
+    englishUnits = _englishUnits()
     pressure = Convert.toSIUnit(pressure, 'pressure', englishUnits=englishUnits)
     if englishUnits:
         enthalpy = Convert.toSIUnit(enthalpy, 'enthalpy')
@@ -1527,6 +1976,7 @@ def cv_ph(pressure, enthalpy):
         specificHeat = Convert.fromSIUnit(specificHeat, 'entropy')
     return specificHeat
 
+@_arrays(_field(States.properties_ps, 'cv'), ('pressure', 'entropy'), 'entropy')
 def cv_ps(pressure, entropy):
     '''
     Heat capacity at constant volume given pressure and entropy
@@ -1538,6 +1988,7 @@ def cv_ps(pressure, entropy):
     Returns:
         float: heat capacity in kJ/(kg*K) or btu/(lb*°F)
     '''
+    englishUnits = _englishUnits()
     pressure = Convert.toSIUnit(pressure, 'pressure', englishUnits=englishUnits)
     if englishUnits:
         entropy = Convert.toSIUnit(entropy, 'entropy')
@@ -1560,6 +2011,7 @@ def cv_ps(pressure, entropy):
         specificHeat = Convert.fromSIUnit(specificHeat, 'entropy')
     return specificHeat
 
+@_arrays(_field(States.saturatedVapor_p, 'speedOfSound'), ('pressure',), 'velocity')
 def wV_p(pressure):
     '''
     Vapor speed of sound given pressure
@@ -1570,6 +2022,7 @@ def wV_p(pressure):
     Returns:
         float: speed of sound in m/s or ft/s
     '''
+    englishUnits = _englishUnits()
     pressure = Convert.toSIUnit(pressure, 'pressure', englishUnits=englishUnits)
 
     if pressure > Constants._pressureMin and pressure < Constants._pressureMax:
@@ -1584,6 +2037,7 @@ def wV_p(pressure):
     else:
         return Constants._errorValue
 
+@_arrays(_field(States.saturatedLiquid_p, 'speedOfSound'), ('pressure',), 'velocity')
 def wL_p(pressure):
     '''
     Liquid speed of sound given pressure
@@ -1594,6 +2048,7 @@ def wL_p(pressure):
     Returns:
         float: speed of sound in m/s or ft/s
     '''
+    englishUnits = _englishUnits()
     pressure = Convert.toSIUnit(pressure, 'pressure', englishUnits=englishUnits)
     if pressure > Constants._pressureMin and pressure < Constants._pressureMax:
         if pressure < Constants._pressureSubDomain:
@@ -1607,6 +2062,7 @@ def wL_p(pressure):
     else:
         return Constants._errorValue
 
+@_arrays(_field(States.saturatedVapor_t, 'speedOfSound'), ('temperature',), 'velocity')
 def wV_T(temperature):
     '''
     Vapor speed of sound given temperature
@@ -1617,6 +2073,7 @@ def wV_T(temperature):
     Returns:
         float: speed of sound in m/s or ft/s
     '''
+    englishUnits = _englishUnits()
     temperature = Convert.toSIUnit(temperature, 'temperature', englishUnits=englishUnits)
     if temperature > Constants._temperatureMin and temperature < Constants._temperatureMax:
         if temperature < Constants._temperatureSubDomain:
@@ -1631,6 +2088,7 @@ def wV_T(temperature):
     else:
         return Constants._errorValue
 
+@_arrays(_field(States.saturatedLiquid_t, 'speedOfSound'), ('temperature',), 'velocity')
 def wL_T(temperature):
     '''
     Liquid speed of sound given temperature
@@ -1641,6 +2099,7 @@ def wL_T(temperature):
     Returns:
         float: speed of sound in m/s or ft/s
     '''
+    englishUnits = _englishUnits()
     temperature = Convert.toSIUnit(temperature, 'temperature', englishUnits=englishUnits)
     if temperature > Constants._temperatureMin and temperature < Constants._temperatureMax:
         if temperature < Constants._temperatureSubDomain:
@@ -1655,6 +2114,7 @@ def wL_T(temperature):
     else:
         return Constants._errorValue
 
+@_arrays(_field(States.properties_pt, 'speedOfSound'), ('pressure', 'temperature'), 'velocity')
 def w_pT(pressure, temperature):
     '''
     Speed of sound given pressure and temperature
@@ -1666,6 +2126,7 @@ def w_pT(pressure, temperature):
     Returns:
         float: speed of sound in m/s or ft/s
     '''
+    englishUnits = _englishUnits()
     pressure = Convert.toSIUnit(pressure, 'pressure', englishUnits=englishUnits)
     temperature = Convert.toSIUnit(temperature, 'temperature', englishUnits=englishUnits)
 
@@ -1677,7 +2138,7 @@ def w_pT(pressure, temperature):
     elif region == 2:
         speedOfSound = Region2.w2_pt(pressure, temperature)
     elif region == 3:
-        density = 1.0/Region3.v3_ph(pressure, Region3.h3_pt(pressure, temperature))
+        density = 1.0/Region3.v3_pt(pressure, temperature, polish=True)
         speedOfSound = Region3.w3_rhot(density, temperature)
     elif region == 5:
         speedOfSound = Region5.w5_pt(pressure, temperature)
@@ -1686,6 +2147,7 @@ def w_pT(pressure, temperature):
         speedOfSound = Convert.fromSIUnit(speedOfSound, 'velocity')
     return speedOfSound
 
+@_arrays(_field(States.properties_ph, 'speedOfSound'), ('pressure', 'enthalpy'), 'velocity')
 def w_ph(pressure, enthalpy):
     '''
     Speed of sound given pressure and enthalpy
@@ -1697,6 +2159,7 @@ def w_ph(pressure, enthalpy):
     Returns:
         float: speed of sound in m/s or ft/s
     '''
+    englishUnits = _englishUnits()
     pressure = Convert.toSIUnit(pressure, 'pressure', englishUnits=englishUnits)
     if englishUnits:
         enthalpy = Convert.toSIUnit(enthalpy, 'enthalpy')
@@ -1718,6 +2181,7 @@ def w_ph(pressure, enthalpy):
         speedOfSound = Convert.fromSIUnit(speedOfSound, 'velocity')
     return speedOfSound
 
+@_arrays(_field(States.properties_ps, 'speedOfSound'), ('pressure', 'entropy'), 'velocity')
 def w_ps(pressure, entropy):
     '''
     Speed of sound given pressure and entropy
@@ -1729,6 +2193,7 @@ def w_ps(pressure, entropy):
     Returns:
         float: speed of sound in m/s or ft/s
     '''
+    englishUnits = _englishUnits()
     pressure = Convert.toSIUnit(float(pressure), 'pressure', englishUnits=englishUnits)
     if englishUnits:
         entropy = Convert.toSIUnit(float(entropy), 'entropy')
@@ -1750,6 +2215,7 @@ def w_ps(pressure, entropy):
         speedOfSound = Convert.fromSIUnit(speedOfSound, 'velocity')
     return speedOfSound
 
+@_arrays(States.viscosity_pt, ('pressure', 'temperature'), 'viscosity')
 def my_pT(pressure, temperature):
     '''
     Viscosity given pressure and temperature
@@ -1761,6 +2227,7 @@ def my_pT(pressure, temperature):
     Returns:
         float: viscosity in Pa*s or lb/(ft*hr)
     '''
+    englishUnits = _englishUnits()
     pressure = Convert.toSIUnit(pressure, 'pressure', englishUnits=englishUnits)
     temperature = Convert.toSIUnit(temperature, 'temperature', englishUnits=englishUnits)
 
@@ -1773,6 +2240,7 @@ def my_pT(pressure, temperature):
         return Convert.fromSIUnit(viscosity, 'viscosity')
     return viscosity
 
+@_arrays(States.viscosity_ph, ('pressure', 'enthalpy'), 'viscosity')
 def my_ph(pressure, enthalpy):
     '''
     Viscosity given pressure and enthalpy
@@ -1784,6 +2252,7 @@ def my_ph(pressure, enthalpy):
     Returns:
         float: viscosity in Pa*s or lb/(ft*hr)
     '''
+    englishUnits = _englishUnits()
     pressure = Convert.toSIUnit(pressure, 'pressure', englishUnits=englishUnits)
     if englishUnits:
         enthalpy = Convert.toSIUnit(enthalpy, 'enthalpy')
@@ -1797,6 +2266,7 @@ def my_ph(pressure, enthalpy):
         return Convert.fromSIUnit(viscosity, 'viscosity')
     return viscosity
 
+@_arrays(States.viscosity_ps, ('pressure', 'entropy'), 'viscosity')
 def my_ps(pressure, entropy):
     '''
     Viscosity given pressure and entropy
@@ -1810,6 +2280,8 @@ def my_ps(pressure, entropy):
     '''
     return my_ph(pressure, h_ps(pressure, entropy))
 
+@_arrays(States.prandtl_pt, ('pressure', 'temperature'), None)
+@_inSI(('pressure', 'temperature'), None)
 def Pr_pT(pressure, temperature):
     '''
     Prandtl number given pressure and temperature
@@ -1828,13 +2300,10 @@ def Pr_pT(pressure, temperature):
     if Constants._errorValue in (heatCapacity, viscosity, thermalConductivity):
         return Constants._errorValue
 
-    if englishUnits:
-        heatCapacity = Convert.toSIUnit(heatCapacity, 'entropy')
-        viscosity = Convert.toSIUnit(viscosity, 'viscosity')
-        thermalConductivity = Convert.toSIUnit(thermalConductivity, 'thermal conductivity')
-
     return heatCapacity*1000.0*viscosity/thermalConductivity
 
+@_arrays(States.prandtl_ph, ('pressure', 'enthalpy'), None)
+@_inSI(('pressure', 'enthalpy'), None)
 def Pr_ph(pressure, enthalpy):
     '''
     Prandtl number given pressure and enthalpy
@@ -1853,13 +2322,10 @@ def Pr_ph(pressure, enthalpy):
     if Constants._errorValue in (heatCapacity, viscosity, thermalConductivity):
         return Constants._errorValue
 
-    if englishUnits:
-        heatCapacity = Convert.toSIUnit(heatCapacity, 'entropy')
-        viscosity = Convert.toSIUnit(viscosity, 'viscosity')
-        thermalConductivity = Convert.toSIUnit(thermalConductivity, 'thermal conductivity')
-
     return heatCapacity*1000.0*viscosity/thermalConductivity
 
+@_arrays(States.heatCapacityRatio_pt, ('pressure', 'temperature'), None)
+@_inSI(('pressure', 'temperature'), None)
 def kappa_pT(pressure, temperature):
     '''
     Heat capcity ratio given pressure and temperature
@@ -1875,6 +2341,8 @@ def kappa_pT(pressure, temperature):
     cv = cv_pT(pressure, temperature)
     return cp/cv
 
+@_arrays(States.heatCapacityRatio_ph, ('pressure', 'enthalpy'), None)
+@_inSI(('pressure', 'enthalpy'), None)
 def kappa_ph(pressure, enthalpy):
     '''
     Heat capcity ratio given pressure and temperature
@@ -1890,6 +2358,7 @@ def kappa_ph(pressure, enthalpy):
     cv = cv_ph(pressure, enthalpy)
     return cp/cv
 
+@_arrays(States.surfaceTension_t, ('temperature',), 'surface tension')
 def st_t(temperature):
     '''
     Surface tension given temperature
@@ -1900,14 +2369,17 @@ def st_t(temperature):
     Returns:
         float: surface tension in N/m or lb/ft
     '''
+    englishUnits = _englishUnits()
     temperature = Convert.toSIUnit(temperature, 'temperature', englishUnits=englishUnits)
-    surfaceTension = surfaceTension_T(temperature)
+    surfaceTension = _surfaceTension_T(temperature)
     if surfaceTension == Constants._errorValue:
         return Constants._errorValue
     if englishUnits:
         surfaceTension = Convert.fromSIUnit(surfaceTension, 'surface tension')
     return surfaceTension
 
+@_arrays(States.surfaceTension_p, ('pressure',), 'surface tension')
+@_inSI(('pressure',), 'surface tension')
 def st_p(pressure):
     '''
     Surface tension given pressure
@@ -1918,20 +2390,14 @@ def st_p(pressure):
     Returns:
         float: surface tension in N/m or lb/ft
     '''
-    temperature = Tsat_p(pressure)
-    temperature = Convert.toSIUnit(temperature, 'temperature', englishUnits=englishUnits)
-    if temperature == Constants._errorValue:
+    pressure = Convert.toSIUnit(float(pressure), 'pressure')
+    if pressure < Constants._pressureMin or pressure > Constants._pressureMax + 0.001:
         return Constants._errorValue
 
-    surfaceTension = surfaceTension_T(temperature)
-
-    if surfaceTension == Constants._errorValue:
-        return Constants._errorValue
-
-    if englishUnits:
-        surfaceTension = Convert.fromSIUnit(surfaceTension, 'surface tension')
-    return surfaceTension
+    return _surfaceTension_T(Region4.t4_p(pressure))
 
+@_arrays(States.thermalConductivityLiquid_p, ('pressure',), 'thermal conductivity')
+@_inSI(('pressure',), 'thermal conductivity')
 def tcL_p(pressure):
     '''
     Liquid thermal conductivity given pressure
@@ -1950,6 +2416,8 @@ def tcL_p(pressure):
 
     return _tc_pTrho_wrapper(pressure, tsatt, specificVolume)
 
+@_arrays(States.thermalConductivityVapor_p, ('pressure',), 'thermal conductivity')
+@_inSI(('pressure',), 'thermal conductivity')
 def tcV_p(pressure):
     '''
     Vapor thermal conductivity given pressure
@@ -1968,6 +2436,8 @@ def tcV_p(pressure):
 
     return _tc_pTrho_wrapper(pressure, tsatt, specificVolume)
 
+@_arrays(States.thermalConductivityLiquid_t, ('temperature',), 'thermal conductivity')
+@_inSI(('temperature',), 'thermal conductivity')
 def tcL_T(temperature):
     '''
     Liquid thermal conductivity given temperature
@@ -1986,6 +2456,8 @@ def tcL_T(temperature):
 
     return _tc_pTrho_wrapper(psatt, temperature, specificVolume)
 
+@_arrays(States.thermalConductivityVapor_t, ('temperature',), 'thermal conductivity')
+@_inSI(('temperature',), 'thermal conductivity')
 def tcV_T(temperature):
     '''
     Vapor thermal conductivity given temperature
@@ -2004,6 +2476,8 @@ def tcV_T(temperature):
 
     return _tc_pTrho_wrapper(psatt, temperature, specificVolume)
 
+@_arrays(States.thermalConductivity_pt, ('pressure', 'temperature'), 'thermal conductivity')
+@_inSI(('pressure', 'temperature'), 'thermal conductivity')
 def tc_pT(pressure, temperature):
     '''
     Liquid thermal conductivity given pressure and temperature
@@ -2018,6 +2492,8 @@ def tc_pT(pressure, temperature):
     specificVolume = v_pT(pressure, temperature)
     return _tc_pTrho_wrapper(pressure, temperature, specificVolume)
 
+@_arrays(States.thermalConductivity_ph, ('pressure', 'enthalpy'), 'thermal conductivity')
+@_inSI(('pressure', 'enthalpy'), 'thermal conductivity')
 def tc_ph(pressure, enthalpy):
     '''
     Liquid thermal conductivity given pressure and enthalpy
@@ -2033,6 +2509,8 @@ def tc_ph(pressure, enthalpy):
     temperature = T_ph(pressure, enthalpy)
     return _tc_pTrho_wrapper(pressure, temperature, specificVolume)
 
+@_arrays(States.thermalConductivity_hs, ('enthalpy', 'entropy'), 'thermal conductivity')
+@_inSI(('enthalpy', 'entropy'), 'thermal conductivity')
 def tc_hs(enthalpy, entropy):
     '''
     Liquid thermal conductivity given pressure and entropy
@@ -2055,21 +2533,12 @@ def tc_hs(enthalpy, entropy):
     return _tc_pTrho_wrapper(pressure, temperature, specificVolume)
 
 def _tc_pTrho_wrapper(pressure, temperature, specificVolume):
-    pressure = Convert.toSIUnit(pressure, 'pressure', englishUnits=englishUnits)
-    temperature = Convert.toSIUnit(temperature, 'temperature', englishUnits=englishUnits)
-    if englishUnits:
-        specificVolume = Convert.toSIUnit(specificVolume, 'specific volume')
-
-    thermalConductivity = tc_pTrho(pressure, temperature, 1.0/specificVolume)
-
-    if thermalConductivity == Constants._errorValue:
-        return Constants._errorValue
-
-    if englishUnits:
-        thermalConductivity = Convert.fromSIUnit(thermalConductivity, 'thermal conductivity')
-
-    return thermalConductivity
+    '''Thermal conductivity in W/(m*K) given pressure in kPa, temperature in °C and specific volume in m**3/kg'''
+    pressure = Convert.toSIUnit(pressure, 'pressure')
+    temperature = Convert.toSIUnit(temperature, 'temperature')
+    return tc_pTrho(pressure, temperature, 1.0/specificVolume)
 
+@_arrays(States.quality_ph, ('pressure', 'enthalpy'), None)
 def x_ph(pressure, enthalpy):
     '''
     Static quality given pressure and enthalpy
@@ -2081,6 +2550,7 @@ def x_ph(pressure, enthalpy):
     Returns:
         float: static quality
     '''
+    englishUnits = _englishUnits()
     pressure = Convert.toSIUnit(pressure, 'pressure', englishUnits=englishUnits)
     if englishUnits:
         enthalpy = Convert.toSIUnit(enthalpy, 'enthalpy')
@@ -2089,6 +2559,7 @@ def x_ph(pressure, enthalpy):
     else:
         return Constants._errorValue
 
+@_arrays(States.quality_ps, ('pressure', 'entropy'), None)
 def x_ps(pressure, entropy):
     '''
     Static quality given pressure and entropy
@@ -2100,6 +2571,7 @@ def x_ps(pressure, entropy):
     Returns:
         float: static quality
     '''
+    englishUnits = _englishUnits()
     pressure = Convert.toSIUnit(pressure, 'pressure', englishUnits=englishUnits)
     if englishUnits:
         entropy = Convert.toSIUnit(entropy, 'entropy')
@@ -2108,6 +2580,7 @@ def x_ps(pressure, entropy):
     else:
         return Constants._errorValue
 
+@_arrays(States.voidFraction_ph, ('pressure', 'enthalpy'), None)
 def vx_ph(pressure, enthalpy):
     '''
     Void fraction given pressure and enthalpy
@@ -2119,6 +2592,7 @@ def vx_ph(pressure, enthalpy):
     Returns:
         float: void fraction
     '''
+    englishUnits = _englishUnits()
     pressure = Convert.toSIUnit(pressure, 'pressure', englishUnits=englishUnits)
     if englishUnits:
         enthalpy = Convert.toSIUnit(enthalpy, 'enthalpy')
@@ -2135,6 +2609,7 @@ def vx_ph(pressure, enthalpy):
     else:
         return Constants._errorValue
 
+@_arrays(States.voidFraction_ps, ('pressure', 'entropy'), None)
 def vx_ps(pressure, entropy):
     '''
     Void fraction given pressure and entropy
@@ -2146,6 +2621,7 @@ def vx_ps(pressure, entropy):
     Returns:
         float: void fraction
     '''
+    englishUnits = _englishUnits()
     pressure = Convert.toSIUnit(pressure, 'pressure', englishUnits=englishUnits)
     if englishUnits:
         entropy = Convert.toSIUnit(entropy, 'entropy')
@@ -2162,6 +2638,7 @@ def vx_ps(pressure, entropy):
     else:
         return Constants._errorValue
 
+@_arrays(States.thermalConductivity_ptrho, (None, None, None), None)
 def tc_pTrho(pressure, temperature, density):
     '''Revised release on the IAPS Formulation 1985 for the Thermal Conductivity of ordinary water IAPWS September 1998 Page 8'''
     if temperature < 0.0 or pressure < Constants._pressureMin \
@@ -2186,8 +2663,13 @@ def tc_pTrho(pressure, temperature, density):
       - 1.02*math.exp(-4.11717*tPrime**(3.0/2.0) - 6.17937/rhoPrime**5)
     return tc0 + tc1 + tc2
 
+@_arrays(States.surfaceTension_t, (None,), None)
 def surfaceTension_T(temperature):
     '''IAPWS Release on Surface Tension of Ordinary Water Substance, September 1994'''
+    return _surfaceTension_T(temperature)
+
+def _surfaceTension_T(temperature):
+    '''surfaceTension_T without the array mode, for the scalar public functions'''
     if temperature < 0.01 or temperature > Constants._tc:
         return Constants._errorValue
     tau = 1.0 - temperature/Constants._tc
@@ -0,0 +1,195 @@
+# -*- coding: utf-8 -*-
+'''
+Micro-benchmarks of the region kernels, backward equations, region classifiers and public functions
+'''
+import argparse
+import datetime
+import json
+import platform
+import re
+import sys
+import timeit
+import warnings
+
+import numpy as np
+
+import Boundaries
+import Inputs
+import Region1
+import Region2
+import Region3
+import Region4
+import Region5
+import Regions
+import XSteamPython
+
+formatVersion = 1
+
+# Functions of the public module that configure it instead of evaluating a property
+_settings = ('switchUnits', 'useEnglish', 'useSI', 'unitSystem', 'useSaturationTable', 'useSaturationEquations',
+             'usePropertyTable', 'usePropertyEquations', 'enableInstrumentation', 'disableInstrumentation',
+             'instrumentationSnapshot', 'resetInstrumentation', 'enableSolverTelemetry', 'disableSolverTelemetry',
+             'solverTelemetrySnapshot', 'resetSolverTelemetry')
+
+# Input sets of the boundary equations
+_boundaryInputs = {'b23p_t': ('t', 23), 'b23t_p': ('p', 23), 'hB13_s': ('s', 13), 'tB23_hs': ('hs', 23)}
+
+class Case(object):
+    '''One function to time with its inputs, arguments holds one array per argument'''
+
+    def __init__(self, name, function, arguments, constants=()):
+        self.name = name
+        self.function = function
+        self.arguments = arguments
+        self.constants = tuple(constants)
+
+    def call(self, *arguments):
+        return self.function(*(arguments + self.constants))
+
+def _argumentNames(function):
+    code = getattr(function, '__wrapped__', function).__code__
+    return code.co_varnames[:code.co_argcount]
+
+def _moduleFunctions(module):
+    return [(name, value) for name, value in sorted(vars(module).items())
+            if callable(value) and not name.startswith('_') and getattr(value, '__module__', None) == module.__name__]
+
+def kernelCases(inputs):
+    '''Cases of every function of Region1 to Region5, Boundaries and Regions, the region functions on the
+    states of their own region'''
+    cases = []
+    for region, module in enumerate((Region1, Region2, Region3, Region4, Region5), 1):
+        for name, function in _moduleFunctions(module):
+            names = _argumentNames(function)
+            # h4_p takes the phase and v3_pt whether to polish the result, neither is an input state
+            constants = ['vap' if argument == 'phase' else False for argument in names if argument in ('phase', 'polish')]
+            arguments = inputs.forArguments([argument for argument in names if argument not in ('phase', 'polish')], region)
+            if arguments is not None:
+                cases.append(Case('{}.{}'.format(module.__name__, name), function, arguments, constants))
+    for name, function in _moduleFunctions(Boundaries):
+        inputSet = _boundaryInputs.get(name, ('p', 23))
+        cases.append(Case('Boundaries.' + name, function, inputs.get(*inputSet)))
+    for name, function in _moduleFunctions(Regions):
+        arguments = inputs.forArguments(_argumentNames(function))
+        if arguments is not None:
+            cases.append(Case('Regions.' + name, function, arguments))
+    return cases
+
+def publicCases(inputs):
+    '''Cases of every property function of XSteamPython in SI units, over the grid of its test data or of
+    the test data of a function with the same arguments'''
+    functions = [(name, function) for name, function in _moduleFunctions(XSteamPython) if name not in _settings]
+    withData = dict((name.split('_', 1)[1], name) for name, function in functions if Inputs.hasTestData(name))
+    cases = []
+    for name, function in functions:
+        if name == 'tc_pTrho':
+            pressure, temperature = inputs.get('pt', 1)
+            arguments = (pressure, temperature, inputs.get('prho', 1)[1])
+        elif name == 'surfaceTension_T':
+            arguments = inputs.get('t', 4)
+        elif Inputs.hasTestData(name):
+            arguments = Inputs.publicInputs(name, function)
+        elif name.split('_', 1)[1] in withData:
+            source = withData[name.split('_', 1)[1]]
+            arguments = Inputs.publicInputs(source, getattr(XSteamPython, source))
+        else:
+            continue
+        cases.append(Case('XSteamPython.' + name, function, arguments))
+    return cases
+
+def _best(statement, repeat):
+    return min(timeit.repeat(statement, number=1, repeat=repeat))
+
+def _evaluates(case, arguments):
+    # Some iterative solvers raise outside of their range instead of returning the error value
+    try:
+        case.call(*arguments)
+    except Exception:
+        return False
+    return True
+
+def timeCase(case, points=100, repeat=5):
+    '''Scalar latency in seconds per call over up to points states of the case and array throughput in
+    states per second over all of its states. States the function raises for are left out of the scalar
+    timing, a function that does not take scalars or arrays gets None.'''
+    size = case.arguments[0].size
+    result = {'points': int(size), 'scalarSeconds': None, 'arrayPointsPerSecond': None}
+    if size == 0:
+        return result
+    sample = np.linspace(0, size - 1, min(points, size)).astype(int)
+    states = [state for state in (tuple(float(argument[index]) for argument in case.arguments) for index in sample) if _evaluates(case, state)]
+    if states:
+        def scalar():
+            for state in states:
+                case.call(*state)
+        result['scalarSeconds'] = _best(scalar, repeat)/len(states)
+    if _evaluates(case, case.arguments):
+        result['arrayPointsPerSecond'] = size/_best(lambda: case.call(*case.arguments), repeat)
+    return result
+
+def run(cases, points=100, repeat=5, log=None):
+    '''Results of timeCase for every case with a description of the environment, ready for JSON'''
+    results = {}
+    with warnings.catch_warnings(), np.errstate(all='ignore'):
+        warnings.simplefilter('ignore')
+        for case in cases:
+            results[case.name] = timeCase(case, points, repeat)
+            if log is not None:
+                log.write('{}: {}\n'.format(case.name, _describe(results[case.name])))
+    return {'formatVersion': formatVersion,
+            'environment': {'python': platform.python_version(), 'numpy': np.__version__, 'machine': platform.platform(),
+                            'date': datetime.datetime.now().isoformat()},
+            'results': results}
+
+def _describe(result):
+    scalar, array = result['scalarSeconds'], result['arrayPointsPerSecond']
+    return '{} scalar, {} array'.format('-' if scalar is None else '{:.2f} us/call'.format(scalar*1e6),
+                                        '-' if array is None else '{:.3g} states/s'.format(array))
+
+def compare(baseline, current, threshold=0.2):
+    '''Regressions of current against baseline, as (name, metric, baseline, current, slowdown) with the
+    slowdown as the ratio of the times. A case is flagged if it became more than threshold slower.'''
+    regressions = []
+    for name in sorted(set(baseline['results']) & set(current['results'])):
+        before, after = baseline['results'][name], current['results'][name]
+        for metric, slowdown in (('scalarSeconds', lambda before, after: after/before),
+                                 ('arrayPointsPerSecond', lambda before, after: before/after)):
+            if before.get(metric) and after.get(metric):
+                ratio = slowdown(before[metric], after[metric])
+                if ratio > 1.0 + threshold:
+                    regressions.append((name, metric, before[metric], after[metric], ratio))
+    return regressions
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Micro-benchmarks of XSteamPython')
+    commands = parser.add_subparsers(dest='command')
+    runParser = commands.add_parser('run', help='time the kernels and public functions')
+    runParser.add_argument('--output', help='JSON file for the results, printed if omitted')
+    runParser.add_argument('--filter', default='', help='regular expression the case names are searched with')
+    runParser.add_argument('--points', type=int, default=100, help='states per scalar timing')
+    runParser.add_argument('--repeat', type=int, default=5, help='timings per case, the best one is kept')
+    compareParser = commands.add_parser('compare', help='flag regressions against a baseline')
+    compareParser.add_argument('baseline', help='JSON results to compare against')
+    compareParser.add_argument('current', help='JSON results to check')
+    compareParser.add_argument('--threshold', type=float, default=0.2, help='slowdown that is flagged, 0.2 is 20%% slower')
+    arguments = parser.parse_args(argv)
+
+    if arguments.command == 'run':
+        inputs = Inputs.InputSets()
+        cases = [case for case in kernelCases(inputs) + publicCases(inputs) if re.search(arguments.filter, case.name)]
+        results = run(cases, arguments.points, arguments.repeat, log=sys.stderr)
+        if arguments.output:
+            with open(arguments.output, 'w') as output:
+                json.dump(results, output, indent=1, sort_keys=True)
+        else:
+            print(json.dumps(results, indent=1, sort_keys=True))
+        return 0
+    if arguments.command == 'compare':
+        with open(arguments.baseline) as baseline, open(arguments.current) as current:
+            regressions = compare(json.load(baseline), json.load(current), arguments.threshold)
+        for name, metric, before, after, ratio in regressions:
+            print('{}: {} {:.4g} -> {:.4g}, {:.2f} times slower'.format(name, metric, before, after, ratio))
+        print('{} regressions'.format(len(regressions)))
+        return 1 if regressions else 0
+    parser.print_help()
+    return 2
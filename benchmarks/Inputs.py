@@ -0,0 +1,119 @@
+# -*- coding: utf-8 -*-
+'''
+Input sets of the benchmarks, drawn from the grids of the test data
+'''
+import os
+
+import numpy as np
+
+import Boundaries
+import Constants
+import Region1
+import Region2
+import Region3
+import Region4
+import Region5
+import Regions
+import XSteamPython
+
+_testData = os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, 'tests', 'TestData')
+
+# Set name of the arguments of a function, by argument names
+_argumentSets = {
+    ('pressure', 'temperature'): 'pt', ('pressure', 'enthalpy'): 'ph', ('pressure', 'entropy'): 'ps',
+    ('enthalpy', 'entropy'): 'hs', ('pressure', 'density'): 'prho', ('density', 'temperature'): 'rhot',
+    ('pressure',): 'p', ('temperature',): 't', ('entropy',): 's', ('enthalpy',): 'h',
+}
+
+def testData(name):
+    '''Arrays of a test data file as floats, the files store object arrays'''
+    data = np.load(os.path.join(_testData, name + '.npz'), allow_pickle=True)
+    return dict((key, np.asarray(data[key], dtype=float)) for key in data.files)
+
+def hasTestData(function):
+    return os.path.isfile(os.path.join(_testData, 'SIUnits_{}.npz'.format(function)))
+
+def publicInputs(function, evaluate):
+    '''Arguments of the public function in SI units over the grid of its test data, flattened. The two
+    dimensional grids store the arguments in either order, the order that reproduces the stored values
+    with evaluate is taken.'''
+    data = testData('SIUnits_' + function)
+    if 'y' not in data:
+        return (data['x'],)
+    x, y = np.meshgrid(data['x'], data['y'])
+    x, y, expected = x.ravel(), y.ravel(), data['f'].ravel()
+    sample = np.flatnonzero(expected != Constants._errorValue)
+    sample = sample[np.linspace(0, sample.size - 1, min(sample.size, 20)).astype(int)]
+
+    def mismatches(first, second):
+        return sum(not np.isclose(evaluate(first[i], second[i]), expected[i], rtol=1e-6, atol=1e-6) for i in sample)
+    return (x, y) if mismatches(x, y) <= mismatches(y, x) else (y, x)
+
+class InputSets(object):
+    '''Inputs in the SI units of the equations (MPa, K, kJ/kg, kJ/(kg K), kg/m**3) by set name and region.
+
+    'pt', 'ph', 'ps' and 'hs' are the grids of the test data of h_pT, T_ph, T_ps and T_hs split by region,
+    region 0 holds the whole grid including the states out of range. The region 3 states of 'pt' are those
+    of 'ph'. 'prho' and 'rhot' add the density of the 'pt' states. 'p', 't', 's' and 'h' are states on the saturation line, region 4 below and
+    region 3 above 16.529 MPa.'''
+
+    def __init__(self):
+        self._sets = {}
+        pressure, temperature = [value.copy() for value in publicInputs('h_pT', XSteamPython.h_pT)]
+        pressure /= 1000.0
+        temperature += 273.15
+        self._split('pt', (pressure, temperature), Regions.region_pt_array(pressure, temperature))
+        for inputSet, function in (('ph', 'T_ph'), ('ps', 'T_ps'), ('hs', 'T_hs')):
+            inputs = publicInputs(function, getattr(XSteamPython, function))
+            if inputSet != 'hs':
+                inputs = (inputs[0]/1000.0, inputs[1])
+            region = getattr(Regions, 'region_{}_array'.format(inputSet))(*inputs)
+            self._split(inputSet, inputs, region)
+
+        density = {}
+        for region, specificVolume in ((1, Region1.v1_pt), (2, Region2.v2_pt), (5, Region5.v5_pt)):
+            pressure, temperature = self.get('pt', region)
+            density[region] = 1.0/specificVolume(pressure, temperature)
+        # The (p, T) grids of the test data stop below region 3, its states come from the (p, h) grid
+        pressure, enthalpy = self.get('ph', 3)
+        self._sets['pt', 3] = (pressure, Region3.t3_ph(pressure, enthalpy))
+        density[3] = 1.0/Region3.v3_ph(pressure, enthalpy)
+        for region in density:
+            pressure, temperature = self.get('pt', region)
+            self._sets['prho', region] = (pressure, density[region])
+            self._sets['rhot', region] = (density[region], temperature)
+        self._sets['prho', 0] = tuple(np.concatenate(values) for values in zip(*[self._sets['prho', region] for region in sorted(density)]))
+
+        pressure = testData('SIUnits_Tsat_p')['x']/1000.0
+        pressure = pressure[(pressure >= Constants._pressureMin) & (pressure <= Constants._pressureMax)]
+        temperature = testData('SIUnits_Psat_T')['x'] + 273.15
+        temperature = temperature[(temperature >= 273.15) & (temperature <= Constants._tc)]
+        entropy = testData('SIUnits_Tsat_s')['x']
+        entropy = entropy[(entropy > -0.0001545495919) & (entropy < 9.155759395)]
+        self._sets['p', 4], self._sets['t', 4], self._sets['s', 4] = (pressure,), (temperature,), (entropy,)
+        high = pressure >= Constants._pressureSubDomain
+        self._sets['p', 3] = (pressure[high],)
+        self._sets['h', 3] = (np.concatenate((Region4.h4_p(pressure[high], 'liq'), Region4.h4_p(pressure[high], 'vap'))),)
+        saturatedEntropy = [testData('SIUnits_{}'.format(function)) for function in ('sL_p', 'sV_p')]
+        self._sets['s', 3] = (np.concatenate([data['f'][data['x']/1000.0 >= Constants._pressureSubDomain] for data in saturatedEntropy]),)
+
+        # Inputs of the region boundaries, states on the boundary lines at the pressures of region 3
+        pressure, temperature = self.get('pt', 3)
+        self._sets['p', 23] = (pressure,)
+        self._sets['t', 23] = (temperature[(temperature >= 623.15) & (temperature <= 863.15)],)
+        self._sets['s', 13] = (Region1.s1_pt(pressure, 623.15),)
+        temperature = Boundaries.b23t_p(pressure)
+        self._sets['hs', 23] = (Region2.h2_pt(pressure, temperature), Region2.s2_pt(pressure, temperature))
+
+    def _split(self, name, inputs, region):
+        self._sets[name, 0] = inputs
+        for value in np.unique(region[region != 0]):
+            self._sets[name, int(value)] = tuple(argument[region == value] for argument in inputs)
+
+    def get(self, name, region=0):
+        return self._sets[name, region]
+
+    def forArguments(self, arguments, region=0):
+        '''Input set for a function with the given argument names, None if there is none'''
+        name = _argumentSets.get(tuple(arguments))
+        return self._sets.get((name, region))
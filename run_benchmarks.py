@@ -0,0 +1,20 @@
+# -*- coding: utf-8 -*-
+'''
+Benchmark runner
+
+python run_benchmarks.py run --output results.json
+python run_benchmarks.py compare baseline.json results.json
+'''
+import os
+import sys
+
+file_directory = os.path.dirname(__file__)
+src_path = os.path.join(os.path.abspath(file_directory), "XSteamPython")
+benchmark_path = os.path.join(os.path.abspath(file_directory), "benchmarks")
+sys.path.append(src_path)
+sys.path.append(benchmark_path)
+
+import Benchmark
+
+if __name__ == '__main__':
+    sys.exit(Benchmark.main())
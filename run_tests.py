@@ -9,17 +9,27 @@ import unittest
 file_directory = os.path.dirname(__file__)
 src_path = os.path.join(os.path.abspath(file_directory), "XSteamPython")
 test_path = os.path.join(os.path.abspath(file_directory), "tests")
+benchmark_path = os.path.join(os.path.abspath(file_directory), "benchmarks")
 sys.path.append(src_path)
 sys.path.append(test_path)
+sys.path.append(benchmark_path)
 
+import Benchmark_Tests
 import Boundaries_Tests
 import Convert_Tests
+import Instrumentation_Tests
+import Polynomials_Tests
 import Region1_Tests
 import Region2_Tests
 import Region3_Tests
 import Region4_Tests
 import Region5_Tests
 import Regions_Tests
+import Saturation_Tests
+import Solvers_Tests
+import States_Tests
+import Storage_Tests
+import Tables_Tests
 
 import Density_Tests
 import Enthalpy_Tests
@@ -37,6 +47,7 @@ import Tsat_Tests
 import Temperature_Tests
 import ThermalConductivity_Tests
 import TransportProperties_Tests
+import Units_Tests
 import VaporFraction_Tests
 import Viscosity_Tests
 
@@ -47,6 +58,7 @@ def main():
     suite = unittest.TestSuite()
 
     suite.addTest(loader.loadTestsFromModule(Convert_Tests))
+    suite.addTest(loader.loadTestsFromModule(Polynomials_Tests))
     suite.addTest(loader.loadTestsFromModule(Region1_Tests))
     suite.addTest(loader.loadTestsFromModule(Region2_Tests))
     suite.addTest(loader.loadTestsFromModule(Region3_Tests))
@@ -54,6 +66,10 @@ def main():
     suite.addTest(loader.loadTestsFromModule(Region5_Tests))
     suite.addTest(loader.loadTestsFromModule(Regions_Tests))
     suite.addTest(loader.loadTestsFromModule(Boundaries_Tests))
+    suite.addTest(loader.loadTestsFromModule(States_Tests))
+    suite.addTest(loader.loadTestsFromModule(Storage_Tests))
+    suite.addTest(loader.loadTestsFromModule(Saturation_Tests))
+    suite.addTest(loader.loadTestsFromModule(Tables_Tests))
 
     suite.addTest(loader.loadTestsFromModule(Psat_Tests))
     suite.addTest(loader.loadTestsFromModule(Tsat_Tests))
@@ -73,6 +89,10 @@ def main():
     suite.addTest(loader.loadTestsFromModule(ThermalConductivity_Tests))
     suite.addTest(loader.loadTestsFromModule(Viscosity_Tests))
     suite.addTest(loader.loadTestsFromModule(Prandtl_Tests))
+    suite.addTest(loader.loadTestsFromModule(Units_Tests))
+    suite.addTest(loader.loadTestsFromModule(Benchmark_Tests))
+    suite.addTest(loader.loadTestsFromModule(Instrumentation_Tests))
+    suite.addTest(loader.loadTestsFromModule(Solvers_Tests))
 
     runner = unittest.TextTestRunner()
     runner.run(suite)
@@ -21,7 +21,7 @@ setuptools.setup(name='XSteamPython', \
     author='Magnus Holmgren; ported by R. Aldridge', \
     packages=setuptools.find_packages(), \
     python_requires='>=2.7, >=3.4.*', \
-    install_requires=['scipy==1.2.1'], \
+    install_requires=['numpy'], \
     classifiers=['License :: OSI Approved :: GNU General Public License v2 (GPLv2)', \
         'Programming Language :: Python :: 2.7', \
         'Programming Language :: Python :: 3.4', \
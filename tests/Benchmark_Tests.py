@@ -0,0 +1,59 @@
+# -*- coding: utf-8 -*-
+'''
+Unit tests for the benchmarks
+'''
+import unittest
+
+import numpy as np
+
+import Benchmark
+import Inputs
+import Regions
+import XSteamPython as stm
+
+class Test_Benchmark(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.inputs = Inputs.InputSets()
+
+    def test_publicInputs(self):
+        pressure, temperature = Inputs.publicInputs('h_pT', stm.h_pT)
+        self.assertEqual(pressure.max(), 23000.0)
+        self.assertEqual(temperature.max(), 1000.0)
+
+    def test_regionInputs(self):
+        for name in ('pt', 'ph', 'ps', 'hs'):
+            classify = getattr(Regions, 'region_{}_array'.format(name))
+            for region in (1, 2, 3, 4, 5):
+                if name == 'pt' and region == 4 or name == 'hs' and region == 5:
+                    continue
+                inputs = self.inputs.get(name, region)
+                self.assertGreater(inputs[0].size, 0, (name, region))
+                if (name, region) != ('pt', 3):
+                    np.testing.assert_array_equal(classify(*inputs), region, err_msg=name)
+
+    def test_cases(self):
+        names = [case.name for case in Benchmark.kernelCases(self.inputs) + Benchmark.publicCases(self.inputs)]
+        for name in ('Region1.t1_ph', 'Region3.v3_pt', 'Region4.h4_p', 'Boundaries.tB23_hs', 'Regions.region_hs_array', 'XSteamPython.rho_pT', 'XSteamPython.tc_pTrho'):
+            self.assertIn(name, names)
+        self.assertNotIn('XSteamPython.useSI', names)
+
+    def test_timeCase(self):
+        case = Benchmark.Case('Region1.h1_pt', stm.Region1.h1_pt, self.inputs.get('pt', 1))
+        result = Benchmark.timeCase(case, points=10, repeat=1)
+        self.assertGreater(result['scalarSeconds'], 0.0)
+        self.assertGreater(result['arrayPointsPerSecond'], 0.0)
+        result = Benchmark.timeCase(Benchmark.Case('Regions.region_pt', Regions.region_pt, self.inputs.get('pt')), points=10, repeat=1)
+        self.assertIsNone(result['arrayPointsPerSecond'])
+
+    def test_compare(self):
+        baseline = {'results': {'a': {'scalarSeconds': 1e-5, 'arrayPointsPerSecond': 1e6}, 'b': {'scalarSeconds': 1e-5, 'arrayPointsPerSecond': None}}}
+        current = {'results': {'a': {'scalarSeconds': 1.1e-5, 'arrayPointsPerSecond': 5e5}, 'b': {'scalarSeconds': 2e-5, 'arrayPointsPerSecond': 1e6}, 'c': {}}}
+        regressions = Benchmark.compare(baseline, current, threshold=0.2)
+        self.assertEqual([(name, metric) for name, metric, before, after, ratio in regressions], [('a', 'arrayPointsPerSecond'), ('b', 'scalarSeconds')])
+        self.assertAlmostEqual(regressions[0][-1], 2.0)
+        self.assertEqual(Benchmark.compare(baseline, baseline), [])
+
+if __name__ == '__main__':
+    unittest.main()
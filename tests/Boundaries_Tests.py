@@ -24,5 +24,19 @@ class Test_Boundaries(unittest.TestCase):
 
         self.assertAlmostEqual(Boundaries.tB23_hs(1000.0, 3.0), 1611.524, places=3)
 
+    def test_t3_p_subregionBoundaries(self):
+        self.assertAlmostEqual(Boundaries.t3ab_p(40.0), 693.0341408, places=6)
+        self.assertAlmostEqual(Boundaries.t3cd_p(25.0), 649.3659208, places=6)
+        self.assertAlmostEqual(Boundaries.t3ef_p(40.0), 713.9593992, places=6)
+        self.assertAlmostEqual(Boundaries.t3gh_p(23.0), 649.8873759, places=6)
+        self.assertAlmostEqual(Boundaries.t3ij_p(23.0), 651.5778091, places=6)
+        self.assertAlmostEqual(Boundaries.t3jk_p(23.0), 655.8338344, places=6)
+        self.assertAlmostEqual(Boundaries.t3mn_p(22.8), 649.6054133, places=6)
+        self.assertAlmostEqual(Boundaries.t3op_p(22.8), 650.0106943, places=6)
+        self.assertAlmostEqual(Boundaries.t3qu_p(22.0), 645.6355027, places=6)
+        self.assertAlmostEqual(Boundaries.t3rx_p(22.0), 648.2622754, places=6)
+        self.assertAlmostEqual(Boundaries.t3uv_p(22.3), 647.7996121, places=6)
+        self.assertAlmostEqual(Boundaries.t3wx_p(22.3), 648.2049480, places=6)
+
 if __name__ == '__main__':
     unittest.main()
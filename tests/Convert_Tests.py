@@ -4,6 +4,8 @@ Unit tests for Convert
 '''
 import unittest
 
+import numpy as np
+
 import Convert
 
 class Test_Conversions(unittest.TestCase):
@@ -74,5 +76,27 @@ class Test_Conversions(unittest.TestCase):
     def test_fromSIUnit_dynamicViscosity_English(self):
         self.assertEqual(Convert.fromSIUnit(1.0, 'viscosity'), 2419.088311)
 
+class Test_Plans(unittest.TestCase):
+
+    def test_cached(self):
+        self.assertIs(Convert.toSIPlan('pressure', True), Convert.toSIPlan('pressure', True))
+        self.assertIs(Convert.fromSIPlan('enthalpy', True), Convert.fromSIPlan('enthalpy', True))
+
+    def test_SIUnits(self):
+        self.assertEqual(Convert.toSIPlan('enthalpy'), ())
+        self.assertEqual(Convert.convert(0.1, Convert.fromSIPlan('pressure')), 100.0)
+
+    def test_matchesConversionFunctions(self):
+        for quantity in ['pressure', 'temperature'] + sorted(Convert.conversionFactors):
+            for value in (0.5, 212.0):
+                self.assertEqual(Convert.convert(value, Convert.toSIPlan(quantity, True)), Convert.toSIUnit(value, quantity, englishUnits=True), quantity)
+                self.assertEqual(Convert.convert(value, Convert.fromSIPlan(quantity, True)), Convert.fromSIUnit(value, quantity, englishUnits=True), quantity)
+
+    def test_inPlace(self):
+        value = np.array([32.0, 212.0])
+        converted = Convert.convert(value, Convert.toSIPlan('temperature', True))
+        self.assertIs(converted, value)
+        np.testing.assert_array_equal(value, [273.15, 373.15])
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
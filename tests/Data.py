@@ -32,4 +32,15 @@ def calculatePropertyFromTwoDimensions(function, independentVariable1, independe
     for i, x in enumerate(independentVariable1):
         for j, y in enumerate(independentVariable2):
             thProperty[i, j] = function(x, y)
-    return thProperty.T
\ No newline at end of file
+    return thProperty.T
+
+def calculatePropertyFromArrays(function, independentVariable1, independentVariable2):
+    '''Same layout as calculatePropertyFromTwoDimensions, evaluated with a single call in array mode'''
+    independentVariable1 = np.asarray(independentVariable1, dtype=float)
+    independentVariable2 = np.asarray(independentVariable2, dtype=float)
+    return function(independentVariable1[:, np.newaxis], independentVariable2[np.newaxis, :]).T
+
+def errorValueToNan(thProperty):
+    '''Test data marks invalid states with the scalar error value, the array mode returns NaN'''
+    thProperty = np.asarray(thProperty, dtype=float)
+    return np.where(thProperty == 2015.0, np.nan, thProperty)
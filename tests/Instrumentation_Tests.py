@@ -0,0 +1,148 @@
+# -*- coding: utf-8 -*-
+'''
+Unit tests for the instrumentation of the public functions
+'''
+import unittest
+import warnings
+
+import numpy as np
+
+import Constants
+import Instrumentation
+import Region1
+import Region4
+import Region5
+import XSteamPython as stm
+
+class Test_Instrumentation(unittest.TestCase):
+
+    def setUp(self):
+        self.h_pT = stm.h_pT
+        stm.enableInstrumentation()
+        stm.resetInstrumentation()
+
+    def tearDown(self):
+        stm.disableInstrumentation()
+        stm.resetInstrumentation()
+
+    def test_disabled(self):
+        stm.disableInstrumentation()
+        self.assertIs(stm.h_pT, self.h_pT)
+        stm.h_pT(101.0, 300.0)
+        self.assertEqual(stm.instrumentationSnapshot(), {})
+
+    def test_calls(self):
+        self.assertIsNot(stm.h_pT, self.h_pT)
+        self.assertEqual(stm.h_pT(101.0, 300.0), self.h_pT(101.0, 300.0))
+        stm.h_pT(np.array([101.0, 20000.0, 101.0]), np.array([100.0, 400.0, 20.0]))
+        statistics = stm.instrumentationSnapshot()['h_pT']
+        self.assertEqual(statistics['calls'], 2)
+        self.assertEqual(statistics['points'], 4)
+        self.assertEqual(statistics['errors'], 0)
+        self.assertGreater(statistics['totalSeconds'], 0.0)
+        self.assertAlmostEqual(statistics['meanSeconds'], statistics['totalSeconds']/2.0)
+        self.assertEqual(sorted(statistics['percentileSeconds']), [50, 90, 99])
+        self.assertLessEqual(statistics['percentileSeconds'][50], statistics['percentileSeconds'][99])
+
+    def test_regions(self):
+        stm.h_pT(np.array([101.0, 20000.0, 101.0, 5000.0]), np.array([100.0, 400.0, 20.0, 1500.0]))
+        stm.T_ph(101.0, 300.0, returnMask=True)
+        stm.hV_p(np.array([100.0, 1.0e6]))
+        snapshot = stm.instrumentationSnapshot()
+        self.assertEqual(snapshot['h_pT']['regions'], {1: 1, 2: 2, 5: 1})
+        self.assertEqual(snapshot['T_ph']['regions'], {1: 1})
+        self.assertEqual(snapshot['hV_p']['regions'], {4: 1, 0: 1})
+
+    def test_regions_units(self):
+        stm.h_pT(14.7, 70.0, units='English')
+        with stm.unitSystem('English'):
+            stm.h_pT(14.7, 300.0)
+        self.assertEqual(stm.instrumentationSnapshot()['h_pT']['regions'], {1: 1, 2: 1})
+
+    def test_errors(self):
+        self.assertEqual(stm.h_pT(-1.0, 300.0), Constants._errorValue)
+        stm.h_pT(np.array([-1.0, 101.0]), 300.0)
+        statistics = stm.instrumentationSnapshot()['h_pT']
+        self.assertEqual(statistics['errors'], 2)
+        self.assertEqual(statistics['regions'], {0: 2, 2: 1})
+
+    def test_composedFunctions(self):
+        # Pr_pT calls Cp_pT, my_pT and tc_pT, only the outer call is recorded
+        stm.Pr_pT(100.0, 50.0)
+        self.assertEqual(list(stm.instrumentationSnapshot()), ['Pr_pT'])
+
+    def test_reset(self):
+        stm.h_pT(101.0, 300.0)
+        stm.resetInstrumentation()
+        self.assertEqual(stm.instrumentationSnapshot(), {})
+        stm.h_pT(101.0, 300.0)
+        self.assertEqual(stm.instrumentationSnapshot()['h_pT']['calls'], 1)
+
+class Test_SolverTelemetry(unittest.TestCase):
+
+    def setUp(self):
+        stm.enableSolverTelemetry()
+        stm.resetSolverTelemetry()
+
+    def tearDown(self):
+        stm.disableSolverTelemetry()
+        stm.resetSolverTelemetry()
+
+    def test_disabled(self):
+        stm.disableSolverTelemetry()
+        Region1.t1_prho(10.0, 1000.0)
+        self.assertEqual(stm.solverTelemetrySnapshot(), {})
+
+    def test_secant(self):
+        temperature = Region1.t1_prho(10.0, 1000.0)
+        stm.disableSolverTelemetry()
+        self.assertEqual(temperature, Region1.t1_prho(10.0, 1000.0))
+        statistics = stm.solverTelemetrySnapshot()['Region1.t1_prho']
+        self.assertEqual((statistics['calls'], statistics['points'], statistics['failures']), (1, 1, 0))
+        self.assertEqual(sum(statistics['iterations'].values()), 1)
+        self.assertLess(max(statistics['residuals']), -6)
+        self.assertEqual(statistics['slowestStates'][0]['pressure'], 10.0)
+
+    def test_secant_array(self):
+        Region5.t5_ph(np.array([10.0, 20.0, 30.0]), np.array([4500.0, 4600.0, 4700.0]))
+        statistics = stm.solverTelemetrySnapshot()['Region5.t5_ph']
+        self.assertEqual((statistics['calls'], statistics['points'], statistics['failures']), (1, 3, 0))
+        self.assertEqual(sum(statistics['residuals'].values()), 3)
+
+    def test_loops(self):
+        stm.h_pT(np.array([25000.0, 30000.0]), np.array([380.0, 390.0]))
+        stm.hV_p(np.array([18000.0, 22000.0]))
+        Region4.t4_hs(np.array([1547.0, 1000.0, 2000.0]), np.array([4.33, 2.8, 5.0]))
+        snapshot = stm.solverTelemetrySnapshot()
+        for name in ('Region3.v3_pt', 'Region4.h4_p', 'Region4.t4_hs wet'):
+            self.assertEqual(snapshot[name]['failures'], 0)
+        self.assertEqual(snapshot['Region3.v3_pt']['points'], 2)
+        self.assertEqual(snapshot['Region4.h4_p']['iterations'], {3: 2})
+        self.assertEqual(snapshot['Region4.t4_hs wet']['points'], 3)
+
+    def test_failures(self):
+        # A state without an enthalpy stops at its first residual and is reported as failed
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore', RuntimeWarning)
+            Region4.t4_hs(np.array([1000.0, np.nan]), np.array([2.8, 3.6]))
+        statistics = stm.solverTelemetrySnapshot()['Region4.t4_hs wet']
+        self.assertEqual(statistics['failures'], 1)
+        self.assertEqual(statistics['failedStates'][0]['entropy'], 3.6)
+        self.assertEqual(statistics['failedStates'][0]['iterations'], 1)
+
+    def test_statistics(self):
+        statistics = Instrumentation.SolverStatistics()
+        statistics.slowestCount = 2
+        statistics.record(np.array([3, 7, 5]), np.array([0.0, 2e-3, 5e-9]), np.array([True, False, True]), {'x': np.array([1.0, 2.0, 3.0])})
+        statistics.record(4, 1e-12, True, {'x': 4.0})
+        snapshot = statistics.snapshot()
+        self.assertEqual((snapshot['calls'], snapshot['points'], snapshot['failures']), (2, 4, 1))
+        self.assertEqual(snapshot['iterations'], {3: 1, 4: 1, 5: 1, 7: 1})
+        self.assertEqual(snapshot['residuals'], {Instrumentation.SolverStatistics.residualFloor: 1, -3: 1, -9: 1, -12: 1})
+        self.assertEqual(snapshot['failedStates'], [{'x': 2.0, 'iterations': 7, 'residual': 2e-3}])
+        self.assertEqual([state['x'] for state in snapshot['slowestStates']], [2.0, 3.0])
+
+    def test_reset(self):
+        Region1.t1_prho(10.0, 1000.0)
+        stm.resetSolverTelemetry()
+        self.assertEqual(stm.solverTelemetrySnapshot(), {})
@@ -0,0 +1,61 @@
+# -*- coding: utf-8 -*-
+'''
+Unit tests for Polynomials
+'''
+import unittest
+
+import numpy as np
+
+import Polynomials
+import Region1
+import Region2
+
+class Test_Polynomials(unittest.TestCase):
+
+    def setUp(self):
+        self.n = np.array([0.5, -1.25, 2.0, 3.5, -0.75])
+        self.i = np.array([0, 1, 1, 3, -2])
+        self.j = np.array([2, 0, 5, 1, -1])
+        self.x = np.array([0.3, 1.7, 2.5])
+        self.y = np.array([1.1, 0.4, 3.0])
+
+    def sum(self, i, j, n):
+        return (n*self.x[:, np.newaxis]**i*self.y[:, np.newaxis]**j).sum(axis=-1)
+
+    def test_sum(self):
+        polynomial = Polynomials.Polynomial(self.n, (self.i, self.j))
+        np.testing.assert_allclose(polynomial(self.x, self.y), self.sum(self.i, self.j, self.n), rtol=1e-14)
+
+    def test_derivatives(self):
+        polynomial = Polynomials.Polynomial(self.n, (self.i, self.j), [(1, 0), (0, 1), (2, 0), (1, 1)])
+        g_x, g_y, g_xx, g_xy = polynomial(self.x, self.y)
+        np.testing.assert_allclose(g_x, self.sum(self.i - 1, self.j, self.n*self.i), rtol=1e-14)
+        np.testing.assert_allclose(g_y, self.sum(self.i, self.j - 1, self.n*self.j), rtol=1e-14)
+        np.testing.assert_allclose(g_xx, self.sum(self.i - 2, self.j, self.n*self.i*(self.i - 1)), rtol=1e-14)
+        np.testing.assert_allclose(g_xy, self.sum(self.i - 1, self.j - 1, self.n*self.i*self.j), rtol=1e-14)
+
+    def test_scalar(self):
+        polynomial = Polynomials.Polynomial(self.n, (self.i, self.j), (0, 1))
+        value = polynomial(1.7, 0.4)
+        self.assertIsInstance(value, float)
+        self.assertAlmostEqual(float(value), self.sum(self.i, self.j - 1, self.n*self.j)[1], places=12)
+
+    def test_constantDerivative(self):
+        polynomial = Polynomials.Polynomial([2.0, 3.0], ([0, 1],), (1,))
+        np.testing.assert_array_equal(polynomial(self.x), [3.0, 3.0, 3.0])
+
+    def test_zeroDivision(self):
+        polynomial = Polynomials.Polynomial([1.0], ([-1],))
+        with np.errstate(divide='ignore'):
+            self.assertEqual(float(polynomial(0.0)), np.inf)
+
+    def test_fractionalExponents(self):
+        self.assertRaises(ValueError, Polynomials.Polynomial, [1.0], ([0.5],))
+
+    def test_regionEquations(self):
+        pressure, temperature = 3.0, 300.0
+        pi, tau = pressure/16.53, 1386.0/temperature
+        i, j, n = Region1.i, Region1.j, Region1.n
+        g_pi = -(n*i*(7.1 - pi)**(i - 1)*(tau - 1.222)**j).sum()
+        self.assertAlmostEqual(Region1.v1_pt(pressure, temperature), Region1.Constants._R*temperature*pi*g_pi/(pressure*1000.0), places=15)
+        np.testing.assert_allclose(Region2.v2_pt([0.0035, 0.0035], [300.0, 700.0]), [39.4913866, 92.3015898], rtol=1e-8)
@@ -4,6 +4,8 @@ Unit tests for Region 1 functions
 '''
 import unittest
 
+import numpy as np
+
 import Region1
 
 class Test_Region1(unittest.TestCase):
@@ -41,5 +43,63 @@ class Test_Region1(unittest.TestCase):
     def test_t1_prho(self):
         self.assertAlmostEqual(Region1.t1_prho(100.0, 990.0), 388.110, places=3)
 
+class Test_properties1_pt(unittest.TestCase):
+
+    def test_properties1_pt_verificationValues(self):
+        # IF97 Table 5, T = 300 K, p = 3 MPa
+        properties = Region1.properties1_pt(3.0, 300.0)
+        self.assertAlmostEqual(properties.specificVolume, 0.100215168E-02, places=11)
+        self.assertAlmostEqual(properties.enthalpy, 0.115331273E+03, places=6)
+        self.assertAlmostEqual(properties.internalEnergy, 0.112324818E+03, places=6)
+        self.assertAlmostEqual(properties.entropy, 0.392294792, places=9)
+        self.assertAlmostEqual(properties.cp, 0.417301218E+01, places=8)
+        self.assertAlmostEqual(properties.speedOfSound, 0.150773921E+04, places=5)
+
+    def test_properties1_pt_matchesSingleProperties(self):
+        pressure, temperature = np.array([3.0, 80.0, 3.0]), np.array([300.0, 300.0, 500.0])
+        properties = Region1.properties1_pt(pressure, temperature)
+        np.testing.assert_allclose(properties.specificVolume, Region1.v1_pt(pressure, temperature), rtol=1e-12)
+        np.testing.assert_allclose(properties.enthalpy, Region1.h1_pt(pressure, temperature), rtol=1e-12)
+        np.testing.assert_allclose(properties.internalEnergy, Region1.u1_pt(pressure, temperature), rtol=1e-12)
+        np.testing.assert_allclose(properties.entropy, Region1.s1_pt(pressure, temperature), rtol=1e-12)
+        np.testing.assert_allclose(properties.cp, Region1.cp1_pt(pressure, temperature), rtol=1e-12)
+        np.testing.assert_allclose(properties.cv, Region1.cv1_pt(pressure, temperature), rtol=1e-12)
+        np.testing.assert_allclose(properties.speedOfSound, Region1.w1_pt(pressure, temperature), rtol=1e-12)
+        np.testing.assert_array_equal(properties.pressure, pressure)
+
+    def test_properties1_pt_largeArray(self):
+        temperature = np.linspace(280.0, 620.0, 10001)
+        properties = Region1.properties1_pt(50.0, temperature)
+        self.assertEqual(properties.cv.shape, (10001,))
+        self.assertAlmostEqual(properties.cv[-1], Region1.cv1_pt(50.0, temperature[-1]), places=9)
+
+class Test_Region1_Arrays(unittest.TestCase):
+
+    def setUp(self):
+        self.pressure = np.linspace(1.0, 100.0, 7)
+        self.temperature = np.linspace(280.0, 620.0, 5)
+
+    def test_basicEquations_matchScalars(self):
+        pressure, temperature = np.meshgrid(self.pressure, self.temperature)
+        for function in (Region1.v1_pt, Region1.h1_pt, Region1.u1_pt, Region1.s1_pt, Region1.cp1_pt, Region1.cv1_pt, Region1.w1_pt):
+            expected = np.array([function(p, t) for p, t in zip(pressure.ravel(), temperature.ravel())])
+            np.testing.assert_allclose(function(pressure, temperature).ravel(), expected, rtol=1e-12)
+
+    def test_broadcasting(self):
+        enthalpy = Region1.h1_pt(self.pressure[:, np.newaxis], self.temperature)
+        self.assertEqual(enthalpy.shape, (7, 5))
+        self.assertAlmostEqual(enthalpy[3, 2], Region1.h1_pt(self.pressure[3], self.temperature[2]), places=9)
+
+    def test_scalars_evaluatedWithFloats(self):
+        self.assertIsInstance(Region1.h1_pt(3.0, 300.0), float)
+        self.assertEqual(Region1.h1_pt(np.float64(3.0), np.array(300.0)), Region1.h1_pt(3.0, 300.0))
+        self.assertAlmostEqual(Region1.h1_pt(np.array([3.0]), 300.0)[0], Region1.h1_pt(3.0, 300.0), places=12)
+
+    def test_largeArray_evaluatedInBlocks(self):
+        temperature = np.linspace(280.0, 620.0, 10001)
+        specificVolume = Region1.v1_pt(100.0, temperature)
+        self.assertEqual(specificVolume.shape, (10001,))
+        self.assertAlmostEqual(specificVolume[-1], Region1.v1_pt(100.0, temperature[-1]), places=12)
+
 if __name__ == '__main__':
     unittest.main()
@@ -4,6 +4,8 @@ Unit tests for Region 2 functions
 '''
 import unittest
 
+import numpy as np
+
 import Region2
 
 class Test_Region2(unittest.TestCase):
@@ -53,5 +55,59 @@ class Test_Region2(unittest.TestCase):
     def test_t2_prho(self):
         self.assertAlmostEqual(Region2.t2_prho(1.01, 5.0), 466.334, places=3)
 
+class Test_properties2_pt(unittest.TestCase):
+
+    def test_properties2_pt_verificationValues(self):
+        # IF97 Table 15, T = 700 K, p = 30 MPa
+        properties = Region2.properties2_pt(30.0, 700.0)
+        self.assertAlmostEqual(properties.specificVolume, 0.542946619E-02, places=11)
+        self.assertAlmostEqual(properties.enthalpy, 0.263149474E+04, places=5)
+        self.assertAlmostEqual(properties.internalEnergy, 0.246861076E+04, places=5)
+        self.assertAlmostEqual(properties.entropy, 0.517540298E+01, places=8)
+        self.assertAlmostEqual(properties.cp, 0.103505092E+02, places=7)
+        self.assertAlmostEqual(properties.speedOfSound, 0.480386523E+03, places=6)
+
+    def test_properties2_pt_matchesSingleProperties(self):
+        pressure, temperature = np.array([0.0035, 0.0035, 10.0, 15.0]), np.array([300.0, 700.0, 600.0, 1073.15])
+        properties = Region2.properties2_pt(pressure, temperature)
+        np.testing.assert_allclose(properties.specificVolume, Region2.v2_pt(pressure, temperature), rtol=1e-12)
+        np.testing.assert_allclose(properties.enthalpy, Region2.h2_pt(pressure, temperature), rtol=1e-12)
+        np.testing.assert_allclose(properties.internalEnergy, Region2.u2_pt(pressure, temperature), rtol=1e-12)
+        np.testing.assert_allclose(properties.entropy, Region2.s2_pt(pressure, temperature), rtol=1e-12)
+        np.testing.assert_allclose(properties.cp, Region2.cp2_pt(pressure, temperature), rtol=1e-12)
+        np.testing.assert_allclose(properties.cv, Region2.cv2_pt(pressure, temperature), rtol=1e-12)
+        np.testing.assert_allclose(properties.speedOfSound, Region2.w2_pt(pressure, temperature), rtol=1e-12)
+
+    def test_basicEquations_broadcasting(self):
+        pressure, temperature = np.array([[0.1], [1.0], [10.0]]), np.linspace(700.0, 1000.0, 4)
+        entropy = Region2.s2_pt(pressure, temperature)
+        self.assertEqual(entropy.shape, (3, 4))
+        self.assertAlmostEqual(entropy[1, 2], Region2.s2_pt(1.0, temperature[2]), places=12)
+
+    def test_backwardEquations_matchScalars(self):
+        # Subregions 2a, 2b and 2c of every backward equation
+        pressure, enthalpy = np.array([1.0, 5.0, 25.0, 60.0]), np.array([3000.0, 3500.0, 2700.0, 3000.0])
+        np.testing.assert_allclose(Region2.t2_ph(pressure, enthalpy), [Region2.t2_ph(p, h) for p, h in zip(pressure, enthalpy)], rtol=1e-14)
+        pressure, entropy = np.array([1.0, 5.0, 25.0, 60.0]), np.array([7.0, 6.5, 5.5, 5.9])
+        np.testing.assert_allclose(Region2.t2_ps(pressure, entropy), [Region2.t2_ps(p, s) for p, s in zip(pressure, entropy)], rtol=1e-14)
+        enthalpy, entropy = np.array([2800.0, 3600.0, 2800.0, 3400.0]), np.array([6.5, 6.5, 5.1, 5.8])
+        np.testing.assert_allclose(Region2.p2_hs(enthalpy, entropy), [Region2.p2_hs(h, s) for h, s in zip(enthalpy, entropy)], rtol=1e-14)
+
+    def test_backwardEquations_matchScalarsAcrossBoundaries(self):
+        # States on both sides of every subregion boundary of the backward equations
+        sides = np.array([1.0 - 1e-12, 1.0 + 1e-12])
+        pressure = np.array([10.0, 30.0, 60.0, 100.0])
+        pressure, enthalpy = np.concatenate([np.full(6, 4.0)*np.repeat(sides, 3), np.repeat(pressure, 2)]), \
+            np.concatenate([np.tile([2800.0, 3200.0, 3800.0], 2), np.outer(2652.6571908428 + np.sqrt((pressure - 4.5257578905948)/1.2809002730136E-04), sides).ravel()])
+        np.testing.assert_allclose(Region2.t2_ph(pressure, enthalpy), [Region2.t2_ph(p, h) for p, h in zip(pressure, enthalpy)], rtol=1e-14)
+        pressure, entropy = np.concatenate([np.full(6, 4.0)*np.repeat(sides, 3), np.repeat([10.0, 30.0, 60.0, 100.0], 2)]), \
+            np.concatenate([np.tile([6.0, 6.5, 7.0], 2), np.tile(5.85*sides, 4)])
+        np.testing.assert_allclose(Region2.t2_ps(pressure, entropy), [Region2.t2_ps(p, s) for p, s in zip(pressure, entropy)], rtol=1e-14)
+        entropy = np.array([5.9, 6.5, 7.5])
+        enthalpy = -3498.98083432139 + 2575.60716905876*entropy - 421.073558227969*entropy**2 + 27.6349063799944*entropy**3
+        enthalpy, entropy = np.concatenate([np.outer(enthalpy, sides).ravel(), [2700.0, 2700.0, 3000.0, 3000.0]]), \
+            np.concatenate([np.repeat(entropy, 2), np.tile(5.84*sides, 2)])
+        np.testing.assert_allclose(Region2.p2_hs(enthalpy, entropy), [Region2.p2_hs(h, s) for h, s in zip(enthalpy, entropy)], rtol=1e-14)
+
 if __name__ == '__main__':
     unittest.main()
@@ -4,12 +4,54 @@ Unit tests for Region 3 functions
 '''
 import unittest
 
+import numpy as np
+
 import Region3
 
 class Test_Region3_Tests(unittest.TestCase):
 
+    # Computer-program verification values of the 2016 release on v(p,T) for region 3: pressure, temperature, subregion, volume
+    verificationValues = (
+        (50.0, 630.0, 'a', 0.001470853100), (80.0, 670.0, 'a', 0.001503831359), (50.0, 710.0, 'b', 0.002204728587), (80.0, 750.0, 'b', 0.001973692940),
+        (20.0, 630.0, 'c', 0.001761696406), (30.0, 650.0, 'c', 0.001819560617), (26.0, 656.0, 'd', 0.002245587720), (30.0, 670.0, 'd', 0.002506897702),
+        (26.0, 661.0, 'e', 0.002970225962), (30.0, 675.0, 'e', 0.003004627086), (26.0, 671.0, 'f', 0.005019029401), (30.0, 690.0, 'f', 0.004656470142),
+        (23.6, 649.0, 'g', 0.002163198378), (24.0, 650.0, 'g', 0.002166044161), (23.6, 652.0, 'h', 0.002651081407), (24.0, 654.0, 'h', 0.002967802335),
+        (23.6, 653.0, 'i', 0.003273916816), (24.0, 655.0, 'i', 0.003550329864), (23.5, 655.0, 'j', 0.004545001142), (24.0, 660.0, 'j', 0.005100267704),
+        (23.0, 660.0, 'k', 0.006109525997), (24.0, 670.0, 'k', 0.006427325645), (22.6, 646.0, 'l', 0.002117860851), (23.0, 646.0, 'l', 0.002062374674),
+        (22.6, 648.6, 'm', 0.002533063780), (22.8, 649.3, 'm', 0.002572971781), (22.6, 649.0, 'n', 0.002923432711), (22.8, 649.7, 'n', 0.002913311494),
+        (22.6, 649.1, 'o', 0.003131208996), (22.8, 649.9, 'o', 0.003221160278), (22.6, 649.4, 'p', 0.003715596186), (22.8, 650.2, 'p', 0.003664754790),
+        (21.1, 640.0, 'q', 0.001970999272), (21.8, 643.0, 'q', 0.002043919161), (21.1, 644.0, 'r', 0.005251009921), (21.8, 648.0, 'r', 0.005256844741),
+        (19.1, 635.0, 's', 0.001932829079), (20.0, 638.0, 's', 0.001985387227), (17.0, 626.0, 't', 0.008483262001), (20.0, 640.0, 't', 0.006227528101),
+        (21.5, 644.6, 'u', 0.002268366647), (22.0, 646.1, 'u', 0.002296350553), (22.5, 648.6, 'v', 0.002832373260), (22.3, 647.9, 'v', 0.002811424405),
+        (22.15, 647.5, 'w', 0.003694032281), (22.3, 648.1, 'w', 0.003622226305), (22.11, 648.0, 'x', 0.004528072649), (22.3, 649.0, 'x', 0.004556905799),
+        (22.0, 646.84, 'y', 0.002698354719), (22.064, 647.05, 'y', 0.002717655648), (22.0, 646.89, 'z', 0.003798732962), (22.064, 647.15, 'z', 0.003701940009))
+
     def test_h3_pt(self):
-        self.assertAlmostEqual(Region3.h3_pt(21.0, 650.0), 2545.682, places=3)
+        self.assertAlmostEqual(Region3.h3_pt(21.0, 650.0), 2545.831, places=3)
+
+    def test_v3_pt_verificationValues(self):
+        for pressure, temperature, subregion, specificVolume in self.verificationValues:
+            self.assertEqual(Region3.subregion3_pt(pressure, temperature), subregion)
+            self.assertAlmostEqual(Region3.v3_pt(pressure, temperature)/specificVolume, 1.0, places=9)
+
+    def test_v3_pt_arrays(self):
+        pressure, temperature = np.array([50.0, 26.0, 23.6, 22.6, 17.0]), np.array([630.0, 671.0, 649.0, 649.4, 626.0])
+        np.testing.assert_array_equal(Region3.subregion3_pt(pressure, temperature), ['a', 'f', 'g', 'p', 't'])
+        np.testing.assert_allclose(Region3.v3_pt(pressure, temperature), [Region3.v3_pt(p, T) for p, T in zip(pressure, temperature)], rtol=1e-14)
+
+    def test_v3_pt_scalarsMatchArrays(self):
+        # Floats and arrays pick the same subregion and volume on every subregion 3a to 3z
+        pressure, temperature, subregion = [np.array(column) for column in list(zip(*self.verificationValues))[:3]]
+        self.assertEqual(set(subregion), set('abcdefghijklmnopqrstuvwxyz'))
+        self.assertEqual([Region3._subregion3Scalar_pt(p, T) for p, T in zip(pressure, temperature)], subregion.tolist())
+        np.testing.assert_allclose([Region3.v3_pt(p, T) for p, T in zip(pressure, temperature)], Region3.v3_pt(pressure, temperature), rtol=1e-14)
+        np.testing.assert_allclose([Region3.v3_pt(p, T, polish=True) for p, T in zip(pressure, temperature)], Region3.v3_pt(pressure, temperature, polish=True), rtol=1e-11)
+
+    def test_v3_pt_polish(self):
+        pressure, temperature = np.array([25.0, 22.3, 21.5, 80.0]), np.array([660.0, 648.1, 644.6, 750.0])
+        specificVolume = Region3.v3_pt(pressure, temperature, polish=True)
+        np.testing.assert_allclose(Region3.p3_rhot(1.0/specificVolume, temperature), pressure, rtol=1e-10)
+        np.testing.assert_allclose(specificVolume, Region3.v3_pt(pressure, temperature), rtol=1e-3)
 
     def test_t3_ph(self):
 
@@ -69,5 +111,65 @@ class Test_Region3_Tests(unittest.TestCase):
     def test_p3sat_s(self):
         self.assertAlmostEqual(Region3.p3sat_s(4.0), 19.809, places=3)
 
+class Test_properties3_rhot(unittest.TestCase):
+
+    def test_properties3_rhot_verificationValues(self):
+        # IF97 Table 33, T = 650 K, rho = 500 kg/m**3
+        properties = Region3.properties3_rhot(500.0, 650.0)
+        self.assertAlmostEqual(properties.pressure, 0.255837018E+02, places=7)
+        self.assertAlmostEqual(properties.enthalpy, 0.186343019E+04, places=5)
+        self.assertAlmostEqual(properties.internalEnergy, 0.181226279E+04, places=5)
+        self.assertAlmostEqual(properties.entropy, 0.405427273E+01, places=8)
+        self.assertAlmostEqual(properties.cp, 0.138935717E+02, places=7)
+        self.assertAlmostEqual(properties.speedOfSound, 0.502005554E+03, places=6)
+        self.assertAlmostEqual(properties.specificVolume, 0.002, places=12)
+
+    def test_properties3_rhot_matchesSingleProperties(self):
+        density, temperature = np.array([500.0, 200.0, 500.0, 350.0]), np.array([650.0, 650.0, 750.0, 700.0])
+        properties = Region3.properties3_rhot(density, temperature)
+        np.testing.assert_allclose(properties.pressure, Region3.p3_rhot(density, temperature), rtol=1e-12)
+        np.testing.assert_allclose(properties.enthalpy, Region3.h3_rhot(density, temperature), rtol=1e-12)
+        np.testing.assert_allclose(properties.internalEnergy, Region3.u3_rhot(density, temperature), rtol=1e-12)
+        np.testing.assert_allclose(properties.entropy, Region3.s3_rhot(density, temperature), rtol=1e-12)
+        np.testing.assert_allclose(properties.cp, Region3.cp3_rhot(density, temperature), rtol=1e-10)
+        np.testing.assert_allclose(properties.cv, Region3.cv3_rhot(density, temperature), rtol=1e-12)
+        np.testing.assert_allclose(properties.speedOfSound, Region3.w3_rhot(density, temperature), rtol=1e-12)
+
+    def test_basicEquations_broadcasting(self):
+        density, temperature = np.array([[200.0], [350.0], [500.0]]), np.linspace(650.0, 800.0, 4)
+        pressure = Region3.p3_rhot(density, temperature)
+        self.assertEqual(pressure.shape, (3, 4))
+        self.assertAlmostEqual(pressure[1, 2], Region3.p3_rhot(350.0, temperature[2]), places=10)
+
+    def test_backwardEquations_matchScalars(self):
+        # Subregions 3a and 3b of every backward equation
+        pressure, enthalpy = np.array([20.0, 50.0, 20.0, 50.0]), np.array([1700.0, 2000.0, 2400.0, 2600.0])
+        for function in (Region3.t3_ph, Region3.v3_ph):
+            np.testing.assert_allclose(function(pressure, enthalpy), [function(p, h) for p, h in zip(pressure, enthalpy)], rtol=1e-14)
+        pressure, entropy = np.array([20.0, 50.0, 20.0, 50.0]), np.array([3.8, 4.2, 4.6, 5.0])
+        for function in (Region3.t3_ps, Region3.v3_ps):
+            np.testing.assert_allclose(function(pressure, entropy), [function(p, s) for p, s in zip(pressure, entropy)], rtol=1e-14)
+        enthalpy, entropy = np.array([1700.0, 2000.0, 2400.0, 2600.0]), np.array([3.8, 4.2, 4.6, 5.0])
+        np.testing.assert_allclose(Region3.p3_hs(enthalpy, entropy), [Region3.p3_hs(h, s) for h, s in zip(enthalpy, entropy)], rtol=1e-14)
+
+    def test_backwardEquations_matchScalarsAcrossBoundaries(self):
+        # States on both sides of the boundary of subregions 3a and 3b of every backward equation
+        sides = np.array([1.0 - 1e-12, 1.0 + 1e-12])
+        pressure = np.array([20.0, 30.0, 50.0, 100.0])
+        enthalpy = np.outer(2014.64004206875 + 3.74696550136983*pressure - 2.19921901054187E-02*pressure**2 + 8.7513168600995E-05*pressure**3, sides).ravel()
+        for function in (Region3.t3_ph, Region3.v3_ph):
+            np.testing.assert_allclose(function(np.repeat(pressure, 2), enthalpy), [function(p, h) for p, h in zip(np.repeat(pressure, 2), enthalpy)], rtol=1e-14)
+        entropy = np.tile(4.41202148223476*sides, 4)
+        for function in (Region3.t3_ps, Region3.v3_ps):
+            np.testing.assert_allclose(function(np.repeat(pressure, 2), entropy), [function(p, s) for p, s in zip(np.repeat(pressure, 2), entropy)], rtol=1e-14)
+        enthalpy = np.repeat([1900.0, 2000.0, 2100.0, 2200.0], 2)
+        np.testing.assert_allclose(Region3.p3_hs(enthalpy, entropy), [Region3.p3_hs(h, s) for h, s in zip(enthalpy, entropy)], rtol=1e-14)
+
+    def test_properties3_rhot_blocked(self):
+        density, temperature = np.linspace(150.0, 600.0, 10001), np.full(10001, 700.0)
+        properties = Region3.properties3_rhot(density, temperature)
+        self.assertEqual(properties.entropy.shape, (10001,))
+        self.assertAlmostEqual(properties.entropy[7777], Region3.s3_rhot(density[7777], 700.0), places=10)
+
 if __name__ == '__main__':
     unittest.main()
@@ -4,6 +4,11 @@ Unit tests for Region 4 functions
 '''
 import unittest
 
+import numpy as np
+
+import Region1
+import Region2
+import Region3
 import Region4
 
 class Test_Region4(unittest.TestCase):
@@ -62,15 +67,70 @@ class Test_Region4(unittest.TestCase):
     def test_h4_p_vap_exception(self):
         self.assertEqual(Region4.h4_p(23.0, 'vap'), 2015.0)
 
+    def test_h4_p_region3Inverse(self):
+        pressure = np.array([16.529, 18.0, 20.0, 22.0, 22.06, 22.0639, 22.06395])
+        for phase in ('liq', 'vap'):
+            enthalpy = Region4.h4_p(pressure, phase)
+            np.testing.assert_allclose(Region3.p3sat_h(enthalpy), pressure, rtol=1e-13)
+        self.assertTrue((Region4.h4_p(pressure, 'liq') < Region4.h4_p(pressure, 'vap')).all())
+
+    def test_h4_p_arrays(self):
+        pressure = np.array([[1.0, 15.0, 17.0], [21.0, 22.06395, 23.0]])
+        enthalpy = Region4.h4_p(pressure, 'vap')
+        self.assertEqual(enthalpy.shape, (2, 3))
+        for index in np.ndindex(pressure.shape):
+            self.assertEqual(enthalpy[index], Region4.h4_p(pressure[index], 'vap'))
+
     def test_t4_hs_region1(self):
         self.assertAlmostEqual(Region4.t4_hs(2000.0, 6.0), 338.379, places=3)
 
     def test_t4_hs_region2(self):
-        self.assertAlmostEqual(Region4.t4_hs(1000.0, 1.0), 505.232, places=3)
+        self.assertAlmostEqual(Region4.t4_hs(1000.0, 1.0), 505.233, places=3)
 
     def test_t4_hs_region3(self):
         self.assertAlmostEqual(Region4.t4_hs(1500.0, 4.0), 403.155, places=3)
 
+    def test_t4_hs_wet(self):
+        temperature, quality = np.array([300.0, 450.0, 600.0]), np.array([0.1, 0.5, 0.3])
+        pressure = Region4.p4_t(temperature)
+        liquid, vapor = Region1.properties1_pt(pressure, temperature), Region2.properties2_pt(pressure, temperature)
+        enthalpy = liquid.enthalpy + quality*(vapor.enthalpy - liquid.enthalpy)
+        entropy = liquid.entropy + quality*(vapor.entropy - liquid.entropy)
+        np.testing.assert_allclose(Region4.t4_hs(enthalpy, entropy), temperature, atol=1e-7)
+        np.testing.assert_allclose([Region4.t4_hs(h, s) for h, s in zip(enthalpy, entropy)], temperature, atol=1e-7)
+
+    def test_t4_hs_arrays(self):
+        # The last two states are above the saturation line on its liquid and critical parts
+        enthalpy, entropy = np.array([2000.0, 1000.0, 1500.0, 1000.0, 2000.0]), np.array([6.0, 1.0, 4.0, 2.0, 4.2])
+        np.testing.assert_allclose(Region4.t4_hs(enthalpy, entropy), [Region4.t4_hs(h, s) for h, s in zip(enthalpy, entropy)], rtol=1e-12)
+
+    def test_t4_hs_scalarsMatchArrays(self):
+        # Wet states on the region 1 and 2 and on the region 3 part of the saturation line up to close to the critical
+        # point, then states above the line on its liquid part and on its critical part
+        temperature, quality = np.array([280.0, 400.0, 600.0, 630.0, 640.0, 645.0, 647.0]), np.array([0.05, 0.5, 0.4, 0.2, 0.6, 0.3, 0.1])
+        (liquidEnthalpy, vaporEnthalpy), (liquidEntropy, vaporEntropy), _ = Region4._saturationLine(temperature)
+        enthalpy = np.concatenate([liquidEnthalpy + quality*(vaporEnthalpy - liquidEnthalpy), [100.0, 1000.0, 1650.0, 2000.0, 2085.0]])
+        entropy = np.concatenate([liquidEntropy + quality*(vaporEntropy - liquidEntropy), [0.2, 2.0, 3.7, 4.2, 4.4]])
+        scalars = [Region4.t4_hs(h, s) for h, s in zip(enthalpy, entropy)]
+        np.testing.assert_allclose(scalars[:7], temperature, atol=1e-7)
+        np.testing.assert_allclose(scalars, Region4.t4_hs(enthalpy, entropy), rtol=1e-12)
+
+    def test_p4_s_arrays(self):
+        entropy = np.array([1.0, 4.0, 6.0])
+        np.testing.assert_allclose(Region4.p4_s(entropy), [Region4.p4_s(s) for s in entropy], rtol=1e-12)
+
+    def test_matchScalarsAcrossBoundaries(self):
+        # States on both sides of the boundaries between the parts of the saturation line, and of the critical entropy
+        # on and above the saturation line
+        sides = np.array([1.0 - 1e-12, 1.0 + 1e-12])
+        entropy = np.outer([3.77828134, 4.41202148223476, 5.210887663, 5.85], sides).ravel()
+        for function in (Region4.h4_s, Region4.p4_s):
+            np.testing.assert_allclose(function(entropy), [function(s) for s in entropy], rtol=1e-12)
+        entropy = np.outer([3.77828134, 5.210887825], sides).ravel()
+        enthalpy = np.concatenate([Region4.h4_s(entropy)*(1.0 - 1e-12), Region4.h4_s(entropy)*(1.0 + 1e-12), Region4.h4_s(entropy) + 50.0])
+        entropy = np.tile(entropy, 3)
+        np.testing.assert_allclose(Region4.t4_hs(enthalpy, entropy), [Region4.t4_hs(h, s) for h, s in zip(enthalpy, entropy)], rtol=1e-12)
+
     def test_t4_hs_exception(self):
         self.assertRaises(ArithmeticError, Region4.t4_hs, 100.0, 100.0)
 
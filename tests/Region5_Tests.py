@@ -4,6 +4,8 @@ Unit tests for Region 5 functions
 '''
 import unittest
 
+import numpy as np
+
 import Region5
 
 class Test_Region5(unittest.TestCase):
@@ -38,5 +40,34 @@ class Test_Region5(unittest.TestCase):
     def test_t5_prho(self):
         self.assertAlmostEqual(Region5.t5_prho(9.0, 10.0), 1943.669, places=3)
 
+class Test_properties5_pt(unittest.TestCase):
+
+    def test_properties5_pt_verificationValues(self):
+        # IF97 Table 42, T = 1500 K, p = 30 MPa
+        properties = Region5.properties5_pt(30.0, 1500.0)
+        self.assertAlmostEqual(properties.specificVolume, 0.231191517E-01, places=9)
+        self.assertAlmostEqual(properties.enthalpy, 0.516757517E+04, places=5)
+        self.assertAlmostEqual(properties.internalEnergy, 0.447400062E+04, places=5)
+        self.assertAlmostEqual(properties.entropy, 0.772969165E+01, places=8)
+        self.assertAlmostEqual(properties.cp, 0.272753197E+01, places=8)
+        self.assertAlmostEqual(properties.speedOfSound, 0.932501326E+03, places=6)
+
+    def test_properties5_pt_matchesSingleProperties(self):
+        pressure, temperature = np.array([0.5, 30.0, 30.0, 10.0]), np.array([1500.0, 1500.0, 2000.0, 2273.15])
+        properties = Region5.properties5_pt(pressure, temperature)
+        np.testing.assert_allclose(properties.specificVolume, Region5.v5_pt(pressure, temperature), rtol=1e-12)
+        np.testing.assert_allclose(properties.enthalpy, Region5.h5_pt(pressure, temperature), rtol=1e-12)
+        np.testing.assert_allclose(properties.internalEnergy, Region5.u5_pt(pressure, temperature), rtol=1e-12)
+        np.testing.assert_allclose(properties.entropy, Region5.s5_pt(pressure, temperature), rtol=1e-12)
+        np.testing.assert_allclose(properties.cp, Region5.cp5_pt(pressure, temperature), rtol=1e-12)
+        np.testing.assert_allclose(properties.cv, Region5.cv5_pt(pressure, temperature), rtol=1e-12)
+        np.testing.assert_allclose(properties.speedOfSound, Region5.w5_pt(pressure, temperature), rtol=1e-12)
+
+    def test_basicEquations_broadcasting(self):
+        pressure, temperature = np.array([[0.5], [10.0], [50.0]]), np.linspace(1100.0, 2200.0, 5)
+        enthalpy = Region5.h5_pt(pressure, temperature)
+        self.assertEqual(enthalpy.shape, (3, 5))
+        self.assertAlmostEqual(enthalpy[2, 3], Region5.h5_pt(50.0, temperature[3]), places=10)
+
 if __name__ == '__main__':
     unittest.main()
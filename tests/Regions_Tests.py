@@ -4,6 +4,9 @@ Unit tests for Regions functions
 '''
 import unittest
 
+import numpy as np
+
+import Region4
 import Regions
 
 class Test_Regions(unittest.TestCase):
@@ -188,5 +191,94 @@ class Test_Regions(unittest.TestCase):
     def test_region_prho_region2_highPressure(self):
         self.assertEqual(Regions.region_prho(17.0, 36.0), 2)
 
+class Test_Regions_Arrays(unittest.TestCase):
+
+    def assertMatchesScalar(self, arrayFunction, scalarFunction, x, y):
+        regions = arrayFunction(x, y)
+        expected = [scalarFunction(a, b) or 0 for a, b in zip(x.ravel(), y.ravel())]
+        self.assertEqual(regions.dtype, np.int8)
+        np.testing.assert_array_equal(regions.ravel(), expected)
+
+    def test_region_pt_array_matchesScalar(self):
+        pressure, temperature = np.meshgrid(np.linspace(0.0001, 105.0, 60), np.linspace(250.0, 2300.0, 80))
+        self.assertMatchesScalar(Regions.region_pt_array, Regions.region_pt, pressure, temperature)
+
+    def test_region_pt_array_saturation(self):
+        temperature = np.array([300.0, 500.0, 640.0, 646.0])
+        np.testing.assert_array_equal(Regions.region_pt_array(Region4.p4_t(temperature), temperature), 4)
+
+    def test_region_pt_array_outOfRange(self):
+        regions = Regions.region_pt_array(np.array([-1.0, 3.0, 101.0, np.nan, 11.0]), np.array([500.0, 200.0, 500.0, 500.0, 1500.0]))
+        np.testing.assert_array_equal(regions, 0)
+
+    def test_region_pt_array_scalar(self):
+        self.assertEqual(Regions.region_pt_array(3.0, 500.0), 1)
+
+    def test_region_ph_array_matchesScalar(self):
+        pressure, enthalpy = np.meshgrid(np.append(np.linspace(0.0001, 105.0, 50), [10.0, 16.529, 16.5292, 22.064]), np.linspace(-100.0, 7500.0, 70))
+        self.assertMatchesScalar(Regions.region_ph_array, Regions.region_ph, pressure, enthalpy)
+
+    def test_region_ph_array_outOfRange(self):
+        regions = Regions.region_ph_array(np.array([0.0, 1.0, 101.0, np.nan, 1.0]), np.array([4.0, -1.0, 1000.0, 1000.0, np.nan]))
+        np.testing.assert_array_equal(regions, 0)
+
+    def test_region_ph_array_scalar(self):
+        self.assertEqual(Regions.region_ph_array(19.0, 2500.0), 3)
+
+    def test_region_ps_array_matchesScalar(self):
+        pressure, entropy = np.meshgrid(np.append(np.linspace(0.0001, 105.0, 50), [10.0, 16.529, 16.5292, 22.064]), np.linspace(-0.5, 13.5, 70))
+        self.assertMatchesScalar(Regions.region_ps_array, Regions.region_ps, pressure, entropy)
+
+    def test_region_ps_array_outOfRange(self):
+        regions = Regions.region_ps_array(np.array([0.0, 1.0, 101.0, np.nan, 1.0, 11.0]), np.array([4.0, -1.0, 4.0, 4.0, np.nan, 9.0]))
+        np.testing.assert_array_equal(regions, 0)
+
+    def test_region_ps_array_scalar(self):
+        self.assertEqual(Regions.region_ps_array(20.0, 4.5), 4)
+
+    def test_region_hs_array_matchesScalar(self):
+        boundaries = [3.397782955, 3.77828134, 4.41202148223476, 5.048096828, 5.09796573397125, 5.260578707, 6.04048367171238, 9.155759395]
+        enthalpy, entropy = np.meshgrid(np.linspace(-10.0, 4500.0, 60), np.append(np.linspace(-0.5, 12.5, 60), boundaries))
+        self.assertMatchesScalar(Regions.region_hs_array, Regions.region_hs, enthalpy, entropy)
+
+    def test_region_hs_array_b23(self):
+        enthalpy, entropy = np.meshgrid(np.linspace(2400.0, 3000.0, 25), np.linspace(4.9, 5.3, 25))
+        self.assertMatchesScalar(Regions.region_hs_array, Regions.region_hs, enthalpy, entropy)
+
+    def test_region_hs_array_outOfRange(self):
+        regions = Regions.region_hs_array(np.array([-1.0, 0.0, np.nan, 2000.0, 3000.0]), np.array([1.0, 1.0, 5.0, np.nan, 5.2]))
+        np.testing.assert_array_equal(regions, 0)
+
+    def test_region_hs_array_scalar(self):
+        self.assertEqual(Regions.region_hs_array(2700.0, 5.2), 2)
+
+    def test_region_prho_array_matchesScalar(self):
+        pressure, density = np.meshgrid(np.append(np.linspace(0.0001, 105.0, 40), [10.0, 16.5292, 18.0, 20.0, 22.064]), np.append(np.logspace(-4.0, 3.05, 50), [96.72, 115.0, 145.0]))
+        regions, errors = Regions.region_prho_array(pressure, density)
+        self.assertEqual(regions.dtype, np.int8)
+        for region, error, p, rho in zip(regions.ravel(), errors.ravel(), pressure.ravel(), density.ravel()):
+            try:
+                expected = Regions.region_prho(p, rho)
+            except ArithmeticError:
+                self.assertEqual(region, 0)
+                self.assertNotEqual(error, 0)
+                continue
+            self.assertEqual(region, expected or 0)
+            self.assertEqual(error, 0 if expected else Regions.densityOutOfBounds)
+
+    def test_region_prho_array_errorCodes(self):
+        regions, errors = Regions.region_prho_array(np.array([0.0, 10.0, 15.0, np.nan, 17.0]), np.array([700.0, 1005.0, 31.0, 700.0, 145.0]))
+        np.testing.assert_array_equal(regions, [0, 0, 0, 0, 4])
+        np.testing.assert_array_equal(errors, [Regions.pressureOutOfBounds, Regions.densityOutOfBounds, Regions.pressureOutOfBounds, Regions.pressureOutOfBounds, 0])
+
+    def test_region_prho_array_sharedPressure(self):
+        density = np.array([115.0, 145.0, 400.0, 145.0, 115.0])
+        regions, errors = Regions.region_prho_array(17.0, density)
+        np.testing.assert_array_equal(regions, [Regions.region_prho(17.0, rho) for rho in density])
+        np.testing.assert_array_equal(errors, 0)
+
+    def test_region_prho_array_scalar(self):
+        self.assertEqual(Regions.region_prho_array(17.0, 145.0), (4, 0))
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,78 @@
+# -*- coding: utf-8 -*-
+'''
+Unit tests for the saturation table
+'''
+import unittest
+
+import numpy as np
+
+import Region4
+import Saturation
+import States
+import XSteamPython as stm
+
+class Test_Saturation(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.table = Saturation.SaturationTable()
+
+    def tearDown(self):
+        stm.useSaturationEquations()
+
+    def test_maximumError(self):
+        for field, error in self.table.maximumError.items():
+            self.assertLess(error, 1e-7, field)
+
+    def test_errorBetweenNodes(self):
+        pressure = np.exp(np.random.RandomState(0).uniform(np.log(0.000611657), np.log(22.06395), 20000))
+        for phase, exact in (('liq', States.saturatedLiquid_p), ('vap', States.saturatedVapor_p)):
+            table, equations = self.table.properties_p(pressure, phase), exact(pressure)
+            for field in table._fields:
+                relative = np.abs(getattr(table, field)/getattr(equations, field) - 1.0)
+                if field == 'cp':
+                    relative = relative[pressure < 22.0]
+                self.assertLess(relative.max(), 1e-7, field)
+
+    def test_maximumErrorEstimate(self):
+        # The error between the check points stays close to the measured maximumError
+        pressure = np.exp(np.random.RandomState(1).uniform(np.log(0.000611657), np.log(22.06395), 100000))
+        for phase, exact in (('liq', States.saturatedLiquid_p), ('vap', States.saturatedVapor_p)):
+            table, equations = self.table.properties_p(pressure, phase), exact(pressure)
+            for field in table._fields:
+                relative = np.abs(getattr(table, field)/getattr(equations, field) - 1.0)
+                if field == 'cp':
+                    relative = relative[pressure < 22.0]
+                self.assertLessEqual(relative.max(), 1.5*self.table.maximumError[field], field)
+
+    def test_nearCritical(self):
+        pressure = np.linspace(22.0, 22.06395, 200, endpoint=False)
+        for phase, exact in (('liq', States.saturatedLiquid_p), ('vap', States.saturatedVapor_p)):
+            table, equations = self.table.properties_p(pressure, phase), exact(pressure)
+            for field in ('specificVolume', 'enthalpy', 'entropy', 'speedOfSound'):
+                np.testing.assert_allclose(getattr(table, field), getattr(equations, field), rtol=1e-7)
+            np.testing.assert_array_equal(np.sign(table.cp), np.sign(equations.cp))
+
+    def test_useSaturationTable(self):
+        pressure = np.array([1.0, 1000.0, 20000.0, 22000.0])
+        enthalpy, quality = stm.hL_p(pressure), stm.x_ph(pressure, 1800.0)
+        self.assertIs(stm.useSaturationTable(self.table), self.table)
+        np.testing.assert_allclose(stm.hL_p(pressure), enthalpy, rtol=1e-7)
+        np.testing.assert_allclose(stm.x_ph(pressure, 1800.0), quality, rtol=1e-6)
+
+    def test_useSaturationTable_scalarUnchanged(self):
+        stm.useSaturationTable(self.table)
+        self.assertEqual(stm.hL_p(1000.0), Region4.h4_p(1.0, 'liq'))
+
+    def test_useSaturationTable_temperature(self):
+        temperature = np.array([20.0, 200.0, 370.0])
+        enthalpy = stm.hV_T(temperature)
+        stm.useSaturationTable(self.table)
+        np.testing.assert_allclose(stm.hV_T(temperature), enthalpy, rtol=1e-7)
+
+    def test_outOfRange(self):
+        stm.useSaturationTable(self.table)
+        self.assertTrue(np.isnan(stm.hV_p(np.array([0.1, 30000.0]))).all())
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+'''
+Unit tests for Solvers
+'''
+import os
+import subprocess
+import sys
+import unittest
+import warnings
+
+import numpy as np
+
+import Region1
+import Region5
+import Solvers
+
+def cubic(x, a):
+    return x**3 - a
+
+def cubicSlope(x, a):
+    return 3.0*x**2
+
+class Test_Solvers(unittest.TestCase):
+
+    def setUp(self):
+        self.a = np.array([0.5, 2.0, 8.0, 27.0, 100.0])
+        self.roots = np.cbrt(self.a)
+
+    def test_secant(self):
+        self.assertAlmostEqual(Solvers.secant(cubic, 1.0, (2.0,)), 2.0**(1.0/3.0), places=12)
+        np.testing.assert_allclose(Solvers.secant(cubic, np.ones(5), (self.a,)), self.roots, rtol=1e-12)
+        np.testing.assert_allclose(Solvers.secant(cubic, 1.0, (self.a.reshape(5, 1),)), self.roots.reshape(5, 1), rtol=1e-12)
+
+    def test_newton(self):
+        self.assertAlmostEqual(Solvers.newton(cubic, cubicSlope, 1.0, (2.0,)), 2.0**(1.0/3.0), places=12)
+        np.testing.assert_allclose(Solvers.newton(cubic, cubicSlope, np.ones(5), (self.a,)), self.roots, rtol=1e-12)
+
+    def test_safeguardedNewton(self):
+        cubicNewton = lambda x, a: (cubic(x, a), cubicSlope(x, a))
+        self.assertAlmostEqual(Solvers.safeguardedNewton(cubicNewton, 1.0, 0.0, 5.0, (2.0,)), 2.0**(1.0/3.0), places=8)
+        np.testing.assert_allclose(Solvers.safeguardedNewton(cubicNewton, np.ones(5), 0.0, 5.0, (self.a,)), self.roots, atol=1e-8)
+        # From a vanishing slope the first step is a bisection, roots beyond a limit end on the limit
+        np.testing.assert_allclose(Solvers.safeguardedNewton(cubicNewton, 0.0, 0.0, 5.0, (self.a,)), self.roots, atol=1e-8)
+        self.assertAlmostEqual(Solvers.safeguardedNewton(cubicNewton, 1.0, 0.0, 4.0, (100.0,)), 4.0, places=7)
+
+    def test_brent(self):
+        self.assertAlmostEqual(Solvers.brent(cubic, 0.0, 5.0, (2.0,)), 2.0**(1.0/3.0), places=11)
+        np.testing.assert_allclose(Solvers.brent(cubic, 0.0, 5.0, (self.a,)), self.roots, rtol=1e-11)
+        self.assertEqual(Solvers.brent(cubic, 2.0, 5.0, (8.0,)), 2.0)
+        with self.assertRaises(ValueError):
+            Solvers.brent(cubic, 0.0, 1.0, (self.a,))
+
+    def test_maskedEvaluation(self):
+        # Converged states are not evaluated again
+        sizes = []
+        def residual(x, a):
+            sizes.append(np.size(x))
+            return cubic(x, a)
+        Solvers.secant(residual, np.array([1.0, 3.0]), (np.array([1.0, 1000.0]),))
+        self.assertEqual(sizes[:2], [2, 2])
+        self.assertEqual(sizes[-1], 1)
+
+    def test_failures(self):
+        square = lambda x: x**2 + 1.0
+        with self.assertRaises(RuntimeError):
+            Solvers.secant(square, 1.0)
+        with self.assertRaises(RuntimeError):
+            Solvers.newton(square, lambda x: 2.0*x, np.array([1.0, 2.0]))
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter('always')
+            roots = Solvers.secant(lambda x, a: x**2 - a, np.ones(2), (np.array([4.0, -1.0]),))
+        self.assertAlmostEqual(roots[0], 2.0, places=10)
+        self.assertTrue(any(issubclass(warning.category, RuntimeWarning) for warning in caught))
+
+    def test_regions(self):
+        temperature = Region1.t1_prho(10.0, 1.0/Region1.v1_pt(10.0, 400.0))
+        self.assertAlmostEqual(temperature, 400.0, places=6)
+        pressure = np.array([10.0, 30.0])
+        enthalpy = Region5.h5_pt(pressure, np.array([1200.0, 1800.0]))
+        np.testing.assert_allclose(Region5.t5_ph(pressure, enthalpy), [1200.0, 1800.0], atol=1e-5)
+
+    def test_withoutScipy(self):
+        source = os.path.dirname(os.path.abspath(Solvers.__file__))
+        output = subprocess.check_output([sys.executable, '-c', 'import sys; sys.path.insert(0, sys.argv[1]); import XSteamPython; print("scipy" in sys.modules)', source])
+        self.assertEqual(output.strip(), b'False')
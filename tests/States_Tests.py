@@ -0,0 +1,138 @@
+# -*- coding: utf-8 -*-
+'''
+Unit tests for the array mode of the public functions
+'''
+import unittest
+
+import numpy as np
+
+import Data
+import Region4
+import States
+import XSteamPython as stm
+
+class Test_ArrayMode(unittest.TestCase):
+
+    def tearDown(self):
+        stm.englishUnits = False
+
+    def test_T_ph(self):
+        pressure, enthalpy, temperatureCompare = Data.getTwoDimensionalTestData('SIUnits_T_ph.npz')
+        temperature = Data.calculatePropertyFromArrays(stm.T_ph, pressure, enthalpy)
+        np.testing.assert_array_almost_equal(temperature, Data.errorValueToNan(temperatureCompare), decimal=2)
+
+    def test_T_ph_English(self):
+        stm.englishUnits = True
+        pressure, enthalpy, temperatureCompare = Data.getTwoDimensionalTestData('EnglishUnits_T_ph.npz')
+        temperature = Data.calculatePropertyFromArrays(stm.T_ph, pressure, enthalpy)
+        np.testing.assert_array_almost_equal(temperature, Data.errorValueToNan(temperatureCompare), decimal=2)
+
+    def test_T_hs(self):
+        enthalpy, entropy, temperatureCompare = Data.getTwoDimensionalTestData('SIUnits_T_hs.npz')
+        temperature = Data.calculatePropertyFromArrays(stm.T_hs, enthalpy, entropy)
+        np.testing.assert_array_almost_equal(temperature, Data.errorValueToNan(temperatureCompare), decimal=2)
+
+    def test_h_pT(self):
+        temperature, pressure, enthalpyCompare = Data.getTwoDimensionalTestData('SIUnits_h_pT.npz')
+        enthalpy = Data.calculatePropertyFromArrays(stm.h_pT, pressure, temperature)
+        np.testing.assert_array_almost_equal(enthalpy.T, Data.errorValueToNan(enthalpyCompare), decimal=2)
+
+    def test_h_px(self):
+        quality, pressure, enthalpyCompare = Data.getTwoDimensionalTestData('SIUnits_h_px.npz')
+        enthalpy = Data.calculatePropertyFromArrays(stm.h_px, pressure, quality)
+        np.testing.assert_array_almost_equal(enthalpy.T, Data.errorValueToNan(enthalpyCompare), decimal=1)
+
+    def test_v_ps(self):
+        pressure, entropy, specificVolumeCompare = Data.getTwoDimensionalTestData('SIUnits_v_ps.npz')
+        specificVolume = Data.calculatePropertyFromArrays(stm.v_ps, pressure, entropy)
+        np.testing.assert_array_almost_equal(specificVolume, Data.errorValueToNan(specificVolumeCompare), decimal=2)
+
+    def test_cp_ph(self):
+        pressure, enthalpy, heatCapacityCompare = Data.getTwoDimensionalTestData('SIUnits_cp_ph.npz')
+        heatCapacity = Data.calculatePropertyFromArrays(stm.cp_ph, pressure, enthalpy)
+        np.testing.assert_array_almost_equal(heatCapacity, Data.errorValueToNan(heatCapacityCompare), decimal=2)
+
+    def test_x_ph(self):
+        pressure, enthalpy, qualityCompare = Data.getTwoDimensionalTestData('SIUnits_x_ph.npz')
+        quality = Data.calculatePropertyFromArrays(stm.x_ph, pressure, enthalpy)
+        np.testing.assert_array_almost_equal(quality, Data.errorValueToNan(qualityCompare), decimal=2)
+
+    def test_tc_ph(self):
+        pressure, enthalpy, conductivityCompare = Data.getTwoDimensionalTestData('SIUnits_tc_ph.npz')
+        conductivity = Data.calculatePropertyFromArrays(stm.tc_ph, pressure, enthalpy)
+        np.testing.assert_array_almost_equal(conductivity, Data.errorValueToNan(conductivityCompare), decimal=1)
+
+    def test_hV_p(self):
+        pressure, enthalpyCompare = Data.getOneDimensionalTestData('SIUnits_hV_p.npz')
+        enthalpy = stm.hV_p(np.asarray(pressure, dtype=float))
+        np.testing.assert_array_almost_equal(enthalpy, Data.errorValueToNan(enthalpyCompare), decimal=2)
+
+    def test_Psat_s(self):
+        entropy, pressureCompare = Data.getOneDimensionalTestData('SIUnits_Psat_s.npz')
+        pressure = stm.Psat_s(np.asarray(entropy, dtype=float))
+        np.testing.assert_array_almost_equal(pressure, Data.errorValueToNan(pressureCompare), decimal=2)
+
+    def test_matchesScalar(self):
+        pressure = np.array([1.0, 1000.0, 1000.0, 3000.0, 17000.0, 25000.0, 40000.0, 40000.0])
+        temperature = np.array([20.0, 100.0, 1200.0, 400.0, 360.0, 380.0, 400.0, 500.0])
+        for function in (stm.h_pT, stm.v_pT, stm.s_pT, stm.cp_pT, stm.w_pT, stm.my_pT):
+            scalar = Data.errorValueToNan([function(p, T) for p, T in zip(pressure, temperature)])
+            np.testing.assert_allclose(function(pressure, temperature), scalar, rtol=1e-9)
+
+    def test_errorIsNan(self):
+        enthalpy = stm.h_pT(np.array([-1.0, 1000.0]), np.array([100.0, 100.0]))
+        self.assertTrue(np.isnan(enthalpy[0]))
+        self.assertAlmostEqual(enthalpy[1], stm.h_pT(1000.0, 100.0), places=9)
+
+    def test_twoPhaseHeatCapacityIsNan(self):
+        self.assertTrue(np.isnan(stm.cp_ph(np.array([1000.0]), np.array([1500.0]))[0]))
+
+    def test_returnMask(self):
+        enthalpy, valid = stm.h_pT(np.array([-1.0, 1000.0, 1000.0]), np.array([100.0, 100.0, 3000.0]), returnMask=True)
+        np.testing.assert_array_equal(valid, [False, True, False])
+        np.testing.assert_array_equal(np.isnan(enthalpy), ~valid)
+
+    def test_returnMask_scalar(self):
+        enthalpy, valid = stm.h_pT(-1.0, 100.0, returnMask=True)
+        self.assertEqual(enthalpy, 2015.0)
+        self.assertFalse(valid)
+
+    def test_scalarUnchanged(self):
+        self.assertIsInstance(stm.Tsat_p(1000.0), float)
+        self.assertAlmostEqual(stm.h_pT(-1.0, 100.0), 2015.0)
+
+    def test_broadcast(self):
+        pressure = np.array([[1000.0], [2000.0]])
+        temperature = np.array([50.0, 100.0, 150.0])
+        enthalpy = stm.h_pT(pressure, temperature)
+        self.assertEqual(enthalpy.shape, (2, 3))
+        self.assertAlmostEqual(enthalpy[1, 2], stm.h_pT(2000.0, 150.0), places=9)
+
+    def test_keywordArguments(self):
+        enthalpy = stm.h_pT(temperature=np.array([100.0]), pressure=np.array([1000.0]))
+        self.assertAlmostEqual(enthalpy[0], stm.h_pT(1000.0, 100.0), places=9)
+
+    def test_inputsUnchanged(self):
+        stm.englishUnits = True
+        pressure, enthalpy = np.array([100.0, 500.0]), np.array([500.0, 1200.0])
+        stm.T_ph(pressure, enthalpy)
+        np.testing.assert_array_equal(pressure, [100.0, 500.0])
+        np.testing.assert_array_equal(enthalpy, [500.0, 1200.0])
+
+class Test_States(unittest.TestCase):
+
+    def test_properties_ph_twoPhase(self):
+        properties = States.properties_ph(np.array([1.0]), np.array([1500.0]))
+        self.assertAlmostEqual(properties.temperature[0], Region4.t4_p(1.0), places=9)
+        self.assertAlmostEqual(properties.enthalpy[0], 1500.0, places=6)
+        self.assertTrue(np.isnan(properties.cp[0]))
+
+    def test_saturationPressure_s(self):
+        entropy = np.array([1.0, 4.0, 4.5, 6.0])
+        np.testing.assert_allclose(States.saturationPressure_s(entropy), [Region4.p4_s(s) for s in entropy], rtol=1e-12)
+
+    def test_saturationPressure_s_outOfRange(self):
+        self.assertTrue(np.isnan(States.saturationPressure_s(np.array([10.0]))[0]))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,100 @@
+# -*- coding: utf-8 -*-
+'''
+Unit tests for the stored tables
+'''
+import json
+import os
+import shutil
+import tempfile
+import unittest
+
+import numpy as np
+
+import Properties
+import Saturation
+import States
+import Storage
+import Tables
+import XSteamPython as stm
+
+class Test_Storage(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.table = Tables.PropertyTable('ph', 60, 120)
+        cls.saturationTable = Saturation.SaturationTable(100, 50)
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        stm.usePropertyEquations()
+        stm.useSaturationEquations()
+        shutil.rmtree(self.directory)
+
+    def editHeader(self, path, **changes):
+        headerPath = os.path.join(path, 'header.json')
+        with open(headerPath) as headerFile:
+            header = json.load(headerFile)
+        header.update(changes)
+        with open(headerPath, 'w') as headerFile:
+            json.dump(header, headerFile)
+
+    def test_propertyTable(self):
+        path = os.path.join(self.directory, 'ph')
+        self.table.save(path)
+        table = Tables.PropertyTable.load(path)
+        self.assertIsInstance(table._coefficients, np.memmap)
+        self.assertEqual(table.inputs, 'ph')
+        self.assertEqual(table.maximumError, self.table.maximumError)
+        self.assertEqual(table.coverage, self.table.coverage)
+        random = np.random.RandomState(0)
+        pressure, enthalpy = np.exp(random.uniform(np.log(0.001), np.log(100.0), 2000)), random.uniform(10.0, 4200.0, 2000)
+        for field, expected, value in zip(Properties.StateProperties._fields, self.table.properties(pressure, enthalpy), table.properties(pressure, enthalpy)):
+            np.testing.assert_array_equal(value, expected, err_msg=field)
+        self.assertRaises(ValueError, Tables.PropertyTable.load, path, 'ps')
+
+    def test_saturationTable(self):
+        path = os.path.join(self.directory, 'saturation')
+        self.saturationTable.save(path)
+        table = Saturation.SaturationTable.load(path)
+        self.assertIsInstance(table._lowNodes, np.memmap)
+        self.assertEqual(table.maximumError, self.saturationTable.maximumError)
+        pressure = np.linspace(0.001, 22.0, 500)
+        for phase in ('liq', 'vap'):
+            np.testing.assert_array_equal(np.array(table.properties_p(pressure, phase)), np.array(self.saturationTable.properties_p(pressure, phase)))
+        self.assertRaises(ValueError, Tables.PropertyTable.load, path)
+
+    def test_staleTable(self):
+        path = os.path.join(self.directory, 'ph')
+        self.table.save(path)
+        self.editHeader(path, checksum='0')
+        self.assertRaises(ValueError, Tables.PropertyTable.load, path)
+        self.table.save(path)
+        self.editHeader(path, formatVersion=Storage.formatVersion + 1)
+        self.assertRaises(ValueError, Tables.PropertyTable.load, path)
+
+    def test_loadOrBuild(self):
+        path = os.path.join(self.directory, 'ph')
+        built = []
+        def build():
+            built.append(True)
+            return self.table
+        table = Storage.loadOrBuild(path, Tables.PropertyTable.load, build)
+        self.assertIsInstance(table._coefficients, np.memmap)
+        Storage.loadOrBuild(path, Tables.PropertyTable.load, build)
+        self.assertEqual(len(built), 1)
+        self.editHeader(path, checksum='0')
+        Storage.loadOrBuild(path, Tables.PropertyTable.load, build)
+        self.assertEqual(len(built), 2)
+        self.assertEqual(sorted(os.listdir(self.directory)), ['ph'])
+
+    def test_usePath(self):
+        path = os.path.join(self.directory, 'saturation')
+        self.saturationTable.save(path)
+        table = stm.useSaturationTable(path=path)
+        self.assertIs(States.saturationTable, table)
+        self.assertEqual(table._lowNodes.size, 100)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,131 @@
+# -*- coding: utf-8 -*-
+'''
+Unit tests for the property tables
+'''
+import unittest
+
+import numpy as np
+
+import Regions
+import States
+import Tables
+import XSteamPython as stm
+
+class Test_Tables(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.table = Tables.PropertyTable('ph', 100, 200)
+        cls.tables = {'ps': Tables.PropertyTable('ps', 100, 200), 'hs': Tables.PropertyTable('hs', 200, 200)}
+
+    def tearDown(self):
+        stm.usePropertyEquations()
+
+    def states(self, size):
+        random = np.random.RandomState(0)
+        return np.exp(random.uniform(np.log(0.001), np.log(100.0), size)), random.uniform(10.0, 4200.0, size)
+
+    def test_maximumError(self):
+        for field, error in self.table.maximumError.items():
+            self.assertLessEqual(error, 1e-5, field)
+        self.assertGreater(self.table.coverage, 0.6)
+
+    def test_errorBetweenNodes(self):
+        pressure, enthalpy = self.states(20000)
+        table, equations = self.table.properties(pressure, enthalpy), States.properties_ph(pressure, enthalpy)
+        for field in ('temperature', 'specificVolume', 'cp', 'cv', 'speedOfSound'):
+            np.testing.assert_allclose(getattr(table, field), getattr(equations, field), rtol=1e-5, err_msg=field)
+        np.testing.assert_allclose(table.entropy, equations.entropy, rtol=1e-5, atol=1e-7)
+        np.testing.assert_allclose(table.internalEnergy, equations.internalEnergy, rtol=1e-5, atol=1e-5)
+
+    def test_fields(self):
+        # Only the fields asked for are interpolated, the states left to the equations get every field
+        pressure, enthalpy = self.states(2000)
+        properties, temperature = self.table.properties(pressure, enthalpy), self.table.properties(pressure, enthalpy, ('temperature',))
+        np.testing.assert_array_equal(temperature.temperature, properties.temperature)
+        np.testing.assert_array_equal(temperature.enthalpy, properties.enthalpy)
+        self.assertTrue(np.isnan(temperature.cp).any())
+        np.testing.assert_array_equal(temperature.cp[~np.isnan(temperature.cp)], properties.cp[~np.isnan(temperature.cp)])
+
+    def test_regionBoundaries(self):
+        # Saturated liquid and the boundaries of region 3 are evaluated with the equations
+        pressure = np.array([0.1, 1.0, 10.0, 20.0, 30.0])
+        enthalpy = np.array([stm.hL_p(1000.0*pressure[:4]).tolist() + [1670.0]]).ravel()
+        table, equations = self.table.properties(pressure, enthalpy), States.properties_ph(pressure, enthalpy)
+        for field in table._fields:
+            np.testing.assert_array_equal(getattr(table, field), getattr(equations, field))
+
+    def test_outOfRange(self):
+        properties = self.table.properties(np.array([-1.0, 1.0, 200.0]), np.array([1000.0, -100.0, 1000.0]))
+        self.assertTrue(np.isnan(properties.temperature).all())
+        self.assertTrue(np.isnan(properties.specificVolume).all())
+
+    def test_usePropertyTable(self):
+        pressure, enthalpy = self.states(500)
+        temperature, entropy = stm.T_ph(1000.0*pressure, enthalpy), stm.s_ph(1000.0*pressure, enthalpy)
+        self.assertIs(stm.usePropertyTable('ph', self.table), self.table)
+        np.testing.assert_allclose(stm.T_ph(1000.0*pressure, enthalpy), temperature, rtol=1e-5)
+        np.testing.assert_allclose(stm.s_ph(1000.0*pressure, enthalpy), entropy, rtol=1e-5, atol=1e-7)
+
+    def test_usePropertyTable_scalarUnchanged(self):
+        temperature = stm.T_ph(1000.0, 1000.0)
+        stm.usePropertyTable('ph', self.table)
+        self.assertEqual(stm.T_ph(1000.0, 1000.0), temperature)
+
+    def test_maximumError_ps_hs(self):
+        for inputs, table in self.tables.items():
+            for field, error in table.maximumError.items():
+                self.assertLessEqual(error, 1e-5, inputs + field)
+            self.assertGreater(table.coverage, 0.6)
+
+    def test_errorBetweenNodes_ps(self):
+        random = np.random.RandomState(1)
+        pressure, entropy = np.exp(random.uniform(np.log(0.001), np.log(100.0), 20000)), random.uniform(0.0, 11.0, 20000)
+        table, equations = self.tables['ps'].properties(pressure, entropy), States.properties_ps(pressure, entropy)
+        for field in ('temperature', 'specificVolume', 'cp', 'speedOfSound'):
+            np.testing.assert_allclose(getattr(table, field), getattr(equations, field), rtol=1e-5, err_msg=field)
+        np.testing.assert_allclose(table.enthalpy, equations.enthalpy, rtol=1e-5, atol=1e-5)
+        np.testing.assert_allclose(table.internalEnergy, equations.internalEnergy, rtol=1e-5, atol=1e-5)
+
+    def test_errorBetweenNodes_hs(self):
+        random = np.random.RandomState(2)
+        enthalpy, entropy = random.uniform(0.0, 4200.0, 20000), random.uniform(0.0, 11.0, 20000)
+        table, equations = self.tables['hs'].properties(enthalpy, entropy), States.properties_hs(enthalpy, entropy)
+        self.assertTrue((np.isnan(table.temperature) == np.isnan(equations.temperature)).all())
+        for field in ('pressure', 'temperature', 'specificVolume', 'cp', 'speedOfSound'):
+            np.testing.assert_allclose(getattr(table, field), getattr(equations, field), rtol=1e-5, err_msg=field)
+
+    def test_toleranceBetweenCheckPoints(self):
+        # The cells are kept below half the tolerance on the check grid, random states stay within tolerance
+        random = np.random.RandomState(3)
+        for inputs, states in (('ph', self.states(100000)), ('hs', (random.uniform(0.0, 4200.0, 100000), random.uniform(0.0, 11.0, 100000)))):
+            table = self.table if inputs == 'ph' else self.tables[inputs]
+            cell = table._locate(*states)[0]
+            first, second = states[0][cell >= 0], states[1][cell >= 0]
+            interpolated, exact = table.properties(first, second), table._equations(first, second)
+            for field in table._fields:
+                value, reference = getattr(interpolated, field), getattr(exact, field)
+                error = np.abs(value - reference)/np.maximum(np.abs(reference), Tables._errorScale.get(field, 0.0))
+                self.assertLessEqual(np.nanmax(error), table.tolerance, inputs + field)
+
+    def test_saturationDome_ps(self):
+        # Inside the dome the patches only interpolate over pressure, the saturation lines are evaluated with the equations
+        pressure = np.full(5, 1.0)
+        entropy = np.array([stm.sL_p(1000.0), 3.0, 4.5, 6.0, stm.sV_p(1000.0)])
+        table, equations = self.tables['ps'].properties(pressure, entropy), States.properties_ps(pressure, entropy)
+        np.testing.assert_allclose(table.enthalpy, equations.enthalpy, rtol=1e-7)
+        np.testing.assert_array_equal(table.enthalpy[[0, -1]], equations.enthalpy[[0, -1]])
+
+    def test_usePropertyTable_ps_hs(self):
+        pressure, entropy = np.array([100.0, 5000.0, 40000.0]), np.array([7.0, 2.0, 5.0])
+        enthalpy, pressureHs = stm.h_ps(pressure, entropy), stm.P_hs(np.array([3000.0, 500.0]), np.array([7.0, 1.5]))
+        stm.usePropertyTable('ps', self.tables['ps'])
+        stm.usePropertyTable('hs', self.tables['hs'])
+        np.testing.assert_allclose(stm.h_ps(pressure, entropy), enthalpy, rtol=1e-5)
+        np.testing.assert_allclose(stm.P_hs(np.array([3000.0, 500.0]), np.array([7.0, 1.5])), pressureHs, rtol=1e-5)
+
+    def test_inputs(self):
+        self.assertRaises(ValueError, Tables.PropertyTable, 'pT')
+
+if __name__ == '__main__':
+    unittest.main()
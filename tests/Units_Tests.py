@@ -0,0 +1,96 @@
+# -*- coding: utf-8 -*-
+'''
+Unit tests for the unit system selection
+'''
+import sys
+import threading
+import unittest
+
+import numpy as np
+
+import XSteamPython as stm
+
+class Test_Units(unittest.TestCase):
+
+    def tearDown(self):
+        stm.englishUnits = False
+
+    def test_unitsKeyword(self):
+        stm.englishUnits = True
+        english = stm.h_pT(14.7, 212.0)
+        stm.englishUnits = False
+        self.assertEqual(stm.h_pT(14.7, 212.0, units='English'), english)
+        self.assertEqual(stm.h_pT(101.0, 300.0, units='SI'), stm.h_pT(101.0, 300.0))
+        stm.englishUnits = True
+        self.assertEqual(stm.h_pT(101.0, 300.0, units='SI'), stm.h_pT(101.0, 300.0, units='si'))
+        self.assertEqual(stm.h_pT(14.7, 212.0), english)
+
+    def test_unitsKeyword_array(self):
+        pressure = np.array([14.7, 100.0])
+        np.testing.assert_array_equal(stm.h_pT(pressure, 212.0, units='English'), [stm.h_pT(value, 212.0, units='English') for value in pressure])
+        value, valid = stm.T_ph(pressure, 1000.0, units='English', returnMask=True)
+        self.assertTrue(valid.all())
+
+    def test_unitSystem(self):
+        stm.englishUnits = True
+        english = stm.tc_ph(14.7, 100.0)
+        stm.englishUnits = False
+        with stm.unitSystem('English'):
+            self.assertEqual(stm.tc_ph(14.7, 100.0), english)
+            with stm.unitSystem('SI'):
+                self.assertEqual(stm.tc_ph(101.0, 100.0, units='SI'), stm.tc_ph(101.0, 100.0))
+            self.assertEqual(stm.tc_ph(14.7, 100.0), english)
+        self.assertNotEqual(stm.tc_ph(14.7, 100.0), english)
+
+    def test_composedFunctions(self):
+        # Composed functions are evaluated in SI units, English arguments only change the state
+        pressure, temperature = stm.Convert.fromSIUnit(0.1, 'pressure', englishUnits=True), 212.0
+        self.assertAlmostEqual(stm.Pr_pT(pressure, temperature, units='English'), stm.Pr_pT(100.0, 100.0), places=9)
+        self.assertAlmostEqual(stm.kappa_pT(pressure, temperature, units='English'), stm.kappa_pT(100.0, 100.0), places=9)
+        self.assertAlmostEqual(stm.tc_pT(pressure, temperature, units='English'), stm.tc_pT(100.0, 100.0)*0.577789, places=9)
+        self.assertEqual(stm.tcL_p(-1.0, units='English'), 2015.0)
+
+    def test_unitSystem_error(self):
+        self.assertRaises(ValueError, stm.h_pT, 101.0, 300.0, units='imperial')
+        with self.assertRaises(ValueError):
+            with stm.unitSystem('kPa'):
+                pass
+        self.assertFalse(stm._englishUnits())
+
+    def test_threads(self):
+        expected = {'SI': stm.h_pT(101.0, 100.0), 'English': stm.h_pT(101.0, 100.0, units='English')}
+        results = dict((units, []) for units in expected)
+        barrier = threading.Event()
+
+        def evaluate(units):
+            with stm.unitSystem(units):
+                barrier.wait()
+                for _ in range(200):
+                    results[units].append(stm.h_pT(101.0, 100.0))
+
+        threads = [threading.Thread(target=evaluate, args=(units,)) for units in sorted(expected)*2]
+        for thread in threads:
+            thread.start()
+        barrier.set()
+        for thread in threads:
+            thread.join()
+        for units, values in results.items():
+            self.assertEqual(set(values), set([expected[units]]), units)
+
+    @unittest.skipIf(sys.version_info < (3, 7), 'contextvars is available from Python 3.7')
+    def test_contexts(self):
+        # asyncio runs every task in a copy of the context it was created in
+        import contextvars
+
+        def evaluate(units):
+            with stm.unitSystem(units):
+                return stm.Tsat_p(100.0)
+
+        context = contextvars.copy_context()
+        with stm.unitSystem('English'):
+            self.assertEqual(context.run(stm.Tsat_p, 100.0), stm.Tsat_p(100.0, units='SI'))
+            self.assertEqual(context.run(evaluate, 'SI'), stm.Tsat_p(100.0, units='SI'))
+            self.assertEqual(stm.Tsat_p(100.0), stm.Tsat_p(100.0, units='English'))
+
+if __name__ == '__main__':
+    unittest.main()